@@ -42,6 +42,16 @@ class BaseRedisClient(ABC):
     async def get_ttl(self, name: str) -> Optional[int]:
         pass
 
+    @abstractmethod
+    async def hget(self, name: str, key: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    async def hset(
+        self, name: str, key: str, value: str, *, ex: int | None = None
+    ) -> None:
+        pass
+
 
 class RedisStandaloneClient(BaseModel, BaseRedisClient):
     """Redis单机客户端"""
@@ -96,6 +106,20 @@ class RedisStandaloneClient(BaseModel, BaseRedisClient):
         result = client.ttl(name)
         return int(result)
 
+    async def hget(self, name: str, key: str) -> bytes | None:
+        client = await self.create_client()
+        result = client.hget(name, key)
+        return result if isinstance(result, bytes) else None
+
+    async def hset(
+        self, name: str, key: str, value: str, *, ex: int | None = None
+    ) -> None:
+        """设置 hash 字段，ex 为整个 hash 的过期时间（秒）"""
+        client = await self.create_client()
+        client.hset(name, key, value)
+        if ex:
+            client.expire(name, ex)
+
     @staticmethod
     async def is_connected(client: redis.Redis) -> bool:
         """检查Redis单机客户端连接"""
@@ -170,6 +194,20 @@ class RedisClusterClient(BaseModel, BaseRedisClient):
             return result
         return None
 
+    async def hget(self, name: str, key: str) -> bytes | None:
+        client = await self.create_client()
+        result = client.hget(name, key)
+        return result if isinstance(result, bytes) else None
+
+    async def hset(
+        self, name: str, key: str, value: str, *, ex: int | None = None
+    ) -> None:
+        """设置 hash 字段，ex 为整个 hash 的过期时间（秒）"""
+        client = await self.create_client()
+        client.hset(name, key, value)
+        if ex:
+            client.expire(name, ex)
+
     @staticmethod
     async def is_connected(client: RedisCluster) -> bool:
         """
@@ -0,0 +1,151 @@
+"""Link 工具 schema 缓存
+
+Tool schemas are cached in Redis, shared with the workflow service and
+deleted by the Link service whenever a tool is written, and in a short-lived
+per-process LRU in front of it. Entries are keyed by (app_id, tool_id,
+version), the local TTL bounds how long a process keeps serving the previous
+schema after a tool update. A schema fetched from Link before an update can
+still be stored after the delete, the short Redis TTL bounds how long it is
+served.
+"""
+
+import json
+import os
+from typing import Any, Optional
+
+from cache.redis_client import BaseRedisClient, create_redis_client
+from common_imports import LocalLRUCache, Span, logger, metric
+from infra import agent_config
+
+# Redis hash of the schemas of one tool, fields are "{app_id}:{version}"
+TOOL_SCHEMA_CACHE_PREFIX = "spark_link:tool_schema"
+
+ToolSchemaKey = tuple[str, str, str]
+
+# 进程内工具 schema LRU 缓存
+LocalToolSchemaCache = LocalLRUCache[ToolSchemaKey, dict[str, Any]]
+
+local_tool_schema_cache = LocalToolSchemaCache(
+    max_size=agent_config.TOOL_SCHEMA_LOCAL_CACHE_SIZE,
+    ttl=agent_config.TOOL_SCHEMA_LOCAL_CACHE_TTL,
+)
+
+_redis_client: Optional[BaseRedisClient] = None
+_cache_counter: Any = None
+
+
+def _get_redis_client() -> Optional[BaseRedisClient]:
+    """Redis 未配置时返回 None，只使用进程内缓存"""
+    global _redis_client
+    if _redis_client is None:
+        if not agent_config.REDIS_CLUSTER_ADDR and not agent_config.REDIS_ADDR:
+            return None
+        _redis_client = create_redis_client(
+            cluster_addr=agent_config.REDIS_CLUSTER_ADDR,
+            standalone_addr=agent_config.REDIS_ADDR,
+            password=agent_config.REDIS_PASSWORD,
+        )
+    return _redis_client
+
+
+def _report_cache_event(layer: str, event: str) -> None:
+    """上报缓存命中情况, layer 为 local 或 redis, event 为 hit 或 miss"""
+    global _cache_counter
+    if _cache_counter is None:
+        if metric.meter is None:
+            return
+        _cache_counter = metric.meter.create_counter(
+            "tool_schema_cache_total",
+            description="Link tool schema cache hit and miss count per layer",
+        )
+    _cache_counter.add(1, {"pid": os.getpid(), "layer": layer, "event": event})
+
+
+async def get_tool_schemas(
+    app_id: str, tools: list[tuple[str, str]], span: Span
+) -> tuple[dict[tuple[str, str], dict[str, Any]], list[tuple[str, str]]]:
+    """查询缓存中的工具 schema
+
+    Args:
+        app_id: 应用ID
+        tools: (tool_id, version) 列表
+        span: 追踪 span
+
+    Returns:
+        命中的工具（按 (tool_id, version) 索引）与未命中的 (tool_id, version) 列表
+    """
+    found: dict[tuple[str, str], dict[str, Any]] = {}
+    missing: list[tuple[str, str]] = []
+    for tool_id, version in dict.fromkeys(tools):
+        tool = local_tool_schema_cache.get((app_id, tool_id, version))
+        _report_cache_event("local", "miss" if tool is None else "hit")
+        if tool is None:
+            missing.append((tool_id, version))
+        else:
+            found[(tool_id, version)] = tool
+
+    local_hits, redis_hits = len(found), 0
+    still_missing = missing
+    if missing:
+        try:
+            redis_client = _get_redis_client()
+            if redis_client is not None:
+                still_missing = []
+                for tool_id, version in missing:
+                    value = await redis_client.hget(
+                        f"{TOOL_SCHEMA_CACHE_PREFIX}:{tool_id}", f"{app_id}:{version}"
+                    )
+                    _report_cache_event("redis", "hit" if value else "miss")
+                    if not value:
+                        still_missing.append((tool_id, version))
+                        continue
+                    tool = json.loads(value)
+                    local_tool_schema_cache.set((app_id, tool_id, version), tool)
+                    found[(tool_id, version)] = tool
+                    redis_hits += 1
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"tool schema cache get failed, {e}")
+            still_missing = [key for key in missing if key not in found]
+
+    span.add_info_events(
+        attributes={
+            "tool-schema-cache-local-hits": local_hits,
+            "tool-schema-cache-redis-hits": redis_hits,
+        }
+    )
+    return found, still_missing
+
+
+async def set_tool_schemas(
+    app_id: str, keys: list[tuple[str, str]], tools: list[dict[str, Any]]
+) -> None:
+    """缓存 Link 返回的工具 schema
+
+    Args:
+        app_id: 应用ID
+        keys: 请求的 (tool_id, version) 列表
+        tools: Link 按请求顺序返回的工具
+    """
+    if len(keys) != len(tools):
+        return
+    redis_client = None
+    try:
+        redis_client = _get_redis_client()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.warning(f"tool schema cache set failed, {e}")
+    for (tool_id, version), tool in zip(keys, tools):
+        if tool.get("id") != tool_id:
+            continue
+        local_tool_schema_cache.set((app_id, tool_id, version), tool)
+        if redis_client is None:
+            continue
+        try:
+            await redis_client.hset(
+                f"{TOOL_SCHEMA_CACHE_PREFIX}:{tool_id}",
+                f"{app_id}:{version}",
+                json.dumps(tool, ensure_ascii=False),
+                ex=agent_config.TOOL_SCHEMA_CACHE_TTL,
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"tool schema cache set failed, {e}")
+            redis_client = None
@@ -21,11 +21,13 @@ try:
     from common.otlp.log_trace.node_log import Data, NodeLog
     from common.otlp.log_trace.node_trace_log import NodeTraceLog
     from common.otlp.log_trace.node_trace_log import Status as TraceStatus
+    from common.otlp.metrics import metric
     from common.otlp.metrics.meter import Meter
     from common.otlp.sid import sid_generator2
     from common.otlp.trace.span import Span
     from common.otlp.trace.trace import logger
     from common.settings.polaris import ConfigFilter, Polaris
+    from common.utils.local_cache import LocalLRUCache
 
     # Provide aliases for backward compatibility
     NodeTrace = NodeTraceLog
@@ -46,7 +48,9 @@ try:
 
     __all__ = [
         "BaseExc",
+        "LocalLRUCache",
         "Meter",
+        "metric",
         "NodeLog",
         "NodeTraceLog",
         "NodeTrace",  # alias
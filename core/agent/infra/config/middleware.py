@@ -21,6 +21,9 @@ class LinkConfig(BaseSettings):
     GET_LINK_URL: str = Field(default="")
     VERSIONS_LINK_URL: str = Field(default="")
     RUN_LINK_URL: str = Field(default="")
+    TOOL_SCHEMA_CACHE_TTL: int = Field(default=300)
+    TOOL_SCHEMA_LOCAL_CACHE_SIZE: int = Field(default=1024)
+    TOOL_SCHEMA_LOCAL_CACHE_TTL: int = Field(default=60)
 
 
 class WorkflowConfig(BaseSettings):
@@ -7,6 +7,7 @@ from typing import Any, Optional
 import aiohttp
 from pydantic import BaseModel, Field
 
+from cache.tool_schema_cache import get_tool_schemas, set_tool_schemas
 from common_imports import Span
 from exceptions.plugin_exc import GetToolSchemaExc, RunToolExc
 from infra import agent_config
@@ -216,47 +217,64 @@ class LinkPluginFactory(BaseModel):
         return None
 
     async def tool_schema_list(self, span: Span) -> list[dict[str, Any]]:
-        """Query protocol list from spark link subsystem"""
+        """Query protocol list, from the tool schema cache or spark link subsystem"""
         with span.start("ToolSchemaList") as sp:
             if not self.tool_ids:
                 return []
 
-            url = agent_config.VERSIONS_LINK_URL + "?" + f"app_id={self.app_id}"
-
+            keys: list[tuple[str, str]] = []
             for tool_id in self.tool_ids:
                 if isinstance(tool_id, str):
-                    url += "&tool_ids=" + tool_id + "&versions=V1.0"
+                    keys.append((tool_id, "V1.0"))
                 elif isinstance(tool_id, dict):
-                    tl_id = tool_id.get("tool_id", "")
-                    tl_version = tool_id.get("version", "")
-                    url += "&tool_ids=" + tl_id + "&versions=" + tl_version
-            sp.add_info_events(attributes={"link-plugin-tool-schema-list-inputs": url})
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    if response.status == 200:
-                        result = await response.json()
-                        sp.add_info_events(
-                            attributes={
-                                "link-plugin-tool-schema-list-outputs": (
-                                    json.dumps(result, ensure_ascii=False)
-                                )
-                            }
-                        )
-                        print(result)
-                        if result.get("code") != 0:
-                            raise GetToolSchemaExc
-                        tools_data = result.get("data", {}).get("tools", [])
-                        return tools_data if isinstance(tools_data, list) else []
-
+                    keys.append(
+                        (tool_id.get("tool_id", ""), tool_id.get("version", ""))
+                    )
+            cached, missing = await get_tool_schemas(self.app_id, keys, sp)
+            if not missing:
+                return [cached[key] for key in keys]
+
+            tools_data = await self.fetch_tool_schema_list(missing, sp)
+            await set_tool_schemas(self.app_id, missing, tools_data)
+            if len(tools_data) != len(missing):
+                return [*cached.values(), *tools_data]
+            cached.update(zip(missing, tools_data))
+            return [cached[key] for key in keys]
+
+    async def fetch_tool_schema_list(
+        self, keys: list[tuple[str, str]], sp: Span
+    ) -> list[dict[str, Any]]:
+        """Query protocol list of (tool_id, version) pairs from spark link subsystem"""
+        url = agent_config.VERSIONS_LINK_URL + "?" + f"app_id={self.app_id}"
+        for tl_id, tl_version in keys:
+            url += "&tool_ids=" + tl_id + "&versions=" + tl_version
+        sp.add_info_events(attributes={"link-plugin-tool-schema-list-inputs": url})
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                if response.status == 200:
+                    result = await response.json()
                     sp.add_info_events(
                         attributes={
                             "link-plugin-tool-schema-list-outputs": (
-                                f"response code is {response.status}"
+                                json.dumps(result, ensure_ascii=False)
                             )
                         }
                     )
-                    raise GetToolSchemaExc
+                    print(result)
+                    if result.get("code") != 0:
+                        raise GetToolSchemaExc
+                    tools_data = result.get("data", {}).get("tools", [])
+                    return tools_data if isinstance(tools_data, list) else []
+
+                sp.add_info_events(
+                    attributes={
+                        "link-plugin-tool-schema-list-outputs": (
+                            f"response code is {response.status}"
+                        )
+                    }
+                )
+                raise GetToolSchemaExc
 
     @staticmethod
     def parse_request_query_schema(
@@ -0,0 +1,122 @@
+"""工具 schema 缓存单元test模块."""
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from cache import tool_schema_cache
+from cache.tool_schema_cache import (
+    TOOL_SCHEMA_CACHE_PREFIX,
+    LocalToolSchemaCache,
+    get_tool_schemas,
+    local_tool_schema_cache,
+    set_tool_schemas,
+)
+
+
+class TestLocalToolSchemaCache:
+    """LocalToolSchemaCache test类."""
+
+    def test_lru_eviction(self) -> None:
+        """超过容量时淘汰最久未使用的工具."""
+        cache = LocalToolSchemaCache(max_size=2, ttl=60)
+        cache.set(("app", "t1", "V1.0"), {"id": "t1"})
+        cache.set(("app", "t2", "V1.0"), {"id": "t2"})
+        assert cache.get(("app", "t1", "V1.0")) == {"id": "t1"}
+        cache.set(("app", "t3", "V1.0"), {"id": "t3"})
+
+        assert cache.get(("app", "t2", "V1.0")) is None
+        assert cache.get(("app", "t1", "V1.0")) == {"id": "t1"}
+        assert cache.get(("app", "t3", "V1.0")) == {"id": "t3"}
+
+    def test_ttl_expiry(self) -> None:
+        """过期的工具不再命中."""
+        cache = LocalToolSchemaCache(max_size=2, ttl=0)
+        cache.set(("app", "t1", "V1.0"), {"id": "t1"})
+
+        assert cache.get(("app", "t1", "V1.0")) is None
+
+    def test_disabled(self) -> None:
+        """容量为 0 时不缓存."""
+        cache = LocalToolSchemaCache(max_size=0, ttl=60)
+        cache.set(("app", "t1", "V1.0"), {"id": "t1"})
+
+        assert cache.get(("app", "t1", "V1.0")) is None
+
+
+class TestToolSchemaCache:
+    """get_tool_schemas/set_tool_schemas test类."""
+
+    @pytest.fixture(autouse=True)
+    def clear_local_cache(self) -> Any:
+        """Test setup method."""
+        local_tool_schema_cache.clear()
+        yield
+        local_tool_schema_cache.clear()
+
+    @pytest.fixture
+    def redis_client(self) -> Any:
+        """内存中的 redis hash."""
+        hashes: dict[str, dict[str, bytes]] = {}
+        client = Mock()
+
+        async def hget(name: str, key: str) -> bytes | None:
+            return hashes.get(name, {}).get(key)
+
+        async def hset(name: str, key: str, value: str, **_: Any) -> None:
+            hashes.setdefault(name, {})[key] = value.encode()
+
+        client.hget = AsyncMock(side_effect=hget)
+        client.hset = AsyncMock(side_effect=hset)
+        client.hashes = hashes
+        with patch.object(tool_schema_cache, "_get_redis_client", return_value=client):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_set_then_get(self, redis_client: Any) -> None:
+        """写入后先命中进程内缓存, 清空后命中 redis."""
+        tool = {"id": "t1", "version": "V1.0", "schema": "{}"}
+        await set_tool_schemas("app", [("t1", "V1.0")], [tool])
+
+        assert (
+            json.loads(
+                redis_client.hashes[f"{TOOL_SCHEMA_CACHE_PREFIX}:t1"]["app:V1.0"]
+            )
+            == tool
+        )
+
+        found, missing = await get_tool_schemas("app", [("t1", "V1.0")], Mock())
+        assert found == {("t1", "V1.0"): tool}
+        assert missing == []
+        redis_client.hget.assert_not_awaited()
+
+        local_tool_schema_cache.clear()
+        found, missing = await get_tool_schemas(
+            "app", [("t1", "V1.0"), ("t2", "V1.0")], Mock()
+        )
+        assert found == {("t1", "V1.0"): tool}
+        assert missing == [("t2", "V1.0")]
+
+    @pytest.mark.asyncio
+    async def test_keyed_by_app_and_version(self, redis_client: Any) -> None:
+        """不同应用和版本的工具互不命中."""
+        tool = {"id": "t1", "version": "V1.0", "schema": "{}"}
+        await set_tool_schemas("app", [("t1", "V1.0")], [tool])
+
+        _, missing = await get_tool_schemas(
+            "other", [("t1", "V1.0"), ("t1", "V2.0")], Mock()
+        )
+        assert missing == [("t1", "V1.0"), ("t1", "V2.0")]
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back(self) -> None:
+        """redis 不可用时全部视为未命中."""
+        client = Mock()
+        client.hget = AsyncMock(side_effect=ConnectionError("redis down"))
+        with patch.object(tool_schema_cache, "_get_redis_client", return_value=client):
+            found, missing = await get_tool_schemas("app", [("t1", "V1.0")], Mock())
+
+        assert found == {}
+        assert missing == [("t1", "V1.0")]
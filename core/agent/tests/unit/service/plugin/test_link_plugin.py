@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from cache.tool_schema_cache import local_tool_schema_cache
 from common_imports import Span
 from exceptions.plugin_exc import GetToolSchemaExc, RunToolExc
 from service.plugin.base import BasePlugin, PluginResponse
@@ -433,6 +434,13 @@ class TestLinkPluginRunner:
 class TestLinkPluginFactory:
     """Test cases for LinkPluginFactory."""
 
+    @pytest.fixture(autouse=True)
+    def clear_tool_schema_cache(self) -> Any:
+        """Keep cached tool schemas from leaking between tests."""
+        local_tool_schema_cache.clear()
+        yield
+        local_tool_schema_cache.clear()
+
     @pytest.fixture
     def sample_factory_data(self) -> Dict[str, Any]:
         """Sample factory data for testing."""
@@ -619,6 +627,41 @@ class TestLinkPluginFactory:
 
                 assert "Failed to get link tool protocol" in str(exc_info.value)
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_tool_schema_list_cached(
+        self, link_factory: LinkPluginFactory
+    ) -> None:
+        """Test cached tool schemas are not requested from link again."""
+        mock_span = Mock(spec=Span)
+        context_manager = Mock()
+        context_manager.__enter__ = Mock(return_value=Mock())
+        context_manager.__exit__ = Mock(return_value=None)
+        mock_span.start = Mock(return_value=context_manager)
+
+        tool1 = {"id": "tool1", "version": "V1.0", "schema": "{}"}
+        tool2 = {"id": "tool2", "version": "v2.0", "schema": "{}"}
+        link_factory.tool_ids = ["tool1"]
+        with patch.object(
+            LinkPluginFactory,
+            "fetch_tool_schema_list",
+            AsyncMock(return_value=[tool1]),
+        ) as mock_fetch:
+            assert await link_factory.tool_schema_list(mock_span) == [tool1]
+            assert await link_factory.tool_schema_list(mock_span) == [tool1]
+        mock_fetch.assert_awaited_once()
+
+        # Only the missing tool is requested, the order of tool_ids is kept
+        link_factory.tool_ids = [{"tool_id": "tool2", "version": "v2.0"}, "tool1"]
+        with patch.object(
+            LinkPluginFactory,
+            "fetch_tool_schema_list",
+            AsyncMock(return_value=[tool2]),
+        ) as mock_fetch:
+            result = await link_factory.tool_schema_list(mock_span)
+        assert result == [tool2, tool1]
+        assert mock_fetch.await_args.args[0] == [("tool2", "v2.0")]
+
     @pytest.mark.unit
     def test_parse_request_query_schema(self) -> None:
         """Test parsing request query schema."""
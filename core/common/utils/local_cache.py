@@ -0,0 +1,190 @@
+"""
+Per-process LRU caches with an optional time to live.
+
+Services keep short-lived copies of values shared through Redis or a
+database in them, so hot values are neither fetched nor decoded again on
+every request.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Cached value, expiry time on the monotonic clock and size in bytes
+_Entry = Tuple[V, float, int]
+
+
+class LocalLRUCache(Generic[K, V]):
+    """
+    Thread-safe LRU cache bounded by its entry count.
+
+    Cached values are shared with every caller and must not be modified.
+    Subclasses add bounds by extending ``_insert``, ``_remove`` and
+    ``_evict``, and observe lookups and evictions through ``_on_event``.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries, 0 disables the cache.
+            ttl: Time to live of an entry in seconds, entries never expire if None.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get an entry and mark it as most recently used.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            The cached value, or None if it is missing or expired.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._on_event("miss")
+                return None
+            if entry[1] <= time.monotonic():
+                self._remove(key)
+                self._on_event("miss")
+                self._on_event("eviction", "ttl")
+                return None
+            self._entries.move_to_end(key)
+            self._on_event("hit")
+            return entry[0]
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store an entry, evicting least recently used entries beyond the bounds.
+
+        Args:
+            key: Key of the entry.
+            value: Value to cache.
+        """
+        self._store(key, value, 0)
+
+    def invalidate(self, key: K) -> None:
+        """
+        Remove an entry.
+
+        Args:
+            key: Key of the entry.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: K, value: V, size: int) -> None:
+        if not self.enabled:
+            return
+        expire_at = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._insert(key, (value, expire_at, size))
+            self._evict()
+
+    def _insert(self, key: K, entry: _Entry[V]) -> None:
+        self._entries[key] = entry
+
+    def _remove(self, key: K) -> _Entry[V]:
+        return self._entries.pop(key)
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self._on_event("eviction", "size")
+
+    def _on_event(self, event: str, reason: str = "") -> None:
+        """
+        Observe a cache event, called with the cache lock held.
+
+        Args:
+            event: Cache event, one of hit, miss and eviction.
+            reason: Eviction reason, one of size, bytes and ttl.
+        """
+
+
+class LocalSizedLRUCache(LocalLRUCache[K, V]):
+    """
+    Thread-safe LRU cache bounded by its entry count and the total size of
+    its values.
+    """
+
+    def __init__(
+        self, max_size: int, max_bytes: int, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries, 0 disables the cache.
+            max_bytes: Maximum total size of the values in bytes.
+            ttl: Time to live of an entry in seconds, entries never expire if None.
+        """
+        super().__init__(max_size, ttl)
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return super().enabled and self.max_bytes > 0
+
+    def set(self, key: K, value: V, size: Optional[int] = None) -> None:
+        """
+        Store an entry, evicting least recently used entries beyond the bounds.
+
+        Args:
+            key: Key of the entry.
+            value: Value to cache.
+            size: Size of the value in bytes, ``len(value)`` if None. Values of
+                unknown size (0) or larger than ``max_bytes`` are not cached.
+        """
+        if size is None:
+            size = len(value)  # type: ignore[arg-type]
+        if not 0 < size <= self.max_bytes:
+            return
+        self._store(key, value, size)
+
+    def _insert(self, key: K, entry: _Entry[V]) -> None:
+        super()._insert(key, entry)
+        self.total_bytes += entry[2]
+
+    def _remove(self, key: K) -> _Entry[V]:
+        entry = super()._remove(key)
+        self.total_bytes -= entry[2]
+        return entry
+
+    def _evict(self) -> None:
+        super()._evict()
+        while self.total_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._on_event("eviction", "bytes")
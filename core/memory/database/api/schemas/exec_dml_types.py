@@ -21,6 +21,9 @@ class ExecDMLInput(DidUidCommon):  # pylint: disable=too-few-public-methods
         dml (str): DML statement to execute (required)
         env (Literal["prod", "test"]): Environment (required, either 'prod' or 'test')
         space_id (Optional[str]): Team space ID (optional)
+        page_size (Optional[int]): Rows per page of a paginated SELECT (optional)
+        cursor (Optional[str]): Cursor of the next page of a paginated SELECT
+            (optional)
     """
 
     # app_id: Required, cannot contain Chinese and special characters
@@ -37,3 +40,13 @@ class ExecDMLInput(DidUidCommon):  # pylint: disable=too-few-public-methods
     )
     # space_id: Optional
     space_id: Optional[str] = Field(default="", description="Team space ID")
+    # page_size: Optional, returns the rows of a SELECT page by page
+    page_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Rows per page of a paginated SELECT, capped by the server",
+    )
+    # cursor: Optional, next_cursor returned with the previous page
+    cursor: Optional[str] = Field(
+        default=None, description="Cursor of the next page of a paginated SELECT"
+    )
@@ -20,6 +20,8 @@ class ExportDataInput(DidUidCommon):  # pylint: disable=too-few-public-methods
         uid (str): User ID (required, 1-64 chars, no Chinese/special characters)
         table_name (str): Name of the table to export data from (required)
         env (Literal["prod", "test"]): Environment (required, either 'prod' or 'test')
+        compression (Literal["none", "gzip"]): Compression of the exported file
+            (optional, defaults to 'none')
     """
 
     # app_id: Required, cannot contain Chinese and special characters
@@ -34,3 +36,7 @@ class ExportDataInput(DidUidCommon):  # pylint: disable=too-few-public-methods
     env: Literal["prod", "test"] = Field(
         ..., description="Required, can only be prod or test"
     )
+    # compression: Optional, gzip exports a compressed csv.gz file
+    compression: Literal["none", "gzip"] = Field(
+        default="none", description="Optional, can only be none or gzip"
+    )
@@ -7,20 +7,19 @@ from typing import Any, List, Optional, Tuple
 
 import sqlalchemy
 import sqlalchemy.exc
-from memory.database.domain.entity.database_meta import (
-    get_id_by_did, get_id_by_did_uid, get_uid_by_did_space_id)
-from memory.database.domain.entity.schema_meta import get_schema_name_by_did
+from memory.database.domain.entity.database_meta import \
+    get_database_meta_by_did
 from memory.database.domain.entity.views.http_resp import format_response
 from memory.database.exceptions.error_code import CodeEnum
 
 
 async def check_database_exists_by_did_uid(
     db: Any, database_id: int, uid: str, span_context: Any, m: Any
-) -> Tuple[Optional[List[List[str]]], Optional[Any]]:
+) -> Tuple[Optional[List[Tuple[str]]], Optional[Any]]:
     """Check if database exists and return its schemas."""
     try:
-        db_id_res = await get_id_by_did_uid(db, database_id=database_id, uid=uid)
-        if not db_id_res:
+        database_meta = await get_database_meta_by_did(db, database_id)
+        if not database_meta or database_meta.uid != uid:
             m.in_error_count(
                 CodeEnum.DatabaseNotExistError.code,
                 lables={"uid": uid},
@@ -36,14 +35,13 @@ async def check_database_exists_by_did_uid(
                 sid=span_context.sid,
             )
 
-        res = await get_schema_name_by_did(db, database_id=database_id)
-        if not res:
+        if not database_meta.schemas:
             return None, format_response(
                 code=CodeEnum.DatabaseNotExistError.code,
                 message=CodeEnum.DatabaseNotExistError.msg,
                 sid=span_context.sid,
             )
-        return res, None
+        return [(schema,) for schema in database_meta.schemas], None
     except sqlalchemy.exc.DBAPIError as e:
         await db.rollback()
         span_context.record_exception(e)
@@ -70,11 +68,11 @@ async def check_database_exists_by_did_uid(
 
 async def check_database_exists_by_did(
     db: Any, database_id: int, uid: str, span_context: Any, m: Any
-) -> Tuple[Optional[List[List[str]]], Optional[Any]]:
+) -> Tuple[Optional[List[Tuple[str]]], Optional[Any]]:
     """Check if database exists."""
     try:
-        db_id_res = await get_id_by_did(db, database_id)
-        if not db_id_res:
+        database_meta = await get_database_meta_by_did(db, database_id)
+        if not database_meta:
             m.in_error_count(
                 CodeEnum.DatabaseNotExistError.code,
                 lables={"uid": uid},
@@ -87,8 +85,7 @@ async def check_database_exists_by_did(
                 sid=span_context.sid,
             )
 
-        res = await get_schema_name_by_did(db, database_id)
-        if not res:
+        if not database_meta.schemas:
             m.in_error_count(
                 CodeEnum.DatabaseNotExistError.code,
                 lables={"uid": uid},
@@ -99,7 +96,7 @@ async def check_database_exists_by_did(
                 message=CodeEnum.DatabaseNotExistError.msg,
                 sid=span_context.sid,
             )
-        return res, None
+        return [(schema,) for schema in database_meta.schemas], None
 
     except Exception as db_error:
         span_context.record_exception(db_error)
@@ -117,11 +114,11 @@ async def check_database_exists_by_did(
 
 async def check_space_id_and_get_uid(
     db: Any, database_id: int, space_id: str, span_context: Any, m: Any
-) -> Tuple[Optional[List[List[str]]], Optional[Any]]:
+) -> Tuple[Optional[List[Tuple[str]]], Optional[Any]]:
     """Check if space ID is valid."""
     span_context.add_info_event(f"space_id: {space_id}")
-    create_uid_res = await get_uid_by_did_space_id(db, database_id, space_id)
-    if not create_uid_res:
+    database_meta = await get_database_meta_by_did(db, database_id)
+    if not database_meta or database_meta.space_id != space_id:
         m.in_error_count(
             CodeEnum.SpaceIDNotExistError.code,
             lables={"space_id": space_id},
@@ -136,4 +133,4 @@ async def check_space_id_and_get_uid(
             sid=span_context.sid,
         )
 
-    return create_uid_res, None
+    return [(database_meta.uid,)], None
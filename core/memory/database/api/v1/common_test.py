@@ -1,6 +1,7 @@
 """Unit tests for common database operations functionality."""
 
 import json
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -8,7 +9,11 @@ import sqlalchemy.exc
 from memory.database.api.v1.common import (check_database_exists_by_did,
                                            check_database_exists_by_did_uid,
                                            check_space_id_and_get_uid)
+from memory.database.domain.entity.database_meta import (
+    get_database_meta_by_did, invalidate_database_meta)
 from memory.database.exceptions.error_code import CodeEnum
+from memory.database.utils.database_meta_cache import (DatabaseMetaEntry,
+                                                       get_database_meta_cache)
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 
@@ -31,28 +36,22 @@ async def test_check_database_exists_by_did_uid_success() -> None:
     mock_meter.in_error_count = MagicMock()
 
     with patch(
-        "memory.database.api.v1.common.get_id_by_did_uid", new_callable=AsyncMock
-    ) as mock_get_id:
-        mock_get_id.return_value = database_id
-
-        with patch(
-            "memory.database.api.v1.common.get_schema_name_by_did",
-            new_callable=AsyncMock,
-        ) as mock_get_schema:
-            mock_get_schema.return_value = [["prod_schema"], ["test_schema"]]
-
-            result, error = await check_database_exists_by_did_uid(
-                mock_db, database_id, uid, mock_span_context, mock_meter
-            )
-
-            # Assertions
-            assert result == [["prod_schema"], ["test_schema"]]
-            assert error is None
-            mock_get_id.assert_called_once_with(
-                mock_db, database_id=database_id, uid=uid
-            )
-            mock_get_schema.assert_called_once_with(mock_db, database_id=database_id)
-            mock_meter.in_error_count.assert_not_called()
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.return_value = DatabaseMetaEntry(
+            uid=uid, space_id="", schemas=("prod_schema", "test_schema")
+        )
+
+        result, error = await check_database_exists_by_did_uid(
+            mock_db, database_id, uid, mock_span_context, mock_meter
+        )
+
+        # Assertions
+        assert result == [("prod_schema",), ("test_schema",)]
+        assert error is None
+        mock_get_meta.assert_called_once_with(mock_db, database_id)
+        mock_meter.in_error_count.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -72,9 +71,10 @@ async def test_check_database_exists_by_did_uid_database_not_exist() -> None:
     mock_meter.in_error_count = MagicMock()
 
     with patch(
-        "memory.database.api.v1.common.get_id_by_did_uid", new_callable=AsyncMock
-    ) as mock_get_id:
-        mock_get_id.return_value = None
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.return_value = None
 
         result, error = await check_database_exists_by_did_uid(
             mock_db, database_id, uid, mock_span_context, mock_meter
@@ -119,29 +119,63 @@ async def test_check_database_exists_by_did_uid_schema_not_exist() -> None:
     mock_meter = MagicMock()
 
     with patch(
-        "memory.database.api.v1.common.get_id_by_did_uid", new_callable=AsyncMock
-    ) as mock_get_id:
-        mock_get_id.return_value = database_id
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.return_value = DatabaseMetaEntry(
+            uid=uid, space_id="", schemas=()
+        )
+
+        result, error = await check_database_exists_by_did_uid(
+            mock_db, database_id, uid, mock_span_context, mock_meter
+        )
+
+        # Assertions
+        assert result is None
+        assert error is not None
+
+        # Parse the response
+        response_body = json.loads(error.body)
+        assert response_body["code"] == CodeEnum.DatabaseNotExistError.code
+        assert response_body["message"] == CodeEnum.DatabaseNotExistError.msg
+        assert response_body["sid"] == "test-sid"
 
-        with patch(
-            "memory.database.api.v1.common.get_schema_name_by_did",
-            new_callable=AsyncMock,
-        ) as mock_get_schema:
-            mock_get_schema.return_value = None
 
-            result, error = await check_database_exists_by_did_uid(
-                mock_db, database_id, uid, mock_span_context, mock_meter
-            )
+@pytest.mark.asyncio
+async def test_check_database_exists_by_did_uid_other_owner() -> None:
+    """Test check_database_exists_by_did_uid when another user owns the database."""
+    mock_db = AsyncMock(spec=AsyncSession)
+    database_id = 123
+    uid = "test_user"
 
-            # Assertions
-            assert result is None
-            assert error is not None
+    # Mock span context
+    mock_span_context = MagicMock()
+    mock_span_context.sid = "test-sid"
 
-            # Parse the response
-            response_body = json.loads(error.body)
-            assert response_body["code"] == CodeEnum.DatabaseNotExistError.code
-            assert response_body["message"] == CodeEnum.DatabaseNotExistError.msg
-            assert response_body["sid"] == "test-sid"
+    # Mock meter
+    mock_meter = MagicMock()
+
+    with patch(
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.return_value = DatabaseMetaEntry(
+            uid="other_user", space_id="", schemas=("prod_schema", "test_schema")
+        )
+
+        result, error = await check_database_exists_by_did_uid(
+            mock_db, database_id, uid, mock_span_context, mock_meter
+        )
+
+        # Assertions
+        assert result is None
+        response_body = json.loads(error.body)
+        assert response_body["code"] == CodeEnum.DatabaseNotExistError.code
+        mock_meter.in_error_count.assert_called_once_with(
+            CodeEnum.DatabaseNotExistError.code,
+            lables={"uid": uid},
+            span=mock_span_context,
+        )
 
 
 @pytest.mark.asyncio
@@ -166,9 +200,10 @@ async def test_check_database_exists_by_did_uid_dbapi_error() -> None:
     mock_dbapi_error = sqlalchemy.exc.DBAPIError("statement", {}, mock_cause)
 
     with patch(
-        "memory.database.api.v1.common.get_id_by_did_uid", new_callable=AsyncMock
-    ) as mock_get_id:
-        mock_get_id.side_effect = mock_dbapi_error
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.side_effect = mock_dbapi_error
 
         result, error = await check_database_exists_by_did_uid(
             mock_db, database_id, uid, mock_span_context, mock_meter
@@ -216,9 +251,10 @@ async def test_check_database_exists_by_did_uid_general_exception() -> None:
     mock_exception.__cause__ = mock_cause
 
     with patch(
-        "memory.database.api.v1.common.get_id_by_did_uid", new_callable=AsyncMock
-    ) as mock_get_id:
-        mock_get_id.side_effect = mock_exception
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.side_effect = mock_exception
 
         result, error = await check_database_exists_by_did_uid(
             mock_db, database_id, uid, mock_span_context, mock_meter
@@ -256,25 +292,21 @@ async def test_check_database_exists_by_did_success() -> None:
     mock_meter = MagicMock()
 
     with patch(
-        "memory.database.api.v1.common.get_id_by_did", new_callable=AsyncMock
-    ) as mock_get_id:
-        mock_get_id.return_value = database_id
-
-        with patch(
-            "memory.database.api.v1.common.get_schema_name_by_did",
-            new_callable=AsyncMock,
-        ) as mock_get_schema:
-            mock_get_schema.return_value = [["prod_schema"], ["test_schema"]]
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.return_value = DatabaseMetaEntry(
+            uid="owner", space_id="", schemas=("prod_schema", "test_schema")
+        )
 
-            result, error = await check_database_exists_by_did(
-                mock_db, database_id, uid, mock_span_context, mock_meter
-            )
+        result, error = await check_database_exists_by_did(
+            mock_db, database_id, uid, mock_span_context, mock_meter
+        )
 
-            # Assertions
-            assert result == [["prod_schema"], ["test_schema"]]
-            assert error is None
-            mock_get_id.assert_called_once_with(mock_db, database_id)
-            mock_get_schema.assert_called_once_with(mock_db, database_id)
+        # Assertions
+        assert result == [("prod_schema",), ("test_schema",)]
+        assert error is None
+        mock_get_meta.assert_called_once_with(mock_db, database_id)
 
 
 @pytest.mark.asyncio
@@ -294,9 +326,10 @@ async def test_check_database_exists_by_did_not_found() -> None:
     mock_meter.in_error_count = MagicMock()
 
     with patch(
-        "memory.database.api.v1.common.get_id_by_did", new_callable=AsyncMock
-    ) as mock_get_id:
-        mock_get_id.return_value = None
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.return_value = None
 
         result, error = await check_database_exists_by_did(
             mock_db, database_id, uid, mock_span_context, mock_meter
@@ -341,35 +374,32 @@ async def test_check_database_exists_by_did_schema_not_found() -> None:
     mock_meter.in_error_count = MagicMock()
 
     with patch(
-        "memory.database.api.v1.common.get_id_by_did", new_callable=AsyncMock
-    ) as mock_get_id:
-        mock_get_id.return_value = database_id
-
-        with patch(
-            "memory.database.api.v1.common.get_schema_name_by_did",
-            new_callable=AsyncMock,
-        ) as mock_get_schema:
-            mock_get_schema.return_value = None
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.return_value = DatabaseMetaEntry(
+            uid="owner", space_id="", schemas=()
+        )
 
-            result, error = await check_database_exists_by_did(
-                mock_db, database_id, uid, mock_span_context, mock_meter
-            )
+        result, error = await check_database_exists_by_did(
+            mock_db, database_id, uid, mock_span_context, mock_meter
+        )
 
-            # Assertions
-            assert result is None
-            assert error is not None
+        # Assertions
+        assert result is None
+        assert error is not None
 
-            # Parse the response
-            response_body = json.loads(error.body)
-            assert response_body["code"] == CodeEnum.DatabaseNotExistError.code
-            assert response_body["message"] == CodeEnum.DatabaseNotExistError.msg
-            assert response_body["sid"] == "test-sid"
+        # Parse the response
+        response_body = json.loads(error.body)
+        assert response_body["code"] == CodeEnum.DatabaseNotExistError.code
+        assert response_body["message"] == CodeEnum.DatabaseNotExistError.msg
+        assert response_body["sid"] == "test-sid"
 
-            mock_meter.in_error_count.assert_called_once_with(
-                CodeEnum.DatabaseNotExistError.code,
-                lables={"uid": uid},
-                span=mock_span_context,
-            )
+        mock_meter.in_error_count.assert_called_once_with(
+            CodeEnum.DatabaseNotExistError.code,
+            lables={"uid": uid},
+            span=mock_span_context,
+        )
 
 
 @pytest.mark.asyncio
@@ -391,9 +421,10 @@ async def test_check_database_exists_by_did_general_exception() -> None:
     mock_exception = Exception("Database error")
 
     with patch(
-        "memory.database.api.v1.common.get_id_by_did", new_callable=AsyncMock
-    ) as mock_get_id:
-        mock_get_id.side_effect = mock_exception
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.side_effect = mock_exception
 
         result, error = await check_database_exists_by_did(
             mock_db, database_id, uid, mock_span_context, mock_meter
@@ -435,22 +466,25 @@ async def test_check_space_id_and_get_uid_success() -> None:
     expected_uid = "found_user"
 
     with patch(
-        "memory.database.api.v1.common.get_uid_by_did_space_id", new_callable=AsyncMock
-    ) as mock_get_uid:
-        mock_get_uid.return_value = expected_uid
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.return_value = DatabaseMetaEntry(
+            uid=expected_uid, space_id=space_id, schemas=("prod_schema",)
+        )
 
         result, error = await check_space_id_and_get_uid(
             mock_db, database_id, space_id, mock_span_context, mock_meter
         )
 
         # Assertions
-        assert result == expected_uid
+        assert result == [(expected_uid,)]
         assert error is None
 
         mock_span_context.add_info_event.assert_called_once_with(
             f"space_id: {space_id}"
         )
-        mock_get_uid.assert_called_once_with(mock_db, database_id, space_id)
+        mock_get_meta.assert_called_once_with(mock_db, database_id)
 
 
 @pytest.mark.asyncio
@@ -471,9 +505,10 @@ async def test_check_space_id_and_get_uid_not_found() -> None:
     mock_meter.in_error_count = MagicMock()
 
     with patch(
-        "memory.database.api.v1.common.get_uid_by_did_space_id", new_callable=AsyncMock
-    ) as mock_get_uid:
-        mock_get_uid.return_value = None
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.return_value = None
 
         result, error = await check_space_id_and_get_uid(
             mock_db, database_id, space_id, mock_span_context, mock_meter
@@ -523,9 +558,10 @@ async def test_check_space_id_and_get_uid_edge_cases() -> None:
     mock_meter.in_error_count = MagicMock()
 
     with patch(
-        "memory.database.api.v1.common.get_uid_by_did_space_id", new_callable=AsyncMock
-    ) as mock_get_uid:
-        mock_get_uid.return_value = None
+        "memory.database.api.v1.common.get_database_meta_by_did",
+        new_callable=AsyncMock,
+    ) as mock_get_meta:
+        mock_get_meta.return_value = None
 
         result, error = await check_space_id_and_get_uid(
             mock_db, database_id, space_id, mock_span_context, mock_meter
@@ -539,4 +575,56 @@ async def test_check_space_id_and_get_uid_edge_cases() -> None:
         mock_span_context.add_info_event.assert_called_once_with(
             f"space_id: {space_id}"
         )
-        mock_get_uid.assert_called_once_with(mock_db, database_id, space_id)
+        mock_get_meta.assert_called_once_with(mock_db, database_id)
+
+
+@pytest.mark.asyncio
+async def test_get_database_meta_by_did_cache() -> None:
+    """Test database metadata is cached until invalidated, missing ones never."""
+    get_database_meta_cache().clear()
+    mock_result = MagicMock()
+    mock_result.all.return_value = [
+        ("test_user", "space123", "prod_test_user_1"),
+        ("test_user", "space123", "test_test_user_1"),
+    ]
+    mock_db = AsyncMock(spec=AsyncSession)
+    mock_db.execute.return_value = mock_result
+
+    expected = DatabaseMetaEntry(
+        uid="test_user",
+        space_id="space123",
+        schemas=("prod_test_user_1", "test_test_user_1"),
+    )
+    assert await get_database_meta_by_did(mock_db, 1) == expected
+    assert await get_database_meta_by_did(mock_db, 1) == expected
+    assert mock_db.execute.call_count == 1
+
+    invalidate_database_meta(1)
+    assert await get_database_meta_by_did(mock_db, 1) == expected
+    assert mock_db.execute.call_count == 2
+
+    mock_result.all.return_value = []
+    assert await get_database_meta_by_did(mock_db, 2) is None
+    assert await get_database_meta_by_did(mock_db, 2) is None
+    assert mock_db.execute.call_count == 4
+    get_database_meta_cache().clear()
+
+
+@pytest.mark.asyncio
+async def test_get_database_meta_by_did_invalidated_while_loading() -> None:
+    """Test metadata read while a database is dropped is not cached."""
+    get_database_meta_cache().clear()
+    mock_result = MagicMock()
+    mock_result.all.return_value = [("test_user", "", "prod_test_user_1")]
+
+    async def drop_while_loading(*args: Any, **kwargs: Any) -> Any:
+        invalidate_database_meta(1)
+        return mock_result
+
+    mock_db = AsyncMock(spec=AsyncSession)
+    mock_db.execute.side_effect = drop_while_loading
+
+    assert await get_database_meta_by_did(mock_db, 1) is not None
+    assert await get_database_meta_by_did(mock_db, 1) is not None
+    assert mock_db.execute.call_count == 2
+    get_database_meta_cache().clear()
@@ -15,7 +15,9 @@ from memory.database.api.schemas.modify_db_desc_types import ModifyDBDescInput
 from memory.database.api.v1.common import check_database_exists_by_did_uid
 from memory.database.domain.entity.database_meta import (
     del_database_meta_by_did, get_id_by_did_uid, get_uid_by_did_space_id,
-    get_uid_by_space_id, update_database_meta_by_did_uid)
+    get_uid_by_space_id, invalidate_database_meta,
+    update_database_meta_by_did_uid)
+from memory.database.domain.entity.schema import invalidate_table_names
 from memory.database.domain.entity.schema_meta import (del_schema_meta_by_did,
                                                        get_schema_name_by_did)
 from memory.database.domain.entity.views.http_resp import format_response
@@ -234,6 +236,7 @@ async def exec_generate_schema(
         db.add(prod_schema_info)
         db.add(dev_schema_info)
         await db.commit()
+        invalidate_database_meta(database_id)
         return DatabaseInfo(
             database_id=database_id, prod_schema=prod_schema, test_schema=dev_schema
         )
@@ -369,6 +372,9 @@ async def drop_db(
             for schema in schema_list:
                 await db.exec(text(f'DROP SCHEMA IF EXISTS "{schema[0]}" CASCADE;'))  # type: ignore[call-overload]
             await db.commit()
+            for schema in schema_list:
+                invalidate_table_names(schema[0])
+            invalidate_database_meta(database_id)
             m.in_success_count(lables={"uid": uid})
             return format_response(  # type: ignore[no-any-return]
                 CodeEnum.Successes.code,
@@ -460,6 +466,7 @@ async def modify_db_description(
                 db, database_id=database_id, uid=uid, description=description
             )
             await db.commit()
+            invalidate_database_meta(database_id)
             m.in_success_count(lables={"uid": uid})
             return format_response(  # type: ignore[no-any-return]
                 CodeEnum.Successes.code,
@@ -82,6 +82,10 @@ async def test_clone_db_success() -> None:
 
     mock_execute_result = MagicMock()
     mock_execute_result.first.return_value = ("u1", "old_db_name", "old_db_desc")
+    mock_execute_result.all.return_value = [
+        ("u1", "", "prod_schema"),
+        ("u1", "", "test_schema"),
+    ]
     mock_db.execute = AsyncMock(return_value=mock_execute_result)
 
     test_input = CloneDBInput(uid="u1", database_id=1, new_database_name="db2")
@@ -13,7 +13,8 @@ from memory.database.api.schemas.exec_ddl_types import ExecDDLInput
 from memory.database.api.v1.common import (check_database_exists_by_did_uid,
                                            check_space_id_and_get_uid)
 from memory.database.domain.entity.general import exec_sql_statement
-from memory.database.domain.entity.schema import set_search_path_by_schema
+from memory.database.domain.entity.schema import (invalidate_table_names,
+                                                  set_search_path_by_schema)
 from memory.database.domain.entity.views.http_resp import format_response
 from memory.database.exceptions.error_code import CodeEnum
 from memory.database.repository.middleware.getters import get_session
@@ -172,6 +173,8 @@ async def exec_ddl(
         try:
             await _execute_ddl_statements(db, schema_list, ddls, span_context)  # type: ignore[arg-type]
             await db.commit()
+            for schema in schema_list:  # type: ignore[union-attr]
+                invalidate_table_names(schema[0])
             m.in_success_count(lables={"uid": uid})
             return format_response(  # type: ignore[no-any-return]
                 CodeEnum.Successes.code,
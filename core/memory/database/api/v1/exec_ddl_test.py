@@ -8,6 +8,7 @@ from memory.database.api.schemas.exec_ddl_types import ExecDDLInput
 from memory.database.api.v1.exec_ddl import (_ddl_split, _reset_uid, exec_ddl,
                                              is_ddl_allowed)
 from memory.database.exceptions.error_code import CodeEnum
+from memory.database.utils.dml_cache import get_table_names_cache
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 
@@ -196,3 +197,60 @@ async def test_exec_ddl_success() -> None:
                                 assert (
                                     response_body["message"] == CodeEnum.Successes.msg
                                 )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ddl_fails", [False, True])
+async def test_exec_ddl_invalidates_table_names_after_commit(ddl_fails: bool) -> None:
+    """Test exec_ddl drops the cached table names only once the DDL is committed."""
+    cache = get_table_names_cache()
+    cache.clear()
+    cache.set("prod_u1_1001", frozenset({"users"}))
+    cache.set("test_u1_1001", frozenset({"users"}))
+    cache.set("prod_u2_1002", frozenset({"orders"}))
+
+    mock_db = AsyncMock(spec=AsyncSession)
+    cached_at_commit = []
+    mock_db.commit = AsyncMock(
+        side_effect=lambda: cached_at_commit.append(cache.get("prod_u1_1001"))
+    )
+    test_input = ExecDDLInput(
+        uid="u1", database_id=1001, ddl="CREATE TABLE orders (id INT);", space_id=""
+    )
+    fake_span_context = MagicMock()
+    fake_span_context.sid = "exec-ddl-sid-123"
+    mock_span_instance = MagicMock()
+    mock_span_instance.start.return_value.__enter__.return_value = fake_span_context
+
+    with patch(
+        "memory.database.api.v1.exec_ddl.get_otlp_metric_service"
+    ) as mock_metric_service_func, patch(
+        "memory.database.api.v1.exec_ddl.get_otlp_span_service"
+    ) as mock_span_service_func, patch(
+        "memory.database.api.v1.exec_ddl.check_database_exists_by_did_uid",
+        new_callable=AsyncMock,
+        return_value=([("prod_u1_1001",), ("test_u1_1001",)], None),
+    ), patch(
+        "memory.database.api.v1.exec_ddl.set_search_path_by_schema",
+        new_callable=AsyncMock,
+    ), patch(
+        "memory.database.api.v1.exec_ddl.exec_sql_statement",
+        new_callable=AsyncMock,
+        side_effect=Exception("syntax error") if ddl_fails else None,
+    ):
+        mock_metric_service_func.return_value.get_meter.return_value = (
+            lambda func: MagicMock()
+        )
+        mock_span_service_func.return_value.get_span.return_value = (
+            lambda uid: mock_span_instance
+        )
+        await exec_ddl(test_input, mock_db)
+
+    if ddl_fails:
+        mock_db.commit.assert_not_awaited()
+        assert cache.get("prod_u1_1001") == frozenset({"users"})
+    else:
+        assert cached_at_commit == [frozenset({"users"})]
+        assert cache.get("prod_u1_1001") is None
+        assert cache.get("test_u1_1001") is None
+    assert cache.get("prod_u2_1002") == frozenset({"orders"})
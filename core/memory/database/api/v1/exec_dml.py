@@ -2,25 +2,38 @@
 
 import datetime
 import decimal
+import itertools
+import json
 import re
 import time
 import uuid
-from typing import Any, List
+from typing import (Any, Callable, Iterator, List, Optional, Sequence, Tuple,
+                    Union)
 
 import sqlparse
 from common.otlp.trace.span import Span
 from common.service import get_otlp_metric_service, get_otlp_span_service
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from memory.database.api.schemas.exec_dml_types import ExecDMLInput
 from memory.database.api.v1.common import (check_database_exists_by_did,
                                            check_space_id_and_get_uid)
-from memory.database.domain.entity.general import (exec_sql_statement,
-                                                   parse_and_exec_sql)
-from memory.database.domain.entity.schema import set_search_path_by_schema
+from memory.database.domain.entity.general import exec_sql_statement
+from memory.database.domain.entity.schema import (get_table_names_by_schema,
+                                                  set_search_path_by_schema)
 from memory.database.domain.entity.views.http_resp import format_response
 from memory.database.exceptions.e import CustomException
 from memory.database.exceptions.error_code import CodeEnum
 from memory.database.repository.middleware.getters import get_session
+from memory.database.utils.dml_cache import (APP_ID_MARKER, ROW_ID_MARKER,
+                                             UID_MARKER, DMLTemplate,
+                                             NormalizedDML, fill_literals,
+                                             get_dml_template_cache,
+                                             normalize_dml,
+                                             render_dml_template)
+from memory.database.utils.dml_page import (InvalidCursorError, decode_cursor,
+                                            encode_cursor, get_page_keys,
+                                            get_page_size, paginate_select)
 from memory.database.utils.snowfake import get_id
 from sqlglot import exp, parse_one
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -29,6 +42,10 @@ from starlette.responses import JSONResponse
 exec_dml_router = APIRouter(tags=["EXEC_DML"])
 
 INSERT_EXTRA_COLUMNS = ["id", "uid", "create_time", "update_time"]
+# Limit added to SELECT statements without one
+DML_SELECT_LIMIT = 100
+# Number of rows of a page encoded per chunk of the response
+DML_PAGE_ENCODE_ROWS = 100
 
 
 def rewrite_dml_with_uid_and_limit(
@@ -53,9 +70,133 @@ def rewrite_dml_with_uid_and_limit(
     Returns:
         tuple: (rewritten_sql, insert_ids)
     """
+    template, normalized = get_dml_template(dml, limit_num)
+    if template.sql is None:
+        parsed = parse_one(dml)
+        insert_ids: List[int] = []
+        _rewrite_dml_expression(parsed, app_id, uid, limit_num, insert_ids)
+        return parsed.sql(dialect="postgres"), insert_ids
+
+    insert_ids = [get_id() for _ in range(template.insert_rows)]
+    rewritten = render_dml_template(
+        template.sql, normalized.literals, app_id, uid, insert_ids
+    )
+    return rewritten, insert_ids
+
+
+def rewrite_select_page(
+    dml: str, app_id: str, uid: str, page_size: int, cursor: Optional[str]
+) -> Tuple[str, int]:
+    """
+    Rewrite a SELECT to get one page of its rows.
+
+    The rows are sorted by the ORDER BY columns of the statement followed by
+    the id column, and start after the sort key encoded in the cursor. One row
+    more than the page size is selected to know if there is a next page.
+
+    Args:
+        dml: SELECT statement
+        app_id: Application ID
+        uid: User ID
+        page_size: Number of rows of the page
+        cursor: Cursor returned with the previous page, None for the first page
+
+    Returns:
+        tuple: (rewritten_sql, number of sort key columns added to the rows)
+
+    Raises:
+        InvalidCursorError: If the cursor was not returned for this statement
+        ValueError: If the statement cannot be paginated
+    """
+    parsed = parse_one(dml)
+    if not isinstance(parsed, exp.Select):
+        raise ValueError("Pagination only supports SELECT statements")
+    keys = get_page_keys(parsed)
+    after = decode_cursor(dml, cursor, len(keys)) if cursor else None
+    _rewrite_dml_expression(parsed, app_id, uid, page_size + 1, [])
+    paginate_select(parsed, keys, after)
+    return parsed.sql(dialect="postgres"), len(keys)
+
+
+def get_dml_template(dml: str, limit_num: int) -> Tuple[DMLTemplate, NormalizedDML]:
+    """
+    Get the table names and rewritten SQL template of a DML statement.
+
+    Statements differing only in their literal values share a template, which
+    is built by parsing the statement once with its literals replaced by
+    markers. The template is only used if filling in the literals gives the
+    same SQL as rewriting the statement itself.
+
+    Args:
+        dml: DML statement
+        limit_num: Limit number for SELECT queries
+
+    Returns:
+        tuple: (template, normalized statement)
+
+    Raises:
+        sqlglot.errors.SqlglotError: If the statement cannot be parsed
+    """
+    normalized = normalize_dml(dml)
+    cache = get_dml_template_cache()
+    key = (limit_num, normalized.key)
+    template = cache.get(key)
+    if template is None:
+        template = _build_dml_template(dml, normalized, limit_num)
+        cache.set(key, template)
+    return template, normalized
+
+
+def _build_dml_template(
+    dml: str, normalized: NormalizedDML, limit_num: int
+) -> DMLTemplate:
+    """Parse a statement and build its rewritten SQL template."""
     parsed = parse_one(dml)
-    insert_ids: List[int] = []
+    tables = frozenset(table.name for table in parsed.find_all(exp.Table))
+    row_markers: List[Any] = []
+    row_counter = itertools.count()
+    _rewrite_dml_expression(
+        parsed,
+        APP_ID_MARKER,
+        UID_MARKER,
+        limit_num,
+        row_markers,
+        row_id_factory=lambda: ROW_ID_MARKER.format(next(row_counter)),
+    )
 
+    template_sql = None
+    if not normalized.has_markers:
+        try:
+            marked = parse_one(normalized.marked_sql)
+            marked_counter = itertools.count()
+            _rewrite_dml_expression(
+                marked,
+                APP_ID_MARKER,
+                UID_MARKER,
+                limit_num,
+                [],
+                row_id_factory=lambda: ROW_ID_MARKER.format(next(marked_counter)),
+            )
+            candidate = marked.sql(dialect="postgres")
+            if fill_literals(candidate, normalized.literals) == parsed.sql(
+                dialect="postgres"
+            ):
+                template_sql = candidate
+        except Exception:  # pylint: disable=broad-except
+            template_sql = None
+
+    return DMLTemplate(tables=tables, sql=template_sql, insert_rows=len(row_markers))
+
+
+def _rewrite_dml_expression(
+    parsed: Any,
+    app_id: str,
+    uid: str,
+    limit_num: int,
+    insert_ids: List[Any],
+    row_id_factory: Optional[Callable[[], Any]] = None,
+) -> None:
+    """Add UID conditions, limit and inserted row parameters to a parsed DML."""
     tables = [table.alias_or_name for table in parsed.find_all(exp.Table)]
 
     if isinstance(parsed, (exp.Update, exp.Delete, exp.Select)):
@@ -67,9 +208,7 @@ def rewrite_dml_with_uid_and_limit(
             parsed.set("limit", exp.Limit(expression=exp.Literal.number(limit_num)))
 
     if isinstance(parsed, exp.Insert):
-        _dml_insert_add_params(parsed, insert_ids, app_id, uid)
-
-    return parsed.sql(dialect="postgres"), insert_ids
+        _dml_insert_add_params(parsed, insert_ids, app_id, uid, row_id_factory)
 
 
 def _dml_add_where(parsed: Any, tables: List[str], app_id: str, uid: str) -> None:
@@ -102,7 +241,11 @@ def _dml_add_where(parsed: Any, tables: List[str], app_id: str, uid: str) -> Non
 
 
 def _dml_insert_add_params(
-    parsed: Any, insert_ids: List[int], app_id: str, uid: str
+    parsed: Any,
+    insert_ids: List[Any],
+    app_id: str,
+    uid: str,
+    row_id_factory: Optional[Callable[[], Any]] = None,
 ) -> None:
     """Add parameters to INSERT statements."""
     existing_columns = parsed.args["this"].expressions or []
@@ -126,7 +269,7 @@ def _dml_insert_add_params(
         existing_columns.append(exp.to_identifier(name))
 
     for i, row in enumerate(rows):
-        row_id = get_id()
+        row_id = row_id_factory() if row_id_factory else get_id()
         insert_ids.append(row_id)
         extra_values = [
             exp.Literal.number(row_id),
@@ -206,7 +349,7 @@ async def _process_dml_statements(
             dml=statement,
             app_id=app_id,
             uid=uid,
-            limit_num=100,
+            limit_num=DML_SELECT_LIMIT,
             env=env,
             span_context=span_context,
         )
@@ -220,10 +363,10 @@ async def _process_dml_statements(
     return rewrite_dmls
 
 
-@exec_dml_router.post("/exec_dml", response_class=JSONResponse)
+@exec_dml_router.post("/exec_dml", response_class=JSONResponse, response_model=None)
 async def exec_dml(
     dml_input: ExecDMLInput, db: AsyncSession = Depends(get_session)
-) -> JSONResponse:
+) -> Union[JSONResponse, StreamingResponse]:
     """
     Execute DML statements on specified database.
 
@@ -232,7 +375,8 @@ async def exec_dml(
         db: Database session
 
     Returns:
-        JSONResponse: Result of DML execution
+        JSONResponse: Result of DML execution, streamed page of the rows of
+            a SELECT when a page size or cursor is given
     """
     uid = dml_input.uid
     database_id = dml_input.database_id
@@ -265,6 +409,11 @@ async def exec_dml(
             if error_split:
                 return error_split  # type: ignore[no-any-return]
 
+            if dml_input.page_size is not None or dml_input.cursor:
+                return await _exec_dml_page(
+                    db, dmls, dml_input, app_id, uid, span_context, m
+                )
+
             rewrite_dmls = await _process_dml_statements(
                 dmls, app_id, uid, env, span_context
             )
@@ -356,6 +505,128 @@ async def _exec_dml_sql(
         )
 
 
+async def _exec_dml_page(
+    db: Any,
+    dmls: List[str],
+    dml_input: Any,
+    app_id: str,
+    uid: str,
+    span_context: Any,
+    m: Any,
+) -> Any:
+    """Execute one page of a SELECT statement and stream it."""
+    if len(dmls) != 1:
+        span_context.add_error_event("Pagination of multiple statements")
+        m.in_error_count(
+            CodeEnum.DMLNotAllowed.code, lables={"uid": uid}, span=span_context
+        )
+        return format_response(
+            code=CodeEnum.DMLNotAllowed.code,
+            message="Pagination only supports a single SELECT statement",
+            sid=span_context.sid,
+        )
+
+    page_size = get_page_size(dml_input.page_size, DML_SELECT_LIMIT)
+    try:
+        page_dml, key_count = rewrite_select_page(
+            dmls[0], app_id, uid, page_size, dml_input.cursor
+        )
+    except InvalidCursorError as cursor_error:
+        span_context.record_exception(cursor_error)
+        m.in_error_count(
+            CodeEnum.ParamError.code, lables={"uid": uid}, span=span_context
+        )
+        return format_response(
+            code=CodeEnum.ParamError.code,
+            message=str(cursor_error),
+            sid=span_context.sid,
+        )
+    except ValueError as page_error:
+        span_context.record_exception(page_error)
+        m.in_error_count(
+            CodeEnum.DMLNotAllowed.code, lables={"uid": uid}, span=span_context
+        )
+        return format_response(
+            code=CodeEnum.DMLNotAllowed.code,
+            message=str(page_error),
+            sid=span_context.sid,
+        )
+    span_context.add_info_event(f"rewrite dml: {page_dml}")
+
+    start_time = time.time()
+    try:
+        result = await exec_sql_statement(db, page_dml)
+        columns = list(result.keys())[:-key_count]
+        rows = result.fetchall()
+    except Exception as exec_error:  # pylint: disable=broad-except
+        span_context.record_exception(exec_error)
+        await db.rollback()
+        m.in_error_count(
+            CodeEnum.DatabaseExecutionError.code, lables={"uid": uid}, span=span_context
+        )
+        return format_response(
+            code=CodeEnum.DatabaseExecutionError.code,
+            message="Database execution failed",
+            sid=span_context.sid,
+        )
+    exec_time = time.time() - start_time
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(dmls[0], rows[-1][-key_count:])
+    span_context.add_info_event(f"page rows: {len(rows)}, next cursor: {next_cursor}")
+    m.in_success_count(lables={"uid": uid})
+    return StreamingResponse(
+        stream_page(columns, rows, exec_time, next_cursor, span_context.sid),
+        media_type="application/json",
+    )
+
+
+def stream_page(
+    columns: List[str],
+    rows: Sequence[Sequence[Any]],
+    exec_time: float,
+    next_cursor: Optional[str],
+    sid: Optional[str],
+    chunk_rows: int = DML_PAGE_ENCODE_ROWS,
+) -> Iterator[bytes]:
+    """
+    Encode a page of rows as the JSON body of an exec_dml response.
+
+    Rows are converted and encoded a chunk at a time while the response is
+    sent, instead of building the list of row dicts and the whole body first.
+    The generator is synchronous, so the encoding runs on the threadpool of
+    the response instead of the event loop.
+
+    Args:
+        columns: Column names of the rows
+        rows: Rows of the page, followed by their sort key columns
+        exec_time: Execution time of the query in seconds
+        next_cursor: Cursor of the next page, None on the last page
+        sid: Session identifier
+        chunk_rows: Number of rows encoded per chunk
+
+    Yields:
+        bytes: Chunk of the response body
+    """
+
+    def dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+    head = {"code": CodeEnum.Successes.code, "message": CodeEnum.Successes.msg}
+    yield f'{dumps(head)[:-1]},"data":{{"exec_success":['.encode("utf-8")
+    for start in range(0, len(rows), chunk_rows):
+        encoded = ",".join(
+            dumps(to_jsonable(dict(zip(columns, row))))
+            for row in rows[start : start + chunk_rows]
+        )
+        yield (f",{encoded}" if start else encoded).encode("utf-8")
+    tail = {"exec_failure": [], "exec_time": exec_time, "next_cursor": next_cursor}
+    sid_field = f',"sid":{dumps(sid)}' if sid else ""
+    yield f"],{dumps(tail)[1:]}{sid_field}}}".encode("utf-8")
+
+
 async def _set_search_path(
     db: Any, schema_list: List[Any], env: str, uid: str, span_context: Any, m: Any
 ) -> Any:
@@ -398,8 +669,8 @@ async def _dml_split(
 
     for statement in dmls:
         try:
-            parsed = parse_one(statement)
-            tables = {table.name for table in parsed.find_all(exp.Table)}
+            template, _ = get_dml_template(statement, DML_SELECT_LIMIT)
+            tables = template.tables
         except Exception as parse_error:  # pylint: disable=broad-except
             span_context.record_exception(parse_error)
             m.in_error_count(
@@ -413,13 +684,12 @@ async def _dml_split(
                 sid=span_context.sid,
             )
 
-        result = await parse_and_exec_sql(
-            db,
-            "SELECT tablename FROM pg_tables WHERE schemaname = :schema",
-            {"schema": schema},
-        )
-        valid_tables = {row[0] for row in result.fetchall()}
-        not_found = tables - valid_tables
+        not_found = tables - await get_table_names_by_schema(db, schema)
+        if not_found:
+            # Tables created by other processes are missing from their cache
+            not_found = tables - await get_table_names_by_schema(
+                db, schema, refresh=True
+            )
 
         if not_found:
             span_context.add_error_event(
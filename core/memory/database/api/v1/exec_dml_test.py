@@ -11,10 +11,18 @@ import pytest
 from memory.database.api.schemas.exec_dml_types import ExecDMLInput
 from memory.database.api.v1.exec_dml import (_dml_add_where,
                                              _dml_insert_add_params,
-                                             _dml_split, _exec_dml_sql,
-                                             _set_search_path, exec_dml,
+                                             _dml_split, _exec_dml_page,
+                                             _exec_dml_sql, _set_search_path,
+                                             exec_dml,
                                              rewrite_dml_with_uid_and_limit,
+                                             rewrite_select_page, stream_page,
                                              to_jsonable)
+from memory.database.domain.entity.schema import invalidate_table_names
+from memory.database.exceptions.error_code import CodeEnum
+from memory.database.utils.dml_cache import (get_dml_template_cache,
+                                             get_normalized_dml_cache,
+                                             get_table_names_cache)
+from memory.database.utils.dml_page import InvalidCursorError, encode_cursor
 from sqlglot import parse_one
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -45,6 +53,113 @@ def test_rewrite_dml_with_uid_and_limit() -> None:
     assert insert_ids == []
 
 
+def test_rewrite_dml_reuses_template() -> None:
+    """Test statements differing in literals are parsed once."""
+    get_normalized_dml_cache().clear()
+    get_dml_template_cache().clear()
+    span_context = MagicMock()
+
+    with patch(
+        "memory.database.api.v1.exec_dml.parse_one", wraps=parse_one
+    ) as mock_parse_one:
+        first_sql, _ = rewrite_dml_with_uid_and_limit(
+            dml="SELECT name FROM users WHERE age > 18 AND city = 'Hefei'",
+            app_id="app123",
+            uid="user456",
+            limit_num=100,
+            env="prod",
+            span_context=span_context,
+        )
+        parse_count = mock_parse_one.call_count
+        second_sql, _ = rewrite_dml_with_uid_and_limit(
+            dml="SELECT name FROM users WHERE age > 30 AND city = 'it''s'",
+            app_id="app123",
+            uid="user789",
+            limit_num=100,
+            env="prod",
+            span_context=span_context,
+        )
+
+    assert mock_parse_one.call_count == parse_count
+    assert first_sql == (
+        "SELECT name FROM users WHERE (age > 18 AND city = 'Hefei') "
+        "AND users.uid IN ('user456', 'app123:user456') LIMIT 100"
+    )
+    assert second_sql == (
+        "SELECT name FROM users WHERE (age > 30 AND city = 'it''s') "
+        "AND users.uid IN ('user789', 'app123:user789') LIMIT 100"
+    )
+
+
+def test_rewrite_dml_insert_template() -> None:
+    """Test inserted rows get new IDs when the template is reused."""
+    get_normalized_dml_cache().clear()
+    get_dml_template_cache().clear()
+    span_context = MagicMock()
+    dml = "INSERT INTO users (name, age) VALUES ('{}', 1), ('b', 2)"
+
+    with patch(
+        "memory.database.api.v1.exec_dml.get_id", side_effect=[1, 2, 3, 4]
+    ):
+        first_sql, first_ids = rewrite_dml_with_uid_and_limit(
+            dml.format("a"), "app1", "u1", 100, "prod", span_context
+        )
+        second_sql, second_ids = rewrite_dml_with_uid_and_limit(
+            dml.format("c"), "app1", "u1", 100, "prod", span_context
+        )
+
+    assert first_ids == [1, 2]
+    assert second_ids == [3, 4]
+    assert first_sql == (
+        "INSERT INTO users (name, age, id, uid) "
+        "VALUES ('a', 1, 1, 'app1:u1'), ('b', 2, 2, 'app1:u1')"
+    )
+    assert second_sql == first_sql.replace("'a', 1, 1", "'c', 1, 3").replace(
+        "2, 2", "2, 4"
+    )
+
+
+@pytest.mark.asyncio
+async def test_dml_split_caches_table_names() -> None:
+    """Test table names are cached per schema and refreshed for unknown tables."""
+    get_table_names_cache().clear()
+    mock_db = AsyncMock(spec=AsyncSession)
+    table_names = [
+        [("users",)],
+        [("users",), ("orders",)],
+        [("users",)],
+        [("users",)],
+    ]
+    mock_db.execute = AsyncMock(
+        side_effect=[
+            MagicMock(fetchall=MagicMock(return_value=names))
+            for names in table_names
+        ]
+    )
+    split_args = {
+        "db": mock_db,
+        "schema": "prod_u1_1001",
+        "uid": "u1",
+        "span_context": MagicMock(sid="dml-split-sid"),
+        "m": MagicMock(),
+    }
+
+    _, error = await _dml_split(dml="SELECT * FROM users;", **split_args)
+    assert error is None
+    _, error = await _dml_split(dml="SELECT * FROM users;", **split_args)
+    assert error is None
+    assert mock_db.execute.call_count == 1
+
+    _, error = await _dml_split(dml="SELECT * FROM orders;", **split_args)
+    assert error is None
+    assert mock_db.execute.call_count == 2
+
+    invalidate_table_names("prod_u1_1001")
+    _, error = await _dml_split(dml="SELECT * FROM orders;", **split_args)
+    assert error is not None
+    assert mock_db.execute.call_count == 4
+
+
 def test_to_jsonable() -> None:
     """Test data type conversion for JSON serialization."""
     test_data = {
@@ -98,12 +213,11 @@ async def test_dml_split_success() -> None:
     mock_span_context = MagicMock()
     mock_meter = MagicMock()
 
-    mock_result = MagicMock()
-    mock_result.fetchall.return_value = [("users",)]
     with patch(
-        "memory.database.api.v1.exec_dml.parse_and_exec_sql", new_callable=AsyncMock
-    ) as mock_parse_exec:
-        mock_parse_exec.return_value = mock_result
+        "memory.database.api.v1.exec_dml.get_table_names_by_schema",
+        new_callable=AsyncMock,
+    ) as mock_get_tables:
+        mock_get_tables.return_value = frozenset({"users"})
 
         dmls, error = await _dml_split(
             dml="SELECT * FROM users;",
@@ -116,7 +230,7 @@ async def test_dml_split_success() -> None:
 
         assert error is None
         assert dmls == ["SELECT * FROM users;"]
-        mock_parse_exec.assert_called_once()
+        mock_get_tables.assert_called_once_with(mock_db, "prod_u1_1001")
         mock_span_context.add_info_event.assert_any_call(
             "Split DML statements: ['SELECT * FROM users;']"
         )
@@ -311,3 +425,127 @@ async def test_exec_dml_success() -> None:
                                         assert "message" in resp_body
                                         assert "sid" in resp_body
                                         assert "data" in resp_body
+
+
+def test_rewrite_select_page() -> None:
+    """Test SELECT pages are sorted by their keys and start after the cursor."""
+    dml = "SELECT name AS n, age FROM users WHERE age > 18 ORDER BY n DESC"
+
+    first_sql, key_count = rewrite_select_page(dml, "app123", "user456", 10, None)
+    assert key_count == 2
+    assert first_sql == (
+        "SELECT name AS n, age, users.name AS __page_key_0, "
+        "users.id AS __page_key_1 FROM users "
+        "WHERE (age > 18) AND users.uid IN ('user456', 'app123:user456') "
+        "ORDER BY users.name DESC NULLS LAST, users.id ASC LIMIT 11"
+    )
+
+    cursor = encode_cursor(dml, ["bob", 7])
+    next_sql, _ = rewrite_select_page(dml, "app123", "user456", 10, cursor)
+    assert (
+        "AND ((users.name < 'bob' OR users.name IS NULL) "
+        "OR (users.name = 'bob' AND (users.id > 7 OR users.id IS NULL)))"
+    ) in next_sql
+
+    with pytest.raises(InvalidCursorError):
+        rewrite_select_page(dml, "app123", "user456", 10, "not-a-cursor")
+    with pytest.raises(InvalidCursorError):
+        rewrite_select_page("SELECT * FROM users", "app123", "user456", 10, cursor)
+    with pytest.raises(ValueError):
+        rewrite_select_page(
+            "SELECT * FROM users LIMIT 5", "app123", "user456", 10, None
+        )
+    with pytest.raises(ValueError):
+        rewrite_select_page(
+            "SELECT age, count(*) FROM users GROUP BY age",
+            "app123",
+            "user456",
+            10,
+            None,
+        )
+
+
+def test_stream_page() -> None:
+    """Test a page is encoded as the body of an exec_dml response."""
+    rows = [
+        ("alice", datetime.date(2024, 1, 2), 1),
+        ("bob", None, 2),
+        ("合肥", datetime.date(2024, 1, 3), 3),
+    ]
+
+    body = b"".join(
+        stream_page(["name", "day"], rows, 0.5, "next", "dml-sid", chunk_rows=2)
+    )
+
+    assert json.loads(body) == {
+        "code": 0,
+        "message": "success",
+        "data": {
+            "exec_success": [
+                {"name": "alice", "day": "2024-01-02"},
+                {"name": "bob", "day": None},
+                {"name": "合肥", "day": "2024-01-03"},
+            ],
+            "exec_failure": [],
+            "exec_time": 0.5,
+            "next_cursor": "next",
+        },
+        "sid": "dml-sid",
+    }
+    assert json.loads(b"".join(stream_page(["name"], [], 0.1, None, None))) == {
+        "code": 0,
+        "message": "success",
+        "data": {
+            "exec_success": [],
+            "exec_failure": [],
+            "exec_time": 0.1,
+            "next_cursor": None,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_exec_dml_page() -> None:
+    """Test a paginated SELECT returns one page and the cursor of the next."""
+    mock_db = AsyncMock(spec=AsyncSession)
+    span_context = MagicMock()
+    span_context.sid = "page-sid"
+    meter = MagicMock()
+    dml = "SELECT name FROM users ORDER BY name"
+    dml_input = ExecDMLInput(
+        app_id="app789",
+        uid="u1",
+        database_id=1001,
+        dml=dml,
+        env="prod",
+        page_size=2,
+    )
+
+    result = MagicMock()
+    result.keys.return_value = ["name", "__page_key_0", "__page_key_1"]
+    result.fetchall.return_value = [
+        ("alice", "alice", 3),
+        ("bob", "bob", 1),
+        ("carol", "carol", 2),
+    ]
+    with patch(
+        "memory.database.api.v1.exec_dml.exec_sql_statement",
+        new_callable=AsyncMock,
+    ) as mock_exec_sql:
+        mock_exec_sql.return_value = result
+        response = await _exec_dml_page(
+            mock_db, [dml], dml_input, "app789", "u1", span_context, meter
+        )
+        assert "LIMIT 3" in mock_exec_sql.call_args[0][1]
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    data = json.loads(body)["data"]
+    assert data["exec_success"] == [{"name": "alice"}, {"name": "bob"}]
+    assert data["next_cursor"] == encode_cursor(dml, ["bob", 1])
+    meter.in_success_count.assert_called_once()
+
+    dml_input.cursor = "bad"
+    response = await _exec_dml_page(
+        mock_db, [dml], dml_input, "app789", "u1", span_context, meter
+    )
+    assert json.loads(response.body)["code"] == CodeEnum.ParamError.code
@@ -2,7 +2,9 @@
 
 import csv
 import io
-from typing import Any, Generator, Union
+import zlib
+from contextlib import aclosing
+from typing import AsyncIterator, List, Union
 
 from common.otlp.metrics.meter import Meter
 from common.otlp.trace.span import Span
@@ -20,6 +22,9 @@ from starlette.responses import JSONResponse
 
 export_data_router = APIRouter(tags=["EXPORT_DATA"])
 
+# Number of rows fetched from the server-side cursor and written per chunk
+EXPORT_FETCH_ROWS = 1000
+
 
 @export_data_router.post(
     "/export_data", response_class=JSONResponse, response_model=None
@@ -35,7 +40,8 @@ async def export_data(
         db: Database session
 
     Returns:
-        StreamingResponse: CSV file download response
+        StreamingResponse: CSV file download response, gzip compressed
+            when requested
     """
     app_id = export_input.app_id
     uid = export_input.uid
@@ -63,27 +69,18 @@ async def export_data(
             }
             span_context.add_info_events(need_check)
 
-            rows, columns, error_response = await _set_search_path_and_exec(
+            schema, columns, error_response = await _set_search_path_and_exec(
                 db, database_id, table_name, env, uid, span_context, m
             )
             if error_response:
                 return error_response  # type: ignore[no-any-return]
 
-            def generate_csv() -> Generator[str, None, None]:
-                """Generate CSV data from query results."""
-                stream = io.StringIO()
-                writer = csv.writer(stream)
-                writer.writerow(columns)
-                for row in rows:
-                    writer.writerow([str(v) if v is not None else "" for v in row])
-                stream.seek(0)
-                yield stream.read()
-
-            filename = f"{table_name}_export.csv"
+            compress = export_input.compression == "gzip"
+            filename = f"{table_name}_export.csv" + (".gz" if compress else "")
             m.in_success_count(lables={"uid": uid})
             return StreamingResponse(
-                generate_csv(),
-                media_type="text/csv",
+                stream_csv(schema, table_name, uid, columns, compress),
+                media_type="application/gzip" if compress else "text/csv",
                 headers={"Content-Disposition": f"attachment; filename={filename}"},
             )
         except CustomException as custom_error:
@@ -105,6 +102,62 @@ async def export_data(
             )
 
 
+async def stream_csv(
+    schema: str,
+    table_name: str,
+    uid: str,
+    columns: List[str],
+    compress: bool = False,
+    fetch_size: int = EXPORT_FETCH_ROWS,
+) -> AsyncIterator[bytes]:
+    """
+    Stream the rows of a user table as CSV chunks.
+
+    Rows are read through a server-side cursor on a session owned by the
+    stream, since the request session is closed before the response body is
+    sent, and each batch of fetched rows is written as one chunk. Memory use
+    is bounded by the batch size whatever the size of the table.
+
+    Args:
+        schema: Schema of the user database
+        table_name: Table name to export
+        uid: User ID
+        columns: Column names written as the header
+        compress: Whether to gzip the chunks
+        fetch_size: Number of rows fetched and written per chunk
+
+    Yields:
+        bytes: CSV chunk, gzip compressed if requested
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    stream = io.StringIO()
+    writer = csv.writer(stream)
+
+    def encode(final: bool = False) -> bytes:
+        chunk = stream.getvalue().encode("utf-8")
+        stream.seek(0)
+        stream.truncate()
+        if compressor is None:
+            return chunk
+        return compressor.compress(chunk) + (compressor.flush() if final else b"")
+
+    writer.writerow(columns)
+    async with aclosing(get_session()) as sessions:
+        async for session in sessions:
+            await session.execute(text(f'SET search_path TO "{schema}"'))  # type: ignore[call-overload]
+            result = await session.stream(
+                text(f'SELECT * FROM "{table_name}" WHERE uid = :uid'),
+                {"uid": uid},
+            )
+            async for rows in result.partitions(fetch_size):
+                for row in rows:
+                    writer.writerow([str(v) if v is not None else "" for v in row])
+                chunk = encode()
+                if chunk:
+                    yield chunk
+    yield encode(final=True)
+
+
 async def _set_search_path_and_exec(
     db: AsyncSession,
     database_id: int,
@@ -115,7 +168,10 @@ async def _set_search_path_and_exec(
     m: Meter,
 ) -> tuple:
     """
-    Set search path and execute query to fetch data.
+    Set search path and check the table to export.
+
+    The table is queried without fetching rows, rows are streamed by
+    stream_csv once the response starts.
 
     Args:
         db: Database session
@@ -127,7 +183,7 @@ async def _set_search_path_and_exec(
         m: Meter for metrics
 
     Returns:
-        tuple: (rows, columns, error_response)
+        tuple: (schema, columns, error_response)
     """
     schema = f"{env}_{uid}_{database_id}"
     span_context.add_info_event(f"schema: {schema}")
@@ -151,10 +207,10 @@ async def _set_search_path_and_exec(
 
     try:
         result = await db.execute(  # type: ignore[call-overload]
-            text(f'SELECT * FROM "{table_name}" WHERE uid = :uid'), {"uid": uid}
+            text(f'SELECT * FROM "{table_name}" WHERE uid = :uid LIMIT 0'),
+            {"uid": uid},
         )
-        rows = result.fetchall()
-        columns = result.keys()
+        columns = list(result.keys())
     except Exception as query_error:  # pylint: disable=broad-except
         span_context.record_exception(query_error)
         m.in_error_count(
@@ -172,7 +228,4 @@ async def _set_search_path_and_exec(
             ),
         )
 
-    if not rows:
-        span_context.add_info_event(f"No data in {schema}.{table_name} table")
-
-    return rows, columns, None
+    return schema, columns, None
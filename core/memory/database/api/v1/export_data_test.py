@@ -1,12 +1,13 @@
 """Unit tests for data export functionality."""
 
+import gzip
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.responses import StreamingResponse
 from memory.database.api.schemas.export_data_types import ExportDataInput
 from memory.database.api.v1.export_data import (_set_search_path_and_exec,
-                                                export_data)
+                                                export_data, stream_csv)
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 
@@ -21,10 +22,6 @@ async def test_set_search_path_and_exec_success() -> None:
         if "SET search_path" in str(sql):
             return None
         mock_result = MagicMock()
-        mock_result.fetchall.return_value = [
-            (1, "u1", "test_data"),
-            (2, "u1", "demo_data"),
-        ]
         mock_result.keys.return_value = ["id", "uid", "content"]
         return mock_result
 
@@ -43,7 +40,7 @@ async def test_set_search_path_and_exec_success() -> None:
     mock_meter = MagicMock()
     mock_meter.in_error_count = MagicMock()
 
-    rows, columns, error_resp = await _set_search_path_and_exec(
+    schema, columns, error_resp = await _set_search_path_and_exec(
         db=mock_db,
         database_id=database_id,
         table_name=table_name,
@@ -54,8 +51,7 @@ async def test_set_search_path_and_exec_success() -> None:
     )
 
     assert error_resp is None
-    assert len(rows) == 2
-    assert rows == [(1, "u1", "test_data"), (2, "u1", "demo_data")]
+    assert schema == expected_schema
     assert columns == ["id", "uid", "content"]
 
     assert len(executed_calls) == 2
@@ -67,7 +63,7 @@ async def test_set_search_path_and_exec_success() -> None:
     assert set_call_params is None or set_call_params == {}
 
     expected_select_table = f'FROM "{table_name}"'
-    expected_select_where = "uid = :uid"
+    expected_select_where = "uid = :uid LIMIT 0"
     assert expected_select_table in select_call_sql
     assert expected_select_where in select_call_sql
     assert select_call_params == {"uid": uid}
@@ -104,11 +100,7 @@ async def test_export_data_success() -> None:
     mock_meter_instance.in_error_count = MagicMock()
 
     mock_set_exec = AsyncMock()
-    mock_set_exec.return_value = (
-        [(1, "u1", "test_data"), (2, "u1", "demo_data")],
-        ["id", "uid", "content"],
-        None,
-    )
+    mock_set_exec.return_value = ("prod_u1_2001", ["id", "uid", "content"], None)
 
     with patch(
         "memory.database.api.v1.export_data.get_otlp_metric_service"
@@ -168,3 +160,70 @@ async def test_export_data_success() -> None:
                 mock_meter_instance.in_success_count.assert_called_once_with(
                     lables={"uid": test_input.uid}
                 )
+
+
+class _FakeStreamResult:
+    """Streamed result returning rows in partitions of the requested size."""
+
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.partition_sizes: list = []
+
+    async def partitions(self, size: int):  # type: ignore[no-untyped-def]
+        self.partition_sizes.append(size)
+        for i in range(0, len(self.rows), size):
+            yield self.rows[i : i + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compress", [False, True])
+async def test_stream_csv(compress: bool) -> None:
+    """Test stream_csv function (rows streamed in chunks)."""
+    rows = [(i, "u1", None if i == 2 else f"data,{i}") for i in range(5)]
+    stream_result = _FakeStreamResult(rows)
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.stream = AsyncMock(return_value=stream_result)
+    closed = []
+
+    async def fake_get_session():  # type: ignore[no-untyped-def]
+        try:
+            yield mock_session
+        finally:
+            closed.append(True)
+
+    with patch(
+        "memory.database.api.v1.export_data.get_session", new=fake_get_session
+    ):
+        chunks = [
+            chunk
+            async for chunk in stream_csv(
+                "prod_u1_2001",
+                "user_data",
+                "u1",
+                ["id", "uid", "content"],
+                compress=compress,
+                fetch_size=2,
+            )
+        ]
+
+    body = b"".join(chunks)
+    if compress:
+        body = gzip.decompress(body)
+    else:
+        assert len(chunks) == 4
+    assert body.decode("utf-8").splitlines() == [
+        "id,uid,content",
+        '0,u1,"data,0"',
+        '1,u1,"data,1"',
+        "2,u1,",
+        '3,u1,"data,3"',
+        '4,u1,"data,4"',
+    ]
+    assert stream_result.partition_sizes == [2]
+    assert 'SET search_path TO "prod_u1_2001"' in str(
+        mock_session.execute.call_args[0][0]
+    )
+    stream_args = mock_session.stream.call_args[0]
+    assert 'FROM "user_data" WHERE uid = :uid' in str(stream_args[0])
+    assert stream_args[1] == {"uid": "u1"}
+    assert closed == [True]
@@ -1,8 +1,15 @@
 """API endpoints for uploading data to database tables."""
 
-import io
-from typing import Dict, List, Tuple
-
+import asyncio
+import json
+import math
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import (Any, AsyncIterator, Awaitable, Callable, Dict, Iterator,
+                    List, Optional, Tuple)
+
+import numpy as np
+import openpyxl
 import pandas as pd
 from common.otlp.trace.span import Span
 from common.service import get_otlp_metric_service, get_otlp_span_service
@@ -21,54 +28,327 @@ upload_data_router = APIRouter(tags=["UPLOAD_DATA"])
 
 SUPPORT_DATA_FILE_TYPES = ("csv", "xls", "xlsx")
 INSERT_EXTRA_COLUMNS = ["id", "uid"]
+# Number of file rows parsed and inserted at a time
+UPLOAD_CHUNK_ROWS = 10000
+# Number of rows loaded by one COPY or INSERT statement
+INSERT_BATCH_ROWS = 1000
+
+BOOL_TRUE_VALUES = ("true", "t", "yes", "y", "1")
+BOOL_FALSE_VALUES = ("false", "f", "no", "n", "0")
+
+UploadChunk = Tuple[List[str], List[Dict], List[int]]
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, int):
+        return int(value)
+    number = Decimal(str(value).strip())
+    if number != number.to_integral_value():
+        raise ValueError(f"{value} is not an integer")
+    return int(number)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    return Decimal(str(value).strip())
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, (bool, int, float)) and value in (0, 1):
+        return bool(value)
+    normalized = str(value).strip().lower()
+    if normalized in BOOL_TRUE_VALUES:
+        return True
+    if normalized in BOOL_FALSE_VALUES:
+        return False
+    raise ValueError(f"{value} is not a boolean")
+
+
+def _to_str(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _to_datetime(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return pd.Timestamp(value).to_pydatetime()
+
+
+def _to_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return pd.Timestamp(value).date()
+
+
+def _to_time(value: Any) -> time:
+    if isinstance(value, datetime):
+        return value.time()
+    if isinstance(value, time):
+        return value
+    return time.fromisoformat(str(value).strip())
+
+
+def _to_json(value: Any) -> str:
+    if isinstance(value, str):
+        json.loads(value)
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+# Conversion of parsed file values to the Python types asyncpg encodes for
+# each information_schema data type
+COLUMN_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    "smallint": _to_int,
+    "integer": _to_int,
+    "bigint": _to_int,
+    "real": float,
+    "double precision": float,
+    "numeric": _to_decimal,
+    "boolean": _to_bool,
+    "text": _to_str,
+    "character varying": _to_str,
+    "character": _to_str,
+    "date": _to_date,
+    "timestamp without time zone": _to_datetime,
+    "timestamp with time zone": _to_datetime,
+    "time without time zone": _to_time,
+    "json": _to_json,
+    "jsonb": _to_json,
+}
+
+
+def coerce_record(record: Dict[str, Any], column_types: Dict[str, str]) -> Dict:
+    """
+    Convert the values of a parsed record to the types of the table columns.
+
+    Args:
+        record: Record parsed from the upload file
+        column_types: Data type of each table column
+
+    Returns:
+        Record with empty values as None and converted values
+
+    Raises:
+        ValueError: If a value cannot be converted to its column type
+    """
+    coerced = {}
+    for column, value in record.items():
+        if isinstance(value, np.generic):
+            value = value.item()
+        if value is None or value is pd.NaT:
+            coerced[column] = None
+            continue
+        if isinstance(value, float) and math.isnan(value):
+            coerced[column] = None
+            continue
+        if isinstance(value, pd.Timestamp):
+            value = value.to_pydatetime()
+        data_type = column_types.get(column, "")
+        coercer = COLUMN_COERCERS.get(data_type)
+        if coercer is None:
+            coerced[column] = value
+            continue
+        try:
+            coerced[column] = coercer(value)
+        except Exception as coerce_error:  # pylint: disable=broad-except
+            raise ValueError(
+                f'Invalid {data_type} value for column "{column}": {value}'
+            ) from coerce_error
+    return coerced
+
+
+def _iter_csv(source: Any, chunk_size: int) -> Iterator[UploadChunk]:
+    # Values are read as strings and converted to the column types on insert
+    for frame in pd.read_csv(source, dtype=str, chunksize=chunk_size):
+        yield (
+            frame.columns.tolist(),
+            frame.to_dict(orient="records"),
+            [i + 2 for i in frame.index.to_list()],
+        )
+
+
+def _iter_xlsx(source: Any, chunk_size: int) -> Iterator[UploadChunk]:
+    workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = list(next(rows, None) or [])
+        while header and header[-1] is None:
+            header.pop()
+        columns = [
+            f"Unnamed: {i}" if name is None else str(name)
+            for i, name in enumerate(header)
+        ]
+        records: List[Dict] = []
+        line_numbers: List[int] = []
+        for line_no, row in enumerate(rows, start=2):
+            values = list(row[: len(columns)])
+            values.extend([None] * (len(columns) - len(values)))
+            if all(value is None for value in values):
+                continue
+            records.append(dict(zip(columns, values)))
+            line_numbers.append(line_no)
+            if len(records) >= chunk_size:
+                yield columns, records, line_numbers
+                records, line_numbers = [], []
+        if records:
+            yield columns, records, line_numbers
+    finally:
+        workbook.close()
+
+
+def _iter_xls(source: Any, chunk_size: int) -> Iterator[UploadChunk]:
+    # The legacy format has no streaming reader
+    frame = pd.read_excel(source)
+    for i in range(0, len(frame), chunk_size):
+        chunk = frame.iloc[i : i + chunk_size]
+        yield (
+            frame.columns.tolist(),
+            chunk.to_dict(orient="records"),
+            [j + 2 for j in chunk.index.to_list()],
+        )
+
+
+UPLOAD_FILE_READERS: Dict[str, Callable[[Any, int], Iterator[UploadChunk]]] = {
+    "csv": _iter_csv,
+    "xlsx": _iter_xlsx,
+    "xls": _iter_xls,
+}
+
+
+async def _next_chunk(chunks: Iterator[UploadChunk]) -> Optional[UploadChunk]:
+    try:
+        return await asyncio.to_thread(next, chunks, None)
+    except Exception as parse_error:  # pylint: disable=broad-except
+        raise CustomException(
+            CodeEnum.ParseFileError,
+            err_msg=f"File parsing failed: {str(parse_error)}",
+        ) from parse_error
 
 
 async def parse_upload_file(
     file: UploadFile,
-) -> Tuple[List[str], List[Dict], List[int]]:
+    chunk_size: int = UPLOAD_CHUNK_ROWS,
+) -> Tuple[List[str], AsyncIterator[Tuple[List[Dict], List[int]]]]:
     """
-    Parse the uploaded file and return columns, records and line numbers.
+    Parse the uploaded file into chunks of records.
+
+    The file is read chunk by chunk off the event loop, only the first chunk
+    is read before returning.
 
     Args:
         file: Uploaded file to parse
+        chunk_size: Maximum number of records per chunk
 
     Returns:
         Tuple containing:
         - List of column names
-        - List of record dictionaries
-        - List of line numbers
+        - Async iterator of record dictionaries and their line numbers
 
     Raises:
-        CustomException: If file type is not supported or parsing fails
+        CustomException: If file type is not supported, the file is empty
+            or parsing fails
     """
-    content = await file.read()
-
-    if not file.filename or not file.filename.endswith(SUPPORT_DATA_FILE_TYPES):
+    if not file.filename or not file.filename.lower().endswith(SUPPORT_DATA_FILE_TYPES):
         raise CustomException(
-            CodeEnum.UploadFileTypeError.code,
-            message="Data file type only supports csv, xls or xlsx",
+            CodeEnum.UploadFileTypeError,
+            err_msg="Data file type only supports csv, xls or xlsx",
         )
 
     ext = file.filename.lower().split(".")[-1]
-    try:
-        if ext == "csv":
-            df = pd.read_csv(io.BytesIO(content))
-        elif ext in ["xls", "xlsx"]:
-            df = pd.read_excel(io.BytesIO(content))
-    except Exception as parse_error:  # pylint: disable=broad-except
-        raise CustomException(
-            CodeEnum.ParseFileError.code,
-            message=f"File parsing failed: {str(parse_error)}",
-        ) from parse_error
+    chunks = UPLOAD_FILE_READERS[ext](file.file, chunk_size)
+    first_chunk = await _next_chunk(chunks)
+    if first_chunk is None or not first_chunk[1]:
+        raise CustomException(CodeEnum.FileEmptyError, err_msg="File is empty")
+
+    async def iter_chunks() -> AsyncIterator[Tuple[List[Dict], List[int]]]:
+        chunk: Optional[UploadChunk] = first_chunk
+        while chunk is not None:
+            yield chunk[1], chunk[2]
+            chunk = await _next_chunk(chunks)
+
+    return first_chunk[0], iter_chunks()
+
+
+def _batch_loader(
+    db: AsyncSession,
+    table_name: str,
+    keys: List[str],
+    column_types: Dict[str, str],
+) -> Tuple[str, Callable[[List[Dict]], Awaitable[None]]]:
+    """
+    Choose how batches of rows are loaded into the table.
+
+    Rows are copied with the binary COPY protocol of asyncpg when every column
+    has a known type, and inserted by one executemany INSERT otherwise.
+
+    Returns:
+        Tuple of the loading statement and the function loading a batch
+    """
+    if db.get_bind().dialect.driver == "asyncpg" and all(
+        column_types.get(k) in COLUMN_COERCERS for k in keys
+    ):
+
+        async def copy_batch(rows: List[Dict]) -> None:
+            connection = await db.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                table_name,
+                records=[tuple(row[k] for k in keys) for row in rows],
+                columns=keys,
+            )
+
+        columns = ", ".join(f'"{k}"' for k in keys)
+        return f'COPY "{table_name}" ({columns}) FROM STDIN', copy_batch
+
+    columns = ", ".join(f'"{k}"' for k in keys)
+    placeholders = ", ".join(f":{k}" for k in keys)
+    sql_text = f'INSERT INTO "{table_name}" ({columns}) VALUES ({placeholders})'
+    sql = text(sql_text)
 
-    if df.empty:
-        raise CustomException(CodeEnum.FileEmptyError.code, message="File is empty")
+    async def insert_batch(rows: List[Dict]) -> None:
+        await db.execute(sql, rows)  # type: ignore[call-overload]
 
-    columns = df.columns.tolist()
-    records = df.to_dict(orient="records")
-    line_numbers = [i + 2 for i in df.index.to_list()]
+    return sql_text, insert_batch
 
-    return columns, records, line_numbers
+
+async def _load_rows(
+    db: AsyncSession,
+    load_batch: Callable[[List[Dict]], Awaitable[None]],
+    rows: List[Dict],
+    line_numbers: List[int],
+    success_rows: List[int],
+    failed_rows: List[Dict],
+) -> None:
+    """
+    Load rows in a savepoint, bisecting a failing batch down to its failing lines.
+    """
+    try:
+        async with db.begin_nested():
+            await load_batch(rows)
+    except Exception as insert_error:  # pylint: disable=broad-except
+        if len(rows) == 1:
+            failed_rows.append({"line": line_numbers[0], "error": str(insert_error)})
+            return
+        middle = len(rows) // 2
+        await _load_rows(
+            db,
+            load_batch,
+            rows[:middle],
+            line_numbers[:middle],
+            success_rows,
+            failed_rows,
+        )
+        await _load_rows(
+            db,
+            load_batch,
+            rows[middle:],
+            line_numbers[middle:],
+            success_rows,
+            failed_rows,
+        )
+        return
+    success_rows.extend(row["id"] for row in rows)
 
 
 async def insert_in_batches(
@@ -77,12 +357,18 @@ async def insert_in_batches(
     records: List[Dict],
     line_numbers: List[int],
     uid: str,
-    batch_size: int = 500,
+    batch_size: int = INSERT_BATCH_ROWS,
     span_context: Span = None,
+    column_types: Optional[Dict[str, str]] = None,
 ) -> Tuple[List[int], List[Dict]]:
     """
     Insert records into database table in batches.
 
+    Records whose values do not match the column types are reported without
+    reaching the database. Each batch is loaded by a single statement in a
+    savepoint, a failing batch is rolled back and split in halves until the
+    failing lines are found.
+
     Args:
         db: Database session
         table_name: Target table name
@@ -91,41 +377,49 @@ async def insert_in_batches(
         uid: User ID
         batch_size: Batch size for insertion
         span_context: Span context for tracing
+        column_types: Data type of each table column
 
     Returns:
         Tuple containing:
         - List of successfully inserted row IDs
-        - List of failed rows with error details
+        - List of failed rows with error details, ordered by line
     """
     if not records:
         return [], []
 
+    column_types = column_types or {}
     keys = list(records[0].keys())
     keys.extend(INSERT_EXTRA_COLUMNS)
-    columns = ", ".join(f'"{k}"' for k in keys)
-    placeholders = ", ".join(f":{k}" for k in keys)
-    sql_text = f'INSERT INTO "{table_name}" ({columns}) VALUES ({placeholders})'
-    sql = text(sql_text)
+    statement, load_batch = _batch_loader(db, table_name, keys, column_types)
 
     if span_context:
-        span_context.add_info_events({"insert_in_batches exec sql": sql_text})
-
-    success_rows = []
-    failed_rows = []
-
-    for i in range(0, len(records), batch_size):
-        batch = records[i : i + batch_size]
-        batch_lines = line_numbers[i : i + batch_size]
+        span_context.add_info_events({"insert_in_batches exec sql": statement})
 
-        for item, line_no in zip(batch, batch_lines):
-            try:
-                row_id = get_id()
-                item.update({"id": row_id, "uid": uid})
-                await db.execute(sql, item)  # type: ignore[call-overload]
-                success_rows.append(row_id)
-            except Exception as insert_error:  # pylint: disable=broad-except
-                failed_rows.append({"line": line_no, "error": str(insert_error)})
+    success_rows: List[int] = []
+    failed_rows: List[Dict] = []
+    rows: List[Dict] = []
+    row_lines: List[int] = []
+    for item, line_no in zip(records, line_numbers):
+        try:
+            row = coerce_record(item, column_types)
+        except ValueError as coerce_error:
+            failed_rows.append({"line": line_no, "error": str(coerce_error)})
+            continue
+        row.update({"id": get_id(), "uid": uid})
+        rows.append(row)
+        row_lines.append(line_no)
+
+    for i in range(0, len(rows), batch_size):
+        await _load_rows(
+            db,
+            load_batch,
+            rows[i : i + batch_size],
+            row_lines[i : i + batch_size],
+            success_rows,
+            failed_rows,
+        )
 
+    failed_rows.sort(key=lambda failed_row: failed_row["line"])
     return success_rows, failed_rows
 
 
@@ -187,7 +481,7 @@ async def upload_data(
 
             sql = text(
                 """
-                SELECT column_name
+                SELECT column_name, data_type
                 FROM information_schema.columns
                 WHERE table_name = :table_name AND table_schema = :table_schema
             """
@@ -195,9 +489,10 @@ async def upload_data(
             result = await db.execute(  # type: ignore[call-overload]
                 sql, {"table_name": table_name, "table_schema": schema}
             )
-            table_columns = [row[0] for row in result.fetchall()]
+            column_types = {row[0]: row[1] for row in result.fetchall()}
+            table_columns = list(column_types)
 
-            columns, records, line_numbers = await parse_upload_file(file)
+            columns, chunks = await parse_upload_file(file)
 
             span_context.add_info_event(f"upload file columns: {columns}")
             span_context.add_info_event(f"target table columns: {table_columns}")
@@ -210,11 +505,22 @@ async def upload_data(
                     "please check",
                 )
 
-            success_rows, failed_rows = await insert_in_batches(
-                db, table_name, records, line_numbers, uid, span_context=span_context
-            )
+            success_rows: List[int] = []
+            failed_rows: List[Dict] = []
+            async for records, line_numbers in chunks:
+                chunk_success_rows, chunk_failed_rows = await insert_in_batches(
+                    db,
+                    table_name,
+                    records,
+                    line_numbers,
+                    uid,
+                    span_context=span_context,
+                    column_types=column_types,
+                )
+                success_rows.extend(chunk_success_rows)
+                failed_rows.extend(chunk_failed_rows)
 
-            span_context.add_info_event(f"insert successful rows: {success_rows}")
+            span_context.add_info_event(f"insert successful rows: {len(success_rows)}")
             span_context.add_info_event(f"insert failing rows: {failed_rows}")
 
             try:
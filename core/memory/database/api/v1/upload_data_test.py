@@ -2,12 +2,17 @@
 
 import io
 import json
+from datetime import date
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import openpyxl
 import pytest
 from memory.database.api.schemas.upload_data_types import UploadDataInput
-from memory.database.api.v1.upload_data import (insert_in_batches,
+from memory.database.api.v1.upload_data import (coerce_record,
+                                                insert_in_batches,
                                                 parse_upload_file, upload_data)
+from memory.database.exceptions.e import CustomException
 from memory.database.exceptions.error_code import CodeEnum
 from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.responses import JSONResponse
@@ -16,27 +21,95 @@ from starlette.responses import JSONResponse
 @pytest.mark.asyncio
 async def test_parse_upload_file_success_csv() -> None:
     """Test parse_upload_file function (success scenario: CSV file)."""
-    csv_content = "name,age,city\nAlice,25,Beijing\nBob,30,Shanghai"
+    csv_content = "name,age,city\nAlice,25,Beijing\nBob,30,Shanghai\nCarol,,Hefei"
     mock_file = MagicMock()
     mock_file.filename = "test_data.csv"
-    mock_file.read = AsyncMock(
-        return_value=io.BytesIO(csv_content.encode("utf-8")).read()
-    )
+    mock_file.file = io.BytesIO(csv_content.encode("utf-8"))
 
-    columns, records, line_numbers = await parse_upload_file(file=mock_file)
+    columns, chunks = await parse_upload_file(file=mock_file, chunk_size=2)
 
     assert columns == ["name", "age", "city"]
-    expected_records = [
-        {"name": "Alice", "age": 25, "city": "Beijing"},
-        {"name": "Bob", "age": 30, "city": "Shanghai"},
+    parsed = [chunk async for chunk in chunks]
+    assert [line_numbers for _, line_numbers in parsed] == [[2, 3], [4]]
+    records = [record for chunk_records, _ in parsed for record in chunk_records]
+    assert records[:2] == [
+        {"name": "Alice", "age": "25", "city": "Beijing"},
+        {"name": "Bob", "age": "30", "city": "Shanghai"},
+    ]
+    assert coerce_record(records[2], {"name": "text", "age": "integer"}) == {
+        "name": "Carol",
+        "age": None,
+        "city": "Hefei",
+    }
+
+
+@pytest.mark.asyncio
+async def test_parse_upload_file_success_xlsx() -> None:
+    """Test parse_upload_file function (success scenario: XLSX file)."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["name", "age"])
+    sheet.append(["Alice", 25])
+    sheet.append([None, None])
+    sheet.append(["Bob", 30])
+    content = io.BytesIO()
+    workbook.save(content)
+    content.seek(0)
+    mock_file = MagicMock()
+    mock_file.filename = "test_data.xlsx"
+    mock_file.file = content
+
+    columns, chunks = await parse_upload_file(file=mock_file)
+
+    assert columns == ["name", "age"]
+    assert [chunk async for chunk in chunks] == [
+        ([{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}], [2, 4])
     ]
-    assert len(records) == 2
 
-    for i, record in enumerate(records):
-        record["age"] = int(record["age"])
-        assert record == expected_records[i]
 
-    assert line_numbers == [2, 3]
+@pytest.mark.asyncio
+async def test_parse_upload_file_empty_and_invalid() -> None:
+    """Test parse_upload_file function (error scenarios)."""
+    mock_file = MagicMock()
+    mock_file.filename = "test_data.csv"
+    mock_file.file = io.BytesIO(b"name,age\n")
+    with pytest.raises(CustomException) as empty_error:
+        await parse_upload_file(file=mock_file)
+    assert empty_error.value.code == CodeEnum.FileEmptyError.code
+
+    mock_file.filename = "test_data.txt"
+    with pytest.raises(CustomException) as type_error:
+        await parse_upload_file(file=mock_file)
+    assert type_error.value.code == CodeEnum.UploadFileTypeError.code
+
+
+def test_coerce_record() -> None:
+    """Test coerce_record function."""
+    column_types = {
+        "age": "integer",
+        "score": "numeric",
+        "active": "boolean",
+        "born": "date",
+        "tags": "jsonb",
+    }
+    assert coerce_record(
+        {
+            "age": "25",
+            "score": "1.50",
+            "active": "true",
+            "born": "2020-01-02",
+            "tags": '["a"]',
+        },
+        column_types,
+    ) == {
+        "age": 25,
+        "score": Decimal("1.50"),
+        "active": True,
+        "born": date(2020, 1, 2),
+        "tags": '["a"]',
+    }
+    with pytest.raises(ValueError, match='column "age"'):
+        coerce_record({"age": "2.5"}, column_types)
 
 
 @pytest.mark.asyncio
@@ -49,7 +122,7 @@ async def test_insert_in_batches_success() -> None:
         mock_get_id.side_effect = [10001, 10002]
 
         table_name = "user_info"
-        records = [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}]
+        records = [{"name": "Alice", "age": "25"}, {"name": "Bob", "age": 30}]
         line_numbers = [2, 3]
         uid = "u1"
         batch_size = 500
@@ -64,37 +137,76 @@ async def test_insert_in_batches_success() -> None:
             uid=uid,
             batch_size=batch_size,
             span_context=fake_span_context,
+            column_types={"name": "text", "age": "integer", "id": "bigint"},
         )
 
         assert len(success_rows) == 2
         assert success_rows == [10001, 10002]
         assert len(failed_rows) == 0
-        assert mock_db.execute.call_count == 2
-
-        first_call_args = mock_db.execute.call_args_list[0][0]
-        first_sql = first_call_args[0]
-        first_params = first_call_args[1]
-        assert 'INSERT INTO "user_info"' in str(first_sql)
-        assert first_params == {
-            "name": "Alice",
-            "age": 25,
-            "id": 10001,
-            "uid": "u1",
-        }
-
-        second_call_args = mock_db.execute.call_args_list[1][0]
-        second_params = second_call_args[1]
-        assert second_params == {
-            "name": "Bob",
-            "age": 30,
-            "id": 10002,
-            "uid": "u1",
-        }
+        assert mock_db.execute.call_count == 1
+
+        call_args = mock_db.execute.call_args_list[0][0]
+        assert 'INSERT INTO "user_info"' in str(call_args[0])
+        assert call_args[1] == [
+            {"name": "Alice", "age": 25, "id": 10001, "uid": "u1"},
+            {"name": "Bob", "age": 30, "id": 10002, "uid": "u1"},
+        ]
 
         assert mock_get_id.call_count == 2
         fake_span_context.add_info_events.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_insert_in_batches_copy_bisects_failed_batches() -> None:
+    """Test insert_in_batches function (COPY with failing lines)."""
+    copied = []
+
+    async def copy_records_to_table(table_name, records, columns):  # type: ignore
+        if any(record[0] == "bad" for record in records):
+            raise ValueError("duplicate key value")
+        copied.append((table_name, records, columns))
+
+    driver_connection = MagicMock()
+    driver_connection.copy_records_to_table = copy_records_to_table
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(
+        return_value=MagicMock(driver_connection=driver_connection)
+    )
+    mock_db = AsyncMock(spec=AsyncSession)
+    mock_db.get_bind.return_value.dialect.driver = "asyncpg"
+    mock_db.connection = AsyncMock(return_value=connection)
+
+    names = ["a", "bad", "b", "c", "d", "bad", "e"]
+    records = [{"name": name, "age": "1"} for name in names]
+    records[4]["age"] = "x"
+    with patch(
+        "memory.database.api.v1.upload_data.get_id",
+        side_effect=range(1, len(records) + 1),
+    ):
+        success_rows, failed_rows = await insert_in_batches(
+            db=mock_db,
+            table_name="user_info",
+            records=records,
+            line_numbers=list(range(2, len(records) + 2)),
+            uid="u1",
+            batch_size=4,
+            column_types={
+                "name": "text",
+                "age": "integer",
+                "id": "bigint",
+                "uid": "text",
+            },
+        )
+
+    assert sorted(success_rows) == [1, 3, 4, 6]
+    assert [row["line"] for row in failed_rows] == [3, 6, 7]
+    assert "duplicate key value" in failed_rows[0]["error"]
+    assert 'column "age"' in failed_rows[1]["error"]
+    assert all(columns == ["name", "age", "id", "uid"] for _, _, columns in copied)
+    assert ("a", 1, 1, "u1") in copied[0][1]
+    mock_db.execute.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_upload_data_success() -> None:
     """Test upload_data endpoint (success scenario)."""
@@ -125,12 +237,11 @@ async def test_upload_data_success() -> None:
     mock_span_instance = MagicMock()
     mock_span_instance.start.return_value.__enter__.return_value = fake_span_context
 
+    async def chunks():  # type: ignore[no-untyped-def]
+        yield [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}], [2, 3]
+
     mock_parse_file = AsyncMock()
-    mock_parse_file.return_value = (
-        ["name", "age"],
-        [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}],
-        [2, 3],
-    )
+    mock_parse_file.return_value = (["name", "age"], chunks())
 
     mock_insert = AsyncMock()
     mock_insert.return_value = ([90001, 90002], [])
@@ -140,7 +251,12 @@ async def test_upload_data_success() -> None:
             None,
             MagicMock(
                 fetchall=MagicMock(
-                    return_value=[("name",), ("age",), ("id",), ("uid",)]
+                    return_value=[
+                        ("name", "text"),
+                        ("age", "integer"),
+                        ("id", "bigint"),
+                        ("uid", "text"),
+                    ]
                 )
             ),
         ]
@@ -210,6 +326,12 @@ async def test_upload_data_success() -> None:
                         [2, 3],
                         test_input.uid,
                         span_context=fake_span_context,
+                        column_types={
+                            "name": "text",
+                            "age": "integer",
+                            "id": "bigint",
+                            "uid": "text",
+                        },
                     )
 
                     expected_schema = (
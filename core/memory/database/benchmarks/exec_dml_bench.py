@@ -0,0 +1,136 @@
+"""
+Benchmark of the statement preparation of exec_dml on repeated queries.
+
+Runs the split, validation and rewrite of exec_dml on a workload of a few
+statement shapes with changing literal values, as sent by agents, with the
+DML template and table name caches disabled and enabled. A fake session
+answers the table name query after the round trip latency of a remote
+PostgreSQL server, statements are not executed.
+
+Usage::
+
+    python -m memory.database.benchmarks.exec_dml_bench --requests 2000 --latency-ms 1
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Any, Dict, List
+
+from memory.database.api.v1.exec_dml import _dml_split, _process_dml_statements
+from memory.database.utils.dml_cache import (get_dml_template_cache,
+                                             get_normalized_dml_cache,
+                                             get_table_names_cache)
+
+SCHEMA = "prod_bench_1"
+TABLES = ["users", "orders", "events"]
+
+SHAPES = [
+    "SELECT id, name, age FROM users WHERE age > {n} AND city = '{s}' "
+    "ORDER BY id DESC LIMIT 20",
+    "SELECT o.id, o.amount FROM orders o JOIN users u ON o.user_id = u.id "
+    "WHERE u.name = '{s}' AND o.amount >= {n}",
+    "UPDATE users SET city = '{s}', age = {n} WHERE id = {n}",
+    "INSERT INTO events (kind, payload, score) VALUES ('{s}', '{{\"n\": {n}}}', {n})",
+    "DELETE FROM events WHERE kind = '{s}' AND score < {n}",
+]
+
+
+class NullSpan:
+    """Span and meter discarding every event."""
+
+    sid = "bench"
+
+    def __getattr__(self, _: str) -> Any:
+        return lambda *args, **kwargs: None
+
+
+class TableNamesResult:
+    """Result of the table name query."""
+
+    def fetchall(self) -> List[tuple]:
+        return [(table,) for table in TABLES]
+
+
+class FakeSession:
+    """Session answering the table name query after a fixed latency."""
+
+    def __init__(self, latency_ms: float):
+        self.latency_ms = latency_ms
+
+    async def execute(self, *_: Any, **__: Any) -> Any:
+        await asyncio.sleep(self.latency_ms / 1000)
+        return TableNamesResult()
+
+
+def make_workload(requests: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    return [
+        rng.choice(SHAPES).format(
+            n=rng.randint(1, 10000), s=rng.choice(["alice", "bob", "carol", "合肥"])
+        )
+        for _ in range(requests)
+    ]
+
+
+def set_caches(enabled: bool) -> None:
+    for cache, size in (
+        (get_normalized_dml_cache(), 1024),
+        (get_dml_template_cache(), 1024),
+        (get_table_names_cache(), 4096),
+    ):
+        cache.clear()
+        cache.max_size = size if enabled else 0
+
+
+async def prepare(session: FakeSession, dml: str) -> Any:
+    span_context = NullSpan()
+    dmls, error = await _dml_split(
+        dml, session, SCHEMA, "bench", span_context, NullSpan()
+    )
+    assert error is None
+    return await _process_dml_statements(
+        dmls, "bench-app", "bench", "prod", span_context
+    )
+
+
+async def run(workload: List[str], latency_ms: float) -> Dict[str, float]:
+    session = FakeSession(latency_ms)
+    latencies = []
+    for dml in workload:
+        start_time = time.perf_counter()
+        await prepare(session, dml)
+        latencies.append((time.perf_counter() - start_time) * 1000)
+    latencies.sort()
+    return {
+        "mean": statistics.fmean(latencies),
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    }
+
+
+async def bench(args: argparse.Namespace) -> None:
+    workload = make_workload(args.requests, args.seed)
+    print(f"{'caches':>8}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for enabled in (False, True):
+        set_caches(enabled)
+        stats = await run(workload, args.latency_ms)
+        print(
+            f"{'on' if enabled else 'off':>8}{stats['mean']:>10.3f}"
+            f"{stats['p50']:>10.3f}{stats['p99']:>10.3f}"
+        )
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
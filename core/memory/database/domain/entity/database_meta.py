@@ -2,6 +2,9 @@
 
 from typing import Any, Optional, Sequence
 
+from memory.database.utils.database_meta_cache import (
+    DatabaseMetaEntry, get_database_meta_cache,
+    report_database_meta_cache_event)
 from memory.database.utils.retry import retry_on_invalid_cached_statement
 from sqlalchemy import Row, text
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -145,3 +148,60 @@ async def get_uid_by_space_id(session: AsyncSession, space_id: str) -> Optional[
         {"space_id": space_id},
     )
     return uid.first()
+
+
+@retry_on_invalid_cached_statement(max_retries=3)
+async def _fetch_database_meta(
+    session: AsyncSession, database_id: int
+) -> Optional[DatabaseMetaEntry]:
+    result = await session.execute(
+        text(
+            """
+            SELECT d.uid, d.space_id, s.schema_name FROM database_meta d
+            LEFT JOIN schema_meta s ON s.database_id = d.id
+            WHERE d.id=:id
+            """
+        ),
+        {"id": database_id},
+    )
+    rows = result.all()
+    if not rows:
+        return None
+    return DatabaseMetaEntry(
+        uid=rows[0][0],
+        space_id=rows[0][1],
+        schemas=tuple(row[2] for row in rows if row[2] is not None),
+    )
+
+
+async def get_database_meta_by_did(
+    session: AsyncSession, database_id: int
+) -> Optional[DatabaseMetaEntry]:
+    """Get the owner, space and schemas of a database.
+
+    Args:
+        session: Async database session
+        database_id: Database ID to query
+
+    Returns:
+        Metadata of the database, None if it does not exist
+    """
+    cache = get_database_meta_cache()
+    entry = cache.get(database_id)
+    report_database_meta_cache_event("miss" if entry is None else "hit")
+    if entry is not None:
+        return entry
+    generation = cache.generation
+    entry = await _fetch_database_meta(session, database_id)
+    if entry is not None and cache.generation == generation:
+        cache.set(database_id, entry)
+    return entry
+
+
+def invalidate_database_meta(database_id: int) -> None:
+    """Drop the cached metadata of a created, dropped or modified database.
+
+    Args:
+        database_id: Database ID
+    """
+    get_database_meta_cache().invalidate(database_id)
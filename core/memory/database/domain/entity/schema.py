@@ -1,5 +1,8 @@
 """Module providing schema-related database operations."""
 
+from typing import FrozenSet
+
+from memory.database.utils.dml_cache import get_table_names_cache
 from memory.database.utils.retry import retry_on_invalid_cached_statement
 from sqlalchemy import text
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -14,3 +17,42 @@ async def set_search_path_by_schema(session: AsyncSession, schema: str) -> None:
         schema: Schema name to set as search path
     """
     await session.exec(text(f'SET search_path = "{schema}"'))  # type: ignore[call-overload]
+
+
+@retry_on_invalid_cached_statement(max_retries=3)
+async def _fetch_table_names(session: AsyncSession, schema: str) -> FrozenSet[str]:
+    result = await session.execute(  # type: ignore[call-overload]
+        text("SELECT tablename FROM pg_tables WHERE schemaname = :schema"),
+        {"schema": schema},
+    )
+    return frozenset(row[0] for row in result.fetchall())
+
+
+async def get_table_names_by_schema(
+    session: AsyncSession, schema: str, refresh: bool = False
+) -> FrozenSet[str]:
+    """Get the names of the tables of a schema.
+
+    Args:
+        session: Async database session
+        schema: Schema name
+        refresh: Whether to query the database even if the names are cached
+
+    Returns:
+        FrozenSet[str]: Table names of the schema
+    """
+    cache = get_table_names_cache()
+    table_names = None if refresh else cache.get(schema)
+    if table_names is None:
+        table_names = await _fetch_table_names(session, schema)
+        cache.set(schema, table_names)
+    return table_names
+
+
+def invalidate_table_names(schema: str) -> None:
+    """Drop the cached table names of a schema changed by a DDL statement.
+
+    Args:
+        schema: Schema name
+    """
+    get_table_names_cache().invalidate(schema)
@@ -0,0 +1,106 @@
+"""
+Cache of the database metadata read by the permission checks.
+
+Every request checks its database ID, user ID and space ID against the
+metadata tables before doing any work, while these rows only change when a
+database is created or dropped. The owner, space and schemas of each existing
+database are cached per process. Missing databases are never cached, so a
+database created by another process is seen at once, and the owner and space
+of a database never change, so an entry can only outlive a database dropped
+by another process, for at most DATABASE_META_CACHE_TTL seconds.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from common.otlp.args import global_otlp_metric_args
+from common.otlp.ip import local_ip
+from common.otlp.metrics import metric
+from common.utils.local_cache import LocalLRUCache
+
+
+@dataclass(frozen=True)
+class DatabaseMetaEntry:
+    """
+    Metadata of a database.
+
+    Attributes:
+        uid: User ID owning the database
+        space_id: Space ID of the database
+        schemas: Names of the prod and test schemas of the database
+    """
+
+    uid: str
+    space_id: Optional[str]
+    schemas: Tuple[str, ...]
+
+
+class DatabaseMetaCache(LocalLRUCache[int, DatabaseMetaEntry]):
+    """
+    LRU cache of database metadata counting its invalidations.
+
+    Loaders compare the generation before and after their query, so metadata
+    read while a database was being dropped is not cached.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        super().__init__(max_size, ttl)
+        self.generation = 0
+
+    def invalidate(self, key: int) -> None:
+        self.generation += 1
+        super().invalidate(key)
+
+    def clear(self) -> None:
+        self.generation += 1
+        super().clear()
+
+
+_database_meta_cache: Optional[DatabaseMetaCache] = None
+_cache_counter: Any = None
+
+
+def get_database_meta_cache() -> DatabaseMetaCache:
+    """
+    Get the cache of database metadata by database ID.
+
+    Its size is DATABASE_META_CACHE_SIZE (default: 4096) and its entries
+    expire after DATABASE_META_CACHE_TTL seconds (default: 300).
+    """
+    global _database_meta_cache
+    if _database_meta_cache is None:
+        _database_meta_cache = DatabaseMetaCache(
+            int(os.getenv("DATABASE_META_CACHE_SIZE", "4096")),
+            ttl=float(os.getenv("DATABASE_META_CACHE_TTL", "300")),
+        )
+    return _database_meta_cache
+
+
+def report_database_meta_cache_event(event: str) -> None:
+    """
+    Report a database metadata cache lookup through the OTLP meter.
+
+    The hit rate is the share of hit events of the database_meta_cache_total
+    counter.
+
+    Args:
+        event: Lookup result, one of hit and miss
+    """
+    global _cache_counter
+    if _cache_counter is None:
+        if metric.meter is None:
+            return
+        _cache_counter = metric.meter.create_counter(
+            "database_meta_cache_total",
+            description="Database metadata cache hit and miss count",
+        )
+    _cache_counter.add(
+        1,
+        {
+            "server_host": local_ip,
+            "server_name": global_otlp_metric_args.otlp_service_name,
+            "pid": os.getpid(),
+            "event": event,
+        },
+    )
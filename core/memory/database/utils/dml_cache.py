@@ -0,0 +1,241 @@
+"""
+Caches of the DML execution path.
+
+Agents send the same statement shapes over and over with different literal
+values. A statement is normalized by tokenizing it and replacing its string
+and number literals with slots, and each normalized statement maps to its
+table names and its rewritten SQL, which has slots for the literals, the user
+and the IDs of inserted rows. Repeated shapes are then only tokenized and
+rendered instead of parsed and generated. The table names of each schema are
+cached as well, and invalidated by DDL statements.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, FrozenSet, List, Optional, Tuple
+
+from common.utils.local_cache import LocalLRUCache
+from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.generator import Generator
+from sqlglot.tokens import TokenType
+
+LITERAL_TOKEN_TYPES = (TokenType.STRING, TokenType.NUMBER)
+
+# Markers rendered into rewritten SQL templates in place of the values of a request
+DML_MARKER_PREFIX = "__dml_"
+LITERAL_MARKER = "__dml_literal_{}__"
+UID_MARKER = "__dml_uid__"
+APP_ID_MARKER = "__dml_app_id__"
+ROW_ID_MARKER = "__dml_row_id_{}__"
+_MARKER_PATTERN = re.compile(
+    r"'__dml_literal_(\d+)__'|__dml_row_id_(\d+)__"
+    r"|'__dml_uid__'|'__dml_app_id__:__dml_uid__'"
+)
+
+_read_dialect = Dialect.get_or_raise(None)
+_literal_generator: Optional[Generator] = None
+
+
+@dataclass(frozen=True)
+class NormalizedDML:
+    """
+    DML statement with its literals replaced by slots.
+
+    Attributes:
+        key: Token types, texts and comments of the statement, without literal values
+        literals: Postgres SQL of each literal, in statement order
+        marked_sql: Statement text with each literal replaced by its marker
+        has_markers: Whether the statement text itself contains marker text
+    """
+
+    key: Tuple[Any, ...]
+    literals: Tuple[str, ...]
+    marked_sql: str
+    has_markers: bool
+
+
+@dataclass(frozen=True)
+class DMLTemplate:
+    """
+    Cached analysis of a normalized DML statement.
+
+    Attributes:
+        tables: Names of the tables referenced by the statement
+        sql: Rewritten postgres SQL with markers, None if the statement shape
+            must be rewritten from its own parse
+        insert_rows: Number of rows inserted by the statement
+    """
+
+    tables: FrozenSet[str]
+    sql: Optional[str]
+    insert_rows: int
+
+
+_normalized_dml_cache: Optional[LocalLRUCache[str, NormalizedDML]] = None
+_dml_template_cache: Optional[LocalLRUCache[Tuple[Any, ...], DMLTemplate]] = None
+_table_names_cache: Optional[LocalLRUCache[str, FrozenSet[str]]] = None
+
+
+def get_normalized_dml_cache() -> LocalLRUCache[str, NormalizedDML]:
+    """
+    Get the cache of normalized statements by statement text.
+
+    Its size is DML_TEMPLATE_CACHE_SIZE (default: 1024).
+    """
+    global _normalized_dml_cache
+    if _normalized_dml_cache is None:
+        _normalized_dml_cache = LocalLRUCache(
+            int(os.getenv("DML_TEMPLATE_CACHE_SIZE", "1024"))
+        )
+    return _normalized_dml_cache
+
+
+def get_dml_template_cache() -> LocalLRUCache[Tuple[Any, ...], DMLTemplate]:
+    """
+    Get the cache of DML templates by normalized statement and limit.
+
+    Its size is DML_TEMPLATE_CACHE_SIZE (default: 1024).
+    """
+    global _dml_template_cache
+    if _dml_template_cache is None:
+        _dml_template_cache = LocalLRUCache(
+            int(os.getenv("DML_TEMPLATE_CACHE_SIZE", "1024"))
+        )
+    return _dml_template_cache
+
+
+def get_table_names_cache() -> LocalLRUCache[str, FrozenSet[str]]:
+    """
+    Get the cache of table names by schema.
+
+    DDL statements invalidate the schemas they change in the process running
+    them, other processes see the change when a statement references a table
+    missing from their cache or after TABLE_NAMES_CACHE_TTL seconds
+    (default: 60). Its size is TABLE_NAMES_CACHE_SIZE (default: 4096).
+    """
+    global _table_names_cache
+    if _table_names_cache is None:
+        _table_names_cache = LocalLRUCache(
+            int(os.getenv("TABLE_NAMES_CACHE_SIZE", "4096")),
+            ttl=float(os.getenv("TABLE_NAMES_CACHE_TTL", "60")),
+        )
+    return _table_names_cache
+
+
+def render_literal(literal: exp.Expression) -> str:
+    """
+    Render a literal as postgres SQL.
+
+    Args:
+        literal: Literal expression
+
+    Returns:
+        str: SQL of the literal
+    """
+    global _literal_generator
+    if _literal_generator is None:
+        _literal_generator = Dialect.get_or_raise("postgres").generator()
+    return _literal_generator.sql(literal)
+
+
+def normalize_dml(statement: str) -> NormalizedDML:
+    """
+    Replace the string and number literals of a statement with slots.
+
+    Args:
+        statement: DML statement
+
+    Returns:
+        NormalizedDML: Normalized statement
+
+    Raises:
+        sqlglot.errors.TokenError: If the statement cannot be tokenized
+    """
+    cache = get_normalized_dml_cache()
+    normalized = cache.get(statement)
+    if normalized is not None:
+        return normalized
+
+    key: List[Any] = []
+    literals: List[str] = []
+    marked_parts: List[str] = []
+    position = 0
+    for token in _read_dialect.tokenize(statement):
+        if token.token_type in LITERAL_TOKEN_TYPES:
+            if token.token_type == TokenType.STRING:
+                literal = exp.Literal.string(token.text)
+            else:
+                literal = exp.Literal.number(token.text)
+            marked_parts.append(statement[position : token.start])
+            marked_parts.append(f"'{LITERAL_MARKER.format(len(literals))}'")
+            position = token.end + 1
+            literals.append(render_literal(literal))
+            key.append((token.token_type, None, tuple(token.comments)))
+        else:
+            key.append((token.token_type, token.text, tuple(token.comments)))
+    marked_parts.append(statement[position:])
+
+    normalized = NormalizedDML(
+        key=tuple(key),
+        literals=tuple(literals),
+        marked_sql="".join(marked_parts),
+        has_markers=DML_MARKER_PREFIX in statement,
+    )
+    cache.set(statement, normalized)
+    return normalized
+
+
+def fill_literals(sql: str, literals: Tuple[str, ...]) -> str:
+    """
+    Replace the literal markers of a rewritten SQL template.
+
+    Args:
+        sql: Rewritten SQL with markers
+        literals: SQL of each literal
+
+    Returns:
+        str: SQL with the user and row ID markers left in place
+    """
+    return _MARKER_PATTERN.sub(
+        lambda match: (
+            literals[int(match.group(1))]
+            if match.group(1) is not None
+            else match.group(0)
+        ),
+        sql,
+    )
+
+
+def render_dml_template(
+    sql: str,
+    literals: Tuple[str, ...],
+    app_id: str,
+    uid: str,
+    row_ids: List[int],
+) -> str:
+    """
+    Render a rewritten SQL template with the values of a request.
+
+    Args:
+        sql: Rewritten SQL with markers
+        literals: SQL of each literal of the statement
+        app_id: Application ID
+        uid: User ID
+        row_ids: IDs of the inserted rows
+
+    Returns:
+        str: Executable SQL
+    """
+
+    def replace(match: "re.Match[str]") -> str:
+        if match.group(1) is not None:
+            return literals[int(match.group(1))]
+        if match.group(2) is not None:
+            return render_literal(exp.Literal.number(row_ids[int(match.group(2))]))
+        if match.group(0) == f"'{UID_MARKER}'":
+            return render_literal(exp.Literal.string(uid))
+        return render_literal(exp.Literal.string(f"{app_id}:{uid}"))
+
+    return _MARKER_PATTERN.sub(replace, sql)
@@ -0,0 +1,267 @@
+"""
+Keyset pagination of SELECT statements.
+
+A paginated SELECT is ordered by its ORDER BY columns followed by the id
+column of its table, and each page only selects the rows sorting after the
+last row of the previous page, so a page costs the same whatever its
+position instead of reading and discarding the rows of all previous pages as
+OFFSET does. The sort key of the last row of a page is returned to the caller
+in an opaque cursor, which is sent back to get the next page.
+"""
+
+import base64
+import datetime
+import hashlib
+import json
+import math
+import os
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+from sqlglot import exp
+
+# Alias prefix of the sort key columns added to the SELECT list of a page
+PAGE_KEY_PREFIX = "__page_key_"
+PAGE_KEY_COLUMN = "id"
+
+
+class InvalidCursorError(ValueError):
+    """Cursor not returned by the previous page of the same statement."""
+
+
+@dataclass(frozen=True)
+class PageKey:
+    """
+    Sort key column of a paginated SELECT.
+
+    Attributes:
+        column: Column qualified with its table
+        desc: Whether the column is sorted in descending order
+        nulls_first: Whether NULL values sort before other values
+    """
+
+    column: exp.Column
+    desc: bool
+    nulls_first: bool
+
+
+def get_page_size(page_size: Optional[int], default: int) -> int:
+    """
+    Get the number of rows of a page, capped by DML_PAGE_SIZE_MAX (default: 1000).
+
+    Args:
+        page_size: Requested page size, None for the default
+        default: Page size used when none is requested
+
+    Returns:
+        int: Page size
+    """
+    max_page_size = int(os.getenv("DML_PAGE_SIZE_MAX", "1000"))
+    return max(1, min(page_size or default, max_page_size))
+
+
+def get_page_keys(parsed: exp.Select) -> List[PageKey]:
+    """
+    Get the sort key columns of a SELECT to paginate.
+
+    Args:
+        parsed: Parsed SELECT statement
+
+    Returns:
+        List[PageKey]: ORDER BY columns followed by the id column
+
+    Raises:
+        ValueError: If the statement cannot be paginated
+    """
+    tables = list(parsed.find_all(exp.Table))
+    if (
+        len(tables) != 1
+        or parsed.find(exp.Join, exp.With)
+        or any(parsed.args.get(arg) for arg in ("distinct", "group", "having"))
+        or any(projection.find(exp.AggFunc) for projection in parsed.expressions)
+    ):
+        raise ValueError(
+            "Pagination only supports SELECT statements on a single table "
+            "without DISTINCT, GROUP BY or aggregates"
+        )
+    if parsed.args.get("limit") or parsed.args.get("offset"):
+        raise ValueError("Pagination does not support LIMIT or OFFSET")
+
+    table = tables[0].args["alias"].this if tables[0].alias else tables[0].this
+    aliases = {
+        projection.alias: projection.this
+        for projection in parsed.expressions
+        if isinstance(projection, exp.Alias)
+    }
+    keys = []
+    order = parsed.args.get("order")
+    for ordered in order.expressions if order else []:
+        column = ordered.this
+        if isinstance(column, exp.Literal) and column.is_int:
+            # ORDER BY position of the SELECT list
+            position = int(column.name) - 1
+            if 0 <= position < len(parsed.expressions):
+                column = parsed.expressions[position].unalias()
+        elif isinstance(column, exp.Column) and not column.table:
+            column = aliases.get(column.name, column)
+        if not isinstance(column, exp.Column) or isinstance(column.this, exp.Star):
+            raise ValueError("Pagination only supports ORDER BY columns")
+        keys.append(
+            PageKey(
+                column=exp.Column(this=column.this.copy(), table=table.copy()),
+                desc=bool(ordered.args.get("desc")),
+                nulls_first=bool(ordered.args.get("nulls_first")),
+            )
+        )
+    if all(key.column.name != PAGE_KEY_COLUMN for key in keys):
+        keys.append(
+            PageKey(
+                column=exp.Column(
+                    this=exp.to_identifier(PAGE_KEY_COLUMN), table=table.copy()
+                ),
+                desc=False,
+                nulls_first=False,
+            )
+        )
+    return keys
+
+
+def paginate_select(
+    parsed: exp.Select, keys: List[PageKey], after: Optional[Sequence[Any]]
+) -> None:
+    """
+    Sort a SELECT by its page keys and select the rows after a sort key.
+
+    The page key columns are added at the end of the SELECT list, the caller
+    removes them from the rows and encodes those of the last row in the
+    cursor of the next page.
+
+    Args:
+        parsed: Parsed SELECT statement, modified in place
+        keys: Page keys of the statement
+        after: Sort key of the last row of the previous page, None for the
+            first page
+    """
+    parsed.set(
+        "order",
+        exp.Order(
+            expressions=[
+                exp.Ordered(
+                    this=key.column.copy(), desc=key.desc, nulls_first=key.nulls_first
+                )
+                for key in keys
+            ]
+        ),
+    )
+    for index, key in enumerate(keys):
+        parsed.select(
+            exp.alias_(key.column.copy(), f"{PAGE_KEY_PREFIX}{index}"), copy=False
+        )
+    if after is not None:
+        parsed.where(_after_condition(keys, after), copy=False)
+
+
+def _after_condition(keys: List[PageKey], after: Sequence[Any]) -> exp.Expression:
+    """Build the condition selecting the rows sorting after a sort key."""
+    terms: List[exp.Expression] = []
+    equal: List[exp.Expression] = []
+    for key, value in zip(keys, after):
+        column = key.column
+        if value is None:
+            after_term: Optional[exp.Expression] = (
+                exp.not_(exp.Is(this=column.copy(), expression=exp.null()))
+                if key.nulls_first
+                else None
+            )
+            equal_term: exp.Expression = exp.Is(
+                this=column.copy(), expression=exp.null()
+            )
+        else:
+            literal = _to_literal(value)
+            after_term = (
+                exp.LT(this=column.copy(), expression=literal)
+                if key.desc
+                else exp.GT(this=column.copy(), expression=literal)
+            )
+            if not key.nulls_first:
+                after_term = exp.or_(
+                    after_term, exp.Is(this=column.copy(), expression=exp.null())
+                )
+            equal_term = exp.EQ(this=column.copy(), expression=literal.copy())
+        if after_term is not None:
+            terms.append(exp.paren(exp.and_(*equal, after_term), copy=False))
+        equal.append(equal_term)
+    if not terms:
+        return exp.false()
+    return exp.paren(exp.or_(*terms), copy=False)
+
+
+def _to_literal(value: Any) -> exp.Expression:
+    if isinstance(value, bool):
+        return exp.Boolean(this=value)
+    if isinstance(value, int) or (isinstance(value, float) and math.isfinite(value)):
+        return exp.Literal.number(value)
+    # Other values are compared as untyped literals cast to the column type
+    return exp.Literal.string(str(value))
+
+
+def encode_cursor(dml: str, after: Sequence[Any]) -> str:
+    """
+    Encode the sort key of the last row of a page in an opaque cursor.
+
+    Args:
+        dml: Paginated statement
+        after: Sort key of the last row
+
+    Returns:
+        str: Cursor of the next page
+    """
+    payload = {"q": _statement_digest(dml), "v": [_to_cursor_value(v) for v in after]}
+    encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(encoded.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(dml: str, cursor: str, key_count: int) -> List[Any]:
+    """
+    Decode the sort key of a cursor.
+
+    Args:
+        dml: Paginated statement
+        cursor: Cursor returned with the previous page
+        key_count: Number of page keys of the statement
+
+    Returns:
+        List[Any]: Sort key of the last row of the previous page
+
+    Raises:
+        InvalidCursorError: If the cursor was not returned for this statement
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (UnicodeError, ValueError) as decode_error:
+        raise InvalidCursorError("Invalid cursor") from decode_error
+    if (
+        not isinstance(payload, dict)
+        or payload.get("q") != _statement_digest(dml)
+        or not isinstance(payload.get("v"), list)
+        or len(payload["v"]) != key_count
+        or not all(
+            value is None or isinstance(value, (bool, int, float, str))
+            for value in payload["v"]
+        )
+    ):
+        raise InvalidCursorError("Invalid cursor")
+    return payload["v"]  # type: ignore[no-any-return]
+
+
+def _statement_digest(dml: str) -> str:
+    return hashlib.sha256(dml.strip().encode("utf-8")).hexdigest()[:16]
+
+
+def _to_cursor_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (datetime.date, datetime.time)):
+        # Full precision, rows sharing a second must not be skipped
+        return value.isoformat()
+    return str(value)
@@ -92,6 +92,10 @@ XingchenEnviron = (
 DEF_VER = "V1.0"
 DEF_DEL = 0
 
+# Redis hash of the cached schemas of one tool, read by the workflow and agent
+# services and deleted here whenever the tool is written
+TOOL_SCHEMA_CACHE_PREFIX = "spark_link:tool_schema"
+
 __all__ = [
     # xc_utils_keys
     "SERVICE_NAME_KEY",
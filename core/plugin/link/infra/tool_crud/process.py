@@ -1,7 +1,10 @@
 from datetime import datetime
+from typing import Iterable
 
+from loguru import logger
 from plugin.link.consts import const
 from plugin.link.domain.entity.tool_schema import Tools
+from plugin.link.domain.models.manager import get_redis_engine
 from plugin.link.domain.models.utils import DatabaseService, session_getter
 from plugin.link.exceptions.sparklink_exceptions import ToolNotExistsException
 from plugin.link.utils.errors.code import ErrCode
@@ -39,6 +42,7 @@ class ToolCrudOperation:
                 )
                 session.add(tool_inst)
                 session.commit()
+                invalidate_tool_schemas([tool.get("tool_id")])
 
     def add_mcp(self, mcp_info: dict):
         """
@@ -86,6 +90,7 @@ class ToolCrudOperation:
                 )
             session.add(tool_inst)
             session.commit()
+        invalidate_tool_schemas([tool_id])
 
     def update_tools(self, tool_info: list):
         """
@@ -121,6 +126,7 @@ class ToolCrudOperation:
                     tool_inst.open_api_schema = tool.get("open_api_schema")
                 session.add(tool_inst)
                 session.commit()
+                invalidate_tool_schemas([tool_id])
 
     def add_tool_version(self, tool_info: list):
         """
@@ -143,6 +149,7 @@ class ToolCrudOperation:
                 except IntegrityError as e:
                     session.rollback()
                     raise Exception("Version already exists!") from e
+                invalidate_tool_schemas([tool.get("tool_id")])
 
     def delete_tools(self, tool_info: list):
         """
@@ -178,6 +185,7 @@ class ToolCrudOperation:
                     for tool in query_result:
                         tool.is_deleted = int(datetime.now().timestamp())
                     session.commit()
+                    invalidate_tool_schemas([tool_id])
 
     def get_tools(self, tool_info: list, span: Span):
         """
@@ -215,3 +223,20 @@ class ToolCrudOperation:
                         )
             span_context.add_info_event(f"result:{str(result)}")
         return result
+
+
+def invalidate_tool_schemas(tool_ids: Iterable[str]):
+    """
+    description: Drop the cached schemas of written tools, a failure is only
+    logged since the cached entries expire on their own
+    """
+    redis_engine = get_redis_engine()
+    if redis_engine is None:
+        return
+    for tool_id in set(tool_ids):
+        if not tool_id:
+            continue
+        try:
+            redis_engine.delete(f"{const.TOOL_SCHEMA_CACHE_PREFIX}:{tool_id}")
+        except Exception as err:
+            logger.error(f"failed to invalidate schema cache of {tool_id}, {err}")
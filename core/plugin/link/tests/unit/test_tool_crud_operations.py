@@ -11,7 +11,10 @@ import pytest
 from plugin.link.consts import const
 from plugin.link.domain.entity.tool_schema import Tools
 from plugin.link.exceptions.sparklink_exceptions import ToolNotExistsException
-from plugin.link.infra.tool_crud.process import ToolCrudOperation
+from plugin.link.infra.tool_crud.process import (
+    ToolCrudOperation,
+    invalidate_tool_schemas,
+)
 from plugin.link.utils.errors.code import ErrCode
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
@@ -805,3 +808,83 @@ class TestGetToolsFunction:
             assert (
                 mock_span_context.add_info_event.call_count >= 2
             )  # Called at start and end
+
+
+class TestInvalidateToolSchemas:
+    """Tests for invalidating cached tool schemas after tool writes."""
+
+    @patch("plugin.link.infra.tool_crud.process.get_redis_engine")
+    def test_deletes_schema_hash_once_per_tool(self, mock_get_redis_engine):
+        """Test each written tool drops its schema hash once."""
+        mock_redis = Mock()
+        mock_get_redis_engine.return_value = mock_redis
+
+        invalidate_tool_schemas(["tool@1", "tool@2", "tool@1", ""])
+
+        deleted = sorted(call.args[0] for call in mock_redis.delete.call_args_list)
+        assert deleted == [
+            f"{const.TOOL_SCHEMA_CACHE_PREFIX}:tool@1",
+            f"{const.TOOL_SCHEMA_CACHE_PREFIX}:tool@2",
+        ]
+
+    @patch("plugin.link.infra.tool_crud.process.get_redis_engine")
+    def test_redis_errors_are_ignored(self, mock_get_redis_engine):
+        """Test a Redis failure does not fail the tool write."""
+        mock_redis = Mock()
+        mock_redis.delete.side_effect = ConnectionError("redis down")
+        mock_get_redis_engine.return_value = mock_redis
+
+        invalidate_tool_schemas(["tool@1"])
+
+        mock_redis.delete.assert_called_once()
+
+    @patch("plugin.link.infra.tool_crud.process.get_redis_engine", return_value=None)
+    def test_without_redis(self, mock_get_redis_engine):
+        """Test invalidation is skipped when Redis is not initialized."""
+        invalidate_tool_schemas(["tool@1"])
+
+        mock_get_redis_engine.assert_called_once()
+
+    @patch("plugin.link.infra.tool_crud.process.get_redis_engine")
+    @patch("plugin.link.infra.tool_crud.process.session_getter")
+    def test_add_tools_invalidates_schemas(
+        self, mock_session_getter, mock_get_redis_engine
+    ):
+        """Test adding tools drops the cached schemas of the added tools."""
+        mock_session = Mock()
+        mock_session_getter.return_value.__enter__ = Mock(return_value=mock_session)
+        mock_session_getter.return_value.__exit__ = Mock(return_value=None)
+        mock_redis = Mock()
+        mock_get_redis_engine.return_value = mock_redis
+
+        ToolCrudOperation(Mock()).add_tools([{"tool_id": "tool@1", "name": "t"}])
+
+        mock_redis.delete.assert_called_once_with(
+            f"{const.TOOL_SCHEMA_CACHE_PREFIX}:tool@1"
+        )
+
+    @patch("plugin.link.infra.tool_crud.process.get_redis_engine")
+    @patch("plugin.link.infra.tool_crud.process.session_getter")
+    def test_update_tools_invalidates_committed_tools_on_failure(
+        self, mock_session_getter, mock_get_redis_engine
+    ):
+        """Test tools committed before a failing tool still drop their schemas."""
+        mock_session = Mock()
+        mock_session.exec.return_value.first.side_effect = [Mock(), None]
+        mock_session_getter.return_value.__enter__ = Mock(return_value=mock_session)
+        mock_session_getter.return_value.__exit__ = Mock(return_value=None)
+        mock_redis = Mock()
+        mock_get_redis_engine.return_value = mock_redis
+
+        with pytest.raises(ToolNotExistsException):
+            ToolCrudOperation(Mock()).update_tools(
+                [
+                    {"tool_id": "tool@1", "name": "t1"},
+                    {"tool_id": "tool@2", "name": "t2"},
+                ]
+            )
+
+        mock_session.commit.assert_called_once()
+        mock_redis.delete.assert_called_once_with(
+            f"{const.TOOL_SCHEMA_CACHE_PREFIX}:tool@1"
+        )
@@ -11,7 +11,6 @@ from workflow.domain.entities.response import Streaming
 from workflow.engine.callbacks.openai_types_sse import LLMGenerate
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
-from workflow.extensions.middleware.getters import get_session
 from workflow.extensions.otlp.metric.meter import Meter
 from workflow.extensions.otlp.trace.span import Span
 from workflow.service import app_service, audit_service, chat_service, flow_service
@@ -40,16 +39,14 @@ async def chat_debug(
     ) as span_context:
         m.set_label("flow_id", chat_vo.flow_id)
         try:
-            session = next(get_session())
-
             if chat_vo.version:
-                db_flow = flow_service.get_latest_published_flow_by(
-                    chat_vo.flow_id, app_id, session, span_context, chat_vo.version
+                db_flow = await flow_service.async_get_latest_published_flow_by(
+                    chat_vo.flow_id, app_id, span_context, chat_vo.version
                 )
             else:
-                db_flow = flow_service.get(chat_vo.flow_id, session, span)
+                db_flow = await flow_service.async_get(chat_vo.flow_id, span)
 
-            app_info = app_service.get_info(app_id, session, span)
+            app_info = await app_service.async_get_info(app_id, span)
 
             event = Event(
                 flow_id=chat_vo.flow_id,
@@ -58,7 +55,7 @@ async def chat_debug(
                 uid=chat_vo.uid,
                 chat_id=chat_vo.chat_id,
             )
-            EventRegistry().init_event(event)
+            await EventRegistry().init_event(event)
             app_audit_policy = (
                 AppAuditPolicy.DEFAULT
                 if app_info.audit_policy == AppAuditPolicy.DEFAULT.value
@@ -119,7 +116,7 @@ async def resume_debug(request: ResumeVo) -> Union[StreamingResponse, JSONRespon
     ) as span_context:
 
         try:
-            event: Optional[Event] = EventRegistry().get_event(event_id=event_id)
+            event: Optional[Event] = await EventRegistry().get_event(event_id=event_id)
             if event is None:
                 raise CustomException(
                     CodeEnum.EVENT_REGISTRY_NOT_FOUND_ERROR,
@@ -144,8 +141,7 @@ async def resume_debug(request: ResumeVo) -> Union[StreamingResponse, JSONRespon
                 )
 
             # Input audit
-            session = next(get_session())
-            app_info = app_service.get_info(event.app_id, session, span)
+            app_info = await app_service.async_get_info(event.app_id, span)
             if app_info.audit_policy == AppAuditPolicy.AGENT_PLATFORM.value:
                 await audit_service.input_audit(content, span)
 
@@ -156,6 +152,8 @@ async def resume_debug(request: ResumeVo) -> Union[StreamingResponse, JSONRespon
                 ),
                 expire_time=event.timeout,
             )
+            # A checkpointed run continues in this process
+            await chat_service.resume_hibernated_run(event, span_context)
 
             return await Streaming.send(
                 chat_service.chat_resume_response_stream(
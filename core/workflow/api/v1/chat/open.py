@@ -9,25 +9,17 @@ import json
 import os
 from typing import Annotated, Optional, Union
 
-from fastapi import APIRouter, Depends, Header
-from workflow.consts.engine.chat_status import ChatStatus
-from workflow.consts.runtime_env import RuntimeEnv
-
-try:
-    from sqlmodel import Session  # type: ignore[import]
-except ImportError:
-    from sqlalchemy.orm import Session  # type: ignore[assignment]
-
+from fastapi import APIRouter, Header
 from starlette.responses import JSONResponse, StreamingResponse
 from workflow.cache.event_registry import Event, EventRegistry
 from workflow.consts.app_audit import AppAuditPolicy
-from workflow.consts.tenant_publish_matrix import Platform, TenantPublishMatrix
+from workflow.consts.engine.chat_status import ChatStatus
+from workflow.consts.runtime_env import RuntimeEnv
 from workflow.domain.entities.chat import ChatVo, ResumeVo
 from workflow.domain.entities.response import Streaming
 from workflow.engine.callbacks.openai_types_sse import LLMGenerate
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
-from workflow.extensions.middleware.getters import get_session
 from workflow.extensions.otlp.metric.meter import Meter
 from workflow.extensions.otlp.trace.span import Span
 from workflow.service import app_service, audit_service, chat_service, flow_service
@@ -40,13 +32,11 @@ router = APIRouter(tags=["SSE_OPENAPI"])
 async def chat_open(
     x_consumer_username: Annotated[str, Header()],
     chat_vo: ChatVo,
-    db_session: Session = Depends(get_session),
 ) -> Union[StreamingResponse, JSONResponse]:
     """
     Handle chat completions for open API
     :param x_consumer_username: Consumer username from header
     :param chat_vo: Chat request data
-    :param db_session: Database session dependency
     :return: Streaming or JSON response
     """
     m = Meter()
@@ -57,11 +47,11 @@ async def chat_open(
         attributes={"flow_id": chat_vo.flow_id},
     ) as span_context:
         try:
-            db_flow = flow_service.get_latest_published_flow_by(
-                chat_vo.flow_id, app_id, db_session, span_context, chat_vo.version
+            db_flow = await flow_service.async_get_latest_published_flow_by(
+                chat_vo.flow_id, app_id, span_context, chat_vo.version
             )
             spark_dsl = db_flow.release_data
-            app_info = app_service.get_info(app_id, db_session, span)
+            app_info = await app_service.async_get_info(app_id, span)
 
             app_audit_policy = (
                 AppAuditPolicy.DEFAULT
@@ -71,20 +61,7 @@ async def chat_open(
             )
 
             # Validate flow platform publishing permissions
-            if (db_flow.release_status == 0) or (
-                (
-                    db_flow.release_status
-                    & TenantPublishMatrix(Platform.XINGCHEN).get_take_off
-                )
-                and (
-                    db_flow.release_status
-                    & TenantPublishMatrix(Platform.KAI_FANG).get_take_off
-                )
-                and (
-                    db_flow.release_status
-                    & TenantPublishMatrix(Platform.AI_UI).get_take_off
-                )
-            ):
+            if flow_service.is_flow_taken_off(db_flow.release_status):
                 return await Streaming.send_error(
                     LLMGenerate.workflow_end_error(
                         span_context.sid,
@@ -114,7 +91,7 @@ async def chat_open(
                 chat_id=chat_vo.chat_id,
                 is_stream=chat_vo.stream,
             )
-            EventRegistry().init_event(event)
+            await EventRegistry().init_event(event)
 
             return await Streaming.send(
                 await chat_service.event_stream(
@@ -170,7 +147,7 @@ async def resume_open(request: ResumeVo) -> Union[StreamingResponse, JSONRespons
     ) as span_context:
 
         try:
-            event: Optional[Event] = EventRegistry().get_event(event_id=event_id)
+            event: Optional[Event] = await EventRegistry().get_event(event_id=event_id)
             if event is None:
                 raise CustomException(
                     CodeEnum.EVENT_REGISTRY_NOT_FOUND_ERROR,
@@ -195,8 +172,7 @@ async def resume_open(request: ResumeVo) -> Union[StreamingResponse, JSONRespons
                 )
 
             # Input audit
-            session = next(get_session())
-            app_info = app_service.get_info(event.app_id, session, span)
+            app_info = await app_service.async_get_info(event.app_id, span)
             if app_info.audit_policy == AppAuditPolicy.AGENT_PLATFORM.value:
                 await audit_service.input_audit(content, span)
 
@@ -207,6 +183,8 @@ async def resume_open(request: ResumeVo) -> Union[StreamingResponse, JSONRespons
                 ),
                 expire_time=event.timeout,
             )
+            # A checkpointed run continues in this process
+            await chat_service.resume_hibernated_run(event, span_context)
 
             return await Streaming.send(
                 chat_service.chat_resume_response_stream(
@@ -0,0 +1,182 @@
+"""
+Load test of the database lookups of the chat endpoints on cache misses.
+
+Compares running the flow, license and app queries of a chat request on a
+synchronous session inside the async handler, as the chat endpoints did
+before, with sessions of the async database service. Concurrent requests are
+started together, so with synchronous sessions every query blocks the event
+loop and the requests are served one after another. A local SQLite database
+answers the queries, each one delayed by the round trip latency of a remote
+MySQL server.
+
+Usage::
+
+    python -m workflow.benchmarks.db_session_bench --concurrency 1 16 64 --latency-ms 2
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from sqlalchemy import Engine, create_engine, event
+from sqlmodel import Session, SQLModel, select  # type: ignore
+from workflow.domain.models.ai_app import App
+from workflow.domain.models.flow import Flow
+from workflow.domain.models.license import License
+from workflow.extensions.middleware.database.async_manager import (
+    AsyncDatabaseService,
+)
+from workflow.repository import flow_dao, license_dao
+
+APP_ALIAS_ID = "bench-app"
+
+
+def _substring_index(value: str, delim: str, count: int) -> str:
+    # SQLite counterpart of the MySQL function used to order flow versions
+    parts = value.split(delim)
+    return delim.join(parts[:count] if count > 0 else parts[count:])
+
+
+def _setup_engine(engine: Engine, latency_ms: float) -> None:
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection: Any, _: Any) -> None:
+        dbapi_connection.create_function("SUBSTRING_INDEX", 3, _substring_index)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def delay(*_: Any) -> None:
+        time.sleep(latency_ms / 1000)
+
+
+def _seed(database_url: str) -> int:
+    engine = create_engine(database_url)
+    SQLModel.metadata.create_all(
+        engine, tables=[App.__table__, Flow.__table__, License.__table__]
+    )
+    with Session(engine) as session:
+        app = App(alias_id=APP_ALIAS_ID, create_by=0, update_by=0)
+        session.add(app)
+        session.commit()
+        for version in ("v1.0", "v1.1", "v2.0"):
+            session.add(
+                Flow(group_id=hash(version) & 0xFFFF, version=version, release_status=1)
+            )
+        flow = Flow(group_id=1, version="v2.1", release_status=1)
+        session.add(flow)
+        session.add(License(app_id=app.id, group_id=1))
+        session.commit()
+        flow_id = flow.id
+    engine.dispose()
+    return flow_id
+
+
+def lookup(session: Session, flow_id: int) -> Flow:
+    """
+    Run the queries of a chat request whose flow and app are not cached.
+    """
+    db_flow = session.exec(select(Flow).where(Flow.id == flow_id)).first()
+    assert db_flow is not None
+    assert license_dao.get_by(db_flow.group_id, APP_ALIAS_ID, session)
+    published_flow = flow_dao.get_latest_published_flow_by(db_flow.group_id, session)
+    assert published_flow is not None
+    assert session.exec(select(App).where(App.alias_id == APP_ALIAS_ID)).first()
+    return published_flow
+
+
+def sync_session(engine: Engine, flow_id: int) -> Callable[[], Awaitable[Any]]:
+    async def handle() -> Any:
+        with Session(engine) as session:
+            return lookup(session, flow_id)
+
+    return handle
+
+
+def async_service(
+    service: AsyncDatabaseService, flow_id: int
+) -> Callable[[], Awaitable[Any]]:
+    async def handle() -> Any:
+        return await service.run(lambda session: lookup(session, flow_id))
+
+    return handle
+
+
+async def run_requests(
+    handle: Callable[[], Awaitable[Any]], requests: int, concurrency: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    loop_lag = [0.0]
+    done = asyncio.Event()
+
+    async def monitor() -> None:
+        # Delay of a coroutine scheduled every millisecond, other requests
+        # such as streamed responses see the same delay
+        while not done.is_set():
+            start_time = time.perf_counter()
+            await asyncio.sleep(0.001)
+            loop_lag[0] = max(loop_lag[0], time.perf_counter() - start_time - 0.001)
+
+    async def one(arrival_time: float) -> None:
+        await handle()
+        latencies.append((time.perf_counter() - arrival_time) * 1000)
+
+    monitor_task = asyncio.create_task(monitor())
+    await asyncio.sleep(0)
+    for _ in range(0, requests, concurrency):
+        # Latency counts from the arrival of the batch, including the time a
+        # request waits for the event loop
+        arrival_time = time.perf_counter()
+        await asyncio.gather(*(one(arrival_time) for _ in range(concurrency)))
+    done.set()
+    await monitor_task
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "lag": loop_lag[0] * 1000,
+    }
+
+
+async def bench(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+        flow_id = _seed(database_url)
+        engine = create_engine(database_url, pool_size=args.pool_size)
+        _setup_engine(engine, args.latency_ms)
+        service = AsyncDatabaseService(database_url, pool_size=args.pool_size)
+        _setup_engine(service.engine, args.latency_ms)
+        handlers: Dict[str, Callable[[], Awaitable[Any]]] = {
+            "sync": sync_session(engine, flow_id),
+            "async": async_service(service, flow_id),
+        }
+        try:
+            print(
+                f"{'concurrency':>12}{'session':>10}{'p50 ms':>10}"
+                f"{'p99 ms':>10}{'loop lag ms':>13}"
+            )
+            for concurrency in args.concurrency:
+                for name, handle in handlers.items():
+                    stats = await run_requests(handle, args.requests, concurrency)
+                    print(
+                        f"{concurrency:>12}{name:>10}{stats['p50']:>10.1f}"
+                        f"{stats['p99']:>10.1f}{stats['lag']:>13.1f}"
+                    )
+        finally:
+            service.teardown()
+            engine.dispose()
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=256)
+    parser.add_argument("--concurrency", type=int, nargs="*", default=[1, 16, 64])
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--pool-size", type=int, default=32)
+    args = parser.parse_args(argv)
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Benchmark of the workflow engine scheduling modes.
+
+Builds synthetic workflows and compares the simple-path ``chains`` mode with the
+compiled ``dag`` mode on engine build time, pickled engine size and run time.
+
+- wide: the start node fans out to N parallel text joiners that all join the end node
+- deep: N stacked if-else diamonds, each branch pair joining on a text joiner
+
+Usage::
+
+    python -m workflow.benchmarks.engine_mode_bench --wide 8 32 128 --deep 4 8 12
+"""
+
+import argparse
+import asyncio
+import pickle
+import time
+from typing import Any, Dict, List
+
+from loguru import logger
+from workflow.consts.engine.engine_mode import EngineModeEnum
+from workflow.engine.callbacks.callback_handler import ChatCallBacks
+from workflow.engine.dsl_engine import WorkflowEngine, WorkflowEngineFactory
+from workflow.engine.entities.workflow_dsl import WorkflowDSL
+from workflow.extensions.otlp.log_trace.workflow_log import WorkflowLog
+from workflow.extensions.otlp.trace.span import Span
+
+START_NODE_ID = "node-start::bench-start"
+END_NODE_ID = "node-end::bench-end"
+
+
+def _ref_input(name: str, node_id: str, ref_name: str) -> Dict[str, Any]:
+    return {
+        "id": f"input-{name}",
+        "name": name,
+        "schema": {
+            "type": "string",
+            "value": {"type": "ref", "content": {"nodeId": node_id, "name": ref_name}},
+        },
+    }
+
+
+def _string_output(name: str) -> Dict[str, Any]:
+    return {"id": f"output-{name}", "name": name, "schema": {"type": "string"}}
+
+
+def _node(node_id: str, node_type: str, **data: Any) -> Dict[str, Any]:
+    return {
+        "id": node_id,
+        "data": {
+            "nodeMeta": {"nodeType": node_type, "aliasName": node_id.split("::")[1]},
+            **data,
+        },
+    }
+
+
+def _start_node() -> Dict[str, Any]:
+    return _node(START_NODE_ID, "start", outputs=[_string_output("query")])
+
+
+def _end_node() -> Dict[str, Any]:
+    return _node(
+        END_NODE_ID,
+        "end",
+        inputs=[_ref_input("output", START_NODE_ID, "query")],
+        nodeParam={"outputMode": 0},
+    )
+
+
+def _text_joiner(node_id: str) -> Dict[str, Any]:
+    return _node(
+        node_id,
+        "text-joiner",
+        inputs=[_ref_input("query", START_NODE_ID, "query")],
+        outputs=[_string_output("output")],
+        nodeParam={"prompt": "{{query}}"},
+    )
+
+
+def _if_else(node_id: str, index: int) -> Dict[str, Any]:
+    return _node(
+        node_id,
+        "if-else",
+        inputs=[_ref_input("query", START_NODE_ID, "query")],
+        nodeParam={
+            "cases": [
+                {
+                    "id": f"branch_one_of::true-{index}",
+                    "level": 1,
+                    "logicalOperator": "and",
+                    "conditions": [
+                        {
+                            "leftVarIndex": "input-query",
+                            "compareOperator": "not_empty",
+                        }
+                    ],
+                },
+                {
+                    "id": f"branch_one_of::default-{index}",
+                    "level": 999,
+                    "logicalOperator": "and",
+                    "conditions": [],
+                },
+            ]
+        },
+    )
+
+
+def _edge(source: str, target: str, handle: str = "") -> Dict[str, str]:
+    return {"sourceNodeId": source, "targetNodeId": target, "sourceHandle": handle}
+
+
+def gen_wide_dsl(width: int, engine_mode: str) -> Dict[str, Any]:
+    """
+    Generate a workflow whose start node fans out to ``width`` parallel nodes.
+
+    :param width: Number of parallel nodes
+    :param engine_mode: Engine scheduling mode of the workflow
+    :return: Workflow DSL data
+    """
+    nodes = [_start_node(), _end_node()]
+    edges = []
+    for i in range(width):
+        node_id = f"text-joiner::wide-{i}"
+        nodes.append(_text_joiner(node_id))
+        edges.append(_edge(START_NODE_ID, node_id))
+        edges.append(_edge(node_id, END_NODE_ID))
+    return {"nodes": nodes, "edges": edges, "engineMode": engine_mode}
+
+
+def gen_deep_dsl(depth: int, engine_mode: str) -> Dict[str, Any]:
+    """
+    Generate a workflow of ``depth`` stacked if-else diamonds.
+
+    :param depth: Number of stacked diamonds
+    :param engine_mode: Engine scheduling mode of the workflow
+    :return: Workflow DSL data
+    """
+    nodes = [_start_node(), _end_node()]
+    edges = []
+    previous_node_id = START_NODE_ID
+    for i in range(depth):
+        if_else_id = f"if-else::deep-{i}"
+        true_id = f"text-joiner::deep-true-{i}"
+        false_id = f"text-joiner::deep-false-{i}"
+        join_id = f"text-joiner::deep-join-{i}"
+        nodes.extend(
+            [
+                _if_else(if_else_id, i),
+                _text_joiner(true_id),
+                _text_joiner(false_id),
+                _text_joiner(join_id),
+            ]
+        )
+        edges.extend(
+            [
+                _edge(previous_node_id, if_else_id),
+                _edge(if_else_id, true_id, f"branch_one_of::true-{i}"),
+                _edge(if_else_id, false_id, f"branch_one_of::default-{i}"),
+                _edge(true_id, join_id),
+                _edge(false_id, join_id),
+            ]
+        )
+        previous_node_id = join_id
+    edges.append(_edge(previous_node_id, END_NODE_ID))
+    return {"nodes": nodes, "edges": edges, "engineMode": engine_mode}
+
+
+async def run_engine(src_engine: WorkflowEngine, span: Span) -> Dict[str, Any]:
+    """
+    Run a built engine once the same way a chat request does.
+
+    :param src_engine: Engine to run, left untouched
+    :param span: Tracing span
+    :return: Outputs of the end node and the IDs of nodes that did not run
+    """
+    engine = src_engine.fork()
+    callbacks = ChatCallBacks(
+        sid=span.sid,
+        stream_queue=asyncio.Queue(),
+        end_node_output_mode=engine.end_node_output_mode,
+        support_stream_node_ids=engine.support_stream_node_ids,
+        need_order_stream_result_q=asyncio.Queue(),
+        chains=engine.engine_ctx.chains,
+        event_id="",
+        flow_id="bench",
+    )
+    result = await engine.async_run(
+        inputs={"query": "benchmark"},
+        span=span,
+        callback=callbacks,
+        history=[],
+        history_v2=[],
+        event_log_trace=WorkflowLog(flow_id="bench", sid=span.sid),
+    )
+    not_run = sorted(
+        node_id
+        for node_id, status in engine.engine_ctx.node_run_status.items()
+        if status.not_run.is_set()
+    )
+    return {"outputs": result.outputs, "not_run": not_run}
+
+
+def bench_one(dsl: Dict[str, Any], span: Span, rounds: int) -> Dict[str, Any]:
+    """
+    Measure build, pickle and run cost of one workflow.
+
+    :param dsl: Workflow DSL data
+    :param span: Tracing span
+    :param rounds: Number of runs to average
+    :return: Measured values
+    """
+    start = time.perf_counter()
+    engine = WorkflowEngineFactory.create_engine(WorkflowDSL.parse_obj(dsl), span)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    pickle_size = len(pickle.dumps(engine))
+
+    run_result: Dict[str, Any] = {}
+    start = time.perf_counter()
+    for _ in range(rounds):
+        run_result = asyncio.run(run_engine(engine, span))
+    run_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    return {
+        "build_ms": build_ms,
+        "pickle_kb": pickle_size / 1024,
+        "run_ms": run_ms,
+        "result": run_result,
+    }
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--wide", type=int, nargs="*", default=[8, 32, 128])
+    parser.add_argument("--deep", type=int, nargs="*", default=[2, 4, 8, 12])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+    # Span events are logged per node, keep them out of the measurement
+    logger.remove()
+
+    span = Span(app_id="bench")
+    cases = [("wide", n, gen_wide_dsl) for n in args.wide] + [
+        ("deep", n, gen_deep_dsl) for n in args.deep
+    ]
+    print(
+        f"{'shape':<6}{'n':>5}{'mode':>8}{'build ms':>12}"
+        f"{'pickle KB':>12}{'run ms':>10}  same result"
+    )
+    for shape, n, gen in cases:
+        results = {}
+        for mode in EngineModeEnum:
+            results[mode] = bench_one(gen(n, mode.value), span, args.rounds)
+        same = (
+            results[EngineModeEnum.CHAINS]["result"]
+            == results[EngineModeEnum.DAG]["result"]
+        )
+        for mode, result in results.items():
+            print(
+                f"{shape:<6}{n:>5}{mode.value:>8}{result['build_ms']:>12.1f}"
+                f"{result['pickle_kb']:>12.1f}{result['run_ms']:>10.1f}  {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
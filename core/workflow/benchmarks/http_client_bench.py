@@ -0,0 +1,103 @@
+"""
+Benchmark of outbound HTTP calls of the workflow nodes.
+
+Compares opening a new ``aiohttp.ClientSession`` for every call, as the nodes
+did before, with the shared HTTP client service whose per-host pools keep
+connections alive between calls. A local server answers the calls, so the
+difference is the connection setup of every call, which grows with TLS and
+network latency in production.
+
+Usage::
+
+    python -m workflow.benchmarks.http_client_bench --calls 500 --concurrency 1 16
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from aiohttp import ClientSession, web
+from workflow.extensions.middleware.http.manager import HttpClientService
+
+
+async def _handle(request: web.Request) -> web.Response:
+    body = await request.json()
+    return web.json_response({"code": 0, "data": body})
+
+
+async def per_call_session(url: str, payload: dict) -> Any:
+    async with ClientSession() as session:
+        async with session.post(url, json=payload) as resp:
+            return await resp.json()
+
+
+def pooled(client: HttpClientService) -> Callable[[str, dict], Awaitable[Any]]:
+    async def call(url: str, payload: dict) -> Any:
+        async with client.post(url, json=payload) as resp:
+            return await resp.json()
+
+    return call
+
+
+async def run_calls(
+    call: Callable[[str, dict], Awaitable[Any]], url: str, calls: int, concurrency: int
+) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            resp = await call(url, {"i": i})
+            assert resp["data"]["i"] == i
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(calls)))
+    return (time.perf_counter() - start_time) * 1_000_000 / calls
+
+
+async def bench(args: argparse.Namespace) -> None:
+    app = web.Application()
+    app.router.add_post("/run", _handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    url = f"http://127.0.0.1:{port}/run"
+
+    client = HttpClientService(
+        limit_per_host=args.limit_per_host,
+        keepalive_timeout=30,
+        dns_cache_ttl=300,
+        connect_timeout=30,
+    )
+    callers: Dict[str, Callable[[str, dict], Awaitable[Any]]] = {
+        "session": per_call_session,
+        "pooled": pooled(client),
+    }
+    try:
+        print(f"{'concurrency':>12}{'client':>10}{'us/call':>10}{'pool wait ms':>14}")
+        for concurrency in args.concurrency:
+            for name, call in callers.items():
+                run_us = await run_calls(call, url, args.calls, concurrency)
+                wait_ms = sum(stats.pool_wait_ms for stats in client.stats().values())
+                print(
+                    f"{concurrency:>12}{name:>10}{run_us:>10.1f}"
+                    f"{wait_ms if name == 'pooled' else 0:>14.1f}"
+                )
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="*", default=[1, 16])
+    parser.add_argument("--limit-per-host", type=int, default=8)
+    args = parser.parse_args(argv)
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
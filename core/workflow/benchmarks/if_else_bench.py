@@ -0,0 +1,268 @@
+"""
+Benchmark of if-else condition evaluation.
+
+Compares interpreting the branches of a condition-heavy if-else node on every
+run, resolving operand names and reading every operand from the variable pool
+before evaluating all conditions, as the node did before, with the branches
+compiled when the engine is built: literal operands read once, constant
+conditions evaluated ahead of time and evaluation stopped at the first
+condition that decides a branch.
+
+Usage::
+
+    python -m workflow.benchmarks.if_else_bench --branches 4 16 --conditions 4 8
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from loguru import logger
+from workflow.benchmarks.engine_mode_bench import (
+    END_NODE_ID,
+    START_NODE_ID,
+    _edge,
+    _end_node,
+    _node,
+    _ref_input,
+    _string_output,
+)
+from workflow.consts.engine.engine_mode import EngineModeEnum
+from workflow.engine.dsl_engine import WorkflowEngineFactory
+from workflow.engine.entities.variable_pool import VariablePool
+from workflow.engine.entities.workflow_dsl import WorkflowDSL
+from workflow.engine.nodes.entities.node_run_result import (
+    NodeRunResult,
+    WorkflowNodeExecutionStatus,
+)
+from workflow.engine.nodes.if_else.if_else_node import IfElseNodeData, IFElseNode
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.otlp.trace.span import Span
+
+IF_ELSE_ID = "if-else::bench-if-else"
+
+
+def _literal_input(name: str, value_type: str, value: Any) -> Dict[str, Any]:
+    return {
+        "id": f"input-{name}",
+        "name": name,
+        "schema": {"type": value_type, "value": {"type": "literal", "content": value}},
+    }
+
+
+def gen_dsl(branches: int, conditions: int) -> Dict[str, Any]:
+    """
+    Generate a workflow whose if-else node has ``branches`` condition branches.
+
+    Each branch checks ``conditions`` conditions of the start outputs against
+    literals. Only the last branch matches, the others fail on their first
+    condition.
+
+    :param branches: Number of branches besides the default branch
+    :param conditions: Number of conditions of each branch
+    :return: Workflow DSL data
+    """
+    start_node = _node(
+        START_NODE_ID,
+        "start",
+        outputs=[
+            _string_output("query"),
+            {"id": "output-count", "name": "count", "schema": {"type": "integer"}},
+        ],
+    )
+    inputs = [
+        _ref_input("query", START_NODE_ID, "query"),
+        _ref_input("count", START_NODE_ID, "count"),
+        _literal_input("keyword", "string", "weather"),
+        _literal_input("limit", "integer", 3),
+    ]
+    cases = []
+    for i in range(branches):
+        branch_conditions = [
+            (
+                {
+                    "leftVarIndex": "input-query",
+                    "rightVarIndex": "input-keyword",
+                    "compareOperator": (
+                        "contains" if i == branches - 1 or j else "not_contains"
+                    ),
+                }
+                if j % 2 == 0
+                else {
+                    "leftVarIndex": "input-count",
+                    "rightVarIndex": "input-limit",
+                    "compareOperator": "gt",
+                }
+            )
+            for j in range(conditions)
+        ]
+        # A condition on literals only, evaluated when the engine is built
+        branch_conditions.append(
+            {
+                "leftVarIndex": "input-limit",
+                "rightVarIndex": "input-limit",
+                "compareOperator": "eq",
+            }
+        )
+        cases.append(
+            {
+                "id": f"branch_one_of::case-{i}",
+                "level": i + 1,
+                "logicalOperator": "and",
+                "conditions": branch_conditions,
+            }
+        )
+    cases.append(
+        {
+            "id": "branch_one_of::default",
+            "level": 999,
+            "logicalOperator": "and",
+            "conditions": [],
+        }
+    )
+    if_else_node = _node(
+        IF_ELSE_ID, "if-else", inputs=inputs, nodeParam={"cases": cases}
+    )
+    return {
+        "nodes": [start_node, if_else_node, _end_node()],
+        "edges": [
+            _edge(START_NODE_ID, IF_ELSE_ID),
+            _edge(IF_ELSE_ID, END_NODE_ID, f"branch_one_of::case-{branches - 1}"),
+            _edge(IF_ELSE_ID, END_NODE_ID, "branch_one_of::default"),
+        ],
+        "engineMode": EngineModeEnum.DAG.value,
+    }
+
+
+class LegacyIFElseNode(IFElseNode):
+    """
+    If-else node evaluating its branches the way it did before compilation.
+    """
+
+    async def do_one_branch(
+        self,
+        variable_pool: VariablePool,
+        span: Span,
+        branch_data: IfElseNodeData,
+        **kwargs: Any,
+    ) -> NodeRunResult:
+        node_inputs: dict[str, list] = {"conditions": []}
+        process_datas: dict[str, list] = {"condition_results": []}
+        with span.start(
+            func_name="do_one_branch", add_source_function_name=True
+        ) as span_context:
+            try:
+                input_conditions = []
+                for condition in branch_data.conditions:
+                    left_var_name = self.input_identifier[0][condition.leftVarIndex]
+                    right_var_name = self.input_identifier[0].get(
+                        condition.rightVarIndex, ""
+                    )
+                    actual_value = variable_pool.get_variable(
+                        node_id=self.node_id, key_name=left_var_name, span=span_context
+                    )
+                    expected_value = None
+                    if right_var_name != "":
+                        expected_value = variable_pool.get_variable(
+                            node_id=self.node_id,
+                            key_name=right_var_name,
+                            span=span_context,
+                        )
+                    input_conditions.append(
+                        {
+                            "actual_value": actual_value,
+                            "expected_value": expected_value,
+                            "comparison_operator": condition.compareOperator,
+                        }
+                    )
+                node_inputs["conditions"] = input_conditions
+                for input_condition in input_conditions:
+                    process_datas["condition_results"].append(
+                        {**input_condition, "result": self._compare(input_condition)}
+                    )
+            except Exception as err:
+                return NodeRunResult(
+                    status=WorkflowNodeExecutionStatus.FAILED,
+                    inputs=node_inputs,
+                    process_data=process_datas,
+                    error=CustomException(
+                        CodeEnum.IF_ELSE_NODE_EXECUTION_ERROR, cause_error=err
+                    ),
+                    node_id=self.node_id,
+                    alias_name=self.alias_name,
+                    node_type=self.node_type,
+                )
+            results = [
+                condition["result"] for condition in process_datas["condition_results"]
+            ]
+            if branch_data.logicalOperator == "and":
+                compare_result = False not in results
+            else:
+                compare_result = True in results
+            return NodeRunResult(
+                status=WorkflowNodeExecutionStatus.SUCCEEDED,
+                inputs=node_inputs,
+                process_data=process_datas,
+                outputs={"res": compare_result},
+                edge_source_handle=branch_data.id,
+                node_id=self.node_id,
+                alias_name=self.alias_name,
+                node_type=self.node_type,
+            )
+
+
+async def run_node(
+    node: IFElseNode, variable_pool: VariablePool, span: Span, rounds: int
+) -> tuple[float, str]:
+    edge_source_handle = ""
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        result = await node.async_execute(variable_pool=variable_pool, span=span)
+        edge_source_handle = result.edge_source_handle or ""
+    return (time.perf_counter() - start_time) * 1_000_000 / rounds, edge_source_handle
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--branches", type=int, nargs="*", default=[4, 16])
+    parser.add_argument("--conditions", type=int, nargs="*", default=[4, 8])
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args(argv)
+    # Span events are logged per branch, keep them out of the measurement
+    logger.remove()
+
+    span = Span(app_id="bench")
+    print(f"{'branches':>9}{'conditions':>11}{'node':>10}{'us/run':>10}  branch")
+    for branches in args.branches:
+        for conditions in args.conditions:
+            dsl = WorkflowDSL.parse_obj(gen_dsl(branches, conditions))
+            engine = WorkflowEngineFactory.create_engine(dsl, span)
+            engine_ctx = engine.engine_ctx
+            variable_pool = engine_ctx.variable_pool
+            variable_pool.add_init_variable(
+                START_NODE_ID,
+                ["query", "count"],
+                {"query": "how is the weather today", "count": 5},
+                span,
+            )
+            node = engine_ctx.built_nodes[IF_ELSE_ID].node_instance
+            nodes = {
+                "legacy": LegacyIFElseNode(
+                    **{name: getattr(node, name) for name in IFElseNode.model_fields}
+                ),
+                "compiled": node,
+            }
+            for name, bench_node in nodes.items():
+                run_us, edge_source_handle = asyncio.run(
+                    run_node(bench_node, variable_pool, span, args.rounds)
+                )
+                print(
+                    f"{branches:>9}{conditions:>11}{name:>10}{run_us:>10.1f}"
+                    f"  {edge_source_handle}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark of the per-run engine context.
+
+Compares starting a run by deep copying the built engine with forking it, which
+shares the compiled flow and only allocates run state. For each workflow size
+the run-start latency and the memory held by every concurrent run are measured.
+
+Usage::
+
+    python -m workflow.benchmarks.run_context_bench --wide 8 32 128 --deep 4 8
+"""
+
+import argparse
+import copy
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from loguru import logger
+from workflow.benchmarks.engine_mode_bench import gen_deep_dsl, gen_wide_dsl
+from workflow.consts.engine.engine_mode import EngineModeEnum
+from workflow.engine.dsl_engine import WorkflowEngine, WorkflowEngineFactory
+from workflow.engine.entities.workflow_dsl import WorkflowDSL
+from workflow.extensions.otlp.trace.span import Span
+
+START_STRATEGIES: Dict[str, Callable[[WorkflowEngine], WorkflowEngine]] = {
+    "deepcopy": copy.deepcopy,
+    "fork": WorkflowEngine.fork,
+}
+
+
+def bench_start(
+    engine: WorkflowEngine,
+    start: Callable[[WorkflowEngine], WorkflowEngine],
+    rounds: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    """
+    Measure the run-start latency and the memory held per concurrent run.
+
+    :param engine: Built engine shared by all runs
+    :param start: Function creating the engine of one run
+    :param rounds: Number of run starts to average the latency over
+    :param concurrency: Number of run engines kept alive for the memory measure
+    :return: Measured values
+    """
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        start(engine)
+    start_ms = (time.perf_counter() - start_time) * 1000 / rounds
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    runs = [start(engine) for _ in range(concurrency)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del runs
+
+    return {"start_ms": start_ms, "run_kb": (current - baseline) / 1024 / concurrency}
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--wide", type=int, nargs="*", default=[8, 32, 128])
+    parser.add_argument("--deep", type=int, nargs="*", default=[4, 8])
+    parser.add_argument("--mode", default=EngineModeEnum.DAG.value)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args(argv)
+    # Span events are logged per node, keep them out of the measurement
+    logger.remove()
+
+    span = Span(app_id="bench")
+    cases = [("wide", n, gen_wide_dsl) for n in args.wide] + [
+        ("deep", n, gen_deep_dsl) for n in args.deep
+    ]
+    print(f"{'shape':<6}{'n':>5}{'start':>10}{'start ms':>12}{'KB per run':>12}")
+    for shape, n, gen in cases:
+        dsl: Dict[str, Any] = gen(n, args.mode)
+        engine = WorkflowEngineFactory.create_engine(WorkflowDSL.parse_obj(dsl), span)
+        for name, start in START_STRATEGIES.items():
+            result = bench_start(engine, start, args.rounds, args.concurrency)
+            print(
+                f"{shape:<6}{n:>5}{name:>10}"
+                f"{result['start_ms']:>12.2f}{result['run_kb']:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Benchmark of prompt template rendering.
+
+Compares rendering a node template by extracting its placeholders with regular
+expressions and replacing them one by one on every run, as the nodes did
+before, with joining the segments of the template compiled once. Both the
+string render of LLM, text joiner and end nodes and the template unit split of
+message and end node streaming are measured.
+
+Usage::
+
+    python -m workflow.benchmarks.template_bench --variables 4 16 64
+"""
+
+import argparse
+import json
+import re
+import time
+from typing import Any, Callable, Dict, List
+
+from loguru import logger
+from workflow.benchmarks.engine_mode_bench import (
+    START_NODE_ID,
+    _node,
+    _ref_input,
+    _start_node,
+    _string_output,
+)
+from workflow.consts.engine.template import TemplateSplitType
+from workflow.consts.engine.value_type import ValueType
+from workflow.engine.entities.variable_pool import VariablePool
+from workflow.engine.entities.workflow_dsl import WorkflowDSL
+from workflow.engine.nodes.util.prompt import (
+    PromptUtils,
+    TemplateUnitObj,
+    process_prompt,
+    prompt_template_replace,
+)
+from workflow.extensions.otlp.trace.span import Span
+from workflow.infra.providers.llm.iflytek_spark.const import RespFormatEnum
+
+NODE_ID = "message::bench-message"
+
+
+def gen_dsl(variables: int) -> Dict[str, Any]:
+    """
+    Generate a workflow whose message node references ``variables`` start outputs.
+
+    :param variables: Number of referenced variables
+    :return: Workflow DSL data
+    """
+    start_node = _start_node()
+    start_node["data"]["outputs"] = [
+        _string_output(f"var{i}") for i in range(variables)
+    ]
+    message_node = _node(
+        NODE_ID,
+        "message",
+        inputs=[
+            _ref_input(f"var{i}", START_NODE_ID, f"var{i}") for i in range(variables)
+        ],
+        outputs=[_string_output("output")],
+        nodeParam={"template": gen_template(variables)},
+    )
+    return {"nodes": [start_node, message_node], "edges": []}
+
+
+def gen_template(variables: int) -> str:
+    return "".join(
+        f"Paragraph {i} of the answer refers to {{{{var{i}}}}}.\n"
+        for i in range(variables)
+    )
+
+
+def legacy_placeholders(template: str) -> list[str]:
+    braces_pattern = re.compile(r"\{\{(.*?)}}")
+    segment_pattern = r"[A-Za-z0-9_-]+(?:\[-?\d+\])*"
+    variable_pattern = re.compile(rf"^{segment_pattern}(?:\.{segment_pattern})*$")
+    return [
+        key for key in braces_pattern.findall(template) if variable_pattern.match(key)
+    ]
+
+
+def legacy_replace(
+    template: str, input_identifier: list, pool: VariablePool, span: Span
+) -> str:
+    """
+    Render a template the way prompt_template_replace did before compilation.
+    """
+    placeholders = legacy_placeholders(template)
+    for placeholder in placeholders:
+        pool.get_variable_ref_node_id(NODE_ID, placeholder, span)
+    replacements = {}
+    for var_name in placeholders:
+        if re.split(r"[\[.\]]", var_name)[0].strip() in input_identifier:
+            replacements[var_name] = process_prompt(NODE_ID, var_name, pool, span)
+    for key, value in replacements.items():
+        if not isinstance(value, str):
+            value = json.dumps(value, ensure_ascii=False)
+        template = template.replace("{{" + key + "}}", value)
+    return template
+
+
+def legacy_units(template: str, pool: VariablePool, span: Span) -> list:
+    """
+    Split a template into units the way get_template_unit did before compilation.
+    """
+    placeholders = legacy_placeholders(template)
+    for placeholder in placeholders:
+        pool.get_variable_ref_node_id(NODE_ID, placeholder, span)
+    with_brackets = [f"{{{{{placeholder}}}}}" for placeholder in placeholders]
+    parts = re.split("(" + "|".join(map(re.escape, with_brackets)) + ")", template)
+    units = []
+    for i, part in enumerate(parts):
+        if part in with_brackets:
+            ref_node_info = pool.get_variable_ref_node_id(NODE_ID, part[2:-2], span)
+            unit = TemplateUnitObj(
+                key=part[2:-2],
+                key_type=TemplateSplitType.VARIABLE.value,
+                ref_node_info=ref_node_info,
+            )
+            if ref_node_info.ref_var_type == ValueType.LITERAL.value:
+                unit.key_type = TemplateSplitType.CONSTS.value
+            elif ref_node_info.llm_resp_format == RespFormatEnum.JSON.value:
+                unit.key_type = TemplateSplitType.LLM_JSON.value
+        else:
+            unit = TemplateUnitObj(value=part, key_type=TemplateSplitType.CONSTS.value)
+        unit.is_end = i == len(parts) - 1
+        units.append(unit)
+    return units
+
+
+def compiled_replace(
+    template: str, input_identifier: list, pool: VariablePool, span: Span
+) -> str:
+    return prompt_template_replace(input_identifier, template, NODE_ID, pool, span)
+
+
+def compiled_units(template: str, pool: VariablePool, span: Span) -> list:
+    return PromptUtils.get_template_unit(NODE_ID, template, pool, span)
+
+
+RENDERERS: Dict[str, Callable[[str, list, VariablePool, Span], str]] = {
+    "legacy": legacy_replace,
+    "compiled": compiled_replace,
+}
+
+SPLITTERS: Dict[str, Callable[[str, VariablePool, Span], list]] = {
+    "legacy": legacy_units,
+    "compiled": compiled_units,
+}
+
+
+def unit_fields(unit: TemplateUnitObj) -> tuple:
+    ref_node_info = vars(unit.ref_node_info) if unit.ref_node_info else None
+    return unit.key, unit.key_type, unit.value, unit.is_end, ref_node_info
+
+
+def timed(func: Callable[[], Any], rounds: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start_time) * 1_000_000 / rounds
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--variables", type=int, nargs="*", default=[4, 16, 64])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args(argv)
+    # Variable lookups log per call, keep them out of the measurement
+    logger.remove()
+
+    span = Span(app_id="bench")
+    print(f"{'vars':>5}{'path':>10}{'render us':>12}{'units us':>12}  same result")
+    for variables in args.variables:
+        pool = VariablePool(WorkflowDSL.parse_obj(gen_dsl(variables)).nodes)
+        keys = [f"var{i}" for i in range(variables)]
+        pool.add_init_variable(
+            START_NODE_ID, keys, {key: f"value of {key}" for key in keys}, span
+        )
+        template = gen_template(variables)
+        results = {}
+        for name in RENDERERS:
+            render, split = RENDERERS[name], SPLITTERS[name]
+            results[name] = (
+                render(template, keys, pool, span),
+                [unit_fields(unit) for unit in split(template, pool, span)],
+                timed(lambda: render(template, keys, pool, span), args.rounds),
+                timed(lambda: split(template, pool, span), args.rounds),
+            )
+        same = all(result[:2] == results["legacy"][:2] for result in results.values())
+        for name, (_, _, render_us, units_us) in results.items():
+            print(
+                f"{variables:>5}{name:>10}{render_us:>12.1f}{units_us:>12.1f}  {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark of the span event recording policy.
+
+Replays the span events of one chat request, the user input and workflow DSL,
+per-node inputs and outputs and one event per streamed LLM token, on a
+recording tracer and measures the tracing time per request and the bytes of
+events held by the exported spans, for each trace policy profile.
+
+Usage::
+
+    python -m workflow.benchmarks.trace_policy_bench --tokens 200 1000 --nodes 32
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Sequence
+
+from loguru import logger
+from opentelemetry import trace
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    SimpleSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+from workflow.benchmarks.engine_mode_bench import gen_wide_dsl
+from workflow.consts.engine.engine_mode import EngineModeEnum
+from workflow.extensions.otlp.trace.policy import PROFILES, set_trace_policy
+from workflow.extensions.otlp.trace.span import Span
+
+
+class _CountingExporter(SpanExporter):
+    """
+    Exporter keeping only the size of the exported span events.
+    """
+
+    def __init__(self) -> None:
+        self.event_bytes = 0
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        for span in spans:
+            for event in span.events:
+                self.event_bytes += len(
+                    json.dumps(dict(event.attributes or {}), ensure_ascii=False)
+                )
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        return None
+
+
+def _token_frame(index: int) -> Dict[str, Any]:
+    return {
+        "code": 0,
+        "message": "Success",
+        "id": "bench",
+        "workflow_step": {"seq": index, "progress": 0.5},
+        "choices": [{"delta": {"role": "assistant", "content": "token "}}],
+    }
+
+
+def run_request(span: Span, dsl: Dict[str, Any], nodes: int, tokens: int) -> None:
+    """
+    Record the span events of one chat request.
+
+    :param span: Request span
+    :param dsl: Workflow DSL of the request
+    :param nodes: Number of executed nodes
+    :param tokens: Number of streamed LLM tokens
+    """
+    with span.start("chat") as span_context:
+        span_context.add_info_event(f"user input: {json.dumps({'query': 'hi'})}")
+        span_context.add_info_event(
+            lambda: f"spark dsl: {json.dumps(dsl, ensure_ascii=False)}",
+            kind="spark dsl",
+        )
+        for index in range(nodes):
+            with span_context.start("node") as node_span:
+                node_span.add_info_events(
+                    {"inputs": json.dumps({"input": f"value {index}"})}
+                )
+                node_span.add_info_events(
+                    {"outputs": json.dumps({"output": f"value {index}"})}
+                )
+        for index in range(tokens):
+            frame = _token_frame(index)
+            span_context.add_info_events(
+                {"llm_resp": lambda: json.dumps(frame, ensure_ascii=False)}
+            )
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tokens", type=int, nargs="*", default=[200, 1000])
+    parser.add_argument("--nodes", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+    # Loguru still formats the messages, drop the sinks to keep IO out
+    logger.remove()
+
+    exporter = _CountingExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+
+    span = Span(app_id="bench")
+    dsl = gen_wide_dsl(args.nodes, EngineModeEnum.DAG.value)
+    print(f"{'tokens':>8} {'profile':>12} {'ms/request':>12} {'event KB':>10}")
+    for tokens in args.tokens:
+        for profile, policy in PROFILES.items():
+            set_trace_policy(policy)
+            exporter.event_bytes = 0
+            start_time = time.perf_counter()
+            for _ in range(args.rounds):
+                run_request(span, dsl, args.nodes, tokens)
+            request_ms = (time.perf_counter() - start_time) * 1000 / args.rounds
+            event_kb = exporter.event_bytes / 1024 / args.rounds
+            print(f"{tokens:>8} {profile:>12} {request_ms:>12.2f} {event_kb:>10.1f}")
+    set_trace_policy(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark of node output validation in the variable pool.
+
+Compares validating the outputs of every node of a run by scanning the whole
+output mapping and compiling a validator per node completion, as the pool did
+before, with the per-node validators compiled once when the pool is built.
+
+Usage::
+
+    python -m workflow.benchmarks.variable_pool_bench --nodes 100 --outputs 4
+"""
+
+import argparse
+import copy
+import time
+from typing import Any, Callable, Dict, List
+
+from workflow.benchmarks.engine_mode_bench import (
+    START_NODE_ID,
+    _edge,
+    _end_node,
+    _node,
+    _ref_input,
+    _start_node,
+    _string_output,
+)
+from workflow.consts.engine.engine_mode import EngineModeEnum
+from workflow.engine.entities.variable_pool import VariablePool
+from workflow.engine.entities.workflow_dsl import WorkflowDSL
+from workflow.utils.json_schema.json_schema_cn import CNValidator
+
+
+def gen_dsl(nodes: int, outputs: int) -> Dict[str, Any]:
+    """
+    Generate a workflow of ``nodes`` parallel nodes with ``outputs`` outputs each.
+
+    :param nodes: Number of nodes besides start and end
+    :param outputs: Number of outputs of each node
+    :return: Workflow DSL data
+    """
+    dsl_nodes = [_start_node(), _end_node()]
+    edges = []
+    for i in range(nodes):
+        node_id = f"text-joiner::node-{i}"
+        dsl_nodes.append(
+            _node(
+                node_id,
+                "text-joiner",
+                inputs=[_ref_input("query", START_NODE_ID, "query")],
+                outputs=[_string_output(f"output{j}") for j in range(outputs)],
+                nodeParam={"prompt": "{{query}}"},
+            )
+        )
+        edges.append(_edge(START_NODE_ID, node_id))
+    return {"nodes": dsl_nodes, "edges": edges, "engineMode": EngineModeEnum.DAG.value}
+
+
+def legacy_validate(pool: VariablePool, node_id: str, outputs: dict) -> None:
+    """
+    Validate node outputs the way the pool did before validators were compiled.
+
+    :param pool: Variable pool
+    :param node_id: ID of the node
+    :param outputs: Outputs of the node
+    """
+    required = []
+    schemas: dict = copy.deepcopy(pool.validate_template)
+    for mapping_key in pool.output_variable_mapping.keys():
+        if mapping_key.startswith(node_id):
+            mapping_value = pool.output_variable_mapping[mapping_key]
+            key = mapping_key.split(f"{node_id}-")[-1]
+            schemas["properties"].update({key: mapping_value.get("schema")})
+            if mapping_value.get("required", False):
+                required.append(key)
+    if required:
+        schemas.update({"required": required})
+    list(CNValidator(schemas).validate(outputs))
+
+
+def compiled_validate(pool: VariablePool, node_id: str, outputs: dict) -> None:
+    pool.do_validate(node_id=node_id, key_name_list=[], outputs=outputs)
+
+
+VALIDATORS: Dict[str, Callable[[VariablePool, str, dict], None]] = {
+    "legacy": legacy_validate,
+    "compiled": compiled_validate,
+}
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nodes", type=int, default=100)
+    parser.add_argument("--outputs", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    dsl = WorkflowDSL.parse_obj(gen_dsl(args.nodes, args.outputs))
+    start_time = time.perf_counter()
+    pool = VariablePool(dsl.nodes)
+    build_ms = (time.perf_counter() - start_time) * 1000
+    node_ids = [node.id for node in dsl.nodes if node.data.outputs]
+    outputs = {f"output{j}": "value" for j in range(args.outputs)}
+
+    print(f"pool build with validators: {build_ms:.2f} ms")
+    print(f"{'validator':>10} {'ms/run':>10} {'us/node':>10}")
+    for name, validate in VALIDATORS.items():
+        start_time = time.perf_counter()
+        for _ in range(args.rounds):
+            for node_id in node_ids:
+                validate(pool, node_id, outputs)
+        run_ms = (time.perf_counter() - start_time) * 1000 / args.rounds
+        print(f"{name:>10} {run_ms:>10.2f} {run_ms * 1000 / len(node_ids):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,18 @@ Workflow engine cache management module.
 
 This module provides caching functionality for workflow engines,
 including retrieval and storage operations for both debug and release engines.
+Built engines are kept in a per-process LRU in front of the Redis pickle cache,
+so hot flows skip unpickling on every request.
 """
 
+import os
 from datetime import datetime
+from typing import Tuple
 
+from common.utils.local_cache import LocalSizedLRUCache
 from workflow.engine.dsl_engine import WorkflowEngine
-from workflow.extensions.middleware.getters import get_cache_service
+from workflow.extensions.middleware.getters import get_async_cache_service
+from workflow.extensions.otlp.metric import metric
 from workflow.extensions.otlp.trace.span import Span
 
 # Cache prefix with hourly timestamp for engine cache keys
@@ -19,7 +25,7 @@ ENGINE_CACHE_PREFIX = (
 ENGINE_CACHE_EXPIRE_TIME = 60 * 30
 
 
-def get_engine(
+async def get_engine(
     is_release: bool, flow_id: str, version: str, app_alias_id: str
 ) -> bytes | None:
     """
@@ -35,18 +41,18 @@ def get_engine(
         key = f"{ENGINE_CACHE_PREFIX}:release:{flow_id}:{version}:{app_alias_id}"
     else:
         key = f"{ENGINE_CACHE_PREFIX}:debug:{flow_id}:{version}:{app_alias_id}"
-    cache_service = get_cache_service()
-    return cache_service[key]
+    cache_service = get_async_cache_service()
+    return await cache_service.get(key)
 
 
-def set_engine(
+async def set_engine(
     is_release: bool,
     flow_id: str,
     version: str,
     app_alias_id: str,
     sparkflow_engine: WorkflowEngine,
     span: Span,
-) -> None:
+) -> int:
     """
     Store workflow engine in cache.
 
@@ -56,7 +62,7 @@ def set_engine(
     :param app_alias_id: Application alias ID
     :param sparkflow_engine: Workflow engine to store
     :param span: Tracing span for monitoring
-    :return: None
+    :return: Pickled size of the engine in bytes, 0 if it could not be pickled
     """
     if is_release:
         key = f"{ENGINE_CACHE_PREFIX}:release:{flow_id}:{version}:{app_alias_id}"
@@ -64,5 +70,131 @@ def set_engine(
         key = f"{ENGINE_CACHE_PREFIX}:debug:{flow_id}:{version}:{app_alias_id}"
     engine_obj = sparkflow_engine.dumps(span)
     if engine_obj:
-        cache_service = get_cache_service()
-        cache_service[key] = engine_obj
+        cache_service = get_async_cache_service()
+        await cache_service.set(key, engine_obj)
+    return len(engine_obj)
+
+
+# Local cache key: (is_release, flow_id, version, app_alias_id, DSL update time in ms)
+LocalEngineKey = Tuple[bool, str, str, str, int]
+
+
+class LocalEngineCache(LocalSizedLRUCache[LocalEngineKey, WorkflowEngine]):
+    """
+    Per-process LRU cache of built workflow engines.
+
+    Entries are keyed by the DSL update time, so an updated flow never hits a
+    stale engine. The cache is bounded by entry count, by the total pickled size
+    of its engines and by a TTL. Cached engines are shared, callers must copy an
+    engine before running it.
+    """
+
+    def _on_event(self, event: str, reason: str = "") -> None:
+        _report_cache_event(event, reason)
+
+
+def _report_cache_event(event: str, reason: str = "") -> None:
+    """
+    Report an in-process engine cache event through the OTLP meter.
+
+    :param event: Cache event, one of hit, miss and eviction
+    :param reason: Eviction reason, one of size, bytes and ttl
+    """
+    if metric.engine_cache_counter is None:
+        return
+    attr = {
+        "server_name": os.getenv("SERVICE_NAME", "default"),
+        "pid": os.getpid(),
+        "event": event,
+    }
+    if reason:
+        attr["reason"] = reason
+    metric.engine_cache_counter.add(1, attr)
+
+
+_local_engine_cache: LocalEngineCache | None = None
+
+
+def get_local_engine_cache() -> LocalEngineCache:
+    """
+    Get the process wide local engine cache, creating it on first use.
+
+    The cache is configured by the following environment variables:
+        - LOCAL_ENGINE_CACHE_SIZE: Maximum number of cached engines (default: 128)
+        - LOCAL_ENGINE_CACHE_MAX_BYTES: Maximum total pickled size (default: 256MB)
+        - LOCAL_ENGINE_CACHE_TTL: Time to live in seconds (default: 1800)
+
+    :return: Local engine cache
+    """
+    global _local_engine_cache
+    if _local_engine_cache is None:
+        _local_engine_cache = LocalEngineCache(
+            max_size=int(os.getenv("LOCAL_ENGINE_CACHE_SIZE") or "128"),
+            max_bytes=int(os.getenv("LOCAL_ENGINE_CACHE_MAX_BYTES") or "268435456"),
+            ttl=int(
+                os.getenv("LOCAL_ENGINE_CACHE_TTL") or str(ENGINE_CACHE_EXPIRE_TIME)
+            ),
+        )
+    return _local_engine_cache
+
+
+def _local_engine_key(
+    is_release: bool,
+    flow_id: str,
+    version: str,
+    app_alias_id: str,
+    dsl_update_time: datetime,
+) -> LocalEngineKey:
+    return (
+        is_release,
+        flow_id,
+        version,
+        app_alias_id,
+        int(dsl_update_time.timestamp() * 1000),
+    )
+
+
+def get_local_engine(
+    is_release: bool,
+    flow_id: str,
+    version: str,
+    app_alias_id: str,
+    dsl_update_time: datetime,
+) -> WorkflowEngine | None:
+    """
+    Retrieve a built workflow engine from the per-process cache.
+
+    :param is_release: Whether this is a release version engine
+    :param flow_id: Flow ID
+    :param version: Engine version
+    :param app_alias_id: Application alias ID
+    :param dsl_update_time: Last update time of the workflow DSL
+    :return: Shared engine instance if found, None otherwise
+    """
+    key = _local_engine_key(is_release, flow_id, version, app_alias_id, dsl_update_time)
+    return get_local_engine_cache().get(key)
+
+
+def set_local_engine(
+    is_release: bool,
+    flow_id: str,
+    version: str,
+    app_alias_id: str,
+    dsl_update_time: datetime,
+    sparkflow_engine: WorkflowEngine,
+    size: int,
+) -> None:
+    """
+    Store a built workflow engine in the per-process cache.
+
+    :param is_release: Whether this is a release version engine
+    :param flow_id: Flow ID
+    :param version: Engine version
+    :param app_alias_id: Application alias ID
+    :param dsl_update_time: Last update time of the workflow DSL
+    :param sparkflow_engine: Workflow engine to store
+    :param size: Pickled size of the engine in bytes
+    :return: None
+    """
+    key = _local_engine_key(is_release, flow_id, version, app_alias_id, dsl_update_time)
+    get_local_engine_cache().set(key, sparkflow_engine, size)
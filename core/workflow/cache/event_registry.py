@@ -15,12 +15,18 @@ from workflow.consts.engine.chat_status import ChatStatus
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.graceful_shutdown.base_shutdown_event import BaseShutdownEvent
-from workflow.extensions.middleware.getters import get_cache_service
+from workflow.extensions.middleware.getters import (
+    get_async_cache_service,
+    get_cache_service,
+)
 from workflow.infra.audit_system.strategy.base_strategy import AuditStrategy
 
 # Redis key prefix for event-related data
 _EVENT_PREFIX = "sparkflowV2:event"
 
+# Interval between two checks of a resume queue in seconds
+_RESUME_DATA_POLL_INTERVAL = 0.2
+
 # Global audit strategy registry for events
 EVENT_AUDIT_STRATEGY: Dict[str, AuditStrategy] = {}
 
@@ -86,7 +92,7 @@ class EventRegistry(BaseShutdownEvent):
         return Event.parse_raw(data)
 
     @classmethod
-    def save_event(cls, event: Event) -> None:
+    async def save_event(cls, event: Event) -> None:
         """
         Save event to cache service.
 
@@ -94,7 +100,7 @@ class EventRegistry(BaseShutdownEvent):
         :param event: Event object to save
         """
         try:
-            get_cache_service().hash_set_ex(
+            await get_async_cache_service().hash_set_ex(
                 name=cls._event_key(),
                 key=event.event_id,
                 value=cls._encode(event),
@@ -104,7 +110,7 @@ class EventRegistry(BaseShutdownEvent):
             pass
 
     @classmethod
-    def init_event(cls, event: Event) -> None:
+    async def init_event(cls, event: Event) -> None:
         """
         Initialize event and save it to cache.
 
@@ -113,12 +119,12 @@ class EventRegistry(BaseShutdownEvent):
         :raise Exception: Raises exception if saving event fails
         """
         try:
-            cls.save_event(event)
+            await cls.save_event(event)
         except Exception as e:
             raise e
 
     @classmethod
-    def get_event(cls, event_id: str) -> Event:
+    async def get_event(cls, event_id: str) -> Event:
         """
         Get event information by event ID.
 
@@ -126,13 +132,15 @@ class EventRegistry(BaseShutdownEvent):
         :param event_id: Event ID string
         :return: Decoded event object if found, raises exception otherwise
         """
-        data = get_cache_service().hash_get(name=cls._event_key(), key=event_id)
+        data = await get_async_cache_service().hash_get(
+            name=cls._event_key(), key=event_id
+        )
         if not data:
             raise CustomException(err_code=CodeEnum.EVENT_REGISTRY_NOT_FOUND_ERROR)
         return cls._decode(data)
 
     @classmethod
-    def del_event(cls, event_id: str) -> None:
+    async def del_event(cls, event_id: str) -> None:
         """
         Delete event by event ID.
 
@@ -140,7 +148,7 @@ class EventRegistry(BaseShutdownEvent):
         :param event_id: ID of the event to delete
         """
         try:
-            get_cache_service().hash_del(cls._event_key(), event_id)
+            await get_async_cache_service().hash_del(cls._event_key(), event_id)
         except Exception:
             pass
 
@@ -157,7 +165,7 @@ class EventRegistry(BaseShutdownEvent):
             return {}
 
     @classmethod
-    def update_event(cls, event_id: str, key: str, value: Any) -> None:
+    async def update_event(cls, event_id: str, key: str, value: Any) -> None:
         """
         Update specified event attribute value and save.
 
@@ -166,16 +174,16 @@ class EventRegistry(BaseShutdownEvent):
         :param key: Attribute name string to update
         :param value: New attribute value
         """
-        event = cls.get_event(event_id)
+        event = await cls.get_event(event_id)
         if not event:
             return
         if not hasattr(event, key):
             raise ValueError(f"Event has no field named '{key}'")
         setattr(event, key, value)
-        cls.save_event(event)
+        await cls.save_event(event)
 
     @classmethod
-    def on_interrupt(cls, event_id: str) -> None:
+    async def on_interrupt(cls, event_id: str) -> None:
         """
         Handle event interruption.
 
@@ -183,23 +191,25 @@ class EventRegistry(BaseShutdownEvent):
 
         :param event_id: Unique identifier of the event
         """
-        event = cls.get_event(event_id)
+        event = await cls.get_event(event_id)
         if event:
             event.status = ChatStatus.INTERRUPT.value
-            cls.save_event(event)
+            await cls.save_event(event)
 
     @classmethod
-    def on_finished(cls, event_id: str) -> None:
+    async def on_finished(cls, event_id: str) -> None:
         """
         Called when event is finished.
 
         :param cls: Class itself
         :param event_id: Unique identifier of the event
         """
-        cls.del_event(event_id)
+        await cls.del_event(event_id)
 
     @classmethod
-    def on_interrupt_node_start(cls, event_id: str, node_id: str, timeout: int) -> None:
+    async def on_interrupt_node_start(
+        cls, event_id: str, node_id: str, timeout: int
+    ) -> None:
         """
         Called when interrupt node starts.
 
@@ -208,24 +218,24 @@ class EventRegistry(BaseShutdownEvent):
         :param node_id: Node ID
         :param timeout: Timeout in seconds
         """
-        event = cls.get_event(event_id)
+        event = await cls.get_event(event_id)
         if event:
             event.interrupt_node = node_id
             event.timeout = timeout
-            cls.save_event(event)
+            await cls.save_event(event)
 
     @classmethod
-    def on_interrupt_node_end(cls, event_id: str) -> None:
+    async def on_interrupt_node_end(cls, event_id: str) -> None:
         """
         Handle interrupt node end event.
 
         :param cls: Class itself for calling class methods
         :param event_id: Event ID as string
         """
-        event = cls.get_event(event_id)
+        event = await cls.get_event(event_id)
         if event:
             event.interrupt_node = ""
-            cls.save_event(event)
+            await cls.save_event(event)
 
     @classmethod
     async def write_resume_data(
@@ -244,13 +254,14 @@ class EventRegistry(BaseShutdownEvent):
             metadata_key = f"{queue_name}:metadata"
             current_time = int(time.time())
 
-            with get_cache_service().pipeline() as pipe:
+            cache = get_async_cache_service()
+            async with cache.pipeline() as pipe:
                 # Check if retries field exists
                 pipe.hexists(metadata_key, "retries")
-                result = pipe.execute()
+                result = await pipe.execute()
 
                 # Reopen pipeline to wrap all operations
-                pipe = get_cache_service().pipeline()
+                pipe = cache.pipeline()
                 if not result[0]:
                     pipe.hset(metadata_key, "retries", 0)
                 else:
@@ -263,7 +274,7 @@ class EventRegistry(BaseShutdownEvent):
                 pipe.expire(message_key, expire_time)
                 pipe.expire(metadata_key, expire_time)
 
-                pipe.execute()
+                await pipe.execute()
         except Exception as e:
             raise e
 
@@ -277,18 +288,17 @@ class EventRegistry(BaseShutdownEvent):
         :return: Dictionary containing message and metadata
         """
         try:
-            cache = get_cache_service()
+            cache = get_async_cache_service()
             message_key = f"{queue_name}"
             metadata_key = f"{queue_name}:metadata"
 
-            # Execute synchronous blpop in thread
-            result = await asyncio.to_thread(cache.blpop, message_key, timeout)
+            result = await cache.blpop(message_key, timeout)
 
             if result and len(result) == 2:
                 _, message = result
                 message_str = message.decode()
 
-                meta_result = await asyncio.to_thread(cache.hgetall_str, metadata_key)
+                meta_result = await cache.hgetall_str(metadata_key)
 
                 return {"message": message_str, "metadata": meta_result}
 
@@ -299,3 +309,25 @@ class EventRegistry(BaseShutdownEvent):
             )
         except Exception as e:
             raise e
+
+    @classmethod
+    async def wait_resume_data(cls, queue_name: str, timeout: float) -> bool:
+        """
+        Wait for data in specified queue without consuming it.
+
+        :param queue_name: Name of the queue
+        :param timeout: Timeout in seconds, 0 checks the queue once
+        :return: True if the queue holds data, False on timeout
+        """
+        cache = get_async_cache_service()
+        deadline = time.monotonic() + timeout
+        while True:
+            async with cache.pipeline() as pipe:
+                pipe.llen(queue_name)
+                result = await pipe.execute()
+            if result[0]:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(_RESUME_DATA_POLL_INTERVAL, remaining))
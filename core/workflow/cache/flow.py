@@ -6,7 +6,10 @@ including retrieval, storage, and deletion operations for flow data.
 """
 
 from workflow.domain.models.flow import Flow
-from workflow.extensions.middleware.getters import get_cache_service
+from workflow.extensions.middleware.getters import (
+    get_async_cache_service,
+    get_cache_service,
+)
 
 # Redis key prefix for flow information
 REDIS_FLOW_INFO_HEAD = "flows:flow_info:new"
@@ -25,6 +28,17 @@ def get_flow_by_id(flow_id: str) -> Flow | None:
     return app
 
 
+async def async_get_flow_by_id(flow_id: str) -> Flow | None:
+    """
+    Retrieve workflow flow information by flow ID from the async cache.
+
+    :param flow_id: Flow ID to retrieve
+    :return: Flow object if found, None otherwise
+    """
+    key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}"
+    return await get_async_cache_service().get(key)
+
+
 def set_flow_by_id(flow_id: str, flow: Flow) -> None:
     """
     Store workflow flow information in cache by flow ID.
@@ -38,6 +52,18 @@ def set_flow_by_id(flow_id: str, flow: Flow) -> None:
     cache_service.set(key=key, value=flow)
 
 
+async def async_set_flow_by_id(flow_id: str, flow: Flow) -> None:
+    """
+    Store workflow flow information in the async cache by flow ID.
+
+    :param flow_id: Flow ID to store
+    :param flow: Flow object to store
+    :return: None
+    """
+    key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}"
+    await get_async_cache_service().set(key, flow)
+
+
 def del_flow_by_id(flow_id: str) -> None:
     """
     Delete workflow flow information from cache by flow ID.
@@ -64,6 +90,18 @@ def get_flow_by_flow_id_version(flow_id: str, version: str) -> Flow | None:
     return app
 
 
+async def async_get_flow_by_flow_id_version(flow_id: str, version: str) -> Flow | None:
+    """
+    Retrieve workflow flow information by flow ID and version from the async cache.
+
+    :param flow_id: Flow ID to retrieve
+    :param version: Version string to retrieve
+    :return: Flow object if found, None otherwise
+    """
+    key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}:{version}"
+    return await get_async_cache_service().get(key)
+
+
 def set_flow_by_flow_id_version(flow_id: str, version: str, flow: Flow) -> None:
     """
     Store workflow flow information in cache by flow ID and version.
@@ -78,6 +116,21 @@ def set_flow_by_flow_id_version(flow_id: str, version: str, flow: Flow) -> None:
     cache_service.set(key=key, value=flow)
 
 
+async def async_set_flow_by_flow_id_version(
+    flow_id: str, version: str, flow: Flow
+) -> None:
+    """
+    Store workflow flow information in the async cache by flow ID and version.
+
+    :param flow_id: Flow ID to store
+    :param version: Version string to store
+    :param flow: Flow object to store
+    :return: None
+    """
+    key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}:{version}"
+    await get_async_cache_service().set(key, flow)
+
+
 def get_flow_by_flow_id_latest(flow_id: str) -> Flow | None:
     """
     Retrieve the latest workflow flow information by flow ID from cache.
@@ -91,6 +144,17 @@ def get_flow_by_flow_id_latest(flow_id: str) -> Flow | None:
     return app
 
 
+async def async_get_flow_by_flow_id_latest(flow_id: str) -> Flow | None:
+    """
+    Retrieve the latest workflow flow information by flow ID from the async cache.
+
+    :param flow_id: Flow ID to retrieve
+    :return: Latest Flow object if found, None otherwise
+    """
+    key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}:latest"
+    return await get_async_cache_service().get(key)
+
+
 def set_flow_by_flow_id_latest(flow_id: str, flow: Flow) -> None:
     """
     Store the latest workflow flow information in cache by flow ID.
@@ -104,6 +168,18 @@ def set_flow_by_flow_id_latest(flow_id: str, flow: Flow) -> None:
     cache_service.set(key=key, value=flow)
 
 
+async def async_set_flow_by_flow_id_latest(flow_id: str, flow: Flow) -> None:
+    """
+    Store the latest workflow flow information in the async cache by flow ID.
+
+    :param flow_id: Flow ID to store
+    :param flow: Flow object to store as latest version
+    :return: None
+    """
+    key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}:latest"
+    await get_async_cache_service().set(key, flow)
+
+
 def del_flow_by_flow_id_latest_version(flow_id: str) -> None:
     """
     Delete the latest workflow flow information from cache by flow ID.
@@ -0,0 +1,161 @@
+"""
+Response cache of LLM nodes.
+
+Nodes opting in with ``enableResponseCache`` record the response frames of a
+model call and replay them when the same request is sent again, so flows
+calling a model on identical rendered prompts (classification, extraction,
+routing) skip the model. Entries are keyed by a digest of the provider, the
+model, the rendered messages and the sampling parameters, and are cached in
+Redis, shared by all workers, and in a per-process LRU in front of it.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from common.utils.local_cache import LocalSizedLRUCache
+from loguru import logger
+from pydantic import BaseModel
+from workflow.extensions.middleware.getters import get_async_cache_service
+from workflow.extensions.otlp.metric import metric
+
+# Redis string of the JSON encoded response frames of one request
+LLM_RESPONSE_CACHE_PREFIX = "sparkflowV2:llm_response"
+
+
+# Per-process LRU cache of JSON encoded LLM response frames, bounded by entry
+# count, by the total size of its entries and by a TTL. Entries are stored
+# encoded, every hit decodes its own frames.
+LocalLLMResponseCache = LocalSizedLRUCache[str, bytes]
+
+
+_local_llm_response_cache: LocalLLMResponseCache | None = None
+
+
+def get_local_llm_response_cache() -> LocalLLMResponseCache:
+    """
+    Get the process wide local LLM response cache, creating it on first use.
+
+    The cache is configured by the following environment variables:
+        - LLM_RESPONSE_LOCAL_CACHE_SIZE: Maximum number of cached responses (default: 1024)
+        - LLM_RESPONSE_LOCAL_CACHE_MAX_BYTES: Maximum total size in bytes (default: 64MB)
+        - LLM_RESPONSE_CACHE_TTL: Time to live in seconds (default: 3600)
+
+    :return: Local LLM response cache
+    """
+    global _local_llm_response_cache
+    if _local_llm_response_cache is None:
+        _local_llm_response_cache = LocalLLMResponseCache(
+            max_size=int(os.getenv("LLM_RESPONSE_LOCAL_CACHE_SIZE") or "1024"),
+            max_bytes=int(
+                os.getenv("LLM_RESPONSE_LOCAL_CACHE_MAX_BYTES") or str(64 * 1024 * 1024)
+            ),
+            ttl=_cache_expire_time(),
+        )
+    return _local_llm_response_cache
+
+
+def llm_response_cache_key(request: Dict[str, Any]) -> str:
+    """
+    Build the cache key of a model request.
+
+    :param request: Provider, model, rendered messages and sampling parameters
+    :return: Response cache key
+    """
+    encoded = json.dumps(
+        request,
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=_encode_default,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+async def get_llm_response(key: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Look up response frames in the local cache, then in Redis.
+
+    :param key: Response cache key
+    :return: Response frames if cached, None otherwise
+    """
+    local_cache = get_local_llm_response_cache()
+    value = local_cache.get(key)
+    _report_cache_event("local", "miss" if value is None else "hit")
+    if value is not None:
+        return json.loads(value)
+
+    try:
+        cache = get_async_cache_service()
+        async with cache.pipeline() as pipe:
+            pipe.get(_llm_response_key(key))
+            (redis_value,) = await pipe.execute()
+    except Exception as e:
+        logger.warning(f"llm response cache get failed, {e}")
+        return None
+    _report_cache_event("redis", "miss" if not redis_value else "hit")
+    if not redis_value:
+        return None
+    value = (
+        redis_value if isinstance(redis_value, bytes) else redis_value.encode("utf-8")
+    )
+    local_cache.set(key, value)
+    return json.loads(value)
+
+
+async def set_llm_response(key: str, frames: List[str]) -> None:
+    """
+    Store the response frames of a completed model call.
+
+    Responses larger than LLM_RESPONSE_CACHE_MAX_ENTRY_BYTES (default: 1MB)
+    are not cached.
+
+    :param key: Response cache key
+    :param frames: JSON encoded response frames in the order they were received
+    """
+    value = f"[{','.join(frames)}]".encode("utf-8")
+    if len(value) > int(os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRY_BYTES") or "1048576"):
+        return
+    get_local_llm_response_cache().set(key, value)
+    try:
+        cache = get_async_cache_service()
+        async with cache.pipeline() as pipe:
+            pipe.set(_llm_response_key(key), value, ex=_cache_expire_time())
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"llm response cache set failed, {e}")
+
+
+def _llm_response_key(key: str) -> str:
+    return f"{LLM_RESPONSE_CACHE_PREFIX}:{key}"
+
+
+def _cache_expire_time() -> int:
+    return int(os.getenv("LLM_RESPONSE_CACHE_TTL") or "3600")
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.dict()
+    return str(value)
+
+
+def _report_cache_event(layer: str, event: str) -> None:
+    """
+    Report an LLM response cache lookup through the OTLP meter.
+
+    :param layer: Cache layer, one of local and redis
+    :param event: Lookup result, one of hit and miss
+    """
+    if metric.llm_response_cache_counter is None:
+        return
+    metric.llm_response_cache_counter.add(
+        1,
+        {
+            "server_name": os.getenv("SERVICE_NAME", "default"),
+            "pid": os.getpid(),
+            "layer": layer,
+            "event": event,
+        },
+    )
@@ -0,0 +1,85 @@
+"""
+Checkpoints of interrupted workflow runs.
+
+A run waiting for user input on a question-answer node can be saved to Redis
+and released from the worker. The first ``/resume`` request of the event
+claims the checkpoint and continues the run in its own process.
+"""
+
+import pickle
+from datetime import datetime
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+from workflow.consts.app_audit import AppAuditPolicy
+from workflow.domain.entities.chat import ChatVo
+from workflow.engine.entities.run_snapshot import RunSnapshot
+from workflow.extensions.middleware.getters import get_async_cache_service
+from workflow.extensions.otlp.trace.span import Span
+
+# Redis key prefix for run checkpoints
+_CHECKPOINT_PREFIX = "sparkflowV2:checkpoint"
+
+
+class RunCheckpoint(BaseModel):
+    """
+    Everything needed to continue an interrupted run on any worker.
+    """
+
+    event_id: str
+    app_alias_id: str
+    workflow_dsl: Dict
+    workflow_dsl_update_time: datetime
+    chat_vo: ChatVo
+    is_release: bool
+    app_audit_policy: AppAuditPolicy
+    snapshot: Optional[RunSnapshot] = None
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+def _checkpoint_key(event_id: str) -> str:
+    return f"{_CHECKPOINT_PREFIX}:{event_id}"
+
+
+async def save_run_checkpoint(
+    checkpoint: RunCheckpoint, expire_time: int, span: Span
+) -> bool:
+    """
+    Save a run checkpoint.
+
+    :param checkpoint: Checkpoint of the run
+    :param expire_time: Expiration time in seconds
+    :param span: Tracing span for monitoring
+    :return: True if saved, False if the run state could not be serialized or stored
+    """
+    try:
+        data = pickle.dumps(checkpoint)
+        cache = get_async_cache_service()
+        async with cache.pipeline() as pipe:
+            pipe.setex(_checkpoint_key(checkpoint.event_id), expire_time, data)
+            await pipe.execute()
+        span.add_info_events({"checkpoint_size": len(data)})
+        return True
+    except Exception as e:
+        span.record_exception(e)
+        return False
+
+
+async def claim_run_checkpoint(event_id: str) -> Optional[RunCheckpoint]:
+    """
+    Take the checkpoint of an event, at most one caller gets it.
+
+    :param event_id: Event ID
+    :return: Checkpoint of the run, None if there is none or another caller took it
+    """
+    cache = get_async_cache_service()
+    key = _checkpoint_key(event_id)
+    async with cache.pipeline() as pipe:
+        pipe.get(key)
+        pipe.delete(key)
+        data, deleted = await pipe.execute()
+    if not data or deleted != 1:
+        return None
+    return pickle.loads(data)
@@ -0,0 +1,177 @@
+"""
+Tool schema cache of plugin nodes.
+
+The OpenAPI schemas of Link tools are cached in Redis, shared with the other
+services calling Link, and in a short-lived per-process LRU in front of it, so
+plugin nodes skip fetching and decoding the schemas of a tool on every run.
+Entries are keyed by (app_id, tool_id, version). The Link management server
+deletes the Redis entries of a tool whenever it is written, the local TTL
+bounds how long other processes keep serving the previous schema. A schema
+fetched from Link before a write can still be stored after the delete, the
+short Redis TTL bounds how long it is served.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Tuple
+
+from common.utils.local_cache import LocalLRUCache
+from loguru import logger
+from workflow.extensions.middleware.getters import get_async_cache_service
+from workflow.extensions.otlp.metric import metric
+
+# Redis hash of the schemas of one tool, shared with the Link service which
+# deletes it on tool updates. Fields are "{app_id}:{version}".
+TOOL_SCHEMA_CACHE_PREFIX = "spark_link:tool_schema"
+
+# Local cache key: (app_id, tool_id, version)
+ToolSchemaKey = Tuple[str, str, str]
+
+# Per-process LRU of decoded tools, cached tools must not be modified
+LocalToolSchemaCache = LocalLRUCache[ToolSchemaKey, Dict[str, Any]]
+
+_local_tool_schema_cache: LocalToolSchemaCache | None = None
+
+
+def get_local_tool_schema_cache() -> LocalToolSchemaCache:
+    """
+    Get the process wide local tool schema cache, creating it on first use.
+
+    The cache is configured by the following environment variables:
+        - TOOL_SCHEMA_LOCAL_CACHE_SIZE: Maximum number of cached tools (default: 1024)
+        - TOOL_SCHEMA_LOCAL_CACHE_TTL: Time to live in seconds (default: 60)
+
+    :return: Local tool schema cache
+    """
+    global _local_tool_schema_cache
+    if _local_tool_schema_cache is None:
+        _local_tool_schema_cache = LocalToolSchemaCache(
+            max_size=int(os.getenv("TOOL_SCHEMA_LOCAL_CACHE_SIZE") or "1024"),
+            ttl=int(os.getenv("TOOL_SCHEMA_LOCAL_CACHE_TTL") or "60"),
+        )
+    return _local_tool_schema_cache
+
+
+def decode_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Decode the OpenAPI schema of a tool returned by Link.
+
+    :param tool: Tool whose schema is a JSON string
+    :return: Copy of the tool whose schema is a dict
+    """
+    schema = tool.get("schema") or "{}"
+    if isinstance(schema, str):
+        schema = json.loads(schema)
+    return {**tool, "schema": schema}
+
+
+async def get_tool_schemas(
+    app_id: str, tool_ids: List[str], version: str
+) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """
+    Look up tools in the local cache, then the missing ones in Redis.
+
+    :param app_id: Application ID
+    :param tool_ids: Tool IDs
+    :param version: Tool version
+    :return: Decoded tools found keyed by tool ID, and the IDs not found
+    """
+    local_cache = get_local_tool_schema_cache()
+    found: Dict[str, Dict[str, Any]] = {}
+    missing: List[str] = []
+    for tool_id in dict.fromkeys(tool_ids):
+        tool = local_cache.get((app_id, tool_id, version))
+        _report_cache_event("local", "miss" if tool is None else "hit")
+        if tool is None:
+            missing.append(tool_id)
+        else:
+            found[tool_id] = tool
+    if not missing:
+        return found, missing
+
+    try:
+        cache = get_async_cache_service()
+        async with cache.pipeline() as pipe:
+            for tool_id in missing:
+                pipe.hget(_tool_schema_key(tool_id), f"{app_id}:{version}")
+            values = await pipe.execute()
+    except Exception as e:
+        logger.warning(f"tool schema cache get failed, {e}")
+        return found, missing
+
+    still_missing = []
+    for tool_id, value in zip(missing, values):
+        _report_cache_event("redis", "miss" if not value else "hit")
+        if not value:
+            still_missing.append(tool_id)
+            continue
+        tool = decode_tool(json.loads(value))
+        local_cache.set((app_id, tool_id, version), tool)
+        found[tool_id] = tool
+    return found, still_missing
+
+
+async def set_tool_schemas(
+    app_id: str, version: str, tools: List[Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Store tools fetched from Link in Redis and in the local cache.
+
+    The Redis entries expire after TOOL_SCHEMA_CACHE_TTL seconds (default: 300).
+
+    :param app_id: Application ID
+    :param version: Tool version
+    :param tools: Tools returned by Link, whose schema is a JSON string
+    :return: Decoded tools keyed by tool ID
+    """
+    local_cache = get_local_tool_schema_cache()
+    decoded = {}
+    for tool in tools:
+        tool_id = tool.get("id")
+        if tool_id is None:
+            continue
+        decoded[tool_id] = decode_tool(tool)
+        local_cache.set((app_id, tool_id, version), decoded[tool_id])
+    if not decoded:
+        return decoded
+
+    expire_time = int(os.getenv("TOOL_SCHEMA_CACHE_TTL") or "300")
+    try:
+        cache = get_async_cache_service()
+        async with cache.pipeline() as pipe:
+            for tool in tools:
+                if tool.get("id") is None:
+                    continue
+                key = _tool_schema_key(tool["id"])
+                pipe.hset(
+                    key, f"{app_id}:{version}", json.dumps(tool, ensure_ascii=False)
+                )
+                pipe.expire(key, expire_time)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"tool schema cache set failed, {e}")
+    return decoded
+
+
+def _tool_schema_key(tool_id: str) -> str:
+    return f"{TOOL_SCHEMA_CACHE_PREFIX}:{tool_id}"
+
+
+def _report_cache_event(layer: str, event: str) -> None:
+    """
+    Report a tool schema cache lookup through the OTLP meter.
+
+    :param layer: Cache layer, one of local and redis
+    :param event: Lookup result, one of hit and miss
+    """
+    if metric.tool_schema_cache_counter is None:
+        return
+    metric.tool_schema_cache_counter.add(
+        1,
+        {
+            "server_name": os.getenv("SERVICE_NAME", "default"),
+            "pid": os.getpid(),
+            "layer": layer,
+            "event": event,
+        },
+    )
@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class EngineModeEnum(Enum):
+    """
+    Engine scheduling mode enumeration.
+
+    Selects how the workflow engine tracks node dependencies and branch activity.
+    """
+
+    # Enumerate every simple path from the start node
+    CHAINS = "chains"
+    # Compiled adjacency lists with per-edge branch deactivation
+    DAG = "dag"
@@ -98,29 +98,17 @@ class ChatCallBacks:
         self.event_id = event_id
         self.flow_id = flow_id
 
-        if chains:
-            self.all_simple_paths_node_cnt = chains.get_all_simple_paths_node_cnt()
-
     def _get_node_progress(self, current_execute_node_id: str) -> float:
         """
         Calculate the current execution progress of the workflow.
 
-        Progress calculation rules:
-        - If a simple path is marked as inactive, all nodes in that path are considered completed
-        - Otherwise, count the number of executed nodes in each simple path
+        Progress is delegated to the execution chains, which know which nodes
+        have been executed or deactivated.
 
         :param current_execute_node_id: ID of the currently executing node
         :return: Progress value between 0.0 and 1.0
         """
-        completed_node_cnt = 0
-        for simple_path in self.chains.master_chains:
-            if simple_path.inactive.is_set():
-                completed_node_cnt += len(simple_path.node_id_list)
-            else:
-                completed_node_cnt += simple_path.every_node_index.get(
-                    current_execute_node_id, 0
-                )
-        return completed_node_cnt / self.all_simple_paths_node_cnt
+        return self.chains.get_node_progress(current_execute_node_id)
 
     async def on_sparkflow_start(self) -> None:
         """
@@ -419,6 +407,68 @@ class ChatCallBacks:
             await self.stream_queue.put(resp)
 
 
+class IterationItemCallBacks(ChatCallBacks):
+    """
+    Callback handler for one item of an iteration running items concurrently.
+
+    Frames of message and end nodes are buffered until the item is released,
+    so that ordered output of items running side by side is streamed item after
+    item. Token usage is aggregated into the parent handler.
+    """
+
+    def __init__(self, parent: ChatCallBacks):
+        """
+        Initialize the item callback handler.
+
+        :param parent: Callback handler of the workflow run
+        """
+        super().__init__(
+            sid=parent.sid,
+            stream_queue=parent.stream_queue,
+            end_node_output_mode=parent.end_node_output_mode,
+            support_stream_node_ids=parent.support_stream_node_id_set,
+            need_order_stream_result_q=parent.order_stream_result_q,
+            chains=parent.chains,
+            event_id=parent.event_id,
+            flow_id=parent.flow_id,
+        )
+        self.generate_usage = parent.generate_usage
+        self.released = False
+        self.buffered_frames: list[ChatCallBackStreamResult] = []
+
+    async def release(self) -> None:
+        """
+        Flush buffered frames and stream following frames directly.
+        """
+        self.released = True
+        for frame in self.buffered_frames:
+            await self.order_stream_result_q.put(frame)
+        self.buffered_frames.clear()
+
+    async def _put_frame_into_queue(
+        self, node_id: str, resp: LLMGenerate, finish_reason: str = ""
+    ) -> None:
+        """
+        Add node response frame to the queues, buffering ordered frames until released.
+
+        :param node_id: Unique identifier of the node
+        :param resp: Generated response from the node
+        :param finish_reason: Reason for node completion
+        """
+        if self.released or node_id.split(":")[0] not in [
+            NodeType.MESSAGE.value,
+            NodeType.END.value,
+        ]:
+            return await super()._put_frame_into_queue(node_id, resp, finish_reason)
+        self.buffered_frames.append(
+            ChatCallBackStreamResult(
+                node_id=node_id,
+                node_answer_content=resp,
+                finish_reason=finish_reason,
+            )
+        )
+
+
 class ChatCallBackConsumer:
     """
     Consumer for callback function results with data organization.
@@ -469,6 +519,9 @@ class ChatCallBackConsumer:
                 if result.node_id not in self.structured_data:
                     self.structured_data[result.node_id] = Queue()
                 await self.structured_data[result.node_id].put(result)
+                if result.finish_reason == ChatStatus.FINISH_REASON.value:
+                    # A later frame of the node starts a new stream, e.g. of the next iteration item
+                    self.support_stream_node_id_set.discard(result.node_id)
                 # Workflow execution completed
                 if (
                     result.node_id.split("::")[0] == NodeType.END.value
@@ -519,7 +572,6 @@ class StructuredConsumer:
         support_stream_node_id_queue: Queue,
         structured_data: Dict[str, Queue],
         stream_queue: Queue,
-        support_stream_node_id_set: set,
     ) -> None:
         """
         Initialize the structured consumer.
@@ -527,12 +579,10 @@ class StructuredConsumer:
         :param support_stream_node_id_queue: Queue for node IDs supporting streaming
         :param structured_data: Dictionary of queues organized by node ID
         :param stream_queue: Final output queue for streaming results
-        :param support_stream_node_id_set: Set of node IDs that support streaming
         """
         self.support_stream_node_id_queue = support_stream_node_id_queue
         self.structured_data = structured_data
         self.stream_queue = stream_queue
-        self.support_stream_node_id_set = support_stream_node_id_set
 
     async def consume(self) -> None:
         """
@@ -563,8 +613,10 @@ class StructuredConsumer:
         """
         Output streaming data in order for a specific node.
 
-        Processes all results from a node's queue and outputs them sequentially
-        to the final stream queue. Handles node completion and cleanup.
+        Processes the results of one stream of a node from the node's queue and
+        outputs them sequentially to the final stream queue. A node streaming
+        several times, like a message node inside an iteration, is queued once
+        per stream and its queue is kept for the following streams.
 
         :param node_id: Unique identifier of the node to process
         """
@@ -577,8 +629,6 @@ class StructuredConsumer:
                 if isinstance(result, ChatCallBackStreamResult):
                     await self.stream_queue.put(result.node_answer_content)
                     if result.finish_reason == ChatStatus.FINISH_REASON.value:
-                        self.support_stream_node_id_set.remove(node_id)
-                        self.structured_data.pop(node_id)
                         break
                 else:
                     raise Exception(
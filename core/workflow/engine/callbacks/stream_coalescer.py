@@ -0,0 +1,170 @@
+"""
+Coalescing of streamed output frames.
+
+LLM nodes emit one frame per token. For apps that opt in, consecutive content
+deltas of the same node are merged into one frame, bounded by a time window
+and a size threshold, to cut the per-frame serialization and SSE overhead.
+"""
+
+import os
+import time
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel
+from workflow.engine.callbacks.openai_types_sse import LLMGenerate, WorkflowStep
+
+
+class StreamCoalescePolicy(BaseModel):
+    """
+    Bounds of a merged frame.
+    """
+
+    # Longest time a delta is held back before it is sent, in milliseconds
+    window_ms: int = 50
+    # Merged content size in bytes that sends the frame immediately
+    max_bytes: int = 1024
+
+
+def get_stream_coalesce_policy(app_id: str) -> Optional[StreamCoalescePolicy]:
+    """
+    Get the coalescing policy of an app.
+
+    :param app_id: Application ID
+    :return: Coalescing policy, None if the app streams every frame as is
+    """
+    coalesce_apps = os.getenv("SSE_COALESCE_APPS", "").split(",")
+    if app_id not in coalesce_apps and "*" not in coalesce_apps:
+        return None
+    return StreamCoalescePolicy(
+        window_ms=int(os.getenv("SSE_COALESCE_WINDOW_MS") or "50"),
+        max_bytes=int(os.getenv("SSE_COALESCE_MAX_BYTES") or "1024"),
+    )
+
+
+class StreamCoalescer:
+    """
+    Merges consecutive content frames of the same node.
+
+    Frames are pushed in arrival order and come back in the same order, with
+    runs of plain content deltas folded into their first frame. Frames that
+    finish, interrupt or carry no content are never merged and flush the
+    pending frame ahead of themselves.
+    """
+
+    def __init__(
+        self,
+        policy: StreamCoalescePolicy,
+        last_workflow_step: WorkflowStep,
+        renumber: bool,
+    ) -> None:
+        """
+        :param policy: Bounds of a merged frame
+        :param last_workflow_step: Sequence and progress tracker of the stream
+        :param renumber: Whether frame sequence numbers come from last_workflow_step
+        """
+        self.policy = policy
+        self.last_workflow_step = last_workflow_step
+        self.renumber = renumber
+        self.received = 0
+        self.sent = 0
+        self._pending: Optional[LLMGenerate] = None
+        self._pending_key: Optional[Tuple[str, bool]] = None
+        self._content: List[str] = []
+        self._reasoning_content: List[str] = []
+        self._size = 0
+        self._deadline = 0.0
+
+    @staticmethod
+    def _merge_key(frame: LLMGenerate, node_id: str) -> Optional[Tuple[str, bool]]:
+        """
+        :return: Key shared by frames that can be merged, None if the frame is not mergeable
+        """
+        choice = frame.choices[0]
+        if frame.event_data or choice.finish_reason or frame.code != 0:
+            return None
+        if not choice.delta.content and not choice.delta.reasoning_content:
+            return None
+        # Reasoning deltas and answer deltas are merged separately
+        return node_id, bool(choice.delta.reasoning_content)
+
+    def timeout(self) -> Optional[float]:
+        """
+        :return: Seconds until the pending frame is due, None if nothing is pending
+        """
+        if self._pending is None:
+            return None
+        return max(self._deadline - time.monotonic(), 0.0)
+
+    def push(self, frame: LLMGenerate, node_id: str) -> List[LLMGenerate]:
+        """
+        Add a frame to the stream.
+
+        :param frame: Filtered response frame
+        :param node_id: ID of the node that produced the frame
+        :return: Frames to send now, in order
+        """
+        self.received += 1
+        ready: List[LLMGenerate] = []
+        key = self._merge_key(frame, node_id)
+
+        if key is None:
+            ready.extend(self.flush())
+            self.sent += 1
+            ready.append(frame)
+            return ready
+
+        if self._pending is not None and key != self._pending_key:
+            ready.extend(self.flush())
+
+        if self._pending is None:
+            self._start(frame, key)
+        else:
+            self._merge(frame)
+
+        if self._size >= self.policy.max_bytes:
+            ready.extend(self.flush())
+        return ready
+
+    def flush(self) -> List[LLMGenerate]:
+        """
+        Take the pending frame.
+
+        :return: The merged frame, empty if nothing is pending
+        """
+        frame = self._pending
+        if frame is None:
+            return []
+        delta = frame.choices[0].delta
+        delta.content = "".join(self._content)
+        delta.reasoning_content = "".join(self._reasoning_content)
+        self._pending = None
+        self._pending_key = None
+        self.sent += 1
+        return [frame]
+
+    def _start(self, frame: LLMGenerate, key: Tuple[str, bool]) -> None:
+        delta = frame.choices[0].delta
+        self._pending = frame
+        self._pending_key = key
+        self._content = [delta.content]
+        self._reasoning_content = [delta.reasoning_content]
+        self._size = len(delta.content.encode()) + len(delta.reasoning_content.encode())
+        self._deadline = time.monotonic() + self.policy.window_ms / 1000
+
+    def _merge(self, frame: LLMGenerate) -> None:
+        assert self._pending is not None
+        delta = frame.choices[0].delta
+        self._content.append(delta.content)
+        self._reasoning_content.append(delta.reasoning_content)
+        self._size += len(delta.content.encode()) + len(
+            delta.reasoning_content.encode()
+        )
+
+        pending_step = self._pending.workflow_step
+        if pending_step and frame.workflow_step:
+            pending_step.progress = frame.workflow_step.progress
+            if self.renumber:
+                # The merged frame keeps its sequence number, hand this one back
+                self.last_workflow_step.seq = pending_step.seq
+        if frame.usage:
+            self._pending.usage = frame.usage
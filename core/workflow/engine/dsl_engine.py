@@ -15,12 +15,14 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field
 from workflow.consts.engine.chat_status import ChatStatus, SparkLLMStatus
+from workflow.consts.engine.engine_mode import EngineModeEnum
 from workflow.consts.engine.error_handler import ErrorHandler
 from workflow.consts.engine.model_provider import ModelProviderEnum
 from workflow.consts.engine.value_type import ValueType
 from workflow.domain.entities.chat import HistoryItem
 from workflow.engine.callbacks.callback_handler import ChatCallBacks
-from workflow.engine.entities.chains import Chains, SimplePath
+from workflow.engine.entities.chains import Chains
+from workflow.engine.entities.dag_chains import DagChains
 from workflow.engine.entities.msg_or_end_dep_info import MsgOrEndDepInfo
 from workflow.engine.entities.node_entities import (
     CONTINUE_ON_ERROR_NOT_STREAM_NODE_TYPE,
@@ -30,6 +32,7 @@ from workflow.engine.entities.node_entities import (
 from workflow.engine.entities.node_running_status import NodeRunningStatus
 from workflow.engine.entities.output_mode import EndNodeOutputModeEnum
 from workflow.engine.entities.retry_config import RetryConfig
+from workflow.engine.entities.run_snapshot import HibernateHandler, RunSnapshot
 from workflow.engine.entities.variable_pool import VariablePool
 from workflow.engine.entities.workflow_dsl import Edge, Node, NodeRef, WorkflowDSL
 from workflow.engine.node import NodeFactory, SparkFlowEngineNode
@@ -39,6 +42,8 @@ from workflow.engine.nodes.entities.node_run_result import (
     NodeRunResult,
     WorkflowNodeExecutionStatus,
 )
+from workflow.engine.nodes.if_else.if_else_node import IFElseNode
+from workflow.engine.nodes.util.prompt import compile_node_templates
 from workflow.exception.e import CustomException, CustomExceptionInterrupt
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.log_trace.workflow_log import WorkflowLog
@@ -90,6 +95,11 @@ class WorkflowEngineCtx(BaseModel):
     # List of depth-first search execution tasks
     dfs_tasks: list[Task] = Field(default_factory=list)
 
+    # Checkpoints the run while a question-answer node waits for input
+    hibernate_handler: Optional[HibernateHandler] = None
+    # Result of the node the run was checkpointed on, the run stops once set
+    hibernated_result: Optional[NodeRunResult] = None
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -697,6 +707,7 @@ class DefaultNodeExecutionStrategy(NodeExecutionStrategy):
             node_run_status=engine_ctx.node_run_status,
             chains=engine_ctx.chains,
             built_nodes=engine_ctx.built_nodes,
+            hibernate_handler=engine_ctx.hibernate_handler,
         )
 
     def can_handle(self, node_type: str) -> bool:
@@ -838,13 +849,7 @@ class WorkflowEngine(BaseModel):
 
         with span.start("engine_async_run") as span_context:
             # Initialize parameters
-            if self.sparkflow_engine_node.node_id.startswith(NodeType.START.value):
-                self.engine_ctx.qa_node_lock = asyncio.Lock()
-                for _, iter_eng in self.engine_ctx.iteration_engine.items():
-                    iter_eng.engine_ctx.qa_node_lock = self.engine_ctx.qa_node_lock
-            self.engine_ctx.end_complete = asyncio.Event()
-            self.engine_ctx.callback = callback
-            self.engine_ctx.event_log_trace = event_log_trace
+            self._init_run_context(callback, event_log_trace)
 
             self._validate_start_node()
             await self._initialize_variable_pool_with_start_node(
@@ -852,22 +857,77 @@ class WorkflowEngine(BaseModel):
             )
 
             # Execute the workflow
-            return await self._execute_workflow_internal(span_context)
+            return await self._execute_workflow_internal(
+                self.sparkflow_engine_node, span_context
+            )
 
-    async def _execute_workflow_internal(self, span: Span) -> NodeRunResult:
+    async def async_resume(
+        self,
+        snapshot: RunSnapshot,
+        span: Span,
+        callback: ChatCallBacks,
+        event_log_trace: WorkflowLog,
+    ) -> NodeRunResult:
+        """
+        Continue a checkpointed run from its interrupt node.
+
+        The engine must be freshly forked from an engine built from the same DSL.
+
+        :param snapshot: Run state captured by ``snapshot``
+        :param span: Tracing span for observability
+        :param callback: Callback handler for workflow events
+        :param event_log_trace: Event log trace for workflow execution tracking
+        :return: NodeRunResult containing the final execution result
+        """
+        with span.start("engine_async_resume") as span_context:
+            self._init_run_context(callback, event_log_trace)
+            self._restore(snapshot, span_context)
+            return await self._execute_workflow_internal(
+                self.engine_ctx.built_nodes[snapshot.interrupt_node_id], span_context
+            )
+
+    def _init_run_context(
+        self, callback: ChatCallBacks, event_log_trace: WorkflowLog
+    ) -> None:
+        """
+        Initialize the per-run synchronization primitives and handlers.
+
+        :param callback: Callback handler for workflow events
+        :param event_log_trace: Event log trace for workflow execution tracking
+        :return: None
+        """
+        if self.sparkflow_engine_node.node_id.startswith(NodeType.START.value):
+            self.engine_ctx.qa_node_lock = asyncio.Lock()
+            for _, iter_eng in self.engine_ctx.iteration_engine.items():
+                iter_eng.engine_ctx.qa_node_lock = self.engine_ctx.qa_node_lock
+        self.engine_ctx.end_complete = asyncio.Event()
+        self.engine_ctx.callback = callback
+        self.engine_ctx.event_log_trace = event_log_trace
+
+    async def _execute_workflow_internal(
+        self, start_node: SparkFlowEngineNode, span: Span
+    ) -> NodeRunResult:
         """
         Internal workflow execution logic.
 
+        :param start_node: Node the depth-first search starts from
         :param span: Tracing span for observability
         :return: NodeRunResult containing the final execution result
         """
 
         # Start depth-first search execution
-        await self._depth_first_search_execution(self.sparkflow_engine_node, span)
+        await self._depth_first_search_execution(start_node, span)
 
         # Wait for completion
         await self.engine_ctx.end_complete.wait()
 
+        # The run was checkpointed, it goes on from the checkpoint on resume
+        if self.engine_ctx.hibernated_result:
+            await self._cancel_pending_task(
+                {task for task in self.engine_ctx.dfs_tasks if not task.done()}
+            )
+            return self.engine_ctx.hibernated_result
+
         # Wait for all tasks to complete
         await self._wait_all_tasks_completion(span)
 
@@ -927,6 +987,12 @@ class WorkflowEngine(BaseModel):
                 node, span_context
             )
 
+            if run_result.status == WorkflowNodeExecutionStatus.HIBERNATED:
+                # Nothing runs after the node in this process
+                self.engine_ctx.hibernated_result = run_result
+                self.engine_ctx.end_complete.set()
+                return [], None
+
             # Mark node as complete
             self.engine_ctx.node_run_status[node.node_id].complete.set()
 
@@ -1610,15 +1676,11 @@ class WorkflowEngine(BaseModel):
     ) -> None:
         with span.start("deactivate_branch_paths") as span_context:
             for node_id in node_ids:
-                node_chains = self.engine_ctx.chains.get_branch_chains(
+                inactive_paths = self.engine_ctx.chains.deactivate_branch(
                     current_node_id, node_id
                 )
-                for simple_path in node_chains:
-                    if not simple_path.inactive.is_set():
-                        simple_path.inactive.set()
-                        span_context.add_info_events(
-                            {"inactive": simple_path.node_id_list}
-                        )
+                for node_id_list in inactive_paths:
+                    span_context.add_info_events({"inactive": node_id_list})
 
     async def _set_nodes_logical_run_status(
         self, not_run_node_ids: List[str], span: Span
@@ -1631,25 +1693,19 @@ class WorkflowEngine(BaseModel):
         :return: None
         """
         for not_run_node_id in not_run_node_ids:
-            # Get chains that the current node belongs to
-            chains_of_node = self.engine_ctx.chains.get_node_chains(
-                not_run_node_id
-            ) or self.engine_ctx.chains.get_node_chains_with_node_id(not_run_node_id)
-
-            # Check if there are any active chains
-            node_should_not_run = True
-            for chain in chains_of_node:
-                if not chain.inactive.is_set():
-                    node_should_not_run = False
-                    break
-
-            if node_should_not_run:
+            node_status = self.engine_ctx.node_run_status[not_run_node_id]
+            # Successors were already visited when the node was first marked
+            if node_status.not_run.is_set():
+                continue
+
+            # Check if the node can still be reached by an active chain
+            if self.engine_ctx.chains.is_node_inactive(not_run_node_id):
                 # Set node status
-                node_status = self.engine_ctx.node_run_status[not_run_node_id]
                 node_status.not_run.set()
                 node_status.processing.set()
                 node_status.complete.set()
                 node_status.start_with_thread.set()
+                self.engine_ctx.chains.deactivate_node(not_run_node_id)
 
                 if span:
                     span.add_info_events({"not_run_node_id": not_run_node_id})
@@ -1689,26 +1745,16 @@ class WorkflowEngine(BaseModel):
         if node_type in [NodeType.START.value, NodeType.ITERATION_START.value]:
             return
 
-        node_chains = self.engine_ctx.chains.get_node_chains(node.node_id)
         tasks = []
 
-        for simple_path in node_chains:
-            if simple_path.inactive.is_set():
-                continue
-
-            # Create waiting tasks for each predecessor node
-            for i in range(len(simple_path.node_id_list) - 1):
-                pre_node_id, current_node_id = (
-                    simple_path.node_id_list[i],
-                    simple_path.node_id_list[i + 1],
-                )
-
-                if current_node_id == node.node_id:
-                    tasks.extend(
-                        self._create_predecessor_wait_tasks(
-                            node, pre_node_id, simple_path
-                        )
-                    )
+        # Create waiting tasks for each predecessor node on active chains
+        for (
+            pre_node_id,
+            inactive,
+        ) in self.engine_ctx.chains.get_pre_node_inactive_events(node.node_id):
+            tasks.extend(
+                self._create_predecessor_wait_tasks(node, pre_node_id, inactive)
+            )
 
         if tasks:
             await asyncio.wait(tasks)
@@ -1728,14 +1774,14 @@ class WorkflowEngine(BaseModel):
         self,
         node: SparkFlowEngineNode,
         pre_node_id: str,
-        simple_path: SimplePath,
+        inactive: asyncio.Event,
     ) -> List[Task]:
         """
         Create waiting tasks for predecessor nodes.
 
         :param node: The current node
         :param pre_node_id: The ID of the predecessor node
-        :param simple_path: The simple path containing the nodes
+        :param inactive: Event set when the chain from the predecessor becomes inactive
         :return: List of asyncio tasks for waiting
         """
         tasks = []
@@ -1751,7 +1797,7 @@ class WorkflowEngine(BaseModel):
                                     pre_node.node_id
                                 ].complete.wait()
                             ),
-                            asyncio.create_task(simple_path.inactive.wait()),
+                            asyncio.create_task(inactive.wait()),
                         ]
                     )
                 )
@@ -1759,6 +1805,206 @@ class WorkflowEngine(BaseModel):
         self.engine_ctx.dfs_tasks.extend(tasks)
         return tasks
 
+    def snapshot(self, interrupt_node_id: str) -> Optional[RunSnapshot]:
+        """
+        Capture the run state while a node waits for user input.
+
+        Besides the interrupt node, only nodes waiting for their predecessors and
+        output nodes scheduled ahead that have not started may be in flight, as
+        both can be scheduled again. Otherwise the run cannot be captured.
+
+        :param interrupt_node_id: ID of the node waiting for user input
+        :return: Run snapshot, None if the run cannot be captured
+        """
+        started_node_ids = (
+            self.engine_ctx.callback.node_execute_start_time
+            if self.engine_ctx.callback
+            else {}
+        )
+        snapshot = RunSnapshot(
+            interrupt_node_id=interrupt_node_id,
+            interrupt_node=self.engine_ctx.built_nodes[interrupt_node_id].node_instance,
+            variable_values=self.engine_ctx.variable_pool.dump_values(),
+            chains_state=self.engine_ctx.chains.get_inactive_state(),
+        )
+        for node_id, node_status in self.engine_ctx.node_run_status.items():
+            if node_id == interrupt_node_id:
+                continue
+            if node_status.pre_processing.is_set():
+                snapshot.pre_processing_node_ids.append(node_id)
+            if node_status.not_run.is_set():
+                snapshot.not_run_node_ids.append(node_id)
+                continue
+            if node_status.complete.is_set():
+                snapshot.complete_node_ids.append(node_id)
+                continue
+            if node_status.pre_processing.is_set():
+                if node_id in started_node_ids:
+                    return None
+            elif node_status.processing.is_set():
+                return None
+            if node_status.start_with_thread.is_set():
+                snapshot.pending_node_ids.append(node_id)
+
+        for (
+            msg_node_id,
+            stream_queues,
+        ) in self.engine_ctx.variable_pool.stream_data.items():
+            for data_source_node_id, stream_queue in stream_queues.items():
+                frames = []
+                while not stream_queue.empty():
+                    frames.append(stream_queue.get_nowait())
+                for frame in frames:
+                    stream_queue.put_nowait(frame)
+                if frames:
+                    snapshot.stream_frames.setdefault(msg_node_id, {})[
+                        data_source_node_id
+                    ] = frames
+        return snapshot
+
+    def _restore(self, snapshot: RunSnapshot, span: Span) -> None:
+        """
+        Apply a run snapshot and schedule the nodes that were in flight.
+
+        :param snapshot: Run state captured by ``snapshot``
+        :param span: Tracing span for observability
+        :return: None
+        """
+        self.engine_ctx.variable_pool.load_values(snapshot.variable_values)
+        for msg_node_id, stream_frames in snapshot.stream_frames.items():
+            for data_source_node_id, frames in stream_frames.items():
+                stream_queue = self.engine_ctx.variable_pool.stream_data[msg_node_id][
+                    data_source_node_id
+                ]
+                for frame in frames:
+                    stream_queue.put_nowait(frame)
+        self.engine_ctx.chains.restore_inactive_state(snapshot.chains_state)
+        self.engine_ctx.built_nodes[snapshot.interrupt_node_id].node_instance = (
+            snapshot.interrupt_node
+        )
+        self.engine_ctx.node_run_status[
+            snapshot.interrupt_node_id
+        ].start_with_thread.set()
+
+        for node_id in snapshot.complete_node_ids + snapshot.not_run_node_ids:
+            node_status = self.engine_ctx.node_run_status[node_id]
+            node_status.start_with_thread.set()
+            node_status.processing.set()
+            node_status.complete.set()
+        for node_id in snapshot.not_run_node_ids:
+            self.engine_ctx.node_run_status[node_id].not_run.set()
+
+        finished_node_ids = set(snapshot.complete_node_ids + snapshot.not_run_node_ids)
+        for node_id in snapshot.pre_processing_node_ids:
+            self.engine_ctx.node_run_status[node_id].pre_processing.set()
+            if node_id in finished_node_ids:
+                continue
+            self.engine_ctx.node_run_status[node_id].processing.set()
+            self.engine_ctx.dfs_tasks.append(
+                asyncio.create_task(self._execute_message_node(node_id, span))
+            )
+        for node_id in snapshot.pending_node_ids:
+            self.engine_ctx.node_run_status[node_id].start_with_thread.set()
+            self.engine_ctx.dfs_tasks.append(
+                asyncio.create_task(
+                    self._depth_first_search_execution(
+                        self.engine_ctx.built_nodes[node_id], span
+                    )
+                )
+            )
+
+    def fork(self) -> "WorkflowEngine":
+        """
+        Create an engine for a single run from this built engine.
+
+        The compiled flow (workflow DSL, node protocol, chain topology and
+        message dependencies) is shared with this engine. Only run state is
+        allocated: node running status, chain flags, variable values, stream
+        queues, pending chat history and lightweight per-run copies of the
+        built nodes.
+
+        :return: Engine ready to run, leaving this engine untouched
+        """
+        built_nodes = SparkFlowEngineNode.fork_nodes(self.engine_ctx.built_nodes)
+        variable_pool = self.engine_ctx.variable_pool.fork()
+        variable_pool.stream_data = {}
+        variable_pool.pending_history = []
+        iteration_engine: Dict[str, WorkflowEngine] = {}
+        run_state = {
+            "variable_pool": variable_pool,
+            "iteration_engine": iteration_engine,
+            "msg_or_end_node_deps": self.engine_ctx.msg_or_end_node_deps,
+            "node_run_status": {
+                node_id: NodeRunningStatus()
+                for node_id in self.engine_ctx.node_run_status
+            },
+            "built_nodes": built_nodes,
+            "chains": self.engine_ctx.chains.fork(),
+            "build_timestamp": self.engine_ctx.build_timestamp,
+        }
+        for start_node_id, engine in self.engine_ctx.iteration_engine.items():
+            iteration_engine[start_node_id] = engine.model_copy(
+                update={
+                    "engine_ctx": WorkflowEngineCtx(**run_state),
+                    "sparkflow_engine_node": built_nodes[start_node_id],
+                }
+            )
+        engine_ctx = WorkflowEngineCtx(**run_state)
+        for engine in iteration_engine.values():
+            engine.engine_ctx.iteration_engine = engine_ctx.iteration_engine
+        return self.model_copy(
+            update={
+                "engine_ctx": engine_ctx,
+                "sparkflow_engine_node": built_nodes[
+                    self.sparkflow_engine_node.node_id
+                ],
+            }
+        )
+
+    def fork_iteration_item(
+        self, iteration_chains: Chains, variable_pool: VariablePool
+    ) -> "WorkflowEngine":
+        """
+        Create an isolated engine for one item of an iteration.
+
+        Nodes inside the iteration get their own running status and node copies,
+        so items can run side by side. Everything outside the iteration is shared
+        with this iteration engine.
+
+        :param iteration_chains: Chains of the iteration forked for the item
+        :param variable_pool: Variable pool of the item
+        :return: Engine running the iteration subgraph for one item
+        """
+        scope_node_ids = iteration_chains.get_scope_node_ids()
+        built_nodes = dict(self.engine_ctx.built_nodes)
+        built_nodes.update(
+            SparkFlowEngineNode.fork_nodes(
+                {node_id: built_nodes[node_id] for node_id in scope_node_ids}
+            )
+        )
+        node_run_status = dict(self.engine_ctx.node_run_status)
+        node_run_status.update(
+            {node_id: NodeRunningStatus() for node_id in scope_node_ids}
+        )
+        engine_ctx = WorkflowEngineCtx(
+            variable_pool=variable_pool,
+            iteration_engine=self.engine_ctx.iteration_engine,
+            msg_or_end_node_deps=self.engine_ctx.msg_or_end_node_deps,
+            node_run_status=node_run_status,
+            built_nodes=built_nodes,
+            chains=iteration_chains,
+            build_timestamp=self.engine_ctx.build_timestamp,
+            qa_node_lock=self.engine_ctx.qa_node_lock,
+        )
+        return self.model_copy(
+            update={
+                "engine_ctx": engine_ctx,
+                "sparkflow_engine_node": built_nodes[
+                    self.sparkflow_engine_node.node_id
+                ],
+            }
+        )
+
     def dumps(self, span: Span) -> bytes:
         """
         Serialize the engine to bytes.
@@ -1938,6 +2184,9 @@ class WorkflowEngineBuilder:
             # Handle special node types
             self._handle_special_node_types(node, spark_node_instance)
 
+            # Split node templates into segments once for all runs
+            compile_node_templates(node.data.nodeParam)
+
             # Check for duplicate nodes
             if node.id in self.built_nodes:
                 raise CustomException(
@@ -1957,7 +2206,10 @@ class WorkflowEngineBuilder:
 
         :return: Self for method chaining
         """
-        self.chains = Chains(workflow_schema=self.sparkflow_dsl)
+        if self.sparkflow_dsl.engineMode == EngineModeEnum.DAG.value:
+            self.chains = DagChains(workflow_schema=self.sparkflow_dsl)
+        else:
+            self.chains = Chains(workflow_schema=self.sparkflow_dsl)
         self.chains.gen()
         return self
 
@@ -1979,6 +2231,20 @@ class WorkflowEngineBuilder:
         """
         msg_or_end_node_deps_list = []
 
+        if isinstance(self.chains, DagChains):
+            # Compiled chains resolve dependencies along edges in topological order
+            msg_or_end_node_deps_list.append(
+                self._build_dag_message_dependency(self.chains)
+            )
+            for iteration_chain in self.chains.iteration_chains.values():
+                if isinstance(iteration_chain, DagChains):
+                    msg_or_end_node_deps_list.append(
+                        self._build_dag_message_dependency(iteration_chain)
+                    )
+            self._merge_message_dependencies(msg_or_end_node_deps_list)
+            self._build_data_dependencies()
+            return self
+
         # Get main chain message dependencies
         for chain in self.chains.master_chains:
             msg_or_end_node_dep: Dict[str, MsgOrEndDepInfo] = {}
@@ -2093,6 +2359,8 @@ class WorkflowEngineBuilder:
             self._handle_iteration_node(node.id, node)
         elif node_type == NodeType.END.value:
             self._handle_end_node(spark_node_instance)
+        elif node_type == NodeType.IF_ELSE.value:
+            self._handle_if_else_node(spark_node_instance)
 
     def _handle_DECISION_MAKING_node(self, node_id: str, node: Node) -> None:
         """
@@ -2140,6 +2408,17 @@ class WorkflowEngineBuilder:
             )
         self.iteration_engine_nodes[iteration_start_node_id] = node_id
 
+    def _handle_if_else_node(self, spark_node_instance: SparkFlowEngineNode) -> None:
+        """
+        Handle if-else node.
+
+        :param spark_node_instance: The SparkFlow engine node instance
+        :return: None
+        """
+        node_instance = spark_node_instance.node_instance
+        if isinstance(node_instance, IFElseNode):
+            node_instance.compile_cases(self.variable_pool)
+
     def _handle_end_node(self, spark_node_instance: SparkFlowEngineNode) -> None:
         """
         Handle end node.
@@ -2269,7 +2548,7 @@ class WorkflowEngineBuilder:
                 if dfs(next_node):
                     return True
 
-            visited.remove(node)
+            # Keep visited nodes marked: reachability does not depend on the path taken
             return False
 
         return dfs(source)
@@ -2302,14 +2581,7 @@ class WorkflowEngineBuilder:
         :param msg_or_end_node_dep: Dictionary to store message dependencies
         :return: None
         """
-        node_fail_branch = self._check_node_fail_branch(node_id)
-
-        if self._should_build_message_dependency(node_id, node_fail_branch):
-            # Handle special logic for iteration nodes
-            if node_id.split("::")[0] == NodeType.ITERATION.value:
-                if not self._iteration_chain_has_message(node_id):
-                    return
-
+        if self._is_message_dependency_node(node_id):
             # Add current node to existing message dependencies
             for existing_dep in msg_or_end_node_dep.values():
                 existing_dep.node_dep.add(node_id)
@@ -2319,6 +2591,57 @@ class WorkflowEngineBuilder:
                 node_dep=set(), data_dep=set(), data_dep_path_info={}
             )
 
+    def _build_dag_message_dependency(
+        self, chains: DagChains
+    ) -> Dict[str, MsgOrEndDepInfo]:
+        """
+        Build message dependencies of compiled chains.
+
+        Each dependency node depends on every dependency node among its ancestors,
+        which matches the union over all simple paths passing through it.
+
+        :param chains: Compiled chains to build dependencies for
+        :return: Dictionary mapping dependency node IDs to their dependency information
+        """
+        msg_or_end_node_dep: Dict[str, MsgOrEndDepInfo] = {}
+        # Dependency nodes among the ancestors of each node
+        ancestor_deps: Dict[str, Set[str]] = {}
+
+        for node_id in chains.node_id_list:
+            node_ancestor_deps: Set[str] = set()
+            for pre_node_id in chains.pre_edge_dict.get(node_id, []):
+                node_ancestor_deps.update(ancestor_deps[pre_node_id])
+                if pre_node_id in msg_or_end_node_dep:
+                    node_ancestor_deps.add(pre_node_id)
+            ancestor_deps[node_id] = node_ancestor_deps
+
+            if self._is_message_dependency_node(node_id):
+                msg_or_end_node_dep[node_id] = MsgOrEndDepInfo(
+                    node_dep=set(node_ancestor_deps),
+                    data_dep=set(),
+                    data_dep_path_info={},
+                )
+
+        return msg_or_end_node_dep
+
+    def _is_message_dependency_node(self, node_id: str) -> bool:
+        """
+        Check whether message or end nodes need to wait for the given node.
+
+        :param node_id: The ID of the node
+        :return: True if message dependency should be built for the node
+        """
+        node_fail_branch = self._check_node_fail_branch(node_id)
+
+        if not self._should_build_message_dependency(node_id, node_fail_branch):
+            return False
+
+        # Handle special logic for iteration nodes
+        if node_id.split("::")[0] == NodeType.ITERATION.value:
+            return self._iteration_chain_has_message(node_id)
+
+        return True
+
     def _check_node_fail_branch(self, node_id: str) -> bool:
         """
         Check if node has failure branch.
@@ -2343,10 +2666,9 @@ class WorkflowEngineBuilder:
         :return: True if iteration chain has message nodes, False otherwise
         """
         iteration_chain = self.chains.iteration_chains[node_id]
-        for master_chain in iteration_chain.master_chains:
-            for iteration_node_id in master_chain.node_id_list:
-                if iteration_node_id.startswith(NodeType.MESSAGE.value):
-                    return True
+        for iteration_node_id in iteration_chain.get_scope_node_ids():
+            if iteration_node_id.startswith(NodeType.MESSAGE.value):
+                return True
         return False
 
     def _should_build_message_dependency(
@@ -1,5 +1,5 @@
 from asyncio import Event
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 
 from pydantic import BaseModel, Field
 from workflow.engine.entities.workflow_dsl import Node, WorkflowDSL
@@ -95,6 +95,140 @@ class Chains(BaseModel):
                     node_chains.append(simple_path)
         return node_chains
 
+    def get_scope_node_ids(self) -> List[str]:
+        """
+        Get the IDs of all nodes covered by these chains.
+
+        :return: Node IDs in order of first appearance
+        """
+        node_ids: Dict[str, None] = {}
+        for simple_path in self.master_chains:
+            for node_id in simple_path.node_id_list:
+                node_ids.setdefault(node_id, None)
+        return list(node_ids)
+
+    def get_node_progress(self, node_id: str) -> float:
+        """
+        Calculate the execution progress when the given node is running.
+
+        A simple path marked as inactive counts all of its nodes as completed,
+        otherwise the number of nodes before the given node is counted.
+
+        :param node_id: ID of the currently executing node
+        :return: Progress value between 0.0 and 1.0
+        """
+        completed_node_cnt = 0
+        for simple_path in self.master_chains:
+            if simple_path.inactive.is_set():
+                completed_node_cnt += len(simple_path.node_id_list)
+            else:
+                completed_node_cnt += simple_path.every_node_index.get(node_id, 0)
+        return completed_node_cnt / self.get_all_simple_paths_node_cnt()
+
+    def deactivate_branch(self, node_id: str, branch_node_id: str) -> List[List[str]]:
+        """
+        Mark every simple path passing through a branch as inactive.
+
+        :param node_id: The source node ID
+        :param branch_node_id: The target branch node ID
+        :return: Node ID lists of the paths that became inactive
+        """
+        inactive_paths = []
+        for simple_path in self.get_branch_chains(node_id, branch_node_id):
+            if not simple_path.inactive.is_set():
+                simple_path.inactive.set()
+                inactive_paths.append(simple_path.node_id_list)
+        return inactive_paths
+
+    def deactivate_node(self, node_id: str) -> None:
+        """
+        Propagate the inactivity of a node that will not run to its successors.
+
+        Every simple path through an inactive node is already inactive,
+        so nothing needs to be propagated.
+
+        :param node_id: The ID of the inactive node
+        """
+        return None
+
+    def is_node_inactive(self, node_id: str) -> bool:
+        """
+        Check whether a node can no longer be reached by an active path.
+
+        :param node_id: The ID of the node to check
+        :return: True if every simple path containing the node is inactive
+        """
+        chains_of_node = self.get_node_chains(
+            node_id
+        ) or self.get_node_chains_with_node_id(node_id)
+        for chain in chains_of_node:
+            if not chain.inactive.is_set():
+                return False
+        return True
+
+    def get_pre_node_inactive_events(self, node_id: str) -> List[Tuple[str, Event]]:
+        """
+        Get the predecessors a node has to wait for on its active paths.
+
+        :param node_id: The ID of the node
+        :return: List of (predecessor node ID, inactive event of the path) pairs
+        """
+        pre_node_events = []
+        for simple_path in self.get_node_chains(node_id):
+            if simple_path.inactive.is_set():
+                continue
+            for i in range(len(simple_path.node_id_list) - 1):
+                pre_node_id, current_node_id = (
+                    simple_path.node_id_list[i],
+                    simple_path.node_id_list[i + 1],
+                )
+                if current_node_id == node_id:
+                    pre_node_events.append((pre_node_id, simple_path.inactive))
+        return pre_node_events
+
+    def get_inactive_state(self) -> List[Any]:
+        """
+        Get the inactive state of the master chains, to restore it on a fork.
+
+        :return: Indexes of the inactive simple paths
+        """
+        return [
+            index
+            for index, simple_path in enumerate(self.master_chains)
+            if simple_path.inactive.is_set()
+        ]
+
+    def restore_inactive_state(self, state: List[Any]) -> None:
+        """
+        Restore the inactive state of the master chains.
+
+        :param state: State returned by ``get_inactive_state``
+        """
+        for index in state:
+            self.master_chains[index].inactive.set()
+
+    def fork(self) -> "Chains":
+        """
+        Create a copy of the chains for a single run.
+
+        Paths and the workflow schema are shared, every simple path gets
+        a fresh inactive flag.
+
+        :return: Chains with their own run state
+        """
+        return self.model_copy(
+            update={
+                "master_chains": [
+                    simple_path.model_copy(update={"inactive": Event()})
+                    for simple_path in self.master_chains
+                ],
+                "iteration_chains": {
+                    iteration_node_id: iteration_chains.fork()
+                    for iteration_node_id, iteration_chains in self.iteration_chains.items()
+                },
+            }
+        )
+
     def _deal_edges(self) -> tuple[str, str, Dict[str, List[str]], Dict[str, str]]:
         """
         Process the edges of the workflow graph.
@@ -0,0 +1,230 @@
+from asyncio import Event
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+from workflow.engine.entities.chains import Chains
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+
+
+class DagChains(Chains):
+    """
+    Represents the execution chains of a workflow as a compiled DAG.
+
+    Instead of enumerating every simple path, nodes reachable from the start
+    node are kept in topological order together with their predecessor lists.
+    Branch deactivation is recorded per edge and propagated forward along edges,
+    so build cost and scheduling cost grow with the number of edges only.
+    """
+
+    # Nodes reachable from the start node, in topological order
+    node_id_list: List[str] = []
+    # Position of each node in the topological order
+    node_index: Dict[str, int] = {}
+    # Predecessors of each node inside these chains, key: target node ID
+    pre_edge_dict: Dict[str, List[str]] = {}
+    # Inactive flag of each edge, key: target node ID, value: {source node ID: Event}
+    edge_inactive: Dict[str, Dict[str, Event]] = {}
+    # Number of inactive incoming edges of each node
+    inactive_in_degree: Dict[str, int] = {}
+
+    def get_all_simple_paths_node_cnt(self) -> int:
+        """
+        Get the number of nodes covered by these chains.
+
+        :return: Number of nodes reachable from the start node
+        """
+        return len(self.node_id_list)
+
+    def get_scope_node_ids(self) -> List[str]:
+        """
+        Get the IDs of all nodes covered by these chains.
+
+        :return: Node IDs in topological order
+        """
+        return list(self.node_id_list)
+
+    def get_node_progress(self, node_id: str) -> float:
+        """
+        Calculate the execution progress when the given node is running.
+
+        Nodes ordered before the given node and nodes that will not run
+        are counted as completed.
+
+        :param node_id: ID of the currently executing node
+        :return: Progress value between 0.0 and 1.0
+        """
+        if not self.node_id_list:
+            return 0.0
+        current_index = self.node_index.get(node_id, 0)
+        completed_node_cnt = 0
+        for index, scope_node_id in enumerate(self.node_id_list):
+            if index < current_index or self._is_dead(scope_node_id):
+                completed_node_cnt += 1
+        return completed_node_cnt / len(self.node_id_list)
+
+    def deactivate_branch(self, node_id: str, branch_node_id: str) -> List[List[str]]:
+        """
+        Mark the edge from a node to one of its branches as inactive.
+
+        :param node_id: The source node ID
+        :param branch_node_id: The target branch node ID
+        :return: The deactivated edge as a node ID list, empty if already inactive
+        """
+        inactive = self.edge_inactive.get(branch_node_id, {}).get(node_id)
+        if inactive is None or inactive.is_set():
+            return []
+        inactive.set()
+        self.inactive_in_degree[branch_node_id] += 1
+        return [[node_id, branch_node_id]]
+
+    def deactivate_node(self, node_id: str) -> None:
+        """
+        Propagate the inactivity of a node that will not run to its outgoing edges.
+
+        :param node_id: The ID of the inactive node
+        """
+        for next_node_id in self.edge_dict.get(node_id, []):
+            self.deactivate_branch(node_id, next_node_id)
+
+    def is_node_inactive(self, node_id: str) -> bool:
+        """
+        Check whether a node can no longer be reached by an active edge.
+
+        :param node_id: The ID of the node to check
+        :return: True if every incoming edge of the node is inactive
+        """
+        if node_id in self.node_index:
+            return self._is_dead(node_id)
+        for chains in self.iteration_chains.values():
+            if isinstance(chains, DagChains) and node_id in chains.node_index:
+                return chains.is_node_inactive(node_id)
+        return True
+
+    def get_pre_node_inactive_events(self, node_id: str) -> List[Tuple[str, Event]]:
+        """
+        Get the predecessors a node has to wait for on its active incoming edges.
+
+        :param node_id: The ID of the node
+        :return: List of (predecessor node ID, inactive event of the edge) pairs
+        """
+        return [
+            (pre_node_id, inactive)
+            for pre_node_id, inactive in self.edge_inactive.get(node_id, {}).items()
+            if not inactive.is_set()
+        ]
+
+    def get_inactive_state(self) -> List[Any]:
+        """
+        Get the inactive state of the compiled DAG, to restore it on a fork.
+
+        :return: Inactive edges as (source node ID, target node ID) pairs
+        """
+        return [
+            (pre_node_id, node_id)
+            for node_id, pre_edges in self.edge_inactive.items()
+            for pre_node_id, inactive in pre_edges.items()
+            if inactive.is_set()
+        ]
+
+    def restore_inactive_state(self, state: List[Any]) -> None:
+        """
+        Restore the inactive state of the compiled DAG.
+
+        :param state: State returned by ``get_inactive_state``
+        """
+        for pre_node_id, node_id in state:
+            self.deactivate_branch(pre_node_id, node_id)
+
+    def fork(self) -> "DagChains":
+        """
+        Create a copy of the compiled DAG for a single run.
+
+        The topological order and the predecessor lists are shared,
+        every edge gets a fresh inactive flag.
+
+        :return: Chains with their own run state
+        """
+        return self.model_copy(
+            update={
+                "iteration_chains": {
+                    iteration_node_id: iteration_chains.fork()
+                    for iteration_node_id, iteration_chains in self.iteration_chains.items()
+                },
+                "edge_inactive": {
+                    node_id: {pre_node_id: Event() for pre_node_id in pre_edges}
+                    for node_id, pre_edges in self.edge_inactive.items()
+                },
+                "inactive_in_degree": dict.fromkeys(self.inactive_in_degree, 0),
+            }
+        )
+
+    def _is_dead(self, node_id: str) -> bool:
+        """
+        Check whether all incoming edges of a node inside these chains are inactive.
+
+        :param node_id: The ID of the node to check
+        :return: True if the node has incoming edges and all of them are inactive
+        """
+        pre_node_ids = self.pre_edge_dict.get(node_id, [])
+        return bool(pre_node_ids) and self.inactive_in_degree[node_id] == len(
+            pre_node_ids
+        )
+
+    def _compile(self, start_node_id: str) -> None:
+        """
+        Compile the subgraph reachable from a start node into topological order.
+
+        :param start_node_id: The node ID the chains start from
+        :raises CustomException: If the reachable subgraph contains a cycle
+        """
+        # Breadth-first order keeps the compiled lists deterministic
+        reachable: Dict[str, None] = {start_node_id: None}
+        queue = deque([start_node_id])
+        while queue:
+            for next_node_id in self.edge_dict.get(queue.popleft(), []):
+                if next_node_id not in reachable:
+                    reachable[next_node_id] = None
+                    queue.append(next_node_id)
+
+        in_degree: Dict[str, int] = {node_id: 0 for node_id in reachable}
+        for node_id in reachable:
+            for next_node_id in self.edge_dict.get(node_id, []):
+                in_degree[next_node_id] += 1
+                self.pre_edge_dict.setdefault(next_node_id, []).append(node_id)
+                self.edge_inactive.setdefault(next_node_id, {})[node_id] = Event()
+
+        queue = deque([start_node_id])
+        while queue:
+            node_id = queue.popleft()
+            self.node_index[node_id] = len(self.node_id_list)
+            self.node_id_list.append(node_id)
+            self.inactive_in_degree[node_id] = 0
+            for next_node_id in self.edge_dict.get(node_id, []):
+                in_degree[next_node_id] -= 1
+                if in_degree[next_node_id] == 0:
+                    queue.append(next_node_id)
+
+        if len(self.node_id_list) != len(reachable):
+            raise CustomException(
+                CodeEnum.ENG_BUILD_ERROR,
+                err_msg="Workflow graph contains a cycle",
+                cause_error="Workflow graph contains a cycle",
+            )
+
+    def gen(self) -> None:
+        """
+        Generate the compiled DAG from the workflow schema.
+        This method processes the workflow graph and compiles both the master chains
+        and the chains inside every iteration node.
+        """
+        start_node_id, _, self.edge_dict, iteration_dict = self._deal_edges()
+
+        # Process iteration node chains
+        for iteration_node_id, iteration_node_id_start_id in iteration_dict.items():
+            iteration_chains = DagChains(workflow_schema=self.workflow_schema)
+            iteration_chains.edge_dict = self.edge_dict
+            iteration_chains._compile(iteration_node_id_start_id)
+            self.iteration_chains[iteration_node_id] = iteration_chains
+
+        self._compile(start_node_id)
@@ -0,0 +1,34 @@
+from typing import Any, Awaitable, Callable, Dict, List
+
+from pydantic import BaseModel, Field
+
+# Called by a node waiting for user input with its node ID. Returns True when
+# the run was checkpointed and the node should stop waiting in memory.
+HibernateHandler = Callable[[str], Awaitable[bool]]
+
+
+class RunSnapshot(BaseModel):
+    """
+    Run state of a workflow engine suspended on an interrupt node.
+
+    Holds only run state, the compiled flow is rebuilt from the workflow DSL
+    and the snapshot is applied to a freshly forked engine.
+    """
+
+    # Node waiting for user input, executed again on resume
+    interrupt_node_id: str
+    # Per-run copy of the interrupt node instance
+    interrupt_node: Any = None
+    # Variable values, history and chat ID of the variable pool
+    variable_values: Dict[str, Any] = Field(default_factory=dict)
+    # Frames produced by streaming nodes and not yet consumed, key: message node ID
+    stream_frames: Dict[str, Dict[str, List[Any]]] = Field(default_factory=dict)
+    # Nodes that have run or will not run
+    complete_node_ids: List[str] = Field(default_factory=list)
+    not_run_node_ids: List[str] = Field(default_factory=list)
+    # Nodes scheduled and waiting for their predecessors
+    pending_node_ids: List[str] = Field(default_factory=list)
+    # Output nodes scheduled ahead, scheduled again unless they have finished
+    pre_processing_node_ids: List[str] = Field(default_factory=list)
+    # Inactive state of the master chains
+    chains_state: List[Any] = Field(default_factory=list)
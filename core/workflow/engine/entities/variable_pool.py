@@ -2,7 +2,8 @@ import asyncio
 import copy
 import re
 from enum import Enum, unique
-from typing import Any, Dict, Optional, cast
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from workflow.consts.engine.value_type import ValueType
 from workflow.domain.entities.chat import HistoryItem
@@ -63,62 +64,6 @@ def assemble_mapping_key(node_id: str, val: str) -> str:
     return f"{node_id}-{val}"
 
 
-def iteration_array(content: Any, schemas: dict, key_list: list) -> Any:
-    """
-    Iterate through nested array/object structures based on key list and schema.
-
-    :param content: Content to iterate through
-    :param schemas: Schema definition for the content
-    :param key_list: List of keys to navigate through
-    :return: Extracted value based on key navigation
-    """
-    mapping_value: Any = content
-    mapping_schema: dict = cast(dict, schemas)  # Ensure not None
-    key_type: str = mapping_schema.get("type", "")
-    key_i = 0
-    for key in key_list:
-        if key_i == 0:
-            key_i += 1
-            continue
-        mapping_schema = cast(dict, mapping_schema)
-        if key_type == "array":
-            mapping_schema = cast(dict, mapping_schema.get("items", {}))
-            array_type = mapping_schema.get("type")
-            if array_type == "object":
-                mapping_schema = cast(dict, mapping_schema.get("properties", {}))
-                if key not in mapping_schema:
-                    raise Exception(f"key {key} does not exist")
-                mapping_schema = cast(dict, mapping_schema[key])
-                key_type = mapping_schema.get("type", "")
-
-                # Ensure mapping_value is iterable list
-                mapping_value = cast(list, mapping_value)
-                return [
-                    iteration_array(
-                        value.get(key, schema_type_default_value.get(key_type)),
-                        mapping_schema,
-                        key_list[key_i:],
-                    )
-                    for value in mapping_value
-                ]
-            else:
-                return mapping_value
-        elif key_type == "object":
-            mapping_schema = cast(dict, mapping_schema.get("properties", {}))
-            if key not in mapping_schema:
-                raise Exception(f"key {key} does not exist")
-            mapping_schema = cast(dict, mapping_schema[key])
-            key_type = mapping_schema.get("type", "")
-            mapping_value = mapping_value.get(
-                key, schema_type_default_value.get(key_type)
-            )
-
-        else:
-            return mapping_value
-        key_i += 1
-    return mapping_value
-
-
 # Default values for different schema types
 schema_type_default_value = {
     "string": "",
@@ -140,6 +85,119 @@ schema_type_map_python: dict[str, list] = {
 }
 
 
+class OutputAccessor:
+    """
+    Path into a nested output variable, compiled from the variable schema.
+
+    Each step is ``("get", key, default)`` for an object property or
+    ``("map", key, default, steps, error)`` for a property of every item of an
+    object array, ``error`` is raised for non-empty arrays when the remaining
+    path does not match the item schema.
+    """
+
+    __slots__ = ("mapping_key", "steps")
+
+    def __init__(self, mapping_key: str, steps: List[tuple]) -> None:
+        self.mapping_key = mapping_key
+        self.steps = steps
+
+    @classmethod
+    def compile(
+        cls, node_id: str, key_name: str, mapping: Dict[str, Any]
+    ) -> "OutputAccessor":
+        """
+        Compile a dotted variable path of a node output.
+
+        :param node_id: ID of the node
+        :param key_name: Variable path, e.g. ``output.items.name``
+        :param mapping: Output variable mapping holding the variable schema
+        :return: Compiled accessor
+        :raises CustomException: If a key of the path is not in the schema
+        """
+        key_list = key_name.split(".")
+        mapping_key = assemble_mapping_key(node_id, key_list[0])
+        schema = mapping[mapping_key].get("schema", {})
+
+        def _not_found(key: str, nested: bool) -> Exception:
+            if nested:
+                return Exception(f"key {key} does not exist")
+            return CustomException(
+                err_code=CodeEnum.VARIABLE_POOL_GET_PARAMETER_ERROR,
+                err_msg=f"Node {node_id} does not have value {key}",
+                cause_error=f"key {key} not in {schema}",
+            )
+
+        def _compile(
+            mapping_schema: dict, keys: List[str], nested: bool
+        ) -> List[tuple]:
+            steps: List[tuple] = []
+            key_type = mapping_schema.get("type", "")
+            for key_i, key in enumerate(keys):
+                if key_type == "array":
+                    mapping_schema = mapping_schema.get("items", {})
+                    if mapping_schema.get("type") != "object":
+                        break
+                    properties = mapping_schema.get("properties", {})
+                    if key not in properties:
+                        raise _not_found(key, nested)
+                    mapping_schema = properties[key]
+                    key_type = mapping_schema.get("type", "")
+                    try:
+                        sub_steps, error = (
+                            _compile(mapping_schema, keys[key_i + 1 :], True),
+                            None,
+                        )
+                    except Exception as e:
+                        sub_steps, error = [], e
+                    steps.append(
+                        (
+                            "map",
+                            key,
+                            schema_type_default_value.get(key_type),
+                            sub_steps,
+                            error,
+                        )
+                    )
+                    break
+                elif key_type == "object":
+                    properties = mapping_schema.get("properties", {})
+                    if key not in properties:
+                        raise _not_found(key, nested)
+                    mapping_schema = properties[key]
+                    key_type = mapping_schema.get("type", "")
+                    steps.append(("get", key, schema_type_default_value.get(key_type)))
+                else:
+                    break
+            return steps
+
+        return cls(mapping_key, _compile(schema, key_list[1:], False))
+
+    @staticmethod
+    def _apply(value: Any, steps: List[tuple]) -> Any:
+        for step in steps:
+            if step[0] == "get":
+                value = value.get(step[1], step[2])
+            else:
+                _, key, default, sub_steps, error = step
+                if error is not None and value:
+                    raise error
+                return [
+                    OutputAccessor._apply(item.get(key, default), sub_steps)
+                    for item in value
+                ]
+        return value
+
+    def get(self, mapping: Dict[str, Any]) -> Any:
+        """
+        Read the value of the path.
+
+        :param mapping: Output variable mapping holding the variable value
+        :return: Value of the path
+        """
+        return self._apply(mapping[self.mapping_key].get("value"), self.steps)
+
+
+@lru_cache(maxsize=4096)
 def extract_variable_name(expression: str) -> Optional[str]:
     """
     Extract variable name from expression using regex.
@@ -248,17 +306,34 @@ class VariablePool:
                 err_msg="Node configuration information not found",
             )
         self.nodes = protocol
+        self.node_index: Dict[str, Node] = {node.id: node for node in protocol}
+        # Compiled paths of nested output variables, key: (node ID, variable path)
+        self.output_accessors: Dict[Tuple[str, str], OutputAccessor] = {}
+        # Output schema and compiled validator of each node, key: node ID
+        self.output_schemas: Dict[str, dict] = {}
+        self.output_validators: Dict[str, CNValidator] = {}
         self.protocol_inputs_parser()
         self.protocol_outputs_parser()
+        self.compile_ref_accessors()
         self.history_mapping: Dict[str, Any] = {}
         self.stream_data: Dict[str, Dict[str, asyncio.Queue]] = {}
         self.chat_id: str = ""
         self.history_v2: Optional[History] = None
+        # Chat history records of the run, written together when the run ends
+        self.pending_history: List[Dict[str, Any]] = []
         self.stream_node_has_sent_first_token: Dict[str, bool] = (
             {}
         )  # Mark whether the streaming output node (LLM node, agent node) sends the first frame
         self.system_params = SystemParams()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Compiled validators are not picklable, they and the variable paths
+        # are compiled again on use
+        state = self.__dict__.copy()
+        state["output_validators"] = {}
+        state["output_accessors"] = {}
+        return state
+
     def __deepcopy__(self, memo: dict) -> "VariablePool":
         return self.__class__.deepcopy(self)
 
@@ -280,10 +355,87 @@ class VariablePool:
         new_vp.stream_data = src.stream_data
         new_vp.chat_id = src.chat_id
         new_vp.history_v2 = copy.deepcopy(src.history_v2)
+        new_vp.pending_history = src.pending_history
         new_vp.system_params = src.system_params
 
         return new_vp
 
+    def fork(self) -> "VariablePool":
+        """
+        Create a copy of the variable pool for a single run.
+
+        The node protocol, the variable schemas, the output validators and the
+        compiled variable paths are immutable after build and are shared with
+        the source pool, only variable values and history are copied. Stream
+        queues and the pending chat history records are shared like in
+        ``deepcopy``.
+
+        :return: Variable pool holding its own variable values
+        """
+        new_vp = self.__class__.__new__(self.__class__)
+        memo: dict = {}
+        new_vp.nodes = self.nodes
+        new_vp.node_index = self.node_index
+        new_vp.output_accessors = self.output_accessors
+        new_vp.output_schemas = self.output_schemas
+        new_vp.output_validators = self.output_validators
+        new_vp.input_variable_mapping = self._fork_mapping(
+            self.input_variable_mapping, memo
+        )
+        new_vp.output_variable_mapping = self._fork_mapping(
+            self.output_variable_mapping, memo
+        )
+        new_vp.history_mapping = copy.deepcopy(self.history_mapping, memo)
+        new_vp.stream_data = self.stream_data
+        new_vp.chat_id = self.chat_id
+        new_vp.history_v2 = copy.deepcopy(self.history_v2, memo)
+        new_vp.pending_history = self.pending_history
+        new_vp.stream_node_has_sent_first_token = {}
+        new_vp.system_params = self.system_params
+        return new_vp
+
+    @staticmethod
+    def _fork_mapping(mapping: Dict[str, Any], memo: dict) -> Dict[str, Any]:
+        """
+        Copy a variable mapping, sharing schemas and copying values.
+
+        :param mapping: Input or output variable mapping
+        :param memo: Deepcopy memo shared by all values of the pool
+        :return: Copied variable mapping
+        """
+        return {
+            mapping_key: {
+                **mapping_value,
+                "value": copy.deepcopy(mapping_value.get("value"), memo),
+            }
+            for mapping_key, mapping_value in mapping.items()
+        }
+
+    def dump_values(self) -> Dict[str, Any]:
+        """
+        Dump the run state of the variable pool, without the protocol and stream queues.
+
+        :return: Picklable variable mappings, history and chat ID
+        """
+        return {
+            "input_variable_mapping": self.input_variable_mapping,
+            "output_variable_mapping": self.output_variable_mapping,
+            "history_mapping": self.history_mapping,
+            "chat_id": self.chat_id,
+            "history_v2": self.history_v2,
+            "pending_history": self.pending_history,
+            "stream_node_has_sent_first_token": self.stream_node_has_sent_first_token,
+        }
+
+    def load_values(self, values: Dict[str, Any]) -> None:
+        """
+        Load a run state dumped by ``dump_values`` into a pool built from the same DSL.
+
+        :param values: Dumped variable mappings, history and chat ID
+        """
+        for key, value in values.items():
+            setattr(self, key, value)
+
     def set_stream_node_has_sent_first_token(self, node_id: str) -> None:
         """
         Mark that a streaming node has sent its first token.
@@ -312,9 +464,9 @@ class VariablePool:
         :return: Node data protocol
         :raises CustomException: If node is not found
         """
-        for node in self.nodes:
-            if node_id == node.id:
-                return node.data
+        node = self.node_index.get(node_id)
+        if node is not None:
+            return node.data
 
         raise CustomException(
             err_code=CodeEnum.ENG_PROTOCOL_VALIDATE_ERROR,
@@ -368,10 +520,13 @@ class VariablePool:
 
     def protocol_outputs_parser(self) -> None:
         """
-        Parse protocol outputs and populate output variable mapping.
+        Parse protocol outputs, populate output variable mapping and compile
+        the output validator of each node.
         """
         for node in self.nodes:
             output_nodes = node.data.outputs
+            schemas: dict = copy.deepcopy(self.validate_template)
+            required = []
             for output_node in output_nodes:
                 output_key = output_node.name
                 output_schema = output_node.output_schema
@@ -388,6 +543,58 @@ class VariablePool:
                 }
                 mapping_key = assemble_mapping_key(node.id, output_key)
                 self.output_variable_mapping.update({mapping_key: mapping_value})
+                schemas["properties"].update({output_key: output_schema})
+                if output_required:
+                    required.append(output_key)
+            if required:
+                schemas.update({"required": required})
+            self.output_schemas[node.id] = schemas
+            self.output_validators[node.id] = CNValidator(schemas)
+
+    def compile_ref_accessors(self) -> None:
+        """
+        Compile the nested output paths referenced by node inputs.
+
+        Paths that do not match the output schema are left to fail when read.
+        """
+        for mapping_value in self.input_variable_mapping.values():
+            ref_content = mapping_value["schema"].value.content
+            if not isinstance(ref_content, NodeRef) or "." not in ref_content.name:
+                continue
+            try:
+                self.get_output_accessor(ref_content.nodeId, ref_content.name)
+            except Exception:
+                continue
+
+    def get_output_accessor(self, node_id: str, key_name: str) -> OutputAccessor:
+        """
+        Get the compiled path of a nested output variable.
+
+        :param node_id: ID of the node
+        :param key_name: Variable path with dot notation
+        :return: Compiled accessor
+        """
+        accessor = self.output_accessors.get((node_id, key_name))
+        if accessor is None:
+            accessor = OutputAccessor.compile(
+                node_id, key_name, self.output_variable_mapping
+            )
+            self.output_accessors[(node_id, key_name)] = accessor
+        return accessor
+
+    def get_node_output_schema(self, node_id: str) -> dict:
+        """
+        Get the object schema of the outputs of a node.
+
+        The schema is shared by all runs, callers must not modify it.
+
+        :param node_id: ID of the node
+        :return: JSON schema of the node outputs
+        """
+        schemas = self.output_schemas.get(node_id)
+        if schemas is None:
+            schemas = self.validate_template
+        return schemas
 
     def add_history(self, history_lists: list[dict]) -> None:
         """
@@ -526,85 +733,13 @@ class VariablePool:
         :param span: Span object for tracing
         :return: Value of the output variable
         """
-        key_name_list = key_name.split(".")
-        if len(key_name_list) == 1:
+        if "." not in key_name:
             mapping_key = assemble_mapping_key(node_id, key_name)
             output_value = self.output_variable_mapping[mapping_key].get("value")
             return output_value
-        mapping_schema_orig = self.output_variable_mapping[
-            assemble_mapping_key(node_id, key_name_list[0])
-        ].get("schema")
-
-        mapping_value: Any = None
-        mapping_schema: Dict[str, Any] = {}
-        key_type: str = ""
-        key_i = 0
-        for key in key_name_list:
-            if key_i == 0:
-                mapping_key = assemble_mapping_key(node_id, key)
-                mapping_value = cast(
-                    Any, self.output_variable_mapping[mapping_key].get("value")
-                )
-                mapping_schema = cast(
-                    Dict[str, Any],
-                    self.output_variable_mapping[mapping_key].get("schema", {}),
-                )
-                key_type = cast(str, mapping_schema.get("type", ""))
-                key_i += 1
-                continue
-            if key_type == "array":
-                mapping_schema = cast(Dict[str, Any], mapping_schema.get("items", {}))
-                array_type = cast(str, mapping_schema.get("type", ""))
-                if array_type == "object":
-                    mapping_schema = cast(
-                        Dict[str, Any], mapping_schema.get("properties", {})
-                    )
-                    if key not in mapping_schema:
-                        cause_error = f"key {key} not in {mapping_schema_orig}"
-                        msg = f"Node {node_id} does not have value {key}"
-                        raise CustomException(
-                            err_code=CodeEnum.VARIABLE_POOL_GET_PARAMETER_ERROR,
-                            err_msg=msg,
-                            cause_error=cause_error,
-                        )
-                    mapping_schema = cast(Dict[str, Any], mapping_schema[key])
-                    key_type = cast(str, mapping_schema.get("type", ""))
-
-                    mapping_value = cast(list, mapping_value)
-                    mapping_value = [
-                        iteration_array(
-                            cast(dict, value).get(
-                                key, schema_type_default_value.get(key_type)
-                            ),
-                            mapping_schema,
-                            key_name_list[key_i:],
-                        )
-                        for value in mapping_value
-                    ]
-                    return mapping_value
-                else:
-                    return mapping_value
-            elif key_type == "object":
-                mapping_schema = cast(
-                    Dict[str, Any], mapping_schema.get("properties", {})
-                )
-                if key not in mapping_schema:
-                    cause_error = f"key {key} not in {mapping_schema_orig}"
-                    msg = f"Node {node_id} does not have value {key}"
-                    raise CustomException(
-                        err_code=CodeEnum.VARIABLE_POOL_GET_PARAMETER_ERROR,
-                        err_msg=msg,
-                        cause_error=cause_error,
-                    )
-                mapping_schema = cast(Dict[str, Any], mapping_schema[key])
-                key_type = cast(str, mapping_schema.get("type", ""))
-                mapping_value = cast(dict, mapping_value).get(
-                    key, schema_type_default_value.get(key_type)
-                )
-            else:
-                return mapping_value
-            key_i += 1
-        return mapping_value
+        return self.get_output_accessor(node_id, key_name).get(
+            self.output_variable_mapping
+        )
 
     def get_variable_ref_node_id(
         self, node_id: str, key_name: str, span: Optional[Span] = None
@@ -644,10 +779,9 @@ class VariablePool:
                 ref_node_id = ref_content.nodeId
                 ref_var_name = ref_content.name
                 if ref_node_id.split(":")[0] == NodeType.LLM.value:
-                    for one in self.nodes:
-                        one_node_id = one.id
-                        if one_node_id == ref_node_id:
-                            llm_resp_format = one.data.nodeParam.get("respFormat", 0)
+                    ref_node = self.node_index.get(ref_node_id)
+                    if ref_node is not None:
+                        llm_resp_format = ref_node.data.nodeParam.get("respFormat", 0)
             else:
                 # Error: protocol issue
                 raise CustomException(err_code=CodeEnum.VARIABLE_PARSE_ERROR)
@@ -659,6 +793,25 @@ class VariablePool:
             llm_resp_format=llm_resp_format or 0,
         )
 
+    def get_literal_input(self, node_id: str, key_name: str) -> Tuple[bool, Any]:
+        """
+        Get the value of a node input defined as a literal.
+
+        Literal values never change between runs, nodes may read them once.
+
+        :param node_id: ID of the node
+        :param key_name: Name of the input
+        :return: Whether the input is a literal and its converted value
+        """
+        mapping_key = assemble_mapping_key(node_id, key_name.partition(".")[0])
+        input_value = self.input_variable_mapping.get(mapping_key)
+        if input_value is None:
+            return False, None
+        input_schema: InputSchema = input_value.get("schema")
+        if input_schema.value.type != ValueType.LITERAL.value:
+            return False, None
+        return True, input_value.get("value")
+
     def get_variable(self, node_id: str, key_name: str, span: Span) -> Any:
         """
         Get variable value by mapping key.
@@ -669,7 +822,7 @@ class VariablePool:
         :return: Variable value
         """
         try:
-            key_name_ = key_name.split(".")[0]
+            key_name_ = key_name.partition(".")[0]
             mapping_key = assemble_mapping_key(node_id, key_name_)
             if mapping_key in self.input_variable_mapping:
                 input_value = self.input_variable_mapping[mapping_key]
@@ -729,21 +882,14 @@ class VariablePool:
         :param span: Optional span object for tracing
         :raises Exception: If validation fails
         """
-        required = []
-        schemas: dict = copy.deepcopy(self.validate_template)
-        for mapping_key in self.output_variable_mapping.keys():
-            if mapping_key.startswith(node_id):
-                mapping_value = self.output_variable_mapping[mapping_key]
-                value_schema = mapping_value.get("schema")
-                key = mapping_key.split(f"{node_id}-")[-1]
-                schemas["properties"].update({key: value_schema})
-                if mapping_value.get("required", False):
-                    required.append(key)
-        if required:
-            schemas.update({"required": required})
+        validator = self.output_validators.get(node_id)
+        if validator is None:
+            validator = CNValidator(self.get_node_output_schema(node_id))
+            if node_id in self.output_schemas:
+                self.output_validators[node_id] = validator
         er_msgs = [
             f"Field: {er['schema_path']}, Error: {er['message']}"
-            for er in CNValidator(schemas).validate(outputs)
+            for er in validator.validate(outputs)
         ]
         if er_msgs:
             raise Exception(f"{';'.join(er_msgs)}")
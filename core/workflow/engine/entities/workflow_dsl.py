@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Literal, Union
 
 from pydantic import BaseModel, Field
+from workflow.consts.engine.engine_mode import EngineModeEnum
 from workflow.engine.entities.retry_config import RetryConfig
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
@@ -136,6 +137,7 @@ class WorkflowDSL(BaseModel):
     Workflow DSL (Domain Specific Language) information.
     :param nodes: Nodes of the workflow
     :param edges: Edges of the workflow
+    :param engineMode: Scheduling mode used by the engine for this workflow
     """
 
     # Node information
@@ -144,6 +146,9 @@ class WorkflowDSL(BaseModel):
     # Edge information
     edges: List[Edge]
 
+    # Engine scheduling mode
+    engineMode: Literal["chains", "dag"] = Field(default=EngineModeEnum.CHAINS.value)
+
     def check_nodes_exist(self, node_id: str) -> Node:
         """
         Check if a node exists in the workflow.
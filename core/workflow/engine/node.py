@@ -10,6 +10,7 @@ from workflow.engine.entities.msg_or_end_dep_info import MsgOrEndDepInfo
 from workflow.engine.entities.node_entities import NodeType
 from workflow.engine.entities.node_running_status import NodeRunningStatus
 from workflow.engine.entities.retry_config import RetryConfig
+from workflow.engine.entities.run_snapshot import HibernateHandler
 from workflow.engine.entities.variable_pool import VariablePool
 from workflow.engine.entities.workflow_dsl import InputItem, Node, OutputItem
 from workflow.engine.nodes.base_node import BaseNode
@@ -23,7 +24,7 @@ from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.log_trace.workflow_log import WorkflowLog
 from workflow.extensions.otlp.trace.span import Span
-from workflow.service.history_service import add_history
+from workflow.service.history_service import new_history_record
 
 
 class NodeParameterStrategy(ABC):
@@ -102,6 +103,22 @@ class IterationNodeParameterStrategy(NodeParameterStrategy):
         return base_params
 
 
+class QuestionAnswerNodeParameterStrategy(NodeParameterStrategy):
+    """Parameter strategy for question-answer nodes."""
+
+    def build_parameters(
+        self, base_params: Dict[str, Any], **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Build parameters for question-answer nodes.
+
+        :param base_params: Base parameters dictionary
+        :param kwargs: Additional keyword arguments containing the hibernate handler
+        :return: Updated parameters with the hibernate handler
+        """
+        base_params.update({"hibernate_handler": kwargs.get("hibernate_handler")})
+        return base_params
+
+
 class NodeExecutionTemplate:
     """Template class for node execution using template method pattern."""
 
@@ -126,6 +143,7 @@ class NodeExecutionTemplate:
             NodeType.KNOWLEDGE_PRO.value: MessageNodeParameterStrategy(),
             NodeType.FLOW.value: MessageNodeParameterStrategy(),
             NodeType.ITERATION.value: IterationNodeParameterStrategy(),
+            NodeType.QUESTION_ANSWER.value: QuestionAnswerNodeParameterStrategy(),
         }
 
     async def execute(self, **kwargs: Any) -> NodeRunResult:
@@ -207,6 +225,10 @@ class NodeExecutionTemplate:
             )
             return
 
+        if result.status == WorkflowNodeExecutionStatus.HIBERNATED:
+            span_context.add_info_event(f"node {result.node_id} run hibernated.")
+            return
+
         if result.status != WorkflowNodeExecutionStatus.SUCCEEDED:
             self._handle_failed_result(result, span_context)
             return
@@ -278,7 +300,9 @@ class NodeExecutionTemplate:
         event_log_trace: WorkflowLog,
         variable_pool: VariablePool,
     ) -> None:
-        """Add chat history if needed for LLM or decision nodes.
+        """Record chat history if needed for LLM or decision nodes.
+
+        Records are written together when the run ends.
 
         :param result: Node execution result
         :param event_log_trace: Workflow event log trace
@@ -295,19 +319,21 @@ class NodeExecutionTemplate:
         ).nodeParam.get("enableChatHistory", False)
 
         if enable_chat_history_v1:
-            add_history(
-                flow_id=event_log_trace.flow_id,
-                node_id=result.node_id,
-                uid=event_log_trace.uid,
-                raw_question={
-                    "role": "user",
-                    "content": (
-                        result.process_data.get("query", "")
-                        if result.process_data
-                        else ""
-                    ),
-                },
-                raw_answer={"role": "assistant", "content": result.raw_output},
+            variable_pool.pending_history.append(
+                new_history_record(
+                    flow_id=event_log_trace.flow_id,
+                    node_id=result.node_id,
+                    uid=event_log_trace.uid,
+                    raw_question={
+                        "role": "user",
+                        "content": (
+                            result.process_data.get("query", "")
+                            if result.process_data
+                            else ""
+                        ),
+                    },
+                    raw_answer={"role": "assistant", "content": result.raw_output},
+                )
             )
 
     def _should_add_chat_history(self, result: NodeRunResult) -> bool:
@@ -568,6 +594,47 @@ class SparkFlowEngineNode(BaseModel):
         """
         return self.pre_nodes
 
+    def fork(self) -> "SparkFlowEngineNode":
+        """
+        Create a copy of the node for a single run.
+
+        The node definition is shared, the node instance is copied with
+        ``BaseNode.fork`` and the node log is recreated. Node relationships
+        still point to the source nodes, use ``fork_nodes`` to relink them.
+
+        :return: Node with its own run state
+        """
+        return self.model_copy(
+            update={
+                "node_instance": self.node_instance.fork(),
+                "node_log": NodeLog(
+                    node_id=self.node_id,
+                    node_name=self.node_alias_name,
+                    node_type=self.node_type,
+                    sid="",
+                ),
+            }
+        )
+
+    @staticmethod
+    def fork_nodes(
+        built_nodes: Dict[str, "SparkFlowEngineNode"],
+    ) -> Dict[str, "SparkFlowEngineNode"]:
+        """
+        Fork built nodes and relink their relationships to the forked nodes.
+
+        Relationships to nodes that are not forked keep pointing to the source nodes.
+
+        :param built_nodes: Built nodes to fork, key: node ID
+        :return: Forked nodes, key: node ID
+        """
+        forked_nodes = {node_id: node.fork() for node_id, node in built_nodes.items()}
+        for node in forked_nodes.values():
+            node.next_nodes = [forked_nodes.get(n.node_id, n) for n in node.next_nodes]
+            node.fail_nodes = [forked_nodes.get(n.node_id, n) for n in node.fail_nodes]
+            node.pre_nodes = [forked_nodes.get(n.node_id, n) for n in node.pre_nodes]
+        return forked_nodes
+
     def gather_node_event_log(self, result: NodeRunResult) -> None:
         """
         Collect and record node event logs.
@@ -610,6 +677,7 @@ class SparkFlowEngineNode(BaseModel):
         node_run_status: Dict[str, NodeRunningStatus],
         chains: Chains,
         built_nodes: Dict[str, Any],
+        hibernate_handler: Optional[HibernateHandler] = None,
     ) -> NodeRunResult:
         """
         Asynchronously execute the node.
@@ -623,6 +691,7 @@ class SparkFlowEngineNode(BaseModel):
         :param node_run_status: Node running status
         :param chains: Execution chains
         :param built_nodes: Built nodes
+        :param hibernate_handler: Checkpoints the run while the node waits for input
         :return: Node execution result
         """
         # Use template method pattern to execute node
@@ -637,6 +706,7 @@ class SparkFlowEngineNode(BaseModel):
             node_run_status=node_run_status or {},
             chains=chains,
             built_nodes=built_nodes or {},
+            hibernate_handler=hibernate_handler,
         )
 
 
@@ -1,9 +1,8 @@
 import asyncio
 import json
 import os
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Tuple, cast
 
-import aiohttp
 from aiohttp import ClientResponse, ClientTimeout
 from pydantic import BaseModel, Field, model_validator
 from workflow.consts.engine.chat_status import ChatStatus
@@ -22,6 +21,7 @@ from workflow.engine.nodes.util.frame_processor import extract_tool_calls_conten
 from workflow.engine.nodes.util.prompt import prompt_template_replace
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.middleware.getters import get_http_client_service
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
 from workflow.infra.providers.llm.iflytek_spark.schemas import StreamOutputMsg
@@ -183,6 +183,16 @@ class AgentNode(BaseNode):
     )
     source: str = Field(default=ModelProviderEnum.XINGHUO.value)
 
+    def fork(self) -> "AgentNode":
+        """
+        Create a copy of the node instance for a single run.
+
+        :return: Node instance with its own metadata
+        """
+        node = cast(AgentNode, super().fork())
+        node.metaData = self.metaData.model_copy()
+        return node
+
     async def _call_agent(
         self,
         inputs: dict,
@@ -241,15 +251,17 @@ class AgentNode(BaseNode):
                 total=30 * 60, sock_connect=30, sock_read=interval_timeout
             )
 
-            async with aiohttp.ClientSession(timeout=timeout_config) as session:
-                async with session.post(
-                    url=os.getenv("AGENT_API_URL", ""), headers=headers, json=req_body
-                ) as response:
-                    content_list, reasoning_content_list, token_usage = (
-                        await self._process_stream_response(
-                            response, variable_pool, msg_or_end_node_deps, span
-                        )
+            async with get_http_client_service().post(
+                os.getenv("AGENT_API_URL", ""),
+                headers=headers,
+                json=req_body,
+                timeout=timeout_config,
+            ) as response:
+                content_list, reasoning_content_list, token_usage = (
+                    await self._process_stream_response(
+                        response, variable_pool, msg_or_end_node_deps, span
                     )
+                )
         except asyncio.TimeoutError as e:
             raise CustomException(
                 err_code=CodeEnum.AGENT_NODE_EXECUTION_ERROR,
@@ -6,6 +6,11 @@ from asyncio import Event
 from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, Field
+from workflow.cache.llm_response import (
+    get_llm_response,
+    llm_response_cache_key,
+    set_llm_response,
+)
 from workflow.consts.engine.chat_status import ChatStatus, SparkLLMStatus
 from workflow.consts.engine.model_provider import ModelProviderEnum
 from workflow.consts.engine.template import TemplateSplitType, TemplateType
@@ -23,6 +28,7 @@ from workflow.engine.entities.node_running_status import NodeRunningStatus
 from workflow.engine.entities.output_mode import EndNodeOutputModeEnum
 from workflow.engine.entities.retry_config import RetryConfig
 from workflow.engine.entities.variable_pool import ParamKey, VariablePool
+from workflow.engine.nodes.entities.llm_response import LLMResponse
 from workflow.engine.nodes.entities.node_run_result import (
     NodeRunResult,
     WorkflowNodeExecutionStatus,
@@ -87,6 +93,18 @@ class BaseNode(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+    def fork(self) -> "BaseNode":
+        """
+        Create a copy of the node instance for a single run.
+
+        Node configuration is shared with the built node. Attributes reassigned
+        during execution only affect the copy, nodes that mutate nested
+        attributes in place must override this method and copy them.
+
+        :return: Node instance with its own run state
+        """
+        return self.model_copy(update={"stream_node_first_token": Event()})
+
     @abstractmethod
     async def async_execute(
         self,
@@ -877,7 +895,7 @@ class BaseOutputNode(BaseNode):
                 llm_response = msg.llm_response
                 exception_occurred = msg.exception_occurred
                 span.add_info_events(
-                    {"recv": json.dumps(llm_response, ensure_ascii=False)}
+                    {"recv": lambda: json.dumps(llm_response, ensure_ascii=False)}
                 )
                 frame: UnionFrame = frame_processor.process_frame(llm_response)
                 code = frame.code
@@ -1027,6 +1045,7 @@ class BaseLLMNode(BaseNode):
     :param source: Model provider source
     :param searchDisable: Whether to disable search functionality
     :param extraParams: Additional parameters
+    :param enableResponseCache: Whether to replay cached responses of identical requests
     :param chat_ai: Chat AI instance
     """
 
@@ -1053,6 +1072,7 @@ class BaseLLMNode(BaseNode):
     source: str = Field(default=ModelProviderEnum.XINGHUO.value)
     searchDisable: bool = Field(default=True)
     extraParams: dict = Field(default_factory=dict)
+    enableResponseCache: bool = Field(default=False)
 
     def _get_chat_ai(self) -> ChatAI:
         """
@@ -1205,6 +1225,34 @@ class BaseLLMNode(BaseNode):
         )
         return user_message
 
+    def _response_cache_key(self, flow_id: str, user_message: list) -> str:
+        """
+        Build the response cache key of a request of this node.
+
+        Requests are scoped to the flow and the application, the flow selects
+        provider specific request options such as quick thinking.
+
+        :param flow_id: Unique identifier for the workflow flow
+        :param user_message: Rendered messages of the request
+        :return: Response cache key
+        """
+        return llm_response_cache_key(
+            {
+                "flow_id": flow_id,
+                "app_id": self.appId,
+                "source": self.source,
+                "url": self.url,
+                "model": self.domain,
+                "patch_id": self.patch_id,
+                "temperature": self.temperature,
+                "max_tokens": self.maxTokens,
+                "top_k": self.topK,
+                "search_disable": self.searchDisable,
+                "extra_params": self.extraParams,
+                "messages": user_message,
+            }
+        )
+
     async def _chat_with_llm(
         self,
         flow_id: str,
@@ -1224,6 +1272,9 @@ class BaseLLMNode(BaseNode):
 
         This method handles the complete LLM interaction flow, including
         message preparation, API calls, response processing, and streaming.
+        With ``enableResponseCache``, the frames of a cached response to the
+        same request are replayed through the same processing instead of
+        calling the model, and report no token usage.
 
         :param flow_id: Unique identifier for the workflow flow
         :param variable_pool: Pool containing variables and streaming data
@@ -1257,23 +1308,47 @@ class BaseLLMNode(BaseNode):
         think_contents = None
         token_usage = {}
         processed_history = system_user_msg.processed_history
+        cache_key = (
+            self._response_cache_key(flow_id, user_message)
+            if self.enableResponseCache
+            else ""
+        )
+        cached_frames = await get_llm_response(cache_key) if cache_key else None
+        # Encoded frames of a model response, cached once the response is complete
+        frames: list[str] = []
+        finished = False
+        if cache_key:
+            cache_event = "miss" if cached_frames is None else "hit"
+            span.add_info_events({"llm_response_cache": cache_event})
+            if event_log_node_trace:
+                event_log_node_trace.append_config_data(
+                    {"llm_response_cache": cache_event}
+                )
         try:
-            async for llm_response in chat_ai.achat(
-                user_message=user_message,
-                event_log_node_trace=event_log_node_trace,
-                span=span,
-                flow_id=flow_id,
-                extra_params=self.extraParams,
-                timeout=(
-                    self.retry_config.timeout
-                    if self.retry_config.should_retry
-                    else None
-                ),
-                search_disable=self.searchDisable,
-            ):
+            llm_responses = (
+                chat_ai.achat(
+                    user_message=user_message,
+                    event_log_node_trace=event_log_node_trace,
+                    span=span,
+                    flow_id=flow_id,
+                    extra_params=self.extraParams,
+                    timeout=(
+                        self.retry_config.timeout
+                        if self.retry_config.should_retry
+                        else None
+                    ),
+                    search_disable=self.searchDisable,
+                )
+                if cached_frames is None
+                else _replay_frames(cached_frames)
+            )
+            async for llm_response in llm_responses:
                 msg = llm_response.msg
+                if cache_key and cached_frames is None:
+                    # Providers may update a frame after yielding it
+                    frames.append(json.dumps(msg, ensure_ascii=False))
                 code, status, content, reasoning_content, token_usage = (
-                    self._get_chat_ai().decode_message(msg)
+                    chat_ai.decode_message(msg)
                 )
                 if code == 0:
                     if reasoning_content:
@@ -1292,6 +1367,7 @@ class BaseLLMNode(BaseNode):
                         ChatStatus.FINISH_REASON.value,
                     ]:
                         token_usage = token_usage
+                        finished = True
                         break
                     if (
                         self.source == ModelProviderEnum.OPENAI.value
@@ -1311,6 +1387,10 @@ class BaseLLMNode(BaseNode):
                         cause_error=json.dumps(msg, ensure_ascii=False),
                     )
             if texts:
+                if cached_frames is not None:
+                    token_usage = {}
+                elif cache_key and finished:
+                    await set_llm_response(cache_key, frames)
                 res = "".join(texts)
                 span.add_info_events({"spark_llm_chat_result": "".join(texts)})
                 think_contents = "".join(reasoning_contents)
@@ -1371,3 +1451,14 @@ class BaseLLMNode(BaseNode):
                     )
         except Exception as e:
             raise e
+
+
+async def _replay_frames(frames: list[dict]) -> AsyncIterator[LLMResponse]:
+    """
+    Replay the frames of a cached model response.
+
+    :param frames: Response frames in the order they were received
+    :return: Async iterator of LLMResponse objects
+    """
+    for frame in frames:
+        yield LLMResponse(msg=frame)
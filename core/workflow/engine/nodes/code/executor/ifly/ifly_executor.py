@@ -4,11 +4,11 @@ import os
 from typing import Any
 
 import httpx
-from aiohttp import ClientSession
 from workflow.engine.nodes.code.executor.base_executor import BaseExecutor
 from workflow.exception.e import CustomException, CustomExceptionCD
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.exception.errors.third_api_code import ThirdApiCodeEnum
+from workflow.extensions.middleware.getters import get_http_client_service
 from workflow.extensions.otlp.trace.span import Span
 
 # Maximum number of retry attempts for failed requests
@@ -125,25 +125,26 @@ class IFlyExecutor(BaseExecutor):
         :return: Tuple of (status_code, result, response_body, response_body_string)
         :raises CustomExceptionCD: If request fails with non-retryable error
         """
-        async with ClientSession() as session:
-            async with session.post(url, json=body, params=params) as resp:
-                resp_body = json.loads(await resp.text())
-                resp_body_str = json.dumps(resp_body, ensure_ascii=False)
-                if resp.status == httpx.codes.OK:
-                    span.add_info_events({"code execute result": resp_body_str})
-                    runner_result = resp_body.get("data", {}).get("stdout", "")
-                    # Remove trailing newline from result
-                    if isinstance(runner_result, str) and runner_result.endswith("\n"):
-                        runner_result = runner_result[:-1]
-                    return resp.status, runner_result, resp_body, resp_body_str
-                elif resp.status in [httpx.codes.INTERNAL_SERVER_ERROR]:
-                    return resp.status, "", resp_body, resp_body_str
-                else:
-                    span.add_error_event(f"{resp_body_str}")
-                    raise CustomExceptionCD(
-                        err_code=CodeEnum.CODE_EXECUTION_ERROR.value[0],
-                        err_msg=f"{resp_body_str}",
-                    )
+        async with get_http_client_service().post(
+            url, json=body, params=params
+        ) as resp:
+            resp_body = json.loads(await resp.text())
+            resp_body_str = json.dumps(resp_body, ensure_ascii=False)
+            if resp.status == httpx.codes.OK:
+                span.add_info_events({"code execute result": resp_body_str})
+                runner_result = resp_body.get("data", {}).get("stdout", "")
+                # Remove trailing newline from result
+                if isinstance(runner_result, str) and runner_result.endswith("\n"):
+                    runner_result = runner_result[:-1]
+                return resp.status, runner_result, resp_body, resp_body_str
+            elif resp.status in [httpx.codes.INTERNAL_SERVER_ERROR]:
+                return resp.status, "", resp_body, resp_body_str
+            else:
+                span.add_error_event(f"{resp_body_str}")
+                raise CustomExceptionCD(
+                    err_code=CodeEnum.CODE_EXECUTION_ERROR.value[0],
+                    err_msg=f"{resp_body_str}",
+                )
 
     @staticmethod
     def __remove_first_traceback_line(traceback_str: str) -> str:
@@ -1,31 +1,64 @@
 import asyncio
 import json
-import multiprocessing
-import traceback
-import warnings
-from typing import Any, Dict
+import os
+import threading
+from typing import Any
 
 from RestrictedPython import PrintCollector  # type: ignore
-from RestrictedPython import (
-    compile_restricted,
-    limited_builtins,
-    safe_builtins,
-    utility_builtins,
-)
+from RestrictedPython import limited_builtins, safe_builtins, utility_builtins
 from RestrictedPython.Eval import default_guarded_getattr  # type: ignore
 from RestrictedPython.Eval import default_guarded_getitem
 from workflow.engine.nodes.code.executor.base_executor import BaseExecutor
-from workflow.exception.e import CustomException
-from workflow.exception.errors.err_code import CodeEnum
+from workflow.engine.nodes.code.executor.local.worker_pool import (
+    GlobalsFactory,
+    SandboxWorkerPool,
+)
 from workflow.extensions.otlp.trace.span import Span
 
+_worker_pool: SandboxWorkerPool | None = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_sandbox_worker_pool(globals_factory: GlobalsFactory) -> SandboxWorkerPool:
+    """
+    Get the process wide sandbox worker pool, creating it on first use.
+
+    The pool is configured by the following environment variables:
+        - LOCAL_EXECUTOR_POOL_SIZE: Number of worker processes (default: 4)
+        - LOCAL_EXECUTOR_MAX_EXECUTIONS: Executions before a worker is recycled (default: 100)
+        - LOCAL_EXECUTOR_MAX_PENDING: Maximum executions waiting for a worker (default: 64)
+        - LOCAL_EXECUTOR_ACQUIRE_TIMEOUT_SEC: Maximum wait for a worker in seconds (default: 10)
+        - LOCAL_EXECUTOR_COMPILE_CACHE_SIZE: Number of cached compiled codes (default: 256)
+
+    :param globals_factory: Builds the restricted global namespace of an execution
+    :return: Sandbox worker pool
+    """
+    global _worker_pool
+    with _worker_pool_lock:
+        # Workers of a parent process can not be used by a forked child
+        if _worker_pool is None or _worker_pool.pid != os.getpid():
+            _worker_pool = SandboxWorkerPool(
+                globals_factory=globals_factory,
+                size=int(os.getenv("LOCAL_EXECUTOR_POOL_SIZE") or "4"),
+                max_executions=int(os.getenv("LOCAL_EXECUTOR_MAX_EXECUTIONS") or "100"),
+                max_pending=int(os.getenv("LOCAL_EXECUTOR_MAX_PENDING") or "64"),
+                acquire_timeout=float(
+                    os.getenv("LOCAL_EXECUTOR_ACQUIRE_TIMEOUT_SEC") or "10"
+                ),
+                compile_cache_size=int(
+                    os.getenv("LOCAL_EXECUTOR_COMPILE_CACHE_SIZE") or "256"
+                ),
+            )
+        return _worker_pool
+
 
 class LocalExecutor(BaseExecutor):
     """
     Local code executor using RestrictedPython for secure execution.
 
     Executes Python code in a restricted environment with limited built-ins
-    and forbidden modules to ensure security. Uses multiprocessing for isolation.
+    and forbidden modules to ensure security. Code runs in a pool of pre-forked
+    worker processes for isolation.
     """
 
     # Modules that are not allowed to be imported for security reasons
@@ -35,7 +68,7 @@ class LocalExecutor(BaseExecutor):
         self, language: str, code: str, timeout: int, span: Span, **kwargs: Any
     ) -> str:
         """
-        Execute code asynchronously using multiprocessing for isolation.
+        Execute code asynchronously on a pre-forked sandbox worker process.
 
         :param language: Programming language (currently only python supported)
         :param code: Code string to execute
@@ -43,59 +76,23 @@ class LocalExecutor(BaseExecutor):
         :param span: Tracing span for logging
         :param kwargs: Additional execution parameters
         :return: Execution result as string
+        :raises CustomException: If execution times out or the worker pool is saturated
         """
+        worker_pool = get_sandbox_worker_pool(self._build_restricted_globals)
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None,  # Use default thread pool
-            self._execute_in_process,  # Wrapper for synchronous execution
+        result = await loop.run_in_executor(
+            None,  # Use default thread pool, the pool call blocks on the worker pipe
+            worker_pool.execute,
             code,
             timeout,
         )
-
-    def _execute_in_process(self, code: str, timeout: int) -> str:
-        """
-        Execute code in a separate process with timeout control.
-
-        :param code: Code string to execute
-        :param timeout: Maximum execution time in seconds
-        :return: Execution result as string
-        :raises CustomException: If execution times out or fails
-        """
-        with multiprocessing.Manager() as manager:
-            result_dict = manager.dict()
-            proc = multiprocessing.Process(
-                target=self._safe_exec, args=(code, result_dict)
-            )
-            proc.start()
-            proc.join(timeout)
-            if proc.is_alive():
-                proc.terminate()
-                raise CustomException(err_code=CodeEnum.CODE_EXECUTION_TIMEOUT_ERROR)
-            if "error" in result_dict:
-                raise Exception(result_dict["error"])
-            return result_dict.get("output", "")
-
-    def _safe_exec(self, code: str, result_dict: dict) -> None:
-        """
-        Safely execute code using RestrictedPython with limited built-ins.
-
-        :param code: Code string to execute
-        :param result_dict: Shared dictionary to store execution results
-        """
-        try:
-            # Suppress syntax warnings from RestrictedPython
-            warnings.filterwarnings(
-                "ignore", category=SyntaxWarning, module="RestrictedPython.compile"
-            )
-
-            locals_dict: Dict[str, Any] = {}
-            restricted_globals = self._build_restricted_globals()
-            code_bytes = compile_restricted(code, "<user_code>", "exec")
-            exec(code_bytes, restricted_globals, locals_dict)
-
-            result_dict["output"] = locals_dict.get("output", "")
-        except Exception:
-            result_dict["error"] = traceback.format_exc()
+        span.add_info_events(
+            {
+                "queue_wait_ms": f"{result.wait_ms:.2f}",
+                "exec_ms": f"{result.exec_ms:.2f}",
+            }
+        )
+        return result.output
 
     def limited_import(self, name: str, *args: Any) -> Any:
         """
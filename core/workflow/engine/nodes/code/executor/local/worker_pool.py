@@ -0,0 +1,314 @@
+"""
+Sandbox worker pool of the local code executor.
+
+Code runs in long-lived pre-forked worker processes that receive restricted
+bytecode over a pipe, so an execution no longer pays for a new process and a
+multiprocessing manager. Workers are recycled after a number of executions or
+when an execution times out. Compiled bytecode is cached by code hash, and
+callers are rejected once too many of them wait for a free worker.
+"""
+
+import hashlib
+import marshal
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import traceback
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+from RestrictedPython import compile_restricted  # type: ignore
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.otlp.metric import metric
+
+# Builds the restricted global namespace of one execution inside a worker
+GlobalsFactory = Callable[[], Dict[str, Any]]
+
+
+def _ignore_restricted_syntax_warnings() -> None:
+    """
+    Suppress syntax warnings from RestrictedPython.
+    """
+    warnings.filterwarnings(
+        "ignore", category=SyntaxWarning, module="RestrictedPython.compile"
+    )
+
+
+def _worker_main(conn: Connection, globals_factory: GlobalsFactory) -> None:
+    """
+    Main loop of a sandbox worker process.
+
+    Executes the bytecode received on the connection and sends back either
+    ``("output", value)`` or ``("error", traceback)``. A ``None`` message or a
+    closed connection stops the worker.
+
+    :param conn: Worker side of the pipe to the pool
+    :param globals_factory: Builds the restricted global namespace of an execution
+    """
+    _ignore_restricted_syntax_warnings()
+    while True:
+        try:
+            code_bytes = conn.recv()
+        except EOFError:
+            return
+        if code_bytes is None:
+            return
+        try:
+            locals_dict: Dict[str, Any] = {}
+            exec(marshal.loads(code_bytes), globals_factory(), locals_dict)
+            conn.send(("output", locals_dict.get("output", "")))
+        except Exception:
+            conn.send(("error", traceback.format_exc()))
+
+
+class CompiledCodeCache:
+    """
+    Thread safe LRU of restricted bytecode keyed by the hash of the source code.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initialize the compiled code cache.
+
+        :param max_size: Maximum number of cached code objects, 0 disables the cache
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, code: str) -> bytes:
+        """
+        Get the marshalled restricted bytecode of the code, compiling it on a miss.
+
+        :param code: Source code
+        :return: Marshalled code object
+        """
+        key = hashlib.sha256(code.encode("utf-8")).hexdigest()
+        with self._lock:
+            code_bytes = self._entries.get(key)
+            if code_bytes is not None:
+                self._entries.move_to_end(key)
+                return code_bytes
+
+        _ignore_restricted_syntax_warnings()
+        code_bytes = marshal.dumps(compile_restricted(code, "<user_code>", "exec"))
+        if self.max_size <= 0:
+            return code_bytes
+        with self._lock:
+            self._entries[key] = code_bytes
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return code_bytes
+
+
+class _SandboxWorker:
+    """
+    Handle of one sandbox worker process.
+    """
+
+    def __init__(self, globals_factory: GlobalsFactory) -> None:
+        """
+        Initialize and start a sandbox worker process.
+
+        :param globals_factory: Builds the restricted global namespace of an execution
+        """
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_worker_main, args=(child_conn, globals_factory), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.executions = 0
+
+    def stop(self) -> None:
+        """
+        Stop the worker process and release its pipe.
+        """
+        self.process.terminate()
+        self.process.join(1)
+        self.conn.close()
+
+
+@dataclass
+class SandboxExecution:
+    """
+    Result of one execution in the sandbox worker pool.
+    """
+
+    output: Any
+    # Time spent waiting for a free worker
+    wait_ms: float
+    # Time spent executing in the worker
+    exec_ms: float
+
+
+class SandboxWorkerPool:
+    """
+    Pool of pre-forked sandbox worker processes.
+
+    ``execute`` is blocking and meant to be called from worker threads.
+    """
+
+    def __init__(
+        self,
+        globals_factory: GlobalsFactory,
+        size: int,
+        max_executions: int,
+        max_pending: int,
+        acquire_timeout: float,
+        compile_cache_size: int,
+    ) -> None:
+        """
+        Initialize the pool and start its workers.
+
+        :param globals_factory: Builds the restricted global namespace of an execution
+        :param size: Number of worker processes
+        :param max_executions: Number of executions after which a worker is recycled
+        :param max_pending: Maximum number of callers waiting for a free worker
+        :param acquire_timeout: Maximum time in seconds to wait for a free worker
+        :param compile_cache_size: Maximum number of cached compiled code objects
+        """
+        self.pid = os.getpid()
+        self.size = size
+        self.max_executions = max_executions
+        self.max_pending = max_pending
+        self.acquire_timeout = acquire_timeout
+        self.compiled_code_cache = CompiledCodeCache(compile_cache_size)
+        self._globals_factory = globals_factory
+        self._pending = 0
+        self._lock = threading.Lock()
+        # Idle workers, None marks a worker that failed to restart
+        self._idle: queue.Queue[Optional[_SandboxWorker]] = queue.Queue()
+        for _ in range(size):
+            self._idle.put(_SandboxWorker(globals_factory))
+
+    def execute(self, code: str, timeout: float) -> SandboxExecution:
+        """
+        Execute code on a free worker.
+
+        :param code: Code string to execute
+        :param timeout: Maximum execution time in seconds
+        :return: Output of the code and the time spent
+        :raises CustomException: If the pool is saturated or the execution times out
+        :raises Exception: If the code fails, with the formatted traceback as message
+        """
+        try:
+            code_bytes = self.compiled_code_cache.get(code)
+        except Exception:
+            raise Exception(traceback.format_exc())
+
+        start_time = time.perf_counter()
+        worker = self._acquire()
+        wait_ms = (time.perf_counter() - start_time) * 1000
+        _report_execution_time("wait", wait_ms)
+
+        healthy = False
+        start_time = time.perf_counter()
+        try:
+            worker.conn.send(code_bytes)
+            if not worker.conn.poll(timeout):
+                raise CustomException(err_code=CodeEnum.CODE_EXECUTION_TIMEOUT_ERROR)
+            status, value = worker.conn.recv()
+            healthy = True
+        except (EOFError, OSError) as err:
+            raise Exception(f"Sandbox worker exited unexpectedly: {err}") from err
+        finally:
+            exec_ms = (time.perf_counter() - start_time) * 1000
+            _report_execution_time("exec", exec_ms)
+            self._release(worker, healthy)
+
+        if status == "error":
+            raise Exception(value)
+        return SandboxExecution(output=value, wait_ms=wait_ms, exec_ms=exec_ms)
+
+    def close(self) -> None:
+        """
+        Stop the idle workers of the pool.
+        """
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            if worker is not None:
+                worker.stop()
+
+    def _acquire(self) -> _SandboxWorker:
+        """
+        Take a free worker, waiting for one up to the acquire timeout.
+
+        :return: Worker reserved for the caller
+        :raises CustomException: If too many callers wait or no worker frees up in time
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise CustomException(
+                    CodeEnum.CODE_EXECUTION_BUSY_ERROR,
+                    err_msg=f"Too many pending code executions: {self._pending}",
+                )
+            self._pending += 1
+        try:
+            worker = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise CustomException(
+                CodeEnum.CODE_EXECUTION_BUSY_ERROR,
+                err_msg=f"No sandbox worker free within {self.acquire_timeout}s",
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+        if worker is not None:
+            return worker
+        try:
+            return _SandboxWorker(self._globals_factory)
+        except Exception:
+            self._idle.put(None)
+            raise
+
+    def _release(self, worker: _SandboxWorker, healthy: bool) -> None:
+        """
+        Return a worker to the pool, recycling it when needed.
+
+        :param worker: Worker reserved by the caller
+        :param healthy: Whether the last execution completed normally
+        """
+        worker.executions += 1
+        if (
+            healthy
+            and worker.executions < self.max_executions
+            and worker.process.is_alive()
+        ):
+            self._idle.put(worker)
+            return
+        worker.stop()
+        try:
+            self._idle.put(_SandboxWorker(self._globals_factory))
+        except Exception as err:
+            logger.error(f"Failed to restart sandbox worker: {err}")
+            self._idle.put(None)
+
+
+def _report_execution_time(phase: str, elapsed_ms: float) -> None:
+    """
+    Report the time of an execution phase through the OTLP meter.
+
+    :param phase: Execution phase, one of wait and exec
+    :param elapsed_ms: Elapsed time in milliseconds
+    """
+    if metric.code_executor_histogram is None:
+        return
+    metric.code_executor_histogram.record(
+        elapsed_ms,
+        {
+            "server_name": os.getenv("SERVICE_NAME", "default"),
+            "pid": os.getpid(),
+            "phase": phase,
+        },
+    )
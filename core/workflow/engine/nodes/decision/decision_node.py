@@ -19,7 +19,7 @@ from workflow.engine.nodes.entities.node_run_result import (
     NodeRunResult,
     WorkflowNodeExecutionStatus,
 )
-from workflow.engine.nodes.util.prompt import PromptUtils, process_prompt
+from workflow.engine.nodes.util.prompt import compile_template, resolve_placeholders
 from workflow.exception.e import CustomException
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
@@ -175,27 +175,13 @@ class DecisionNode(BaseLLMNode):
         prompt_prefix = copy.deepcopy(self.promptPrefix)
         span.add_info_events({"user_input_prompt_prefix": prompt_prefix})
 
-        # Find variables that need to be replaced in the prompt
-        available_placeholders = PromptUtils.get_available_placeholders(
-            self.node_id, prompt_prefix, variable_pool, span
-        )
-        replacements = {}
+        # Resolve variables that need to be replaced in the prompt
+        compiled = compile_template(prompt_prefix)
         # Replace variables in prompt with actual values
         try:
-            for var_name in available_placeholders:
-                var_name_list = re.split(r"[\[.\]]", var_name)
-                # Only process variables that are in input identifiers
-                if var_name_list[0].strip() in self.input_identifier:
-                    replacements.update(
-                        {
-                            var_name: process_prompt(
-                                node_id=self.node_id,
-                                key_name=var_name,
-                                variable_pool=variable_pool,
-                                span=span,
-                            )
-                        }
-                    )
+            replacements = resolve_placeholders(
+                compiled, self.input_identifier, self.node_id, variable_pool, span
+            )
         except CustomException as err:
             # Handle variable processing errors
             span.record_exception(err)
@@ -213,7 +199,7 @@ class DecisionNode(BaseLLMNode):
         replacements_str = {
             k: (lambda v: (str(v) or " "))(v) for k, v in replacements.items()
         }
-        prompt_prefix = PromptUtils.replace_variables(prompt_prefix, replacements_str)
+        prompt_prefix = compiled.render(replacements_str)
         span.add_info_events({"finally_prompt_prefix": prompt_prefix})
         # Execute function call with Spark AI
         try:
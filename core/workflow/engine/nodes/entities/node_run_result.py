@@ -18,6 +18,7 @@ class WorkflowNodeExecutionStatus(Enum):
     SUCCEEDED = "succeeded"  # Node completed successfully
     FAILED = "failed"  # Node execution failed
     CANCELLED = "cancelled"  # Node execution was cancelled
+    HIBERNATED = "hibernated"  # Run was checkpointed while the node waits for input
 
 
 class NodeRunOutputType(Enum):
@@ -3,12 +3,13 @@ import copy
 import json
 import os
 import time
-from typing import Any, Dict, Optional, Tuple
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
 
-import aiohttp
 from aiohttp import ClientTimeout
 from pydantic import Field
 from workflow.consts.engine.chat_status import ChatStatus
+from workflow.domain.entities.chat import ChatVo
 from workflow.domain.models.ai_app import App
 from workflow.engine.callbacks.openai_types_sse import GenerateUsage
 from workflow.engine.entities.history import EnableChatHistoryV2, History
@@ -24,7 +25,10 @@ from workflow.engine.nodes.entities.node_run_result import (
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.middleware.database.utils import session_getter
-from workflow.extensions.middleware.getters import get_db_service
+from workflow.extensions.middleware.getters import (
+    get_db_service,
+    get_http_client_service,
+)
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
 
@@ -196,11 +200,14 @@ class FlowNode(BaseNode):
         event_log_node_trace: NodeLog | None = None,
     ) -> Tuple[dict, dict]:
         """
-        Execute nested workflow via Server-Sent Events (SSE) API.
+        Execute nested workflow and process its streamed response.
 
-        This method establishes a streaming connection to the target workflow
-        and processes the response in real-time, handling different output modes
-        and streaming content to dependent nodes when necessary.
+        When the target workflow is published on this service, it is executed
+        in process, sharing the engine cache, callbacks and tracing with the
+        calling workflow. Otherwise a streaming connection is established to
+        the workflow SSE API. The response is processed in real-time, handling
+        different output modes and streaming content to dependent nodes when
+        necessary.
 
         :param url: SSE endpoint URL for the workflow API
         :param inputs: Input parameters for the target workflow
@@ -221,86 +228,86 @@ class FlowNode(BaseNode):
                 cause_error=f"Flow output mode not configured for flow_id: {self.flowId}",
             )
 
-        # Assemble request headers and body
-        headers, req_body = self._assemble_request(
-            url, inputs, variable_pool, span, event_log_node_trace
+        # Build request body shared by the in-process and HTTP calls
+        req_body = self._assemble_request_body(inputs, variable_pool)
+
+        # Configure timeout based on retry settings
+        interval_timeout = (
+            self.retry_config.timeout if self.retry_config.should_retry else None
         )
 
         # Initialize response containers
         outputs = {}
         token_usage = {}
 
+        messages: Optional[AsyncGenerator[Dict[str, Any], None]] = None
+        if os.getenv("FLOW_NODE_IN_PROCESS", "1") == "1":
+            messages = await self._local_flow_messages(
+                req_body, span, event_log_node_trace
+            )
+        if messages is None:
+            headers = self._assemble_request_headers(url, span)
+            if event_log_node_trace:
+                event_log_node_trace.append_config_data(
+                    {
+                        "url": url,
+                        "req_headers": headers,
+                        "req_body": json.dumps(req_body, ensure_ascii=False),
+                    }
+                )
+            messages = self._remote_flow_messages(
+                url, headers, req_body, interval_timeout, span
+            )
+
         try:
             # Initialize content accumulators for streaming response
             result_content = ""
             result_reasoning_content = ""
 
-            # Configure timeout based on retry settings
-            interval_timeout = (
-                self.retry_config.timeout if self.retry_config.should_retry else None
-            )
+            while True:
+                try:
+                    async with asyncio.timeout(interval_timeout):
+                        msg = await anext(messages)
+                except StopAsyncIteration:
+                    break
+
+                # Check for API errors
+                if msg.get("code", 0) != 0:
+                    raise CustomException(
+                        err_code=CodeEnum.WORKFLOW_EXECUTION_ERROR,
+                        err_msg=msg.get("message", ""),
+                        cause_error=json.dumps(msg, ensure_ascii=False),
+                    )
+
+                # Extract choices from response
+                choices = msg.get("choices", ())
+                if not choices:
+                    break
 
-            # Establish SSE connection with appropriate timeouts
-            async with aiohttp.ClientSession(
-                timeout=ClientTimeout(
-                    total=30 * 60, sock_connect=30, sock_read=interval_timeout
+                # Process content delta
+                delta = choices[0].get("delta", {})
+                content, reasoning_content = delta.get("content", ""), delta.get(
+                    "reasoning_content", ""
                 )
-            ) as session:
-                async with session.post(
-                    url=url, headers=headers, json=req_body
-                ) as response:
-                    # Process streaming response line by line
-                    async for line in response.content:
-                        line_str = line.decode("utf-8")
-                        if line_str == "\n":
-                            continue
-
-                        # Log received data for debugging
-                        span.add_info_event(f"recv: {line_str}")
-
-                        # Parse SSE data format
-                        msg: dict[str, Any] = json.loads(line_str.removeprefix("data:"))
-
-                        # Check for API errors
-                        if msg.get("code", 0) != 0:
-                            raise CustomException(
-                                err_code=CodeEnum.WORKFLOW_EXECUTION_ERROR,
-                                err_msg=msg.get("message", ""),
-                                cause_error=json.dumps(msg, ensure_ascii=False),
-                            )
-
-                        # Extract choices from response
-                        choices = msg.get("choices", ())
-                        if not choices:
-                            break
-
-                        # Process content delta
-                        delta = choices[0].get("delta", {})
-                        content, reasoning_content = delta.get(
-                            "content", ""
-                        ), delta.get("reasoning_content", "")
-
-                        # Accumulate content for final output
-                        result_content += content
-                        result_reasoning_content += reasoning_content
-
-                        # Stream content to dependent nodes if in prompt mode
-                        if output_mode == EndNodeOutputModeEnum.PROMPT_MODE.value:
-                            await self.put_stream_content(
-                                self.node_id,
-                                variable_pool,
-                                msg_or_end_node_deps,
-                                NodeType.FLOW.value,
-                                msg,
-                            )
-
-                        # Check for completion
-                        if (
-                            choices[0].get("finish_reason")
-                            == ChatStatus.FINISH_REASON.value
-                        ):
-                            token_usage = msg.get("usage", {})
-                            break
+
+                # Accumulate content for final output
+                result_content += content
+                result_reasoning_content += reasoning_content
+
+                # Stream content to dependent nodes if in prompt mode
+                if output_mode == EndNodeOutputModeEnum.PROMPT_MODE.value:
+                    await self.put_stream_content(
+                        self.node_id,
+                        variable_pool,
+                        msg_or_end_node_deps,
+                        NodeType.FLOW.value,
+                        msg,
+                    )
+
+                # Check for completion
+                if choices[0].get("finish_reason") == ChatStatus.FINISH_REASON.value:
+                    token_usage = msg.get("usage", {})
+                    break
         except asyncio.TimeoutError as e:
             # Handle timeout errors with detailed information
             raise CustomException(
@@ -308,6 +315,9 @@ class FlowNode(BaseNode):
                 err_msg=f"Flow node response timeout ({interval_timeout}s)",
                 cause_error=f"Flow node response timeout ({interval_timeout}s)",
             ) from e
+        finally:
+            # Stop the nested workflow stream if it was left unfinished
+            await messages.aclose()
 
         # Process outputs based on the configured output mode
         outputs = self._handle_outputs(
@@ -315,32 +325,116 @@ class FlowNode(BaseNode):
         )
         return outputs, token_usage
 
-    def _assemble_request(
+    async def _local_flow_messages(
         self,
-        url: str,
-        inputs: dict,
-        variable_pool: VariablePool,
+        req_body: dict,
         span: Span,
         event_log_node_trace: NodeLog | None = None,
-    ) -> Tuple[dict, dict]:
+    ) -> Optional[AsyncGenerator[Dict[str, Any], None]]:
         """
-        Assemble HTTP request headers and body for workflow API call.
+        Start the target workflow in this process.
 
-        This method constructs the complete request including authentication,
-        chat history, and input parameters. It also queries the database
-        to retrieve the application credentials for authentication.
+        The nested workflow gets its own session ID, its spans are recorded
+        under the span of this node.
 
-        :param url: Target API endpoint URL
-        :param inputs: Input parameters for the workflow
-        :param variable_pool: Variable pool containing workflow context
+        :param req_body: Request body of the nested workflow call
         :param span: Tracing span for observability
         :param event_log_node_trace: Optional node trace logging
-        :return: Tuple containing (headers_dict, request_body_dict)
-        :raises CustomException: When app credentials are not found
+        :return: Response messages of the nested workflow, None when the
+            workflow cannot be loaded or built by this service
         """
-        # Initialize request headers
-        headers = {"Content-Type": "application/json"}
+        # Imported here, the chat service depends on the engine
+        from workflow.service import chat_service
+
+        nested_span = Span(app_id=self.appId, uid=self.uid)
+        try:
+            chat_vo = ChatVo(**req_body)
+            frames = await chat_service.nested_flow_frames(
+                self.appId, chat_vo, nested_span
+            )
+        except Exception as err:
+            # Load and build errors are left to the workflow API, only errors
+            # of the running workflow come through the returned messages
+            span.add_info_event(
+                f"Flow {self.flowId} not loaded locally ({err}), calling the API"
+            )
+            return None
+
+        if event_log_node_trace:
+            event_log_node_trace.append_config_data(
+                {
+                    "url": "in-process",
+                    "req_body": json.dumps(req_body, ensure_ascii=False),
+                }
+            )
+        span.add_info_events({"nested_flow_sid": nested_span.sid})
+        return self._traced_messages(frames, span)
 
+    async def _traced_messages(
+        self, frames: AsyncGenerator[Dict[str, Any], None], span: Span
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Record the response frames of an in-process nested workflow.
+
+        :param frames: Response frames of the nested workflow
+        :param span: Tracing span for observability
+        :return: AsyncIterator yielding the response frames
+        """
+        async with aclosing(frames):
+            async for frame in frames:
+                span.add_info_event(
+                    lambda: f"recv: {json.dumps(frame, ensure_ascii=False)}",
+                    kind="recv",
+                )
+                yield frame
+
+    async def _remote_flow_messages(
+        self,
+        url: str,
+        headers: dict,
+        req_body: dict,
+        interval_timeout: Optional[float],
+        span: Span,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Call the target workflow through the workflow SSE API.
+
+        :param url: SSE endpoint URL for the workflow API
+        :param headers: Request headers
+        :param req_body: Request body of the nested workflow call
+        :param interval_timeout: Timeout between two received lines
+        :param span: Tracing span for observability
+        :return: AsyncIterator yielding the parsed response messages
+        """
+        # Establish SSE connection on the shared connection pool
+        async with get_http_client_service().post(
+            url,
+            headers=headers,
+            json=req_body,
+            timeout=ClientTimeout(
+                total=30 * 60, sock_connect=30, sock_read=interval_timeout
+            ),
+        ) as response:
+            # Process streaming response line by line
+            async for line in response.content:
+                line_str = line.decode("utf-8")
+                if line_str == "\n":
+                    continue
+
+                # Log received data for debugging
+                span.add_info_event(f"recv: {line_str}")
+
+                # Parse SSE data format
+                yield json.loads(line_str.removeprefix("data:"))
+
+    def _assemble_request_body(self, inputs: dict, variable_pool: VariablePool) -> dict:
+        """
+        Assemble the request body of the nested workflow call.
+
+        :param inputs: Input parameters for the workflow
+        :param variable_pool: Variable pool containing workflow context
+        :return: Request body dictionary
+        """
         # Process chat history if enabled
         history = []
         if self.enableChatHistoryV2.is_enabled:
@@ -369,16 +463,22 @@ class FlowNode(BaseNode):
         # Add version if specified
         if self.version:
             req_body.update({"version": self.version})
+        return req_body
 
-        # Log request details for debugging
-        if event_log_node_trace:
-            event_log_node_trace.append_config_data(
-                {
-                    "url": url,
-                    "req_headers": headers,
-                    "req_body": json.dumps(req_body, ensure_ascii=False),
-                }
-            )
+    def _assemble_request_headers(self, url: str, span: Span) -> dict:
+        """
+        Assemble HTTP request headers for workflow API call.
+
+        This method queries the database to retrieve the application
+        credentials for authentication.
+
+        :param url: Target API endpoint URL
+        :param span: Tracing span for observability
+        :return: Request headers dictionary
+        :raises CustomException: When app credentials are not found
+        """
+        # Initialize request headers
+        headers = {"Content-Type": "application/json"}
 
         # Query application credentials from database
         with session_getter(get_db_service()) as session:
@@ -410,7 +510,7 @@ class FlowNode(BaseNode):
             # Use bearer token for production environments
             headers["Authorization"] = authorization
 
-        return headers, req_body
+        return headers
 
     def _handle_outputs(
         self, output_mode: int, result_content: str, result_reasoning_content: str
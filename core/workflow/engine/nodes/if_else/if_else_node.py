@@ -1,4 +1,4 @@
-from typing import Any, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 from workflow.engine.entities.variable_pool import VariablePool
@@ -61,6 +61,44 @@ class IfElseNodeData(BaseModel):
     conditions: List[Condition]
 
 
+class CompiledCondition(BaseModel):
+    """
+    Condition with its operand names resolved when the engine is built.
+    :param compare_operator: Comparison operator
+    :param left_var_index: Index of the left variable
+    :param left_var_name: Name of the left variable, None if the index is unknown
+    :param right_var_name: Name of the right variable, empty if there is none
+    :param left_literal: Whether the left variable is a literal
+    :param left_value: Value of the left variable if it is a literal
+    :param right_literal: Whether the right variable is a literal
+    :param right_value: Value of the right variable if it is a literal
+    :param constant: Reported condition with its result if every operand is a literal
+    """
+
+    compare_operator: str
+    left_var_index: str | None = None
+    left_var_name: str | None = None
+    right_var_name: str = ""
+    left_literal: bool = False
+    left_value: Any = None
+    right_literal: bool = False
+    right_value: Any = None
+    constant: dict | None = None
+
+
+class CompiledBranch(BaseModel):
+    """
+    Branch with its conditions compiled when the engine is built.
+    :param id: ID of the branch
+    :param is_and: Whether all conditions must hold, otherwise any of them
+    :param conditions: Compiled conditions of the branch
+    """
+
+    id: str
+    is_and: bool
+    conditions: List[CompiledCondition]
+
+
 class IFElseNode(BaseNode):
     """
     If-Else conditional node implementation.
@@ -71,6 +109,72 @@ class IFElseNode(BaseNode):
     """
 
     cases: List[IfElseNodeData] = Field(min_length=2)
+    # Compiled branches keyed by branch ID, filled by compile_cases
+    compiled_cases: Dict[str, CompiledBranch] = Field(default_factory=dict)
+
+    def compile_cases(self, variable_pool: VariablePool) -> None:
+        """
+        Compile the conditions of every branch once for all runs.
+
+        Operand names are resolved from the input identifiers, literal operands
+        are read from the variable pool and conditions whose operands are all
+        literals are evaluated ahead of time.
+
+        :param variable_pool: Variable pool of the workflow
+        """
+        compiled_cases = {}
+        for branch in self.cases:
+            conditions = []
+            for condition in branch.conditions:
+                if not condition:
+                    continue
+                conditions.append(self._compile_condition(variable_pool, condition))
+            compiled_cases[branch.id] = CompiledBranch(
+                id=branch.id,
+                is_and=branch.logicalOperator == "and",
+                conditions=conditions,
+            )
+        self.compiled_cases = compiled_cases
+
+    def _compile_condition(
+        self, variable_pool: VariablePool, condition: Condition
+    ) -> CompiledCondition:
+        """
+        Compile a single condition.
+
+        :param variable_pool: Variable pool of the workflow
+        :param condition: Condition to compile
+        :return: Compiled condition
+        """
+        compiled = CompiledCondition(
+            compare_operator=condition.compareOperator,
+            left_var_index=condition.leftVarIndex,
+            left_var_name=self.input_identifier[0].get(condition.leftVarIndex),
+            right_var_name=self.input_identifier[0].get(condition.rightVarIndex, ""),
+        )
+        if compiled.left_var_name is not None:
+            compiled.left_literal, compiled.left_value = (
+                variable_pool.get_literal_input(self.node_id, compiled.left_var_name)
+            )
+        if compiled.right_var_name != "":
+            compiled.right_literal, compiled.right_value = (
+                variable_pool.get_literal_input(self.node_id, compiled.right_var_name)
+            )
+        if compiled.left_literal and (
+            compiled.right_literal or compiled.right_var_name == ""
+        ):
+            input_condition = {
+                "actual_value": compiled.left_value,
+                "expected_value": compiled.right_value,
+                "comparison_operator": compiled.compare_operator,
+            }
+            try:
+                result = self._compare(input_condition)
+            except Exception:
+                # Keep failing conditions to report their error on every run
+                return compiled
+            compiled.constant = {**input_condition, "result": result}
+        return compiled
 
     async def do_one_branch(
         self,
@@ -101,115 +205,44 @@ class IFElseNode(BaseNode):
             func_name="do_one_branch", add_source_function_name=True
         ) as span_context:
             try:
-                # Get the logical operator for combining conditions
+                branch = self.compiled_cases.get(node_data.id)
+                if branch is None:
+                    # Branches added after the engine was built
+                    self.compile_cases(variable_pool)
+                    branch = self.compiled_cases[node_data.id]
                 logical_operator = node_data.logicalOperator
-                input_conditions = []
-                for condition in node_data.conditions:
-                    if not condition:
-                        continue
-                    left_var_index = condition.leftVarIndex
-                    left_var_name = self.input_identifier[0][left_var_index]
-                    right_var_index = condition.rightVarIndex
-                    right_var_name = self.input_identifier[0].get(right_var_index, "")
-
-                    # Retrieve actual value from variable pool
-                    actual_value = variable_pool.get_variable(
-                        node_id=self.node_id, key_name=left_var_name, span=span_context
-                    )
-
-                    # Retrieve expected value from variable pool if specified
-                    expected_value = None
-                    if right_var_name != "":
-                        expected_value = variable_pool.get_variable(
-                            node_id=self.node_id,
-                            key_name=right_var_name,
-                            span=span_context,
+                for condition in branch.conditions:
+                    if condition.constant is not None:
+                        condition_result = dict(condition.constant)
+                        node_inputs["conditions"].append(
+                            {
+                                key: value
+                                for key, value in condition_result.items()
+                                if key != "result"
+                            }
                         )
-
-                    input_conditions.append(
-                        {
-                            "actual_value": actual_value,
-                            "expected_value": expected_value,
-                            "comparison_operator": condition.compareOperator,
+                        process_datas["condition_results"].append(condition_result)
+                    else:
+                        input_condition = {
+                            "actual_value": self._get_operand(
+                                variable_pool, condition, span_context, left=True
+                            ),
+                            "expected_value": self._get_operand(
+                                variable_pool, condition, span_context, left=False
+                            ),
+                            "comparison_operator": condition.compare_operator,
                         }
-                    )
-
-                node_inputs["conditions"] = input_conditions
-
-                # Evaluate each condition using the appropriate comparison operator
-                for input_condition in input_conditions:
-                    actual_value = input_condition["actual_value"]
-                    expected_value = input_condition["expected_value"]
-                    comparison_operator = input_condition["comparison_operator"]
-
-                    # Apply the specified comparison operator
-                    match comparison_operator:
-                        case "contains":
-                            compare_result = self._assert_contains(
-                                actual_value, expected_value
-                            )
-                        case "not_contains":
-                            compare_result = self._assert_not_contains(
-                                actual_value, expected_value
-                            )
-                        case "start_with":
-                            compare_result = self._assert_start_with(
-                                actual_value, expected_value
-                            )
-                        case "end_with":
-                            compare_result = self._assert_end_with(
-                                actual_value, expected_value
-                            )
-                        case "is":
-                            compare_result = self._assert_is(
-                                actual_value, expected_value
-                            )
-                        case "is_not":
-                            compare_result = self._assert_is_not(
-                                actual_value, expected_value
-                            )
-                        case "empty":
-                            compare_result = self._assert_empty(
-                                actual_value, input_condition
-                            )
-                        case "not_empty":
-                            compare_result = self._assert_not_empty(
-                                actual_value, input_condition
-                            )
-                        case "eq":
-                            compare_result = self._assert_equal(
-                                actual_value, expected_value
-                            )
-                        case "ne":
-                            compare_result = self._assert_not_equal(
-                                actual_value, expected_value
-                            )
-                        case "gt":
-                            compare_result = self._assert_greater_than(
-                                actual_value, expected_value
-                            )
-                        case "lt":
-                            compare_result = self._assert_less_than(
-                                actual_value, expected_value
-                            )
-                        case "ge":
-                            compare_result = self._assert_greater_than_or_equal(
-                                actual_value, expected_value
-                            )
-                        case "le":
-                            compare_result = self._assert_less_than_or_equal(
-                                actual_value, expected_value
-                            )
-                        case "null":
-                            compare_result = self._assert_null(actual_value)
-                        case "not_null":
-                            compare_result = self._assert_not_null(actual_value)
-                        case _:
-                            continue
-
-                    process_datas["condition_results"].append(
-                        {**input_condition, "result": compare_result}
-                    )
+                        node_inputs["conditions"].append(input_condition)
+                        compare_result = self._compare(input_condition)
+                        process_datas["condition_results"].append(
+                            {**input_condition, "result": compare_result}
+                        )
+                    # Stop at the first condition that decides the branch
+                    if (
+                        process_datas["condition_results"][-1]["result"]
+                        != branch.is_and
+                    ):
+                        break
 
             except Exception as err:
                 span_context.add_error_event(
@@ -255,6 +288,85 @@ class IFElseNode(BaseNode):
                 node_type=self.node_type,
             )
 
+    def _get_operand(
+        self,
+        variable_pool: VariablePool,
+        condition: CompiledCondition,
+        span: Span,
+        left: bool,
+    ) -> Any:
+        """
+        Get the value of an operand of a compiled condition.
+
+        :param variable_pool: Variable pool containing runtime variables
+        :param condition: Compiled condition
+        :param span: Tracing span for monitoring execution
+        :param left: Whether to get the left operand, otherwise the right one
+        :return: Operand value, None if the condition has no right operand
+        """
+        if left:
+            if condition.left_literal:
+                return condition.left_value
+            if condition.left_var_name is None:
+                raise KeyError(condition.left_var_index)
+            return variable_pool.get_variable(
+                node_id=self.node_id, key_name=condition.left_var_name, span=span
+            )
+        if condition.right_literal:
+            return condition.right_value
+        if condition.right_var_name == "":
+            return None
+        return variable_pool.get_variable(
+            node_id=self.node_id, key_name=condition.right_var_name, span=span
+        )
+
+    def _compare(self, input_condition: dict) -> bool:
+        """
+        Evaluate a condition with the comparison operator it specifies.
+
+        :param input_condition: Condition with its actual and expected values
+        :return: Whether the condition holds
+        """
+        actual_value = input_condition["actual_value"]
+        expected_value = input_condition["expected_value"]
+        # Apply the specified comparison operator
+        match input_condition["comparison_operator"]:
+            case "contains":
+                return self._assert_contains(actual_value, expected_value)
+            case "not_contains":
+                return self._assert_not_contains(actual_value, expected_value)
+            case "start_with":
+                return self._assert_start_with(actual_value, expected_value)
+            case "end_with":
+                return self._assert_end_with(actual_value, expected_value)
+            case "is":
+                return self._assert_is(actual_value, expected_value)
+            case "is_not":
+                return self._assert_is_not(actual_value, expected_value)
+            case "empty":
+                return self._assert_empty(actual_value, input_condition)
+            case "not_empty":
+                return self._assert_not_empty(actual_value, input_condition)
+            case "eq":
+                return self._assert_equal(actual_value, expected_value)
+            case "ne":
+                return self._assert_not_equal(actual_value, expected_value)
+            case "gt":
+                return self._assert_greater_than(actual_value, expected_value)
+            case "lt":
+                return self._assert_less_than(actual_value, expected_value)
+            case "ge":
+                return self._assert_greater_than_or_equal(actual_value, expected_value)
+            case "le":
+                return self._assert_less_than_or_equal(actual_value, expected_value)
+            case "null":
+                return self._assert_null(actual_value)
+            case "not_null":
+                return self._assert_not_null(actual_value)
+        raise ValueError(
+            f"Unknown comparison operator: {input_condition['comparison_operator']}"
+        )
+
     async def async_execute(
         self,
         variable_pool: VariablePool,
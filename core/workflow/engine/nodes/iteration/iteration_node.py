@@ -1,10 +1,13 @@
 import asyncio
-import copy
-from typing import Any, Dict
+import os
+from typing import Any, Dict, List
 
-from workflow.engine.callbacks.callback_handler import ChatCallBacks
+from pydantic import Field
+from workflow.engine.callbacks.callback_handler import (
+    ChatCallBacks,
+    IterationItemCallBacks,
+)
 from workflow.engine.entities.chains import Chains
-from workflow.engine.entities.node_entities import NodeType
 from workflow.engine.entities.node_running_status import NodeRunningStatus
 from workflow.engine.entities.variable_pool import VariablePool
 from workflow.engine.nodes.base_node import BaseNode
@@ -26,11 +29,25 @@ class IterationNode(BaseNode):
 
     This node processes batch data by running a complete workflow iteration
     for each item in the input batch, collecting and aggregating results.
+    Items run on isolated per-item contexts, up to ``maxConcurrency`` at a time.
     """
 
     # Node ID of the first node in the workflow subgraph within this iteration
     IterationStartNodeId: str
 
+    # Maximum number of items running at the same time, capped by ITERATION_MAX_CONCURRENCY
+    maxConcurrency: int = Field(default=1, ge=1)
+
+    @property
+    def concurrency(self) -> int:
+        """
+        Get the number of items allowed to run at the same time.
+
+        :return: Node concurrency capped by the global iteration concurrency
+        """
+        global_cap = int(os.getenv("ITERATION_MAX_CONCURRENCY", "10"))
+        return max(1, min(self.maxConcurrency, global_cap))
+
     async def async_execute(
         self,
         variable_pool: VariablePool,
@@ -42,7 +59,8 @@ class IterationNode(BaseNode):
         Asynchronously execute the iteration node by processing batch data.
 
         This method processes each item in the input batch by running a complete
-        workflow iteration, then aggregates the results from all iterations.
+        workflow iteration, then aggregates the results from all iterations
+        in the order of the input batch.
 
         :param variable_pool: Pool of variables for the workflow execution
         :param span: Tracing span for monitoring and debugging
@@ -64,6 +82,7 @@ class IterationNode(BaseNode):
                 "node_run_status", {}
             )
             node_run_status[self.node_id].processing.set()
+            inputs: dict = {}
             try:
                 iteration_one_engine = kwargs.get("iteration_engine", {})[
                     self.IterationStartNodeId
@@ -73,7 +92,6 @@ class IterationNode(BaseNode):
                         self.node_id
                     ]
                 )
-                built_nodes = copy.deepcopy(iteration_one_engine.engine_ctx.built_nodes)
 
                 batch_datas = variable_pool.get_variable(
                     node_id=self.node_id,
@@ -81,24 +99,24 @@ class IterationNode(BaseNode):
                     span=span_context,
                 )
                 inputs = {self.input_identifier[0]: batch_datas}
-                span_context.add_info_events({"inputs": f"{inputs}"})
+                span_context.add_info_events(
+                    {"inputs": f"{inputs}", "concurrency": self.concurrency}
+                )
 
+                temp_variable_pool = variable_pool.fork()
+                batch_results = await self._process_batches(
+                    batch_datas,
+                    temp_variable_pool,
+                    source_iteration_chains,
+                    span_context,
+                    iteration_one_engine,
+                    variable_pool,
+                    callbacks,
+                    event_log_trace,
+                )
                 batch_result_dict: dict[str, list] = {}
-                temp_variable_pool = copy.deepcopy(variable_pool)
-                for batch_data in batch_datas:
-                    iteration_one_engine.engine_ctx.built_nodes = built_nodes
-                    res = await self._process_single_batch(
-                        batch_data,
-                        temp_variable_pool,
-                        source_iteration_chains,
-                        span_context,
-                        iteration_one_engine,
-                        variable_pool,
-                        callbacks,
-                        event_log_trace,
-                    )
-                    cur_batch_res = res.outputs
-                    for res_k, res_v in cur_batch_res.items():
+                for res in batch_results:
+                    for res_k, res_v in res.outputs.items():
                         if res_k not in batch_result_dict:
                             batch_result_dict[res_k] = []
                         batch_result_dict[res_k].append(res_v)
@@ -144,6 +162,63 @@ class IterationNode(BaseNode):
                 node_type=self.node_type,
             )
 
+    async def _process_batches(
+        self,
+        batch_datas: list,
+        temp_variable_pool: VariablePool,
+        source_iteration_chains: Chains,
+        span: Span,
+        iteration_one_engine: Any,
+        variable_pool: VariablePool,
+        callbacks: ChatCallBacks,
+        event_log_trace: WorkflowLog,
+    ) -> List[NodeRunResult]:
+        """
+        Process all batch items, running up to ``concurrency`` items at a time.
+
+        Results are collected in the order of the batch. Ordered output of an item
+        is streamed once all previous items have completed, and the first failing
+        item cancels the items still running.
+
+        :param batch_datas: Items of the batch to be processed
+        :param temp_variable_pool: Variable pool the item variable pools are forked from
+        :param source_iteration_chains: Source chains configuration for iteration
+        :param span: Tracing span for monitoring and debugging
+        :param iteration_one_engine: Workflow engine instance for this iteration
+        :param variable_pool: Original variable pool containing history and context
+        :param callbacks: Callback handlers for the workflow execution
+        :param event_log_trace: Event logging trace for the workflow
+        :return: Results of the items in batch order
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        item_callbacks = [IterationItemCallBacks(callbacks) for _ in batch_datas]
+
+        async def process_item(index: int) -> NodeRunResult:
+            async with semaphore:
+                return await self._process_single_batch(
+                    batch_datas[index],
+                    temp_variable_pool,
+                    source_iteration_chains,
+                    span,
+                    iteration_one_engine,
+                    variable_pool,
+                    item_callbacks[index],
+                    event_log_trace,
+                )
+
+        tasks = [asyncio.create_task(process_item(i)) for i in range(len(batch_datas))]
+        batch_results: List[NodeRunResult] = []
+        try:
+            for index, task in enumerate(tasks):
+                await item_callbacks[index].release()
+                batch_results.append(await task)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return batch_results
+
     async def _process_single_batch(
         self,
         batch_data: Any,
@@ -158,7 +233,7 @@ class IterationNode(BaseNode):
         """
         Process a single batch item through the iteration workflow.
 
-        This method sets up a fresh execution environment for each batch item,
+        This method sets up an isolated execution environment for the batch item,
         runs the complete iteration workflow, and returns the results.
 
         :param batch_data: Single item from the batch to be processed
@@ -167,18 +242,27 @@ class IterationNode(BaseNode):
         :param span: Tracing span for monitoring and debugging
         :param iteration_one_engine: Workflow engine instance for this iteration
         :param variable_pool: Original variable pool containing history and context
-        :param callbacks: Callback handlers for the workflow execution
+        :param callbacks: Callback handlers for this batch item
         :param event_log_trace: Event logging trace for the workflow
         :return: NodeRunResult containing the execution results for this batch item
         """
         cur_batch_data_dict = {self.input_identifier[0]: batch_data}
 
-        # Prepare execution environment for this iteration
-        new_variable_pool = copy.deepcopy(temp_variable_pool)
-        iteration_chains = copy.deepcopy(source_iteration_chains)
-
-        iteration_one_engine.engine_ctx.variable_pool = new_variable_pool
-        iteration_one_engine.engine_ctx.chains = iteration_chains
+        # Prepare an isolated execution environment for this item
+        iteration_chains = source_iteration_chains.fork()
+        scope_node_ids = iteration_chains.get_scope_node_ids()
+        new_variable_pool = temp_variable_pool.fork()
+        new_variable_pool.stream_data = {
+            node_id: (
+                {dep_node_id: asyncio.Queue() for dep_node_id in queues}
+                if node_id in scope_node_ids
+                else queues
+            )
+            for node_id, queues in temp_variable_pool.stream_data.items()
+        }
+        item_engine = iteration_one_engine.fork_iteration_item(
+            iteration_chains, new_variable_pool
+        )
 
         # Convert legacy history format for compatibility
         history = []
@@ -190,7 +274,7 @@ class IterationNode(BaseNode):
         history_v2 = []
         if variable_pool.history_v2:
             history_v2 = variable_pool.history_v2.origin_history
-        res = await iteration_one_engine.async_run(
+        return await item_engine.async_run(
             inputs=cur_batch_data_dict,
             span=span,
             callback=callbacks,
@@ -199,51 +283,6 @@ class IterationNode(BaseNode):
             event_log_trace=event_log_trace,
         )
 
-        # Reset node running status after each iteration execution
-        self._init_iteration_node(
-            iteration_one_engine.engine_ctx.node_run_status,
-            iteration_chains,
-            variable_pool,
-        )
-        iteration_one_engine.engine_ctx.end_complete = asyncio.Event()
-        return res
-
-    def _init_iteration_node(
-        self,
-        node_run_status: Dict[str, NodeRunningStatus],
-        chains: Chains,
-        variable_pool: VariablePool,
-    ) -> None:
-        """
-        Initialize iteration node running status for the next iteration.
-
-        This method resets all node running status flags and clears stream data
-        for message and end nodes to prepare for the next iteration execution.
-
-        :param node_run_status: Dictionary mapping node IDs to their running status
-        :param chains: Workflow chains configuration
-        :param variable_pool: Variable pool containing stream data to be reset
-        """
-        try:
-            for master_chain in chains.master_chains:
-                for node_id in master_chain.node_id_list:
-                    node_run_status[node_id].processing.clear()
-                    node_run_status[node_id].complete.clear()
-                    node_run_status[node_id].start_with_thread.clear()
-                    node_run_status[node_id].pre_processing.clear()
-                    node_run_status[node_id].not_run.clear()
-                    # Reset stream data for message and end nodes within iteration
-                    if node_id.split(":")[0] in [
-                        NodeType.MESSAGE.value,
-                        NodeType.ITERATION_END.value,
-                    ]:
-                        if node_id not in variable_pool.stream_data:
-                            continue
-                        for k, _ in variable_pool.stream_data[node_id].items():
-                            variable_pool.stream_data[node_id][k] = asyncio.Queue()
-        except Exception as e:
-            raise e
-
 
 class IterationStartNode(BaseNode):
     """
@@ -10,7 +10,6 @@ import json
 import os
 from typing import Any, List, Literal
 
-import aiohttp
 from aiohttp import ClientTimeout
 from pydantic import Field
 from workflow.engine.entities.node_entities import NodeType
@@ -23,6 +22,7 @@ from workflow.engine.nodes.entities.node_run_result import (
 from workflow.engine.nodes.knowledge_pro.consts import RagTypeEnum, RepoTypeEnum
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.middleware.getters import get_http_client_service
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
 
@@ -138,72 +138,72 @@ class KnowledgeProNode(BaseNode):
             interval_timeout = (
                 self.retry_config.timeout if self.retry_config.should_retry else None
             )
-            # Create HTTP session with appropriate timeout configuration
-            async with aiohttp.ClientSession(
+            # Send POST request to Knowledge Pro API on the shared connection pool
+            async with get_http_client_service().post(
+                url,
+                json=payload,
                 timeout=ClientTimeout(
                     total=30 * 60, sock_connect=30, sock_read=interval_timeout
-                )
-            ) as session:
-                # Send POST request to Knowledge Pro API
-                async with session.post(url=url, json=payload) as response:
-                    # Process streaming response line by line
-                    async for line in response.content:
-                        line_str = line.decode("utf-8")
-                        # Skip empty lines
-                        if line_str == "\n":
-                            continue
-                        span.add_info_event(f"recv: {line_str}")
-                        # Remove SSE data prefix
-                        line_str = line_str.removeprefix("data: ")
-                        # Handle stream completion signal
-                        if line_str.startswith("[DONE]"):
-                            await self.put_stream_content(
-                                self.node_id,
-                                variable_pool,
-                                msg_or_end_node_deps,
-                                NodeType.KNOWLEDGE_PRO.value,
-                                self.get_stream_done_content(),
-                            )
-                            break
-                        # Parse JSON message from stream
-                        msg = json.loads(line_str)
-                        content_type = msg.get("data", {}).get("content_type", "answer")
-
-                        # Handle error responses from the API
-                        if msg.get("code", 0) != 0:
-                            await self.put_stream_content(
-                                self.node_id,
-                                variable_pool,
-                                msg_or_end_node_deps,
-                                NodeType.KNOWLEDGE_PRO.value,
-                                self.get_stream_done_content(),
-                            )
-                            raise CustomException(
-                                err_code=CodeEnum.KNOWLEDGE_REQUEST_ERROR,
-                                err_msg=msg.get("message", ""),
-                                cause_error=json.dumps(msg, ensure_ascii=False),
-                            )
-
-                        # Process answer content type
-                        if content_type == "answer":
-                            content = msg.get("data", {}).get("content", "")
-                            content_list += [content] if content else []
-                            # Put stream content frame into msg_or_end_node_deps
-                            await self.put_stream_content(
-                                self.node_id,
-                                variable_pool,
-                                msg_or_end_node_deps,
-                                NodeType.KNOWLEDGE_PRO.value,
-                                msg,
-                            )
-
-                        # Extract knowledge metadata if present
-                        knowledge_metadata = (
-                            msg.get("data", {}).get("content", [])
-                            if content_type == "knowledge_metadata"
-                            else []
+                ),
+            ) as response:
+                # Process streaming response line by line
+                async for line in response.content:
+                    line_str = line.decode("utf-8")
+                    # Skip empty lines
+                    if line_str == "\n":
+                        continue
+                    span.add_info_event(f"recv: {line_str}")
+                    # Remove SSE data prefix
+                    line_str = line_str.removeprefix("data: ")
+                    # Handle stream completion signal
+                    if line_str.startswith("[DONE]"):
+                        await self.put_stream_content(
+                            self.node_id,
+                            variable_pool,
+                            msg_or_end_node_deps,
+                            NodeType.KNOWLEDGE_PRO.value,
+                            self.get_stream_done_content(),
+                        )
+                        break
+                    # Parse JSON message from stream
+                    msg = json.loads(line_str)
+                    content_type = msg.get("data", {}).get("content_type", "answer")
+
+                    # Handle error responses from the API
+                    if msg.get("code", 0) != 0:
+                        await self.put_stream_content(
+                            self.node_id,
+                            variable_pool,
+                            msg_or_end_node_deps,
+                            NodeType.KNOWLEDGE_PRO.value,
+                            self.get_stream_done_content(),
+                        )
+                        raise CustomException(
+                            err_code=CodeEnum.KNOWLEDGE_REQUEST_ERROR,
+                            err_msg=msg.get("message", ""),
+                            cause_error=json.dumps(msg, ensure_ascii=False),
                         )
 
+                    # Process answer content type
+                    if content_type == "answer":
+                        content = msg.get("data", {}).get("content", "")
+                        content_list += [content] if content else []
+                        # Put stream content frame into msg_or_end_node_deps
+                        await self.put_stream_content(
+                            self.node_id,
+                            variable_pool,
+                            msg_or_end_node_deps,
+                            NodeType.KNOWLEDGE_PRO.value,
+                            msg,
+                        )
+
+                    # Extract knowledge metadata if present
+                    knowledge_metadata = (
+                        msg.get("data", {}).get("content", [])
+                        if content_type == "knowledge_metadata"
+                        else []
+                    )
+
             # Prepare final outputs with combined content and metadata
             outputs = {"output": "".join(content_list), "result": knowledge_metadata}
         except asyncio.TimeoutError:
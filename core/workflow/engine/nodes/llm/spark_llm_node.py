@@ -13,7 +13,7 @@ from workflow.engine.nodes.entities.node_run_result import (
     WorkflowNodeExecutionStatus,
 )
 from workflow.engine.nodes.llm.prompt_ai_personal import system_template
-from workflow.engine.nodes.util.prompt import PromptUtils, process_prompt
+from workflow.engine.nodes.util.prompt import compile_template, resolve_placeholders
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
@@ -305,23 +305,10 @@ class SparkLLMNode(BaseLLMNode):
         :param variable_pool: Variable pool containing available variables
         :return: Fully processed prompt with variable substitutions
         """
-        available_placeholders = PromptUtils.get_available_placeholders(
-            self.node_id, prompt_template, variable_pool, span_context
+        compiled = compile_template(prompt_template)
+        replacements = resolve_placeholders(
+            compiled, self.input_identifier, self.node_id, variable_pool, span_context
         )
-        replacements = {}
-        for var_name in available_placeholders:
-            var_name_list = re.split(r"[\[.\]]", var_name)
-            if var_name_list[0].strip() in self.input_identifier:
-                replacements.update(
-                    {
-                        var_name: process_prompt(
-                            node_id=self.node_id,
-                            key_name=var_name,
-                            variable_pool=variable_pool,
-                            span=span_context,
-                        )
-                    }
-                )
         replacements_str = {}
         for key, value in replacements.items():
             try:
@@ -332,7 +319,4 @@ class SparkLLMNode(BaseLLMNode):
                 value = " "
             replacements_str[key] = value
         # Replace variables in prompt template
-        prompt_template = PromptUtils.replace_variables(
-            prompt_template, replacements_str
-        )
-        return prompt_template
+        return compiled.render(replacements_str)
@@ -319,18 +319,7 @@ class ParamsExtractorNode(BaseLLMNode):
         :param variable_pool: Pool of variables for schema validation
         :return: Validated and fixed parameter dictionary
         """
-        required = []
-        schemas: dict = copy.deepcopy(variable_pool.validate_template)
-        for mapping_key in variable_pool.output_variable_mapping.keys():
-            if mapping_key.startswith(self.node_id):
-                mapping_value = variable_pool.output_variable_mapping[mapping_key]
-                value_schema = mapping_value.get("schema")
-                key = mapping_key.split(f"{self.node_id}-")[-1]
-                schemas["properties"].update({key: value_schema})
-                if mapping_value.get("required", False):
-                    required.append(key)
-        if required:
-            schemas.update({"required": required})
+        schemas = copy.deepcopy(variable_pool.get_node_output_schema(self.node_id))
         validator = JsonSchemaValidator(schemas)
         is_valid, fixed_data = validator.validate_and_fix(res_dict)
         return fixed_data
@@ -6,6 +6,7 @@ from typing import Any, Dict
 from workflow.consts.database import ExecuteEnv
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.middleware.getters import get_http_client_service
 from workflow.extensions.otlp.trace.span import Span
 
 
@@ -97,36 +98,31 @@ class PGSqlClient:
                 {"request_data": json.dumps(payload, ensure_ascii=False)}
             )
             try:
-                from aiohttp import ClientSession
-
                 # Execute HTTP POST request to PostgreSQL service
-                async with ClientSession() as session:
-                    start_time = time.time()
-                    async with session.post(url, headers=headers, json=payload) as resp:
-                        background_json = await resp.json()
-                        # Log execution time and response for monitoring
-                        request_span.add_info_events(
-                            {"cost_time": f"{(time.time() - start_time) * 1000}"}
+                start_time = time.time()
+                async with get_http_client_service().post(
+                    url, headers=headers, json=payload
+                ) as resp:
+                    background_json = await resp.json()
+                    # Log execution time and response for monitoring
+                    request_span.add_info_events(
+                        {"cost_time": f"{(time.time() - start_time) * 1000}"}
+                    )
+                    request_span.add_info_events(
+                        {"response": json.dumps(background_json, ensure_ascii=False)}
+                    )
+                    # Check for service-level errors in response
+                    if background_json.get("code") != 0:
+                        msg = (
+                            f"err code {background_json.get('code')}, "
+                            f"reason {background_json.get('message')}, sid {background_json.get('sid')}"
                         )
-                        request_span.add_info_events(
-                            {
-                                "response": json.dumps(
-                                    background_json, ensure_ascii=False
-                                )
-                            }
+                        request_span.add_error_event(msg)
+                        raise CustomException(
+                            err_code=CodeEnum.PG_SQL_REQUEST_ERROR,
+                            err_msg=f"{msg}",
                         )
-                        # Check for service-level errors in response
-                        if background_json.get("code") != 0:
-                            msg = (
-                                f"err code {background_json.get('code')}, "
-                                f"reason {background_json.get('message')}, sid {background_json.get('sid')}"
-                            )
-                            request_span.add_error_event(msg)
-                            raise CustomException(
-                                err_code=CodeEnum.PG_SQL_REQUEST_ERROR,
-                                err_msg=f"{msg}",
-                            )
-                        return background_json
+                    return background_json
             except CustomException as e:
                 # Re-raise custom exceptions as-is
                 raise e
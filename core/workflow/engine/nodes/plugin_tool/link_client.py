@@ -3,10 +3,12 @@ import time
 from base64 import b64encode
 from typing import Any, Dict, List, Set, Tuple
 
-import requests  # type: ignore
+from aiohttp import ClientConnectionError
+from workflow.cache.tool_schema import decode_tool, get_tool_schemas, set_tool_schemas
 from workflow.exception.e import CustomException
 from workflow.exception.errors.code_convert import CodeConvert
 from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.middleware.getters import get_http_client_service
 from workflow.extensions.otlp.trace.span import Span
 
 
@@ -263,29 +265,22 @@ class Tool:
 
             # Execute HTTP request to Link system
             try:
-                from aiohttp import ClientSession
-
                 # Make asynchronous HTTP request to Link system
-                async with ClientSession() as session:
-                    start_time = time.time() * 1000
-                    async with session.post(
-                        self.run_url, json=run_link_payload
-                    ) as response:
-                        link_response = await response.json()
-                        # Log response timing and content
-                        link_tool_span.add_info_events(
-                            {
-                                "plugin_node_link_post_cost_time": f"{time.time() * 1000 - start_time}"
-                            }
-                        )
-                        link_tool_span.add_info_events(
-                            {
-                                "link_response": json.dumps(
-                                    link_response, ensure_ascii=False
-                                )
-                            }
-                        )
-            except requests.ConnectionError as e:
+                start_time = time.time() * 1000
+                async with get_http_client_service().post(
+                    self.run_url, json=run_link_payload
+                ) as response:
+                    link_response = await response.json()
+                    # Log response timing and content
+                    link_tool_span.add_info_events(
+                        {
+                            "plugin_node_link_post_cost_time": f"{time.time() * 1000 - start_time}"
+                        }
+                    )
+                    link_tool_span.add_info_events(
+                        {"link_response": json.dumps(link_response, ensure_ascii=False)}
+                    )
+            except ClientConnectionError as e:
                 # Handle connection errors
                 raise CustomException(
                     CodeEnum.SPARK_LINK_CONNECTION_ERROR,
@@ -335,48 +330,88 @@ class Link:
         get_url: str,
         run_url: str,
         version: str = "V1.0",
+        open_api_schema_list: List[Dict[str, Any]] | None = None,
     ):
         """
         Initialize Link client instance.
 
+        Use ``create`` to retrieve the tool schemas from the Link system.
+
         :param app_id: Application identifier
         :param tool_ids: List of tool identifiers to manage
         :param get_url: URL for retrieving tool schema information
         :param run_url: URL for executing tool operations
         :param version: Tool version (default: "V1.0")
+        :param open_api_schema_list: OpenAPI schema list of the tools
         """
         self.app_id = app_id
         self.tool_ids = tool_ids
         self.get_url = get_url
         self.run_url = run_url
         self.version = version
-        # Retrieve OpenAPI schema list from Spark Link system
-        self.open_api_schema_list = self.tool_schema_list()
+        self.open_api_schema_list = open_api_schema_list or []
         self.tools: List[Tool] = []  # List of Tool instances
         # Parse schemas and create Tool instances
         self.parse_react_schema_list()
 
-    def tool_schema_list(self) -> List[Dict[str, Any]]:
+    @classmethod
+    async def create(
+        cls,
+        app_id: str,
+        tool_ids: list[str],
+        get_url: str,
+        run_url: str,
+        version: str = "V1.0",
+    ) -> "Link":
+        """
+        Create a Link client with the tool schemas of the Link system.
+
+        :param app_id: Application identifier
+        :param tool_ids: List of tool identifiers to manage
+        :param get_url: URL for retrieving tool schema information
+        :param run_url: URL for executing tool operations
+        :param version: Tool version (default: "V1.0")
+        :return: Link client instance
+        """
+        link = cls(app_id, tool_ids, get_url, run_url, version)
+        # Retrieve OpenAPI schema list from Spark Link system
+        link.open_api_schema_list = await link.tool_schema_list()
+        link.parse_react_schema_list()
+        return link
+
+    async def tool_schema_list(self) -> List[Dict[str, Any]]:
         """
         Query tool schema list from Spark Link subsystem.
 
-        This method makes an HTTP request to retrieve the OpenAPI schemas
-        for the specified tools from the Link system.
+        Schemas are looked up in the tool schema cache first, only the tools
+        missing there are requested from the Link system.
 
-        :return: List of tool schema dictionaries
+        :return: List of tool schema dictionaries whose schema is decoded
         """
-        params = {
-            "tool_ids": self.tool_ids,
-            "versions": [self.version],
-            "app_id": self.app_id,
-        }
-        response_json = requests.get(
-            self.get_url, headers=self.const_headers, params=params
-        ).json()
-        if response_json.get("code", CodeEnum.SPARK_LINK_ACTION_ERROR.code) != 0:
-            # TODO: Add logging for error cases
-            return []
-        return response_json.get("data", {}).get("tools", [])
+        cached, missing = await get_tool_schemas(
+            self.app_id, self.tool_ids, self.version
+        )
+        if missing:
+            params = {
+                "tool_ids": missing,
+                "versions": [self.version],
+                "app_id": self.app_id,
+            }
+            async with get_http_client_service().get(
+                self.get_url, headers=self.const_headers, params=params
+            ) as response:
+                response_json = await response.json(content_type=None)
+            if response_json.get("code", CodeEnum.SPARK_LINK_ACTION_ERROR.code) != 0:
+                # TODO: Add logging for error cases
+                return []
+            cached.update(
+                await set_tool_schemas(
+                    self.app_id,
+                    self.version,
+                    response_json.get("data", {}).get("tools", []),
+                )
+            )
+        return [cached[tool_id] for tool_id in self.tool_ids if tool_id in cached]
 
     @staticmethod
     def parse_request_query_schema(
@@ -456,7 +491,7 @@ class Link:
                     err_msg="Tool ID is empty",
                     cause_error=json.dumps(tool_schema, ensure_ascii=False),
                 )
-            tool_schema = json.loads(tool_schema.get("schema", "{}"))
+            tool_schema = decode_tool(tool_schema)["schema"]
             # Process each path and method in the OpenAPI schema
             for path, path_schema in tool_schema.get("paths", {}).items():
                 for method, method_schema in path_schema.items():
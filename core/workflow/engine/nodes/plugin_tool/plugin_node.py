@@ -120,7 +120,7 @@ class PluginNode(BaseNode):
         try:
             event_log_node_trace = kwargs.get("event_log_node_trace")
             # Initialize Link client for tool communication
-            link = Link(
+            link = await Link.create(
                 app_id=self.appId,
                 tool_ids=[self.pluginId],
                 get_url=os.getenv("PLUGIN_GET_URL", ""),
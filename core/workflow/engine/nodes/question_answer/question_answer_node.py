@@ -1,5 +1,6 @@
 import copy
 import json
+import os
 import re
 import time
 from enum import Enum
@@ -10,6 +11,7 @@ from typing_extensions import Annotated
 from workflow.cache.event_registry import EventRegistry
 from workflow.consts.engine.chat_status import ChatStatus
 from workflow.engine.callbacks.callback_handler import ChatCallBacks
+from workflow.engine.entities.run_snapshot import HibernateHandler
 from workflow.engine.entities.variable_pool import VariablePool
 from workflow.engine.entities.workflow_dsl import OutputItem
 from workflow.engine.nodes.base_node import BaseLLMNode
@@ -190,6 +192,19 @@ class QuestionAnswerNode(BaseLLMNode):
     instruction: str = Field(default="")
     token_usage: dict = Field(default_factory=dict)
     processed_options: List[Option] = Field(default_factory=list)
+    # Inputs and outputs of an interrupt sent before the run was checkpointed
+    resume_state: Optional[dict] = None
+
+    def fork(self) -> "QuestionAnswerNode":
+        """
+        Create a copy of the node instance for a single run.
+
+        :return: Node instance with its own token usage and processed options
+        """
+        node = cast(QuestionAnswerNode, super().fork())
+        node.token_usage = dict(self.token_usage)
+        node.processed_options = list(self.processed_options)
+        return node
 
     def assemble_schema_info(self) -> dict:
         """
@@ -222,18 +237,7 @@ class QuestionAnswerNode(BaseLLMNode):
         :param variable_pool: Variable pool object containing validation templates and output variable mappings
         :return: Fixed data dictionary
         """
-        required = []
-        schemas: dict = copy.deepcopy(variable_pool.validate_template)
-        for mapping_key in variable_pool.output_variable_mapping.keys():
-            if mapping_key.startswith(self.node_id):
-                mapping_value = variable_pool.output_variable_mapping[mapping_key]
-                value_schema = mapping_value.get("schema")
-                key = mapping_key.split(f"{self.node_id}-")[-1]
-                schemas["properties"].update({key: value_schema})
-                if mapping_value.get("required", False):
-                    required.append(key)
-        if required:
-            schemas.update({"required": required})
+        schemas = copy.deepcopy(variable_pool.get_node_output_schema(self.node_id))
         validator = JsonSchemaValidator(schemas)
         # Validate and fix data
         is_valid, fixed_data = validator.validate_and_fix(res_dict)
@@ -313,7 +317,7 @@ class QuestionAnswerNode(BaseLLMNode):
         :raises CustomException: When specific errors occur
         """
         try:
-            event = EventRegistry().get_event(event_id=self.event_id)
+            event = await EventRegistry().get_event(event_id=self.event_id)
             if event is None:
                 raise CustomException(
                     err_code=CodeEnum.EVENT_REGISTRY_NOT_FOUND_ERROR,
@@ -881,6 +885,119 @@ class QuestionAnswerNode(BaseLLMNode):
         )
         return res
 
+    async def send_interrupt(
+        self, variable_pool: VariablePool, span: Span, callbacks: ChatCallBacks
+    ) -> tuple[dict, dict]:
+        """
+        Register the interrupt of the node and send the question to the user
+
+        :param variable_pool: Variable pool for data access
+        :param span: Tracing span for monitoring
+        :param callbacks: Callback handler of the run
+        :return: Inputs and outputs of the node
+        """
+        self.start_time = time.time()
+        self.timeout = self.timeout * 60  # Convert timeout from minutes to seconds
+        # Process question content
+        self.question = prompt_template_replace(
+            input_identifier=self.input_identifier,
+            _prompt_template=self.question,
+            node_id=self.node_id,
+            variable_pool=variable_pool,
+            span_context=span,
+        )
+
+        # Process input
+        inputs = {}
+        for input_key in self.input_identifier:
+            val = variable_pool.get_variable(
+                node_id=self.node_id, key_name=input_key, span=span
+            )
+            inputs[input_key] = val
+
+        # Process output query
+        outputs = {}
+        outputs.update({SystemOutputVariable.QUERY.value: self.question})
+
+        span.add_info_events(
+            {
+                "question": self.question,
+                "inputs": json.dumps(inputs, ensure_ascii=False),
+                "output": json.dumps(outputs, ensure_ascii=False),
+            }
+        )
+
+        self.event_id = callbacks.event_id
+
+        # Register node interrupt event
+        await EventRegistry().on_interrupt_node_start(
+            event_id=self.event_id, node_id=self.node_id, timeout=self.timeout
+        )
+        span.add_info_events(
+            {
+                "interrupt_info": f"event_id: {self.event_id}, node_id: {self.node_id}, timeout: {str(self.timeout)}"
+            }
+        )
+
+        await callbacks.on_node_start(
+            code=0, node_id=self.node_id, alias_name=self.alias_name
+        )
+
+        # Construct different interrupt data based on answerType
+        if self.answerType == AnswerType.OPTION.value:
+            value = InterruptData(
+                type=AnswerType.OPTION.value,
+                content=self.question,
+                option=self.process_option_answers(
+                    span_context=span, variable_pool=variable_pool
+                ),
+            )
+        else:
+            value = InterruptData(type=AnswerType.DIRECT.value, content=self.question)
+
+        span.add_info_events(
+            {"interrupt_data": json.dumps(value.dict(), ensure_ascii=False)}
+        )
+
+        await self.send_interrupt_callback(callbacks=callbacks, data=value)
+        return inputs, outputs
+
+    async def hibernate(
+        self,
+        span_context: Span,
+        hibernate_handler: Optional[HibernateHandler],
+        inputs: dict,
+        outputs: dict,
+    ) -> bool:
+        """
+        Checkpoint the run when the user does not answer within a grace period
+
+        The grace period is set by WORKFLOW_HIBERNATE_AFTER_SEC, a negative
+        value keeps every waiting run in memory.
+
+        :param span_context: Context object for tracking and recording events
+        :param hibernate_handler: Checkpoints the run, None if the run cannot be
+        :param inputs: Input data dictionary
+        :param outputs: Output data dictionary
+        :return: True if the run was checkpointed and must stop here
+        """
+        hibernate_after = float(os.getenv("WORKFLOW_HIBERNATE_AFTER_SEC") or "10")
+        if hibernate_handler is None or not 0 <= hibernate_after < self.timeout:
+            return False
+
+        event = await EventRegistry().get_event(event_id=self.event_id)
+        if await EventRegistry().wait_resume_data(
+            queue_name=event.get_node_q_name(), timeout=hibernate_after
+        ):
+            return False
+
+        self.resume_state = {"inputs": inputs, "outputs": outputs}
+        hibernated = await hibernate_handler(self.node_id)
+        if not hibernated:
+            self.resume_state = None
+        span_context.add_info_events({"hibernated": str(hibernated)})
+        return hibernated
+
     async def async_execute(
         self,
         variable_pool: VariablePool,
@@ -899,73 +1016,32 @@ class QuestionAnswerNode(BaseLLMNode):
         """
 
         callbacks = cast(ChatCallBacks, kwargs.get("callbacks"))
-        self.start_time = time.time()
-        self.timeout = self.timeout * 60  # Convert timeout from minutes to seconds
+        hibernate_handler = cast(
+            Optional[HibernateHandler], kwargs.get("hibernate_handler")
+        )
         try:
-            # Process question content
-            self.question = prompt_template_replace(
-                input_identifier=self.input_identifier,
-                _prompt_template=self.question,
-                node_id=self.node_id,
-                variable_pool=variable_pool,
-                span_context=span,
-            )
-
-            # Process input
-            inputs = {}
-            for input_key in self.input_identifier:
-                val = variable_pool.get_variable(
-                    node_id=self.node_id, key_name=input_key, span=span
-                )
-                inputs[input_key] = val
-
-            # Process output query
-            outputs = {}
-            outputs.update({SystemOutputVariable.QUERY.value: self.question})
-
-            span.add_info_events(
-                {
-                    "question": self.question,
-                    "inputs": json.dumps(inputs, ensure_ascii=False),
-                    "output": json.dumps(outputs, ensure_ascii=False),
-                }
-            )
-
-            self.event_id = callbacks.event_id
-
-            # Register node interrupt event
-            EventRegistry().on_interrupt_node_start(
-                event_id=self.event_id, node_id=self.node_id, timeout=self.timeout
-            )
-            span.add_info_events(
-                {
-                    "interrupt_info": f"event_id: {self.event_id}, node_id: {self.node_id}, timeout: {str(self.timeout)}"
-                }
-            )
-
-            await callbacks.on_node_start(
-                code=0, node_id=self.node_id, alias_name=self.alias_name
-            )
-
-            # Construct different interrupt data based on answerType
-            if self.answerType == AnswerType.OPTION.value:
-                value = InterruptData(
-                    type=AnswerType.OPTION.value,
-                    content=self.question,
-                    option=self.process_option_answers(
-                        span_context=span, variable_pool=variable_pool
-                    ),
+            if self.resume_state is None:
+                inputs, outputs = await self.send_interrupt(
+                    variable_pool=variable_pool, span=span, callbacks=callbacks
                 )
+                if await self.hibernate(
+                    span_context=span,
+                    hibernate_handler=hibernate_handler,
+                    inputs=inputs,
+                    outputs=outputs,
+                ):
+                    return self._build_node_result(
+                        status=WorkflowNodeExecutionStatus.HIBERNATED,
+                        inputs=inputs,
+                        outputs=outputs,
+                    )
             else:
-                value = InterruptData(
-                    type=AnswerType.DIRECT.value, content=self.question
-                )
-
-            span.add_info_events(
-                {"interrupt_data": json.dumps(value.dict(), ensure_ascii=False)}
-            )
+                # The interrupt was sent before the run was checkpointed
+                inputs = self.resume_state["inputs"]
+                outputs = self.resume_state["outputs"]
+                self.resume_state = None
+                span.add_info_event("resume from checkpoint")
 
-            await self.send_interrupt_callback(callbacks=callbacks, data=value)
             resume_data = await self.qa_fetch_resume_data(span_context=span)
             action_type = resume_data.event_type
             node_res = None
@@ -1008,11 +1084,11 @@ class QuestionAnswerNode(BaseLLMNode):
                     inputs=inputs,
                     outputs=outputs,
                 )
-            EventRegistry().on_interrupt_node_end(event_id=self.event_id)
+            await EventRegistry().on_interrupt_node_end(event_id=self.event_id)
             return node_res
 
         except CustomException as e:
-            EventRegistry().on_interrupt_node_end(event_id=self.event_id)
+            await EventRegistry().on_interrupt_node_end(event_id=self.event_id)
             return self._build_node_result(
                 status=WorkflowNodeExecutionStatus.FAILED,
                 error=e,
@@ -1020,7 +1096,7 @@ class QuestionAnswerNode(BaseLLMNode):
                 outputs={},
             )
         except Exception as e:
-            EventRegistry().on_interrupt_node_end(event_id=self.event_id)
+            await EventRegistry().on_interrupt_node_end(event_id=self.event_id)
             return self._build_node_result(
                 status=WorkflowNodeExecutionStatus.FAILED,
                 error=CustomException(
@@ -1,16 +1,131 @@
 import json
 import re
-from typing import Any, Literal, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 from workflow.consts.engine.template import TemplateSplitType
 from workflow.consts.engine.value_type import ValueType
-from workflow.engine.entities.variable_pool import RefNodeInfo, VariablePool
+from workflow.engine.entities.variable_pool import (
+    RefNodeInfo,
+    VariablePool,
+    extract_variable_name,
+)
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.trace.span import Span
 from workflow.infra.providers.llm.iflytek_spark.const import RespFormatEnum
 
+# Content between {{ ... }}
+_BRACES_PATTERN = re.compile(r"\{\{(.*?)}}")
+# Single name: letters, numbers, underscores, hyphens
+_NAME_PATTERN = r"[A-Za-z0-9_-]+"
+# Optional array index: multiple [numbers], allow negative numbers
+_INDEX_PATTERN = r"(?:\[-?\d+\])*"
+# One complete segment: name + optional index
+_SEGMENT_PATTERN = rf"{_NAME_PATTERN}{_INDEX_PATTERN}"
+# Multiple segments connected by dots
+_VARIABLE_PATTERN = re.compile(rf"^{_SEGMENT_PATTERN}(?:\.{_SEGMENT_PATTERN})*$")
+# Delimiters between the root variable name and its access path
+_ROOT_SPLIT_PATTERN = re.compile(r"[\[.\]]")
+
+
+class CompiledTemplate:
+    """
+    Template split once into literal text and placeholder segments.
+
+    ``texts`` always holds one more item than ``placeholders``: the template is
+    ``texts[0] + {{placeholders[0]}} + texts[1] + ... + texts[-1]``, with empty
+    texts between adjacent placeholders.
+    """
+
+    __slots__ = ("texts", "placeholders", "roots", "parse_error")
+
+    def __init__(self, template: str) -> None:
+        """
+        :param template: Template string containing variables
+        """
+        texts: list[str] = []
+        placeholders: list[str] = []
+        start = 0
+        for match in _BRACES_PATTERN.finditer(template):
+            key = match.group(1)
+            if not _VARIABLE_PATTERN.match(key):
+                continue
+            texts.append(template[start : match.start()])
+            placeholders.append(key)
+            start = match.end()
+        texts.append(template[start:])
+        self.texts: Tuple[str, ...] = tuple(texts)
+        self.placeholders: Tuple[str, ...] = tuple(placeholders)
+        # Root variable name of each distinct placeholder
+        self.roots: Dict[str, str] = {
+            placeholder: _ROOT_SPLIT_PATTERN.split(placeholder)[0].strip()
+            for placeholder in placeholders
+        }
+        # Placeholders such as '-name' have no valid variable name to resolve
+        self.parse_error = any(
+            not extract_variable_name(placeholder) for placeholder in self.roots
+        )
+
+    def render(self, replacements: Dict[str, str]) -> str:
+        """
+        Join the template segments with the replacement values.
+
+        Placeholders without a replacement are kept as they are.
+
+        :param replacements: Dictionary mapping placeholders to their values
+        :return: Rendered template
+        """
+        if not self.placeholders:
+            return self.texts[0]
+        parts = [self.texts[0]]
+        for placeholder, text in zip(self.placeholders, self.texts[1:]):
+            value = replacements.get(placeholder)
+            parts.append("{{" + placeholder + "}}" if value is None else value)
+            parts.append(text)
+        return "".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Compile a template into literal text and placeholder segments.
+
+    Templates of a workflow are compiled when its engine is built and the
+    compiled form is reused by every run.
+
+    :param template: Template string containing variables
+    :return: Compiled template
+    """
+    return CompiledTemplate(template)
+
+
+# Node parameters holding templates, nested dictionaries hold several templates
+TEMPLATE_PARAM_KEYS = (
+    "template",
+    "reasoningTemplate",
+    "systemTemplate",
+    "prompt",
+    "promptPrefix",
+    "question",
+    "instruction",
+)
+
+
+def compile_node_templates(node_param: dict) -> None:
+    """
+    Compile the templates found in the parameters of a node.
+
+    :param node_param: Node parameters from the workflow DSL
+    """
+    for key in TEMPLATE_PARAM_KEYS:
+        value = node_param.get(key)
+        templates = value.values() if isinstance(value, dict) else [value]
+        for template in templates:
+            if isinstance(template, str) and template:
+                compile_template(template)
+
 
 def process_array(name: str) -> str:
     """
@@ -24,27 +139,24 @@ def process_array(name: str) -> str:
     return array_name
 
 
-def parse_nested_array(arr: list, index_str: str) -> Union[Any, None]:
+@lru_cache(maxsize=4096)
+def parse_key_path(key_name: str) -> Tuple[Tuple[str, Optional[Tuple[int, ...]]], ...]:
     """
-    Parse nested array values based on string notation (e.g., 'arr_arr_input[0][0]').
+    Split a variable path into its parts.
 
-    This function extracts values from nested arrays using string-based index expressions.
+    For example 'input[0].xx1' gives (('input', (0,)), ('xx1', None)).
 
-    :param arr: Target nested array
-    :param index_str: String representation of index expression (e.g., 'arr_arr_input[0][0]')
-    :return: Parsed value from the nested array
+    :param key_name: Variable name with potential nested access
+    :return: Name and array indices of each part, None for parts without brackets
     """
-    import re
-
-    # Extract indices from array expression, e.g., 'arr_arr_input[0][0]' -> ['0', '0']
-    index_list = re.findall(r"\[(\d+)\]", index_str)
-    # Convert indices to integer list
-    indices = [int(i) for i in index_list]
-    # Iteratively parse array values using extracted indices
-    result = arr
-    for idx in indices:
-        result = result[idx]
-    return result
+    parts = []
+    for part in key_name.split("."):
+        if "[" in part:
+            indices = tuple(int(i) for i in re.findall(r"\[(\d+)\]", part))
+            parts.append((process_array(part), indices))
+        else:
+            parts.append((part, None))
+    return tuple(parts)
 
 
 def process_prompt(
@@ -68,14 +180,8 @@ def process_prompt(
     """
 
     try:
-        key_name_parts = key_name.split(".")
         last_part: Any = None
-        for index, cur_part_key_name in enumerate(key_name_parts):
-            arr_name = (
-                process_array(cur_part_key_name)
-                if "[" in cur_part_key_name
-                else cur_part_key_name
-            )
+        for index, (arr_name, indices) in enumerate(parse_key_path(key_name)):
             try:
                 last_part = (
                     variable_pool.get_variable(
@@ -87,11 +193,9 @@ def process_prompt(
             except Exception:
                 # User's key_name is incorrect and not found in variable pool
                 return key_name
-            last_part = (
-                parse_nested_array(last_part, cur_part_key_name)
-                if "[" in cur_part_key_name
-                else last_part
-            )
+            if indices is not None:
+                for idx in indices:
+                    last_part = last_part[idx]
         return last_part
     except Exception as e:
         raise CustomException(
@@ -100,6 +204,38 @@ def process_prompt(
         ) from e
 
 
+def resolve_placeholders(
+    compiled: CompiledTemplate,
+    input_identifier: list,
+    node_id: str,
+    variable_pool: VariablePool,
+    span: Span,
+) -> Dict[str, Any]:
+    """
+    Resolve the values of the template placeholders that reference node inputs.
+
+    :param compiled: Compiled template
+    :param input_identifier: List of valid input variable identifiers
+    :param node_id: ID of the current node
+    :param variable_pool: Pool containing variables and their values
+    :param span: Tracing span for monitoring
+    :return: Dictionary mapping placeholders to their values
+    :raises: CustomException if a placeholder cannot be parsed
+    """
+    if compiled.parse_error:
+        raise CustomException(err_code=CodeEnum.VARIABLE_PARSE_ERROR)
+    replacements = {}
+    for var_name, root in compiled.roots.items():
+        if root in input_identifier:
+            replacements[var_name] = process_prompt(
+                node_id=node_id,
+                key_name=var_name,
+                variable_pool=variable_pool,
+                span=span,
+            )
+    return replacements
+
+
 def prompt_template_replace(
     input_identifier: list,
     _prompt_template: str,
@@ -121,23 +257,10 @@ def prompt_template_replace(
     :param span_context: Tracing span for monitoring
     :return: Template with variables replaced by their values
     """
-    available_placeholders = PromptUtils.get_available_placeholders(
-        node_id, _prompt_template, variable_pool, span_context
+    compiled = compile_template(_prompt_template)
+    replacements = resolve_placeholders(
+        compiled, input_identifier, node_id, variable_pool, span_context
     )
-    replacements = {}
-    for var_name in available_placeholders:
-        var_name_list = re.split(r"[\[.\]]", var_name)
-        if var_name_list[0].strip() in input_identifier:
-            replacements.update(
-                {
-                    var_name: process_prompt(
-                        node_id=node_id,
-                        key_name=var_name,
-                        variable_pool=variable_pool,
-                        span=span_context,
-                    )
-                }
-            )
 
     replacements_str = {}
     for key, value in replacements.items():
@@ -150,8 +273,7 @@ def prompt_template_replace(
         replacements_str[key] = value
 
     # Replace variables in template with resolved values
-    _prompt_template = PromptUtils.replace_variables(_prompt_template, replacements_str)
-    return _prompt_template
+    return compiled.render(replacements_str)
 
 
 class TemplateUnitObj(BaseModel):
@@ -190,28 +312,7 @@ class PromptUtils:
         :param template: Template string containing variables
         :return: List of placeholders
         """
-        placeholders: list[str] = []
-
-        # Step1 : Extract content between {{ ... }}
-        braces_pattern = re.compile(r"\{\{(.*?)}}")
-        raw_matches = braces_pattern.findall(template)
-
-        # Step2: Define variable name rules
-        # Single name: letters, numbers, underscores, hyphens
-        name_pattern = r"[A-Za-z0-9_-]+"
-        # Optional array index: multiple [numbers], allow negative numbers
-        index_pattern = r"(?:\[-?\d+\])*"
-        # One complete segment: name + optional index
-        segment_pattern = rf"{name_pattern}{index_pattern}"
-        # Multiple segments connected by dots
-        variable_pattern = re.compile(rf"^{segment_pattern}(?:\.{segment_pattern})*$")
-
-        # Step3: Filter valid variable names
-        for key in raw_matches:
-            if not variable_pattern.match(key):
-                continue
-            placeholders.append(key)
-        return placeholders
+        return list(compile_template(template).placeholders)
 
     @staticmethod
     def get_available_placeholders(
@@ -254,31 +355,26 @@ class PromptUtils:
 
         template_unit_list: list[TemplateUnitObj] = []
 
-        placeholders = PromptUtils.get_available_placeholders(
-            node_id, template, variable_pool, span
-        )
-        placeholders_with_brackets = [
-            f"{{{{{placeholder}}}}}" for placeholder in placeholders
-        ]
-
-        # Build the regularity to capture all delimiters
-        pattern = "(" + "|".join(map(re.escape, placeholders_with_brackets)) + ")"
-        parts = re.split(pattern, template)
-        for i, part in enumerate(parts):
+        compiled = compile_template(template)
+        if compiled.parse_error:
+            raise CustomException(err_code=CodeEnum.VARIABLE_PARSE_ERROR)
+        # Alternate text and placeholder parts, starting and ending with text
+        parts: list[Tuple[str, bool]] = [(compiled.texts[0], False)]
+        for placeholder, text in zip(compiled.placeholders, compiled.texts[1:]):
+            parts.append((placeholder, True))
+            parts.append((text, False))
+        for i, (part, is_placeholder) in enumerate(parts):
 
             # Handle placeholder information
-            if part in placeholders_with_brackets:
-                part_without_brackets = part.removeprefix("{{").removesuffix("}}")
+            if is_placeholder:
                 ref_node_info = variable_pool.get_variable_ref_node_id(
-                    node_id, part_without_brackets, span
+                    node_id, part, span
                 )
                 if not ref_node_info:
-                    raise ValueError(
-                        f"Node {node_id} has no variable {part_without_brackets}"
-                    )
+                    raise ValueError(f"Node {node_id} has no variable {part}")
 
                 template_unit = TemplateUnitObj(
-                    key=part_without_brackets,
+                    key=part,
                     key_type=TemplateSplitType.VARIABLE.value,
                     ref_node_info=ref_node_info,
                 )
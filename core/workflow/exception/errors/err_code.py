@@ -244,6 +244,7 @@ class CodeEnum(Enum):
         "Code node return result type does not meet requirements",
     )
     CODE_EXECUTION_TIMEOUT_ERROR = (21603, "Code execution timeout")
+    CODE_EXECUTION_BUSY_ERROR = (21604, "Code executor is busy")
 
     # Node debug related errors
     NODE_DEBUG_ERROR = (21700, "Node debug failed")
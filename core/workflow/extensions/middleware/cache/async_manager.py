@@ -0,0 +1,249 @@
+import asyncio
+import functools
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from loguru import logger
+from workflow.extensions.middleware.base import Service
+from workflow.extensions.middleware.cache.base import AsyncBaseCacheService
+from workflow.extensions.middleware.cache.manager import RedisCache
+
+# Longest BLPOP sent to Redis in seconds, longer waits are split into several
+_BLPOP_MAX_WAIT = 1
+
+
+class AsyncCachePipeline:
+    """
+    Pipeline of the async Redis cache.
+
+    Commands are buffered locally by the wrapped Redis pipeline, only
+    ``execute`` talks to Redis and has to be awaited.
+    """
+
+    def __init__(self, pipe: Any, run: Callable[..., Any]) -> None:
+        """
+        Initialize the pipeline.
+
+        :param pipe: Redis pipeline buffering the commands
+        :param run: Coroutine function running a blocking call off the event loop
+        """
+        self._pipe = pipe
+        self._run = run
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Forward command buffering to the wrapped Redis pipeline.
+
+        :param name: Command name
+        :return: Command of the wrapped pipeline
+        """
+        return getattr(self._pipe, name)
+
+    async def execute(self) -> List[Any]:
+        """
+        Send the buffered commands to Redis.
+
+        :return: Results of the buffered commands
+        """
+        return await self._run(self._pipe.execute)
+
+    async def __aenter__(self) -> "AsyncCachePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._pipe.reset()
+
+
+class AsyncRedisCache(AsyncBaseCacheService, Service):
+    """
+    Redis cache implementation for the event loop.
+
+    The pinned redis and redis-py-cluster clients have no asyncio API, so
+    commands run on a dedicated thread pool sized to a dedicated connection
+    pool. Threads never wait for a connection, and the default executor and
+    the connections of the synchronous cache are left to legacy callers.
+    ``blpop`` waits in BLPOP commands on a separate thread and connection
+    pool, so waiting on lists never holds up the other commands.
+    """
+
+    def __init__(
+        self,
+        cache: RedisCache,
+        max_connections: int,
+        blocking_cache: RedisCache,
+        blocking_connections: int,
+    ) -> None:
+        """
+        Initialize the async Redis cache.
+
+        :param cache: Redis cache owning a connection pool of ``max_connections``
+        :param max_connections: Maximum number of commands running at the same time
+        :param blocking_cache: Redis cache owning a pool of ``blocking_connections``
+        :param blocking_connections: Maximum number of BLPOP running at the same time
+        """
+        self._cache = cache
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections, thread_name_prefix="async_redis_cache"
+        )
+        self.max_connections = max_connections
+        self._blocking_cache = blocking_cache
+        self._blocking_executor = ThreadPoolExecutor(
+            max_workers=blocking_connections,
+            thread_name_prefix="async_redis_cache_blocking",
+        )
+        self.blocking_connections = blocking_connections
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking Redis call on the cache thread pool.
+
+        :param func: Blocking function to call
+        :param args: Positional arguments of the call
+        :param kwargs: Keyword arguments of the call
+        :return: Result of the call
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def is_connected(self) -> bool:
+        """
+        Check if the Redis client is connected.
+
+        :return: True if connected, False otherwise
+        """
+        return self._cache.is_connected()
+
+    async def get(self, key: str) -> Any:
+        """
+        Retrieve an item from the cache.
+
+        :param key: The key of the item to retrieve
+        :return: The value associated with the key, or None if the key is not found
+        """
+        return await self._run(self._cache.get, key)
+
+    async def set(self, key: str, value: Any) -> None:
+        """
+        Add an item to the cache.
+
+        :param key: The key of the item
+        :param value: The value to cache
+        """
+        await self._run(self._cache.set, key, value)
+
+    async def hash_set_ex(
+        self, name: str, key: str, value: Any, expire_time: int | None
+    ) -> None:
+        """
+        Set a hash field with optional expiration.
+
+        :param name: The hash key name
+        :param key: The field key within the hash
+        :param value: The value to cache
+        :param expire_time: Expiration time in seconds for the hash key
+        """
+        await self._run(self._cache.hash_set_ex, name, key, value, expire_time)
+
+    async def hash_get(self, name: str, key: str) -> Any:
+        """
+        Get a hash field value.
+
+        :param name: The hash key name
+        :param key: The field key within the hash
+        :return: The unpickled value or None if not found
+        """
+        return await self._run(self._cache.hash_get, name, key)
+
+    async def hash_del(self, name: str, *key: str) -> Any:
+        """
+        Delete hash fields.
+
+        :param name: The hash key name
+        :param key: Variable number of field keys to delete
+        :return: Tuple of (success_flag, failed_deletions_dict)
+        """
+        return await self._run(self._cache.hash_del, name, *key)
+
+    async def hash_get_all(self, name: str) -> Dict[str, Any]:
+        """
+        Get all fields and values from a hash.
+
+        :param name: The hash key name
+        :return: Dictionary containing all field-value pairs
+        """
+        return await self._run(self._cache.hash_get_all, name)
+
+    async def delete(self, key: str) -> None:
+        """
+        Remove an item from the cache.
+
+        :param key: The key of the item to remove
+        """
+        await self._run(self._cache.delete, key)
+
+    def pipeline(self) -> AsyncCachePipeline:
+        """
+        Create a pipeline for batch operations.
+
+        :return: Pipeline whose ``execute`` method has to be awaited
+        """
+        return AsyncCachePipeline(self._cache.pipeline(), self._run)
+
+    async def blpop(self, key: str, timeout: int) -> Any:
+        """
+        Pop the first element of a list, waiting for one up to the timeout.
+
+        The wait is sent to Redis as BLPOP commands of at most
+        ``_BLPOP_MAX_WAIT`` seconds, which bounds the time a waiter holds a
+        blocking thread, so waiters beyond the pool size take turns.
+
+        :param key: The list key to pop from
+        :param timeout: Maximum time to wait for an element in seconds, 0 waits forever
+        :return: A (key, element) pair or None if timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout > 0 else None
+        while True:
+            wait = _BLPOP_MAX_WAIT
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                wait = min(wait, math.ceil(remaining))
+            result = await loop.run_in_executor(
+                self._blocking_executor,
+                functools.partial(self._blocking_cache.blpop, key, wait),
+            )
+            if result is not None:
+                return result
+
+    async def hgetall_str(self, name: str) -> Dict[str, str]:
+        """
+        Get all hash fields and values as strings.
+
+        :param name: The hash key name
+        :return: Dictionary with string keys and values
+        """
+        return await self._run(self._cache.hgetall_str, name)
+
+    def teardown(self) -> None:
+        """
+        Stop the thread pools of the cache.
+        """
+        logger.debug("async redis cache teardown")
+        self._executor.shutdown(wait=False)
+        self._blocking_executor.shutdown(wait=False)
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the AsyncRedisCache instance.
+
+        :return: String representation showing the connection limits
+        """
+        return (
+            f"AsyncRedisCache(max_connections={self.max_connections}, "
+            f"blocking_connections={self.blocking_connections})"
+        )
@@ -128,6 +128,15 @@ class BaseCacheService(abc.ABC):
         :return: The popped element or None if timeout.
         """
 
+    @abc.abstractmethod
+    def lpop(self, key: str) -> Any:
+        """
+        Non-blocking left pop operation on a list.
+
+        :param key: The list key to pop from.
+        :return: The popped element or None if the list is empty.
+        """
+
     @abc.abstractmethod
     def hgetall_str(self, name: str) -> Dict[str, str]:
         """
@@ -176,3 +185,111 @@ class BaseCacheService(abc.ABC):
         Args:
             key: The key of the item to remove.
         """
+
+
+class AsyncBaseCacheService(abc.ABC):
+    """
+    Abstract base class for a cache used from the event loop.
+
+    Methods mirror the ones of ``BaseCacheService`` and can be awaited
+    without blocking the event loop.
+    """
+
+    name = ServiceType.ASYNC_CACHE_SERVICE
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Any:
+        """
+        Retrieve an item from the cache.
+
+        :param key: The key of the item to retrieve.
+        :return: The value associated with the key, or None if the key is not found.
+        """
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        """
+        Add an item to the cache.
+
+        :param key: The key of the item.
+        :param value: The value to cache.
+        """
+
+    @abc.abstractmethod
+    async def hash_set_ex(
+        self, name: str, key: str, value: Any, expire_time: int | None
+    ) -> None:
+        """
+        Add a hash item to the cache with optional expiration.
+
+        :param name: The hash key name.
+        :param key: The field key within the hash.
+        :param value: The value to cache.
+        :param expire_time: Expiration time in seconds for the hash key.
+        """
+
+    @abc.abstractmethod
+    async def hash_get(self, name: str, key: str) -> Any:
+        """
+        Retrieve a hash field value from the cache.
+
+        :param name: The hash key name.
+        :param key: The field key within the hash.
+        :return: The value associated with the field, or None if not found.
+        """
+
+    @abc.abstractmethod
+    async def hash_del(self, name: str, key: str) -> Any:
+        """
+        Delete a hash field from the cache.
+
+        :param name: The hash key name.
+        :param key: The field key to delete.
+        :return: The result of the deletion operation.
+        """
+
+    @abc.abstractmethod
+    async def hash_get_all(self, name: str) -> Dict[str, Any]:
+        """
+        Retrieve all fields and values from a hash.
+
+        :param name: The hash key name.
+        :return: A dictionary containing all field-value pairs in the hash.
+        """
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Remove an item from the cache.
+
+        :param key: The key of the item to remove.
+        """
+
+    @abc.abstractmethod
+    def pipeline(self) -> Any:
+        """
+        Create a pipeline for batch operations.
+
+        Commands are buffered locally and sent to Redis by awaiting ``execute``.
+
+        :return: A pipeline object with an awaitable ``execute`` method.
+        """
+
+    @abc.abstractmethod
+    async def blpop(self, key: str, timeout: int) -> Any:
+        """
+        Blocking left pop operation on a list.
+
+        :param key: The list key to pop from.
+        :param timeout: Maximum time to wait for an element in seconds.
+        :return: A (key, element) pair or None if timeout.
+        """
+
+    @abc.abstractmethod
+    async def hgetall_str(self, name: str) -> Dict[str, str]:
+        """
+        Retrieve all fields and values from a hash as strings.
+
+        :param name: The hash key name.
+        :return: A dictionary containing all field-value pairs as strings.
+        """
@@ -1,7 +1,12 @@
 import os
 
 from loguru import logger
-from workflow.extensions.middleware.cache.base import BaseCacheService, RedisModel
+from workflow.extensions.middleware.cache.async_manager import AsyncRedisCache
+from workflow.extensions.middleware.cache.base import (
+    AsyncBaseCacheService,
+    BaseCacheService,
+    RedisModel,
+)
 from workflow.extensions.middleware.cache.manager import RedisCache
 from workflow.extensions.middleware.factory import ServiceFactory
 
@@ -52,3 +57,62 @@ class CacheServiceFactory(ServiceFactory):
             return redis_cache
         else:
             raise RuntimeError("Could not connect to Redis cache")
+
+
+class AsyncCacheServiceFactory(ServiceFactory):
+    """
+    Factory class for creating async cache service instances.
+
+    The async cache connects to the same Redis as the cache service
+    with its own bounded connection pool.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the async cache service factory.
+
+        Sets up the factory to create AsyncBaseCacheService instances.
+        """
+        super().__init__(AsyncBaseCacheService)
+
+    def create(self) -> AsyncBaseCacheService:
+        """
+        Create an async Redis cache service instance.
+
+        Uses the same environment variables as the cache service, plus:
+        - REDIS_ASYNC_MAX_CONNECTIONS: Connection pool size of the async cache (default: 32)
+        - REDIS_ASYNC_BLOCKING_CONNECTIONS: Connection pool size of BLPOP (default: 16)
+
+        :return: A configured AsyncRedisCache instance.
+        :raises RuntimeError: If unable to connect to Redis.
+        """
+        logger.debug("Creating async Redis cache")
+        redis_cluster_addr = os.getenv("REDIS_CLUSTER_ADDR", "")
+        redis_addr = os.getenv("REDIS_ADDR", "")
+        if not redis_cluster_addr and not redis_addr:
+            raise RuntimeError("REDIS_CLUSTER_ADDR or REDIS_ADDR must be set")
+
+        max_connections = int(os.getenv("REDIS_ASYNC_MAX_CONNECTIONS") or "32")
+        blocking_connections = int(
+            os.getenv("REDIS_ASYNC_BLOCKING_CONNECTIONS") or "16"
+        )
+        cache_kwargs = {
+            "expiration_time": int(os.getenv("REDIS_EXPIRE") or "3600"),
+            "addr": redis_cluster_addr or redis_addr,
+            "password": os.getenv("REDIS_PASSWORD", ""),
+            "model": RedisModel.CLUSTER if redis_cluster_addr else RedisModel.SINGLE,
+        }
+        async_redis_cache = AsyncRedisCache(
+            cache=RedisCache(max_connections=max_connections, **cache_kwargs),
+            max_connections=max_connections,
+            blocking_cache=RedisCache(
+                max_connections=blocking_connections, **cache_kwargs
+            ),
+            blocking_connections=blocking_connections,
+        )
+
+        if async_redis_cache.is_connected():
+            logger.debug("Async Redis cache is connected")
+            return async_redis_cache
+        else:
+            raise RuntimeError("Could not connect to async Redis cache")
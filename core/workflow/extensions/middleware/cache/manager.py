@@ -21,6 +21,7 @@ class RedisCache(BaseCacheService, Service):
         password: str,
         expiration_time: int = 60 * 60,
         model: RedisModel = RedisModel.CLUSTER,
+        max_connections: int | None = None,
     ) -> None:
         """
         Initialize Redis cache with cluster configuration.
@@ -29,20 +30,24 @@ class RedisCache(BaseCacheService, Service):
         :param password: Redis authentication password
         :param expiration_time: Default expiration time in seconds (default: 3600)
         :param model: Redis model type (default: RedisModel.CLUSTER)
+        :param max_connections: Maximum size of the connection pool, None for unbounded
         """
         if model == RedisModel.CLUSTER:
-            self._client = self.init_redis_cluster(addr, password)
+            self._client = self.init_redis_cluster(addr, password, max_connections)
         else:
-            self._client = self.init_redis(addr, password)
+            self._client = self.init_redis(addr, password, max_connections)
         logger.debug("redis init success")
         self.expiration_time = expiration_time
 
-    def init_redis_cluster(self, cluster_addr: str, password: str) -> Any:
+    def init_redis_cluster(
+        self, cluster_addr: str, password: str, max_connections: int | None = None
+    ) -> Any:
         """
         Initialize Redis cluster connection.
 
         :param cluster_addr: Cluster addresses in format "addr1:port1,addr2:port2,addr3:port3"
         :param password: Redis authentication password
+        :param max_connections: Maximum size of the connection pool, None for unbounded
         :return: RedisCluster client instance
         """
         logger.debug("redis cluster init in progress")
@@ -56,21 +61,30 @@ class RedisCache(BaseCacheService, Service):
                 host = match.group(1)
                 port = match.group(2)
                 cluster_nodes.append({"host": host, "port": port})
-        return RedisCluster(startup_nodes=cluster_nodes, password=password)
+        return RedisCluster(
+            startup_nodes=cluster_nodes,
+            password=password,
+            max_connections=max_connections,
+        )
 
-    def init_redis(self, addr: str, password: str) -> Any:
+    def init_redis(
+        self, addr: str, password: str, max_connections: int | None = None
+    ) -> Any:
         """
         Initialize Redis connection.
 
         :param addr: Redis addresses in format "host:port"
         :param password: Redis authentication password
+        :param max_connections: Maximum size of the connection pool, None for unbounded
         :return: Redis client instance
         """
         logger.debug("redis init in progress")
         from redis import Redis  # type: ignore
 
         host, port = addr.split(":")
-        return Redis(host=host, port=port, password=password)
+        return Redis(
+            host=host, port=port, password=password, max_connections=max_connections
+        )
 
     def is_connected(self) -> bool:
         """
@@ -281,6 +295,15 @@ class RedisCache(BaseCacheService, Service):
         """
         return self._client.blpop(key, timeout=timeout)
 
+    def lpop(self, key: str) -> Any:
+        """
+        Non-blocking left pop operation on a list.
+
+        :param key: The list key to pop from
+        :return: The popped element or None if the list is empty
+        """
+        return self._client.lpop(key)
+
     def hgetall_str(self, name: str) -> Dict[str, str]:
         """
         Get all hash fields and values as strings.
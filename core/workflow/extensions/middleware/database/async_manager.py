@@ -0,0 +1,145 @@
+"""
+Async database service module.
+
+This module provides the database service of the request path, whose sessions
+are used from async handlers without blocking the event loop.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from loguru import logger
+from sqlalchemy import Engine, create_engine
+from sqlmodel import Session  # type: ignore
+from workflow.extensions.middleware.base import Service
+from workflow.extensions.middleware.utils import ServiceType
+from workflow.extensions.otlp.metric import metric
+
+T = TypeVar("T")
+
+
+class AsyncDatabaseService(Service):
+    """
+    Database service implementation for the event loop.
+
+    The pinned PyMySQL driver has no asyncio API, so sessions run on a
+    dedicated thread pool sized to a dedicated connection pool, like the async
+    cache. Threads never wait for a connection, requests beyond the pool size
+    wait on the event loop for a free thread, and the connections of the
+    synchronous database service are left to the management API.
+    """
+
+    name = ServiceType.ASYNC_DATABASE_SERVICE
+
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 32,
+        pool_recycle: int = 3600,
+    ):
+        """
+        Initialize the async database service.
+
+        :param database_url: Database connection URL string
+        :param pool_size: Maximum number of sessions running at the same time
+        :param pool_recycle: Maximum seconds before recycling a connection,
+                            used to handle database server auto-closing long-running connections
+        """
+        self.database_url = database_url
+        self.pool_size = pool_size
+        self.pool_recycle = pool_recycle
+        self.engine = self._create_engine()
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="async_database"
+        )
+        logger.debug("async database init success")
+
+    def _create_engine(self) -> "Engine":
+        """
+        Create the SQLAlchemy engine owning one connection per session thread.
+
+        :return: Configured SQLAlchemy engine instance
+        """
+        return create_engine(
+            self.database_url,
+            echo=False,
+            pool_size=self.pool_size,
+            max_overflow=0,
+            pool_recycle=self.pool_recycle,
+        )
+
+    async def run(self, func: Callable[[Session], T]) -> T:
+        """
+        Run a function using a database session on the session thread pool.
+
+        The session is rolled back if the function raises and is always
+        closed. Loaded objects are not expired on commit, they stay readable
+        after the session is closed.
+
+        :param func: Blocking function called with the session
+        :return: Result of the function
+        """
+        submit_time = time.perf_counter()
+
+        def call() -> T:
+            _report_pool_wait((time.perf_counter() - submit_time) * 1000)
+            _report_active_sessions(1)
+            try:
+                with Session(self.engine, expire_on_commit=False) as session:
+                    try:
+                        return func(session)
+                    except Exception:
+                        session.rollback()
+                        raise
+            finally:
+                _report_active_sessions(-1)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, call)
+
+    def teardown(self) -> None:
+        """
+        Stop the session thread pool and close the pooled connections.
+        """
+        logger.debug("async database teardown")
+        self._executor.shutdown(wait=False)
+        self.engine.dispose()
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the AsyncDatabaseService instance.
+
+        :return: String representation showing the pool size
+        """
+        return f"AsyncDatabaseService(pool_size={self.pool_size})"
+
+
+def _report_pool_wait(wait_ms: float) -> None:
+    """
+    Report the time a session waited for a free thread through the OTLP meter.
+
+    :param wait_ms: Wait time in milliseconds
+    """
+    if metric.database_pool_wait_histogram is None:
+        return
+    metric.database_pool_wait_histogram.record(
+        wait_ms,
+        {"server_name": os.getenv("SERVICE_NAME", "default"), "pid": os.getpid()},
+    )
+
+
+def _report_active_sessions(delta: int) -> None:
+    """
+    Report a change of the sessions in use through the OTLP meter.
+
+    :param delta: 1 when a session starts, -1 when it ends
+    """
+    if metric.database_active_sessions_counter is None:
+        return
+    metric.database_active_sessions_counter.add(
+        delta,
+        {"server_name": os.getenv("SERVICE_NAME", "default"), "pid": os.getpid()},
+    )
@@ -8,6 +8,9 @@ with configurable connection parameters.
 import os
 from typing import Optional
 
+from workflow.extensions.middleware.database.async_manager import (
+    AsyncDatabaseService,
+)
 from workflow.extensions.middleware.database.manager import DatabaseService
 from workflow.extensions.middleware.factory import ServiceFactory
 
@@ -42,12 +45,56 @@ class DatabaseServiceFactory(ServiceFactory):
         :return: A configured DatabaseService instance
         """
         if database_url is None:
-            # Extract database connection parameters from environment variables
-            host = os.getenv("MYSQL_HOST")
-            port = os.getenv("MYSQL_PORT")
-            user = os.getenv("MYSQL_USER")
-            password = os.getenv("MYSQL_PASSWORD")
-            db = os.getenv("MYSQL_DB")
-            # Construct MySQL connection URL using PyMySQL driver
-            database_url = f"mysql+pymysql://{user}:{password}@{host}:{port}/{db}"
+            database_url = _database_url_from_env()
         return DatabaseService(database_url=database_url)
+
+
+class AsyncDatabaseServiceFactory(ServiceFactory):
+    """
+    Factory class for creating AsyncDatabaseService instances.
+
+    The async database service connects to the same database as the
+    database service with its own bounded connection pool.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the AsyncDatabaseServiceFactory.
+
+        Sets up the factory to create AsyncDatabaseService instances.
+        """
+        super().__init__(AsyncDatabaseService)
+
+    def create(self, database_url: Optional[str] = None) -> AsyncDatabaseService:
+        """
+        Create a new AsyncDatabaseService instance.
+
+        Uses the same environment variables as the database service, plus:
+        - MYSQL_ASYNC_POOL_SIZE: Connection pool size of the async service (default: 32)
+
+        :param database_url: Optional database connection URL. If None,
+                            will be constructed from environment variables
+        :return: A configured AsyncDatabaseService instance
+        """
+        if database_url is None:
+            database_url = _database_url_from_env()
+        return AsyncDatabaseService(
+            database_url=database_url,
+            pool_size=int(os.getenv("MYSQL_ASYNC_POOL_SIZE") or "32"),
+        )
+
+
+def _database_url_from_env() -> str:
+    """
+    Build the database URL from environment variables.
+
+    :return: MySQL connection URL
+    """
+    # Extract database connection parameters from environment variables
+    host = os.getenv("MYSQL_HOST")
+    port = os.getenv("MYSQL_PORT")
+    user = os.getenv("MYSQL_USER")
+    password = os.getenv("MYSQL_PASSWORD")
+    db = os.getenv("MYSQL_DB")
+    # Construct MySQL connection URL using PyMySQL driver
+    return f"mysql+pymysql://{user}:{password}@{host}:{port}/{db}"
@@ -9,8 +9,15 @@ type-safe access to services and handle the casting to appropriate types.
 from typing import Iterator, cast
 
 from sqlmodel import Session  # type: ignore
-from workflow.extensions.middleware.cache.base import BaseCacheService
+from workflow.extensions.middleware.cache.base import (
+    AsyncBaseCacheService,
+    BaseCacheService,
+)
+from workflow.extensions.middleware.database.async_manager import (
+    AsyncDatabaseService,
+)
 from workflow.extensions.middleware.database.manager import DatabaseService
+from workflow.extensions.middleware.http.manager import HttpClientService
 from workflow.extensions.middleware.kafka.manager import KafkaProducerService
 from workflow.extensions.middleware.manager import service_manager
 from workflow.extensions.middleware.masdk.manager import MASDKService
@@ -27,6 +34,17 @@ def get_db_service() -> "DatabaseService":
     return cast(DatabaseService, service_manager.get(ServiceType.DATABASE_SERVICE))
 
 
+def get_async_db_service() -> "AsyncDatabaseService":
+    """
+    Get the async database service instance.
+
+    :return: The async database service instance
+    """
+    return cast(
+        AsyncDatabaseService, service_manager.get(ServiceType.ASYNC_DATABASE_SERVICE)
+    )
+
+
 def get_session() -> Iterator["Session"]:
     """
     Get a database session from the database service.
@@ -51,6 +69,17 @@ def get_cache_service() -> "BaseCacheService":
     return cast(BaseCacheService, service_manager.get(ServiceType.CACHE_SERVICE))
 
 
+def get_async_cache_service() -> "AsyncBaseCacheService":
+    """
+    Get the async cache service instance.
+
+    :return: The async cache service instance
+    """
+    return cast(
+        AsyncBaseCacheService, service_manager.get(ServiceType.ASYNC_CACHE_SERVICE)
+    )
+
+
 def get_kafka_producer_service() -> "KafkaProducerService":
     """
     Get the Kafka producer service instance.
@@ -78,3 +107,12 @@ def get_masdk_service() -> "MASDKService":
     :return: The MASDK service instance
     """
     return cast(MASDKService, service_manager.get(ServiceType.MASDK_SERVICE))
+
+
+def get_http_client_service() -> "HttpClientService":
+    """
+    Get the shared HTTP client service instance.
+
+    :return: The HTTP client service instance
+    """
+    return cast(HttpClientService, service_manager.get(ServiceType.HTTP_CLIENT_SERVICE))
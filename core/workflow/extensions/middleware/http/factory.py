@@ -0,0 +1,41 @@
+import os
+
+from loguru import logger
+from workflow.extensions.middleware.factory import ServiceFactory
+from workflow.extensions.middleware.http.manager import HttpClientService
+
+
+class HttpClientServiceFactory(ServiceFactory):
+    """
+    Factory class for creating the shared HTTP client service.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the HTTP client service factory.
+
+        Sets up the factory to create HttpClientService instances.
+        """
+        super().__init__(HttpClientService)
+
+    def create(self) -> HttpClientService:
+        """
+        Create the shared HTTP client service.
+
+        Creates an HttpClientService with configuration from environment variables:
+        - HTTP_CLIENT_LIMIT_PER_HOST: Maximum connections to one host, 0 is unlimited (default: 100)
+        - HTTP_CLIENT_KEEPALIVE_TIMEOUT_SEC: Idle connection keep-alive in seconds (default: 30)
+        - HTTP_CLIENT_DNS_CACHE_TTL_SEC: Resolved address cache TTL in seconds (default: 300)
+        - HTTP_CLIENT_CONNECT_TIMEOUT_SEC: Default connect timeout in seconds (default: 30)
+
+        :return: A configured HttpClientService instance.
+        """
+        logger.debug("Creating HTTP client")
+        return HttpClientService(
+            limit_per_host=int(os.getenv("HTTP_CLIENT_LIMIT_PER_HOST") or "100"),
+            keepalive_timeout=float(
+                os.getenv("HTTP_CLIENT_KEEPALIVE_TIMEOUT_SEC") or "30"
+            ),
+            dns_cache_ttl=int(os.getenv("HTTP_CLIENT_DNS_CACHE_TTL_SEC") or "300"),
+            connect_timeout=float(os.getenv("HTTP_CLIENT_CONNECT_TIMEOUT_SEC") or "30"),
+        )
@@ -0,0 +1,290 @@
+import asyncio
+import os
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Set
+from urllib.parse import urlsplit
+
+from aiohttp import (
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionQueuedEndParams,
+    TraceConnectionQueuedStartParams,
+)
+from loguru import logger
+from workflow.extensions.middleware.base import Service
+from workflow.extensions.middleware.utils import ServiceType
+from workflow.extensions.otlp.metric import metric
+
+
+@dataclass
+class HostPoolStats:
+    """
+    Counters of the connection pool of one host.
+    """
+
+    requests: int = 0
+    in_flight: int = 0
+    pool_waits: int = 0
+    pool_wait_ms: float = 0.0
+
+
+class _HostPool:
+    """
+    Connection pool and session of one host on one event loop.
+    """
+
+    def __init__(self, host: str, session_kwargs: Dict[str, Any]) -> None:
+        """
+        Initialize the pool, its session records the time spent waiting for
+        a free connection.
+
+        :param host: Host of the pool
+        :param session_kwargs: Keyword arguments of the session
+        """
+        self.host = host
+        self.stats = HostPoolStats()
+        trace_config = TraceConfig()
+        trace_config.on_connection_queued_start.append(self._on_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_queued_end)
+        self.session = ClientSession(trace_configs=[trace_config], **session_kwargs)
+
+    async def _on_queued_start(
+        self,
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceConnectionQueuedStartParams,
+    ) -> None:
+        ctx.queued_at = time.perf_counter()
+
+    async def _on_queued_end(
+        self,
+        session: ClientSession,
+        ctx: SimpleNamespace,
+        params: TraceConnectionQueuedEndParams,
+    ) -> None:
+        wait_ms = (time.perf_counter() - ctx.queued_at) * 1000
+        self.stats.pool_waits += 1
+        self.stats.pool_wait_ms += wait_ms
+        _report_pool_wait(self.host, wait_ms)
+
+
+class HttpClientService(Service):
+    """
+    Shared HTTP client of the workflow nodes.
+
+    Every host gets its own keep-alive connection pool, so a slow or
+    saturated dependency can not starve the connections of the others, and
+    resolved addresses are cached by the connector. aiohttp sessions are
+    bound to the event loop they are created on, pools are therefore kept
+    per event loop and created on first use. The time requests wait for a
+    free connection and the number of requests in flight are reported per
+    host through the OTLP meter.
+    """
+
+    name = ServiceType.HTTP_CLIENT_SERVICE
+
+    def __init__(
+        self,
+        limit_per_host: int,
+        keepalive_timeout: float,
+        dns_cache_ttl: int,
+        connect_timeout: float,
+    ) -> None:
+        """
+        Initialize the HTTP client service.
+
+        :param limit_per_host: Maximum number of connections to one host, 0 is unlimited
+        :param keepalive_timeout: Seconds an idle connection is kept open
+        :param dns_cache_ttl: Seconds a resolved address is cached
+        :param connect_timeout: Default timeout of establishing a connection in seconds
+        """
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.connect_timeout = connect_timeout
+        self._pools: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[str, _HostPool]
+        ] = weakref.WeakKeyDictionary()
+        # Closing of the pools of a loop torn down from within that loop
+        self._closing: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        return f"{parts.scheme}://{parts.hostname}:{port}"
+
+    def _get_pool(self, url: str) -> _HostPool:
+        """
+        Get the connection pool of the host of a URL on the running event loop.
+
+        :param url: Request URL
+        :return: Connection pool of the host
+        """
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        host = self._host_of(url)
+        pool = pools.get(host)
+        if pool is None or pool.session.closed:
+            pool = _HostPool(
+                host,
+                {
+                    "connector": TCPConnector(
+                        limit=self.limit_per_host,
+                        ttl_dns_cache=self.dns_cache_ttl,
+                        keepalive_timeout=self.keepalive_timeout,
+                    ),
+                    "timeout": ClientTimeout(
+                        total=5 * 60, sock_connect=self.connect_timeout
+                    ),
+                },
+            )
+            pools[host] = pool
+        return pool
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> AsyncIterator[ClientResponse]:
+        """
+        Send a request on the connection pool of the host of the URL.
+
+        The request counts as in flight until the context exits, which also
+        releases its connection back to the pool.
+
+        :param method: HTTP method
+        :param url: Request URL
+        :param kwargs: Keyword arguments of ``ClientSession.request``, such as
+            json, headers, params and a per request timeout
+        :return: Async context manager yielding the response
+        """
+        pool = self._get_pool(url)
+        pool.stats.requests += 1
+        pool.stats.in_flight += 1
+        _report_inflight_requests(pool.host, 1)
+        try:
+            async with pool.session.request(method, url, **kwargs) as response:
+                yield response
+        finally:
+            pool.stats.in_flight -= 1
+            _report_inflight_requests(pool.host, -1)
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        """
+        Send a GET request, see ``request``.
+
+        :param url: Request URL
+        :param kwargs: Keyword arguments of ``ClientSession.request``
+        :return: Async context manager yielding the response
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        """
+        Send a POST request, see ``request``.
+
+        :param url: Request URL
+        :param kwargs: Keyword arguments of ``ClientSession.request``
+        :return: Async context manager yielding the response
+        """
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, HostPoolStats]:
+        """
+        Get the counters of the connection pools on the running event loop.
+
+        :return: Counters keyed by host
+        """
+        pools = self._pools.get(asyncio.get_running_loop(), {})
+        return {host: pool.stats for host, pool in pools.items()}
+
+    async def close(self) -> None:
+        """
+        Close the connection pools of the running event loop.
+        """
+        pools = self._pools.pop(asyncio.get_running_loop(), {})
+        await _close_sessions([pool.session for pool in pools.values()])
+
+    def teardown(self) -> None:
+        """
+        Close the sessions and connectors of the connection pools, each on the
+        event loop it was created on.
+        """
+        logger.debug("http client teardown")
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        for loop, pools in list(self._pools.items()):
+            sessions = [pool.session for pool in pools.values()]
+            if loop.is_closed() or not sessions:
+                continue
+            if loop is current_loop:
+                task = loop.create_task(_close_sessions(sessions))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+            elif loop.is_running():
+                try:
+                    asyncio.run_coroutine_threadsafe(
+                        _close_sessions(sessions), loop
+                    ).result(timeout=5)
+                except Exception as err:
+                    logger.warning(f"http client pools not closed: {err}")
+            else:
+                loop.run_until_complete(_close_sessions(sessions))
+        self._pools.clear()
+
+
+async def _close_sessions(sessions: List[ClientSession]) -> None:
+    """
+    Close sessions and the connectors they own.
+
+    :param sessions: Sessions created on the running event loop
+    """
+    await asyncio.gather(
+        *(session.close() for session in sessions), return_exceptions=True
+    )
+
+
+def _report_pool_wait(host: str, wait_ms: float) -> None:
+    """
+    Report the time a request waited for a free connection through the OTLP meter.
+
+    :param host: Host of the connection pool
+    :param wait_ms: Wait time in milliseconds
+    """
+    if metric.http_client_pool_wait_histogram is None:
+        return
+    metric.http_client_pool_wait_histogram.record(
+        wait_ms,
+        {
+            "server_name": os.getenv("SERVICE_NAME", "default"),
+            "pid": os.getpid(),
+            "host": host,
+        },
+    )
+
+
+def _report_inflight_requests(host: str, delta: int) -> None:
+    """
+    Report a change of the requests in flight through the OTLP meter.
+
+    :param host: Host of the connection pool
+    :param delta: 1 when a request starts, -1 when its response is released
+    """
+    if metric.http_client_inflight_counter is None:
+        return
+    metric.http_client_inflight_counter.add(
+        delta,
+        {
+            "server_name": os.getenv("SERVICE_NAME", "default"),
+            "pid": os.getpid(),
+            "host": host,
+        },
+    )
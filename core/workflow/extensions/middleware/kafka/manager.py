@@ -1,5 +1,5 @@
 import os
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from confluent_kafka import Producer  # type: ignore
 from loguru import logger
@@ -52,6 +52,41 @@ class KafkaProducerService(Service):
             logger.error(f"Kafka message send failed: {e}")
             raise e
 
+    def send_batch(
+        self,
+        topic: str,
+        values: List[str],
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Send messages to the specified Kafka topic and wait for their delivery once.
+
+        :param topic: Target Kafka topic name
+        :param values: Message contents (serialized JSON strings)
+        :param timeout: Flush timeout in seconds, None for KAFKA_TIMEOUT (default: 10)
+        :raises Exception: If message sending fails
+        """
+        if timeout is None:
+            timeout = int(os.getenv("KAFKA_TIMEOUT", "10"))
+        try:
+            for value in values:
+                try:
+                    self.producer.produce(
+                        topic=topic, value=value, callback=self._delivery_report
+                    )
+                except BufferError:
+                    # Local queue is full, serve delivery reports and retry once
+                    self.producer.poll(1)
+                    self.producer.produce(
+                        topic=topic, value=value, callback=self._delivery_report
+                    )
+            remaining = self.producer.flush(timeout)
+            if remaining:
+                logger.error(f"Kafka batch not fully delivered: {remaining} pending")
+        except Exception as e:
+            logger.error(f"Kafka message send failed: {e}")
+            raise e
+
     def _delivery_report(self, err: Optional[Any], msg: Any) -> None:
         """
         Default callback function for Kafka message delivery confirmation.
@@ -19,12 +19,15 @@ class ServiceType(str, Enum):
     """
 
     CACHE_SERVICE = "cache_service"
+    ASYNC_CACHE_SERVICE = "async_cache_service"
     DATABASE_SERVICE = "database_service"
+    ASYNC_DATABASE_SERVICE = "async_database_service"
     LOG_SERVICE = "log_service"
     KAFKA_PRODUCER_SERVICE = "kafka_producer_service"
     OSS_SERVICE = "oss_service"
     MASDK_SERVICE = "masdk_service"
     OTLP_SERVICE = "otlp_service"
+    HTTP_CLIENT_SERVICE = "http_client_service"
 
 
 def get_factories_and_deps() -> List[Tuple[Any, List[ServiceType]]]:
@@ -39,6 +42,7 @@ def get_factories_and_deps() -> List[Tuple[Any, List[ServiceType]]]:
     """
     from workflow.extensions.middleware.cache import factory as cache_factory
     from workflow.extensions.middleware.database import factory as database_factory
+    from workflow.extensions.middleware.http import factory as http_client_factory
     from workflow.extensions.middleware.kafka import factory as kafka_producer_factory
     from workflow.extensions.middleware.log import factory as log_factory
     from workflow.extensions.middleware.oss import factory as oss_factory
@@ -49,10 +53,18 @@ def get_factories_and_deps() -> List[Tuple[Any, List[ServiceType]]]:
             database_factory.DatabaseServiceFactory(),
             [ServiceType.DATABASE_SERVICE],
         ),
+        (
+            database_factory.AsyncDatabaseServiceFactory(),
+            [ServiceType.ASYNC_DATABASE_SERVICE],
+        ),
         (
             cache_factory.CacheServiceFactory(),
             [ServiceType.CACHE_SERVICE],
         ),
+        (
+            cache_factory.AsyncCacheServiceFactory(),
+            [ServiceType.ASYNC_CACHE_SERVICE],
+        ),
         (
             kafka_producer_factory.KafkaProducerServiceFactory(),
             [ServiceType.KAFKA_PRODUCER_SERVICE],
@@ -63,4 +75,8 @@ def get_factories_and_deps() -> List[Tuple[Any, List[ServiceType]]]:
         ),
         (log_factory.LogServiceFactory(), [ServiceType.LOG_SERVICE]),
         (otlp_factory.OTLPServiceFactory(), [ServiceType.OTLP_SERVICE]),
+        (
+            http_client_factory.HttpClientServiceFactory(),
+            [ServiceType.HTTP_CLIENT_SERVICE],
+        ),
     ]
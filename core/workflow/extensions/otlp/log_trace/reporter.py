@@ -0,0 +1,192 @@
+"""
+Background reporting of workflow logs.
+
+Reported logs are put on a bounded queue and a single worker thread drains it
+in batches. Large values of a batch are uploaded to object storage
+concurrently, each distinct value once, and the batch is sent to Kafka with a
+single delivery wait, so requests never wait on object storage or Kafka. A
+value that fails to upload is reported truncated instead of its reference.
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+from workflow.extensions.middleware.getters import get_kafka_producer_service
+from workflow.extensions.otlp.log_trace.workflow_log import (
+    WorkflowLog,
+    dump_log_json,
+    find_large_values,
+    replace_large_values,
+    upload_large_value,
+)
+
+# Number of storage references kept to skip uploading repeated values
+_LINK_CACHE_SIZE = 1024
+# Number of characters kept of a value that failed to upload
+_TRUNCATED_VALUE_SIZE = 1024
+
+
+class WorkflowLogReporter:
+    """
+    Bounded queue of workflow logs drained by a background worker.
+    """
+
+    def __init__(
+        self,
+        queue_size: int,
+        batch_size: int,
+        linger_ms: int,
+        offload_workers: int,
+    ) -> None:
+        """
+        :param queue_size: Maximum number of logs waiting to be reported
+        :param batch_size: Maximum number of logs sent in one batch
+        :param linger_ms: Time the worker waits to fill a batch, in milliseconds
+        :param offload_workers: Number of concurrent large value uploads
+        """
+        self.batch_size = batch_size
+        self.linger_ms = linger_ms
+        self._queue: queue.Queue[WorkflowLog] = queue.Queue(maxsize=queue_size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=offload_workers, thread_name_prefix="workflow-log-offload"
+        )
+        # Storage references of recently uploaded values, key: content hash
+        self._value_links: OrderedDict[str, str] = OrderedDict()
+        self._worker = threading.Thread(
+            target=self._run, name="workflow-log-reporter", daemon=True
+        )
+        self._worker.start()
+
+    def report(self, workflow_log: WorkflowLog) -> bool:
+        """
+        Queue a workflow log for reporting without blocking.
+
+        :param workflow_log: Finished workflow log
+        :return: True if queued, False if the queue is full and the log was dropped
+        """
+        try:
+            self._queue.put_nowait(workflow_log)
+            return True
+        except queue.Full:
+            logger.error(f"Workflow log queue full, dropped log: {workflow_log.sid}")
+            return False
+
+    def _next_batch(self) -> List[WorkflowLog]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.linger_ms / 1000
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                self._report_batch(batch)
+            except Exception as err:
+                logger.error("Failed to produce message: {}".format(err))
+
+    def _upload(self, large_values: Dict[str, str]) -> Tuple[Dict[str, str], Set[str]]:
+        """
+        Upload the values missing from the reference cache concurrently.
+
+        :param large_values: Large values of a batch, key: content hash
+        :return: Storage references and the hashes of values that failed to upload
+        """
+        value_links: Dict[str, str] = {}
+        failed: Set[str] = set()
+        missing = []
+        for key in large_values:
+            link = self._value_links.get(key)
+            if link is None:
+                missing.append(key)
+            else:
+                self._value_links.move_to_end(key)
+                value_links[key] = link
+        futures = {
+            key: self._executor.submit(upload_large_value, large_values[key])
+            for key in missing
+        }
+        for key, future in futures.items():
+            try:
+                link = future.result()
+            except Exception as err:
+                logger.error(f"Failed to upload workflow log value: {err}")
+                failed.add(key)
+                continue
+            value_links[key] = link
+            self._value_links[key] = link
+            if len(self._value_links) > _LINK_CACHE_SIZE:
+                self._value_links.popitem(last=False)
+        return value_links, failed
+
+    def _report_batch(self, batch: List[WorkflowLog]) -> None:
+        log_data = [workflow_log.dict() for workflow_log in batch]
+        log_values: List[Dict[str, str]] = []
+        large_values: Dict[str, str] = {}
+        for data in log_data:
+            values: Dict[str, str] = {}
+            find_large_values(data, values)
+            log_values.append(values)
+            large_values.update(values)
+        value_links, failed = self._upload(large_values)
+        for key in failed:
+            value_links[key] = _truncate_value(large_values[key])
+
+        messages = []
+        for workflow_log, data, values in zip(batch, log_data, log_values):
+            if failed.intersection(values):
+                logger.error(
+                    f"Workflow log reported with truncated values: {workflow_log.sid}"
+                )
+            messages.append(dump_log_json(replace_large_values(data, value_links)))
+        # Get Kafka topic from environment variables
+        topic = os.getenv("KAFKA_TOPIC") or ""
+        get_kafka_producer_service().send_batch(topic, messages)
+
+
+def _truncate_value(value: str) -> str:
+    """
+    Keep the start of a large value whose upload failed.
+
+    :param value: Large string value
+    :return: Start of the value marked as truncated
+    """
+    return f"{value[:_TRUNCATED_VALUE_SIZE]}...[truncated, {len(value)} chars]"
+
+
+_reporter: Optional[WorkflowLogReporter] = None
+_reporter_lock = threading.Lock()
+
+
+def get_workflow_log_reporter() -> WorkflowLogReporter:
+    """
+    Get the process-wide workflow log reporter, started on first use.
+
+    :return: Workflow log reporter
+    """
+    global _reporter
+    if _reporter is None:
+        with _reporter_lock:
+            if _reporter is None:
+                _reporter = WorkflowLogReporter(
+                    queue_size=int(os.getenv("WORKFLOW_LOG_QUEUE_SIZE") or "2000"),
+                    batch_size=int(os.getenv("WORKFLOW_LOG_BATCH_SIZE") or "50"),
+                    linger_ms=int(os.getenv("WORKFLOW_LOG_BATCH_LINGER_MS") or "200"),
+                    offload_workers=int(
+                        os.getenv("WORKFLOW_LOG_OFFLOAD_WORKERS") or "8"
+                    ),
+                )
+    return _reporter
@@ -5,8 +5,10 @@ This module provides data structures and methods for logging entire workflow
 executions, including status tracking, performance metrics, and data management.
 """
 
+import hashlib
 import json
 import os
+import sys
 import time
 import uuid
 from typing import Any, Dict, List
@@ -17,6 +19,9 @@ from workflow.extensions.middleware.getters import get_oss_service
 from workflow.extensions.otlp.log_trace.base import Usage
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 
+# Strings above this size in bytes are moved to object storage
+LARGE_VALUE_LIMIT = 5 * 1024
+
 
 class Status(BaseModel):
     """
@@ -201,51 +206,101 @@ class WorkflowLog(BaseModel):
 
         :return: JSON string representation of the workflow log
         """
-        import sys
-
-        def is_large_string(s: str, limit: int = 5 * 1024) -> bool:
-            """
-            Check if a string exceeds the size limit for direct JSON inclusion.
-
-            :param s: String to check
-            :param limit: Size limit in bytes (default: 5KB)
-            :return: True if string exceeds limit, False otherwise
-            """
-            return isinstance(s, str) and sys.getsizeof(s.encode("utf-8")) > limit
-
-        def process_data(data: dict) -> Any:
-            """
-            Recursively process data structure to handle large strings.
-
-            :param data: Data structure to process
-            :return: Processed data with large strings uploaded to OSS
-            """
-            if isinstance(data, dict):
-                return {k: process_data(v) for k, v in data.items()}
-            elif isinstance(data, list):
-                return [process_data(item) for item in data]
-            elif isinstance(data, str):
-                if is_large_string(data):
-                    return get_oss_service().upload_file(
-                        f"{uuid.uuid4().hex}.txt",
-                        data.encode("utf-8"),
-                        bucket_name=os.getenv("OSS_BUCKET_NAME", "test"),
-                    )
-                else:
-                    return data
-            else:
-                return data
-
-        result = process_data(self.dict())
-
-        def json_fallback(obj: Any) -> Any:
-            """
-            Fallback function for JSON serialization of unsupported types.
-
-            :param obj: Object to serialize
-            :return: JSON-serializable representation of the object
-            """
-            if isinstance(obj, set):
-                return list(obj)
-
-        return json.dumps(result, ensure_ascii=False, default=json_fallback)
+        data = self.dict()
+        large_values: Dict[str, str] = {}
+        find_large_values(data, large_values)
+        value_links = {
+            key: upload_large_value(value) for key, value in large_values.items()
+        }
+        return dump_log_json(replace_large_values(data, value_links))
+
+
+def _is_large_string(s: Any, limit: int = LARGE_VALUE_LIMIT) -> bool:
+    """
+    Check if a string exceeds the size limit for direct JSON inclusion.
+
+    :param s: Value to check
+    :param limit: Size limit in bytes (default: 5KB)
+    :return: True if string exceeds limit, False otherwise
+    """
+    return isinstance(s, str) and sys.getsizeof(s.encode("utf-8")) > limit
+
+
+def large_value_key(value: str) -> str:
+    """
+    Content hash identifying a large value.
+
+    :param value: Large string value
+    :return: Hex digest of the value
+    """
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def find_large_values(data: Any, found: Dict[str, str]) -> None:
+    """
+    Recursively collect the large strings of a data structure.
+
+    :param data: Data structure to walk
+    :param found: Large values found, key: content hash, filled in place
+    """
+    if isinstance(data, dict):
+        for v in data.values():
+            find_large_values(v, found)
+    elif isinstance(data, list):
+        for item in data:
+            find_large_values(item, found)
+    elif _is_large_string(data):
+        found.setdefault(large_value_key(data), data)
+
+
+def replace_large_values(data: Any, value_links: Dict[str, str]) -> Any:
+    """
+    Recursively replace large strings with their storage references.
+
+    :param data: Data structure to process
+    :param value_links: Storage references, key: content hash
+    :return: Processed data with large strings replaced
+    """
+    if isinstance(data, dict):
+        return {k: replace_large_values(v, value_links) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [replace_large_values(item, value_links) for item in data]
+    elif _is_large_string(data):
+        return value_links[large_value_key(data)]
+    else:
+        return data
+
+
+def upload_large_value(value: str) -> str:
+    """
+    Upload a large value to object storage.
+
+    :param value: Large string value
+    :return: Storage reference of the value
+    """
+    return get_oss_service().upload_file(
+        f"{uuid.uuid4().hex}.txt",
+        value.encode("utf-8"),
+        bucket_name=os.getenv("OSS_BUCKET_NAME", "test"),
+    )
+
+
+def dump_log_json(data: Any) -> str:
+    """
+    Serialize processed workflow log data to JSON string.
+
+    :param data: Workflow log data with large values replaced
+    :return: JSON string
+    """
+
+    def json_fallback(obj: Any) -> Any:
+        """
+        Fallback function for JSON serialization of unsupported types.
+
+        :param obj: Object to serialize
+        :return: JSON-serializable representation of the object
+        """
+        if isinstance(obj, set):
+            return list(obj)
+
+    return json.dumps(data, ensure_ascii=False, default=json_fallback)
@@ -14,6 +14,20 @@ RELY_SERVER_REQUEST_TIME = "rely_server_request_time"
 SERVER_CONC = "server_conc"
 # Outbound traffic concurrency
 RELY_SERVER_CONC = "rely_server_conc"
+# In-process workflow engine cache events
+ENGINE_CACHE_TOTAL = "engine_cache_total"
+# Local code executor queue wait and execution time
+CODE_EXECUTOR_TIME_MILLISECONDS = "code_executor_time_milliseconds"
+# Outbound HTTP client connection pool wait time and requests in flight
+HTTP_CLIENT_POOL_WAIT_MILLISECONDS = "http_client_pool_wait_milliseconds"
+HTTP_CLIENT_INFLIGHT_REQUESTS = "http_client_inflight_requests"
+# Plugin tool schema cache lookups
+TOOL_SCHEMA_CACHE_TOTAL = "tool_schema_cache_total"
+# Async database service wait for a session thread and sessions in use
+DATABASE_POOL_WAIT_MILLISECONDS = "database_pool_wait_milliseconds"
+DATABASE_ACTIVE_SESSIONS = "database_active_sessions"
+# LLM node response cache lookups
+LLM_RESPONSE_CACHE_TOTAL = "llm_response_cache_total"
 
 
 SERVER_REQUEST_DESC = "Service inbound error count"
@@ -22,3 +36,11 @@ SERVER_REQUEST_TIME_DESC = "Service inbound performance"
 RELY_SERVER_REQUEST_TIME_DESC = "Service outbound performance"
 SERVER_CONC_DESC = "Service inbound concurrency"
 RELY_SERVER_CONC_DESC = "Service outbound concurrency"
+ENGINE_CACHE_DESC = "In-process workflow engine cache hit, miss and eviction count"
+CODE_EXECUTOR_TIME_DESC = "Local code executor queue wait and execution time"
+HTTP_CLIENT_POOL_WAIT_DESC = "Outbound HTTP client wait for a pooled connection"
+HTTP_CLIENT_INFLIGHT_DESC = "Outbound HTTP client requests in flight"
+TOOL_SCHEMA_CACHE_DESC = "Plugin tool schema cache hit and miss count per layer"
+DATABASE_POOL_WAIT_DESC = "Async database service wait for a pooled session"
+DATABASE_ACTIVE_SESSIONS_DESC = "Async database service sessions in use"
+LLM_RESPONSE_CACHE_DESC = "LLM node response cache hit and miss count per layer"
@@ -7,10 +7,26 @@ from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
 from workflow.extensions.otlp.metric.consts import (
+    CODE_EXECUTOR_TIME_DESC,
+    CODE_EXECUTOR_TIME_MILLISECONDS,
+    DATABASE_ACTIVE_SESSIONS,
+    DATABASE_ACTIVE_SESSIONS_DESC,
+    DATABASE_POOL_WAIT_DESC,
+    DATABASE_POOL_WAIT_MILLISECONDS,
+    ENGINE_CACHE_DESC,
+    ENGINE_CACHE_TOTAL,
+    HTTP_CLIENT_INFLIGHT_DESC,
+    HTTP_CLIENT_INFLIGHT_REQUESTS,
+    HTTP_CLIENT_POOL_WAIT_DESC,
+    HTTP_CLIENT_POOL_WAIT_MILLISECONDS,
+    LLM_RESPONSE_CACHE_DESC,
+    LLM_RESPONSE_CACHE_TOTAL,
     SERVER_REQUEST_DESC,
     SERVER_REQUEST_TIME_DESC,
     SERVER_REQUEST_TIME_MICROSECONDS,
     SERVER_REQUEST_TOTAL,
+    TOOL_SCHEMA_CACHE_DESC,
+    TOOL_SCHEMA_CACHE_TOTAL,
 )
 
 # SDK metric reporting interval, recommended less than 30000ms, default 1000ms
@@ -25,6 +41,14 @@ from workflow.extensions.otlp.metric.consts import (
 # Global metric objects
 counter = None
 histogram = None
+engine_cache_counter = None
+code_executor_histogram = None
+http_client_pool_wait_histogram = None
+http_client_inflight_counter = None
+tool_schema_cache_counter = None
+database_pool_wait_histogram = None
+database_active_sessions_counter = None
+llm_response_cache_counter = None
 meter = None
 
 
@@ -48,7 +72,11 @@ def init_metric(
     :param export_timeout_millis: Metrics reporting server timeout in milliseconds, default 5000ms
     """
 
-    global counter, histogram, meter
+    global counter, histogram, engine_cache_counter, code_executor_histogram, meter
+    global http_client_pool_wait_histogram, http_client_inflight_counter
+    global tool_schema_cache_counter
+    global database_pool_wait_histogram, database_active_sessions_counter
+    global llm_response_cache_counter
 
     if os.getenv("OTLP_ENABLE", "1") == "1":
         assert endpoint is not None, "endpoint is None"
@@ -90,4 +118,34 @@ def init_metric(
     histogram = meter.create_histogram(
         SERVER_REQUEST_TIME_MICROSECONDS, description=SERVER_REQUEST_TIME_DESC
     )
+    # Create counter metric for in-process engine cache events
+    engine_cache_counter = meter.create_counter(
+        ENGINE_CACHE_TOTAL, description=ENGINE_CACHE_DESC
+    )
+    # Create histogram metric for local code executor wait and execution time
+    code_executor_histogram = meter.create_histogram(
+        CODE_EXECUTOR_TIME_MILLISECONDS, description=CODE_EXECUTOR_TIME_DESC
+    )
+    # Create metrics of the outbound HTTP client connection pools
+    http_client_pool_wait_histogram = meter.create_histogram(
+        HTTP_CLIENT_POOL_WAIT_MILLISECONDS, description=HTTP_CLIENT_POOL_WAIT_DESC
+    )
+    http_client_inflight_counter = meter.create_up_down_counter(
+        HTTP_CLIENT_INFLIGHT_REQUESTS, description=HTTP_CLIENT_INFLIGHT_DESC
+    )
+    # Create counter metric for plugin tool schema cache lookups
+    tool_schema_cache_counter = meter.create_counter(
+        TOOL_SCHEMA_CACHE_TOTAL, description=TOOL_SCHEMA_CACHE_DESC
+    )
+    # Create metrics of the async database service session pool
+    database_pool_wait_histogram = meter.create_histogram(
+        DATABASE_POOL_WAIT_MILLISECONDS, description=DATABASE_POOL_WAIT_DESC
+    )
+    database_active_sessions_counter = meter.create_up_down_counter(
+        DATABASE_ACTIVE_SESSIONS, description=DATABASE_ACTIVE_SESSIONS_DESC
+    )
+    # Create counter metric for LLM node response cache lookups
+    llm_response_cache_counter = meter.create_counter(
+        LLM_RESPONSE_CACHE_TOTAL, description=LLM_RESPONSE_CACHE_DESC
+    )
     logger.debug("metric init success")
@@ -0,0 +1,197 @@
+"""
+Recording policy of span events.
+
+Span events are keyed by a kind, the first attribute key of ``add_info_events``
+or the text before the first colon of ``add_info_event``. The policy decides
+per kind how often an event is recorded, how large a single event may be and
+how many bytes of events a span may hold, so hot paths such as per-token LLM
+frames stay cheap in production while debugging keeps full detail.
+
+Profiles are selected with ``TRACE_POLICY_PROFILE``, ``debug`` records every
+event as before. Single settings of the profile can be overridden with
+``TRACE_SAMPLE_RATES`` (``kind=rate`` pairs, comma-separated),
+``TRACE_SPAN_BYTE_BUDGET``, ``TRACE_EVENT_MAX_BYTES`` and
+``TRACE_LOG_EVENTS``.
+"""
+
+import os
+import random
+import threading
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+
+# Suffix appended to truncated attribute values
+TRUNCATED_MARK = "...[truncated]"
+
+
+class TracePolicy(BaseModel):
+    """
+    Recording rules of span events.
+    """
+
+    # Fraction of events recorded per event kind
+    sample_rates: Dict[str, float] = Field(default_factory=dict)
+    # Fraction of events recorded for kinds missing in sample_rates
+    default_sample_rate: float = 1.0
+    # Bytes of events a span may hold, 0 for no limit
+    span_byte_budget: int = 0
+    # Bytes of a single event before its values are truncated, 0 uploads
+    # oversized events to OSS instead
+    event_max_bytes: int = 0
+    # Whether events are also written to the service log
+    log_events: bool = True
+
+    def sampled(self, kind: str) -> bool:
+        """
+        Decide whether an event of a kind is recorded.
+
+        :param kind: Event kind
+        :return: True if the event is recorded
+        """
+        rate = self.sample_rates.get(kind, self.default_sample_rate)
+        if rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        return random.random() < rate
+
+
+PROFILES: Dict[str, TracePolicy] = {
+    "debug": TracePolicy(),
+    "production": TracePolicy(
+        sample_rates={
+            # Per-token frames of LLM and streaming nodes
+            "recv": 0.01,
+            "llm_resp": 0.01,
+            "function_call_recv": 0.01,
+            "spark_llm_reasoning_content": 0.01,
+            # Full workflow DSL of every chat request
+            "spark dsl": 0.0,
+        },
+        span_byte_budget=64 * 1024,
+        event_max_bytes=4 * 1024,
+        log_events=False,
+    ),
+}
+
+
+def truncate_value(value: str, max_bytes: int) -> str:
+    """
+    Cut a string to a number of UTF-8 bytes.
+
+    :param value: String to cut
+    :param max_bytes: Maximum size in bytes
+    :return: The string, cut and marked if it was longer
+    """
+    value_bytes = value.encode("utf-8")
+    if len(value_bytes) <= max_bytes:
+        return value
+    return value_bytes[:max_bytes].decode("utf-8", errors="ignore") + TRUNCATED_MARK
+
+
+_trace_policy: Optional[TracePolicy] = None
+_trace_policy_lock = threading.Lock()
+
+
+def _parse_sample_rates(value: str) -> Dict[str, float]:
+    sample_rates: Dict[str, float] = {}
+    for item in value.split(","):
+        kind, sep, rate = item.rpartition("=")
+        if sep and kind.strip():
+            sample_rates[kind.strip()] = float(rate)
+    return sample_rates
+
+
+def load_trace_policy() -> TracePolicy:
+    """
+    Build the trace policy from the environment.
+
+    :return: Trace policy
+    """
+    profile = os.getenv("TRACE_POLICY_PROFILE") or "debug"
+    policy = PROFILES.get(profile, PROFILES["debug"]).model_copy(deep=True)
+    sample_rates = os.getenv("TRACE_SAMPLE_RATES")
+    if sample_rates:
+        policy.sample_rates.update(_parse_sample_rates(sample_rates))
+    span_byte_budget = os.getenv("TRACE_SPAN_BYTE_BUDGET")
+    if span_byte_budget:
+        policy.span_byte_budget = int(span_byte_budget)
+    event_max_bytes = os.getenv("TRACE_EVENT_MAX_BYTES")
+    if event_max_bytes:
+        policy.event_max_bytes = int(event_max_bytes)
+    log_events = os.getenv("TRACE_LOG_EVENTS")
+    if log_events:
+        policy.log_events = log_events.lower() in ("1", "true")
+    return policy
+
+
+def get_trace_policy() -> TracePolicy:
+    """
+    Get the process-wide trace policy, created on first use.
+
+    :return: Trace policy
+    """
+    global _trace_policy
+    if _trace_policy is None:
+        with _trace_policy_lock:
+            if _trace_policy is None:
+                _trace_policy = load_trace_policy()
+    return _trace_policy
+
+
+def set_trace_policy(policy: Optional[TracePolicy]) -> None:
+    """
+    Replace the process-wide trace policy, None reloads it from the environment.
+
+    :param policy: Trace policy
+    """
+    global _trace_policy
+    with _trace_policy_lock:
+        _trace_policy = policy
+
+
+class SpanByteBudget:
+    """
+    Bytes of events recorded on open spans.
+
+    Only spans started through ``Span.start`` are tracked, events of other
+    spans are never limited.
+    """
+
+    def __init__(self) -> None:
+        self._spent: Dict[int, int] = {}
+        self._exhausted: set[int] = set()
+
+    def open(self, span_id: int) -> None:
+        # Spans of a disabled tracer all share the invalid ID 0
+        if span_id:
+            self._spent[span_id] = 0
+
+    def close(self, span_id: int) -> None:
+        self._spent.pop(span_id, None)
+        self._exhausted.discard(span_id)
+
+    def charge(self, span_id: int, size: int, budget: int) -> Optional[bool]:
+        """
+        Charge the size of an event to a span.
+
+        :param span_id: ID of the span
+        :param size: Event size in bytes
+        :param budget: Byte budget of the span, 0 for no limit
+        :return: True if the event fits, False if it does not, None if it does
+            not and this is the first event dropped on the span
+        """
+        spent = self._spent.get(span_id)
+        if budget <= 0 or spent is None:
+            return True
+        if spent + size <= budget:
+            self._spent[span_id] = spent + size
+            return True
+        if span_id in self._exhausted:
+            return False
+        self._exhausted.add(span_id)
+        return None
+
+
+span_byte_budget = SpanByteBudget()
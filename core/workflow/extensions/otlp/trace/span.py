@@ -5,7 +5,7 @@ import time
 import traceback
 import uuid
 from contextlib import contextmanager
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Union
 
 import workflow.extensions.otlp.sid.sid_generator2 as sid_gen
 from loguru import logger
@@ -14,6 +14,12 @@ from opentelemetry.trace import Status, StatusCode
 from opentelemetry.util import types
 from workflow.extensions.middleware.getters import get_oss_service
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
+from workflow.extensions.otlp.trace.policy import (
+    TracePolicy,
+    get_trace_policy,
+    span_byte_budget,
+    truncate_value,
+)
 from workflow.extensions.otlp.trace.trace import SpanLevel
 
 from .trace import Trace
@@ -99,8 +105,13 @@ class Span:
         # Start the span and yield control
         with self.tracer.start_as_current_span(
             func_name, context=context, attributes=default_attr
-        ):
-            yield self
+        ) as otlp_span:
+            span_id = otlp_span.get_span_context().span_id
+            span_byte_budget.open(span_id)
+            try:
+                yield self
+            finally:
+                span_byte_budget.close(span_id)
 
     def _get_source_function_name(self) -> str:
         """
@@ -215,69 +226,143 @@ class Span:
         if node_log and attributes:
             node_log.add_info_log(f"{name}={attributes}")
 
-    def add_info_event(self, value: str, node_log: Optional[NodeLog] = None) -> None:
+    def _within_budget(
+        self, otlp_span: trace.Span, size: int, policy: TracePolicy
+    ) -> bool:
+        """
+        Charge an event to the byte budget of a span.
+
+        :param otlp_span: Span the event is recorded on
+        :param size: Event size in bytes
+        :param policy: Trace policy
+        :return: True if the event fits in the budget
+        """
+        fits = span_byte_budget.charge(
+            otlp_span.get_span_context().span_id, size, policy.span_byte_budget
+        )
+        if fits is None:
+            otlp_span.add_event(
+                SpanLevel.WARN.value,
+                attributes={"trace_budget_exhausted": policy.span_byte_budget},
+            )
+        return bool(fits)
+
+    def add_info_event(
+        self,
+        value: Union[str, Callable[[], str]],
+        node_log: Optional[NodeLog] = None,
+        kind: Optional[str] = None,
+    ) -> None:
         """
         Add an INFO level event to the current span.
 
-        If the content exceeds the size limit, it will be uploaded to OSS.
+        The event is recorded as the trace policy allows. If the content exceeds
+        the size limit, it is truncated or uploaded to OSS.
 
-        :param value: Information content to log
+        :param value: Information content to log, or a function building it,
+            called only if the event is recorded or logged
         :param node_log: Optional node log for additional logging
+        :param kind: Event kind for the trace policy, defaults to the text
+            before the first colon of value
         """
-        # Log event
-        logger.opt(depth=1).info(f"sid: {self.sid}, event: {value}")
-        # Check if content exceeds size limit
-        value_bytes = value.encode("utf-8")
-        if len(value_bytes) >= SPAN_SIZE_LIMIT:
-            try:
-                # Upload large content to OSS and store link
-                trace_link = get_oss_service().upload_file(
-                    f"{str(uuid.uuid4())}", value_bytes
-                )
-                value = f"trace_link: {trace_link}"
-            except Exception:
-                value = "Content too large, failed to upload to OSS storage"
+        policy = get_trace_policy()
+        otlp_span = self.get_otlp_span()
+        if kind is None:
+            kind = value.split(":", 1)[0] if isinstance(value, str) else "info"
+        record = otlp_span.is_recording() and policy.sampled(kind)
+        if not (record or policy.log_events or node_log):
+            return
+        if callable(value):
+            value = value()
 
-        # Add INFO event to span
-        self.get_otlp_span().add_event("INFO", attributes={"INFO LOG": value})
+        # Log event
+        if policy.log_events:
+            logger.opt(depth=1).info(f"sid: {self.sid}, event: {value}")
+        if record:
+            # Check if content exceeds size limit
+            value_bytes = value.encode("utf-8")
+            if policy.event_max_bytes and len(value_bytes) > policy.event_max_bytes:
+                value = truncate_value(value, policy.event_max_bytes)
+            elif len(value_bytes) >= SPAN_SIZE_LIMIT:
+                try:
+                    # Upload large content to OSS and store link
+                    trace_link = get_oss_service().upload_file(
+                        f"{str(uuid.uuid4())}", value_bytes
+                    )
+                    value = f"trace_link: {trace_link}"
+                except Exception:
+                    value = "Content too large, failed to upload to OSS storage"
+
+            # Add INFO event to span
+            if self._within_budget(otlp_span, len(value.encode("utf-8")), policy):
+                otlp_span.add_event("INFO", attributes={"INFO LOG": value})
         if node_log:
             node_log.add_info_log(f"{value}")
 
     def add_info_events(
         self,
-        attributes: Optional[types.Attributes] = None,
+        attributes: Optional[Dict[str, Any]] = None,
         timestamp: Optional[int] = None,
         node_log: Optional[NodeLog] = None,
     ) -> None:
         """
         Add multiple INFO level events to the current span.
 
-        If the content exceeds the size limit, it will be uploaded to OSS.
+        The event is recorded as the trace policy allows, its kind is the first
+        attribute key. If the content exceeds the size limit, it is truncated
+        or uploaded to OSS.
 
-        :param attributes: Event attributes dictionary
+        :param attributes: Event attributes dictionary, a value may be a function
+            building it, called only if the event is recorded or logged
         :param timestamp: Optional timestamp for the event
         :param node_log: Optional node log for additional logging
         """
+        policy = get_trace_policy()
+        otlp_span = self.get_otlp_span()
+        kind = next(iter(attributes), "") if attributes else ""
+        record = otlp_span.is_recording() and policy.sampled(kind)
+        if not (record or policy.log_events or node_log):
+            return
+        if attributes:
+            attributes = {
+                key: value() if callable(value) else value
+                for key, value in attributes.items()
+            }
+
         # Log event
-        logger.opt(depth=1).info(f"sid: {self.sid}, event: {attributes}")
-        # Check if content exceeds size limit
-        value_bytes = json.dumps(attributes, ensure_ascii=False).encode("utf-8")
-        if len(value_bytes) >= SPAN_SIZE_LIMIT:
-            try:
-                # Upload large content to OSS and store link
-                trace_link = get_oss_service().upload_file(
-                    f"{str(uuid.uuid4())}", value_bytes
-                )
-                attributes = {"trace_link": trace_link}
-            except Exception:
+        if policy.log_events:
+            logger.opt(depth=1).info(f"sid: {self.sid}, event: {attributes}")
+        if record:
+            # Check if content exceeds size limit
+            value_bytes = json.dumps(attributes, ensure_ascii=False).encode("utf-8")
+            size = len(value_bytes)
+            if policy.event_max_bytes and size > policy.event_max_bytes:
                 attributes = {
-                    "error": "Content too large, failed to upload to OSS storage"
+                    key: (
+                        truncate_value(value, policy.event_max_bytes)
+                        if isinstance(value, str)
+                        else value
+                    )
+                    for key, value in (attributes or {}).items()
                 }
-
-        # Add INFO event to span
-        self.get_otlp_span().add_event(
-            SpanLevel.INFO.value, attributes=attributes, timestamp=timestamp
-        )
+                size = min(size, policy.event_max_bytes * len(attributes))
+            elif size >= SPAN_SIZE_LIMIT:
+                try:
+                    # Upload large content to OSS and store link
+                    trace_link = get_oss_service().upload_file(
+                        f"{str(uuid.uuid4())}", value_bytes
+                    )
+                    attributes = {"trace_link": trace_link}
+                except Exception:
+                    attributes = {
+                        "error": "Content too large, failed to upload to OSS storage"
+                    }
+
+            # Add INFO event to span
+            if self._within_budget(otlp_span, size, policy):
+                otlp_span.add_event(
+                    SpanLevel.INFO.value, attributes=attributes, timestamp=timestamp
+                )
         if node_log:
             node_log.add_info_log(f"{attributes}")
 
@@ -254,7 +254,9 @@ class SparkChatAi(ChatAI):
                             event_log_node_trace.set_node_first_cost_time(
                                 llm_first_token_cost
                             )
-                    span.add_info_events({"recv": json.dumps(msg, ensure_ascii=False)})
+                    span.add_info_events(
+                        {"recv": lambda: json.dumps(msg, ensure_ascii=False)}
+                    )
                     if event_log_node_trace:
                         event_log_node_trace.add_info_log(
                             json.dumps(msg, ensure_ascii=False)
@@ -110,7 +110,7 @@ class SparkFunctionCallAi(BaseModel):
             try:
                 msg = json.loads(await ws_handle.recv())
                 span.add_info_events(
-                    {"function_call_recv": json.dumps(msg, ensure_ascii=False)}
+                    {"function_call_recv": lambda: json.dumps(msg, ensure_ascii=False)}
                 )
                 code = msg["header"]["code"]
                 if code != 0:
@@ -166,7 +166,7 @@ class SparkFunctionCallAi(BaseModel):
         :return: Tuple containing (function_name, token_usage, arguments) or (None, None, None) if not ready
         """
         span.add_info_events(
-            {"function_call_recv": json.dumps(msg, ensure_ascii=False)}
+            {"function_call_recv": lambda: json.dumps(msg, ensure_ascii=False)}
         )
         code = msg["header"]["code"]
         if code != 0:
@@ -25,6 +25,7 @@ from workflow.cache.event_registry import EventRegistry
 from workflow.consts.runtime_env import RuntimeEnv
 from workflow.exception import handlers
 from workflow.extensions.graceful_shutdown.graceful_shutdown import GracefulShutdown
+from workflow.extensions.middleware.getters import get_http_client_service
 from workflow.extensions.middleware.initialize import initialize_services
 
 
@@ -112,6 +113,8 @@ def create_app() -> FastAPI:
         This function is called as part of the graceful shutdown process
         to perform any necessary cleanup operations.
         """
+        # Close the keep-alive connections of the shared HTTP client
+        await get_http_client_service().close()
         print("🧹 Final shutdown hook executed.")
 
     # Register shutdown event handler for graceful shutdown
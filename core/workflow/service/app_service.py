@@ -8,6 +8,7 @@ from workflow.domain.models.ai_app import App
 from workflow.domain.models.app_source import AppSource
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.middleware.getters import get_async_db_service
 from workflow.extensions.otlp.trace.span import Span
 from workflow.utils.hmac_auth import HMACAuth
 
@@ -210,3 +211,20 @@ def get_info(app_id: str, session: Session, span: Span) -> App:
         set_app_by_app_id(app_id, app_info)
 
     return app_info
+
+
+async def async_get_info(app_id: str, span: Span) -> App:
+    """
+    Retrieve application information without blocking the event loop.
+
+    The cache lookup, the database query and the management platform calls
+    run in a session of the async database service.
+
+    :param app_id: The application ID to retrieve
+    :param span: Tracing span for logging and monitoring
+    :return: App object containing application information
+    :raises CustomException: If application cannot be found or created
+    """
+    return await get_async_db_service().run(
+        lambda session: get_info(app_id, session, span)
+    )
@@ -1,17 +1,30 @@
 import asyncio
 import copy
 import json
+import os
 import time
 from asyncio import Queue
+from contextlib import aclosing
 from datetime import datetime
 from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple, cast
 
 from loguru import logger
-from workflow.cache.engine import get_engine, set_engine
+from workflow.cache.engine import (
+    get_engine,
+    get_local_engine,
+    set_engine,
+    set_local_engine,
+)
 from workflow.cache.event_registry import Event, EventRegistry
+from workflow.cache.run_checkpoint import (
+    RunCheckpoint,
+    claim_run_checkpoint,
+    save_run_checkpoint,
+)
 from workflow.consts.app_audit import AppAuditPolicy
 from workflow.consts.engine.chat_status import ChatStatus
 from workflow.consts.engine.model_provider import ModelProviderEnum
+from workflow.consts.runtime_env import RuntimeEnv
 from workflow.domain.entities.chat import ChatVo
 from workflow.domain.entities.response import Streaming
 from workflow.engine.callbacks.callback_handler import (
@@ -20,13 +33,22 @@ from workflow.engine.callbacks.callback_handler import (
     StructuredConsumer,
 )
 from workflow.engine.callbacks.openai_types_sse import LLMGenerate, WorkflowStep
+from workflow.engine.callbacks.stream_coalescer import (
+    StreamCoalescePolicy,
+    StreamCoalescer,
+    get_stream_coalesce_policy,
+)
 from workflow.engine.dsl_engine import WorkflowEngine, WorkflowEngineFactory
 from workflow.engine.entities.file import File
 from workflow.engine.entities.msg_or_end_dep_info import MsgOrEndDepInfo
 from workflow.engine.entities.node_entities import NodeType
+from workflow.engine.entities.run_snapshot import HibernateHandler, RunSnapshot
 from workflow.engine.entities.variable_pool import ParamKey, VariablePool
 from workflow.engine.entities.workflow_dsl import WorkflowDSL
-from workflow.engine.nodes.entities.node_run_result import NodeRunResult
+from workflow.engine.nodes.entities.node_run_result import (
+    NodeRunResult,
+    WorkflowNodeExecutionStatus,
+)
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.log_trace.workflow_log import WorkflowLog
@@ -37,10 +59,15 @@ from workflow.infra.audit_system.audit_api.iflytek.ifly_audit_api import IFlyAud
 from workflow.infra.audit_system.base import FrameAuditResult
 from workflow.infra.audit_system.strategy.base_strategy import AuditStrategy
 from workflow.infra.audit_system.strategy.text_strategy import TextAuditStrategy
-from workflow.service import audit_service
-from workflow.service.flow_service import set_flow_node_output_mode
-from workflow.service.history_service import get_history
+from workflow.service import app_service, audit_service
+from workflow.service.flow_service import (
+    async_get_latest_published_flow_by,
+    is_flow_taken_off,
+    set_flow_node_output_mode,
+)
+from workflow.service.history_service import load_history, save_histories
 from workflow.service.ops_service import kafka_report
+from workflow.utils.snowfake import get_id
 
 
 async def event_stream(
@@ -69,6 +96,136 @@ async def event_stream(
     :param span: Distributed tracing span for monitoring and debugging
     :return: AsyncIterator yielding streaming response strings
     """
+    response_queue = _start_run(
+        app_alias_id,
+        event_id,
+        workflow_dsl,
+        workflow_dsl_update_time,
+        chat_vo,
+        is_release,
+        app_audit_policy,
+        span,
+    )
+
+    return _chat_response_stream(
+        response_queue,
+        chat_vo.flow_id,
+        app_audit_policy,
+        event_id,
+        chat_vo.stream,
+        is_release,
+        span,
+        get_stream_coalesce_policy(app_alias_id),
+    )
+
+
+async def nested_flow_frames(
+    app_alias_id: str, chat_vo: ChatVo, span: Span
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Run a published workflow in this process on behalf of a flow node.
+
+    Follows the open API chat endpoint, the engine cache, callbacks and tracing
+    are shared with the calling workflow, and response frames are yielded as
+    dictionaries instead of being serialized as server-sent events.
+
+    :param app_alias_id: Application alias ID the workflow is called with
+    :param chat_vo: Chat value object of the nested workflow call
+    :param span: Distributed tracing span of the flow node
+    :return: AsyncIterator yielding response frames
+    :raises CustomException: When the workflow is not found or not published
+    :raises Exception: When the workflow cannot be loaded or built
+    """
+    db_flow = await async_get_latest_published_flow_by(
+        chat_vo.flow_id, app_alias_id, span, chat_vo.version
+    )
+    workflow_dsl = db_flow.release_data
+    workflow_dsl_update_time = db_flow.update_at
+    release_status = db_flow.release_status
+    app_info = await app_service.async_get_info(app_alias_id, span)
+    api_key, api_secret = app_info.api_key, app_info.api_secret
+    app_audit_policy = (
+        AppAuditPolicy.DEFAULT
+        if not app_info.audit_policy
+        or app_info.audit_policy == AppAuditPolicy.DEFAULT.value
+        else AppAuditPolicy.AGENT_PLATFORM
+    )
+
+    if is_flow_taken_off(release_status):
+        raise CustomException(CodeEnum.FLOW_NOT_PUBLISH_ERROR)
+
+    if not os.getenv("RUNTIME_ENV", RuntimeEnv.Local.value) in [
+        RuntimeEnv.Dev.value,
+        RuntimeEnv.Test.value,
+    ]:
+        # Replace app_id, api_key, api_secret in protocol
+        workflow_dsl = change_dsl_triplets(
+            workflow_dsl, app_id=app_alias_id, api_key=api_key, api_secret=api_secret
+        )
+
+    # Built before the run starts, so that the caller can tell a workflow that
+    # cannot be built from a failing run
+    src_engine = await _get_or_build_workflow_engine(
+        True, chat_vo, app_alias_id, workflow_dsl, workflow_dsl_update_time, span
+    )
+
+    event = Event(
+        flow_id=chat_vo.flow_id,
+        app_id=app_alias_id,
+        event_id=str(get_id()),
+        uid=chat_vo.uid,
+        chat_id=chat_vo.chat_id,
+        is_stream=chat_vo.stream,
+    )
+    await EventRegistry().init_event(event)
+
+    response_queue = _start_run(
+        app_alias_id,
+        event.event_id,
+        workflow_dsl,
+        workflow_dsl_update_time,
+        chat_vo,
+        True,
+        app_audit_policy,
+        span,
+        src_engine=src_engine,
+    )
+    return _chat_response_frames(
+        response_queue,
+        chat_vo.flow_id,
+        app_audit_policy,
+        event.event_id,
+        chat_vo.stream,
+        True,
+        span,
+    )
+
+
+def _start_run(
+    app_alias_id: str,
+    event_id: str,
+    workflow_dsl: Dict,
+    workflow_dsl_update_time: datetime,
+    chat_vo: ChatVo,
+    is_release: bool,
+    app_audit_policy: AppAuditPolicy,
+    span: Span,
+    src_engine: Optional[WorkflowEngine] = None,
+) -> Queue:
+    """
+    Start executing a workflow in a background task.
+
+    :param app_alias_id: Application alias ID for identification
+    :param event_id: Unique event identifier for tracking
+    :param workflow_dsl: Workflow DSL definition containing node configurations
+    :param workflow_dsl_update_time: Timestamp of workflow DSL last update
+    :param chat_vo: Chat value object containing user input and configuration
+    :param is_release: Whether running in production release environment
+    :param app_audit_policy: Application audit policy for content moderation
+    :param span: Distributed tracing span for monitoring and debugging
+    :param src_engine: Built workflow engine, None to get it from the cache
+    :return: Queue receiving the response frames of the run
+    """
     response_queue: Queue = Queue()
 
     task = asyncio.create_task(
@@ -82,6 +239,7 @@ async def event_stream(
             app_audit_policy,
             response_queue,
             span,
+            src_engine=src_engine,
         )
     )
 
@@ -92,16 +250,7 @@ async def event_stream(
             logger.exception("event_stream background task failed")
 
     task.add_done_callback(_handle_task_result)
-
-    return _chat_response_stream(
-        response_queue,
-        chat_vo.flow_id,
-        app_audit_policy,
-        event_id,
-        chat_vo.stream,
-        is_release,
-        span,
-    )
+    return response_queue
 
 
 def _init_workflow_trace(
@@ -142,8 +291,9 @@ async def _get_or_build_workflow_engine(
     """
     Get or build workflow engine with caching mechanism.
 
-    This function attempts to retrieve a cached workflow engine first. If no valid
-    cached engine exists or the cache is outdated, it builds a new engine from the DSL.
+    This function attempts to retrieve a cached workflow engine first, from the
+    per-process cache and then from Redis. If no valid cached engine exists or
+    the cache is outdated, it builds a new engine from the DSL.
 
     :param is_release: Whether running in production release environment
     :param chat_vo: Chat value object containing flow configuration
@@ -157,8 +307,20 @@ async def _get_or_build_workflow_engine(
     sparkflow_engine: WorkflowEngine
     need_rebuild = True
 
+    # Built engines are shared within the process, callers copy before running
+    local_engine = get_local_engine(
+        is_release,
+        chat_vo.flow_id,
+        chat_vo.version,
+        app_alias_id,
+        workflow_dsl_update_time,
+    )
+    if local_engine:
+        span_context.add_info_event("Retrieved Workflow engine from local cache")
+        return local_engine
+
     # Attempt to retrieve engine from cache
-    sparkflow_engine_cache_obj = get_engine(
+    sparkflow_engine_cache_obj = await get_engine(
         is_release, chat_vo.flow_id, chat_vo.version, app_alias_id
     )
 
@@ -175,6 +337,15 @@ async def _get_or_build_workflow_engine(
             span_context.add_info_event(
                 f"Retrieved Workflow engine from cache, DSL update time: {workflow_dsl_update_time}, engine build time: {build_timestamp}"
             )
+            set_local_engine(
+                is_release,
+                chat_vo.flow_id,
+                chat_vo.version,
+                app_alias_id,
+                workflow_dsl_update_time,
+                sparkflow_engine,
+                len(sparkflow_engine_cache_obj),
+            )
 
     # Rebuild engine if cache miss or outdated
     if need_rebuild:
@@ -193,7 +364,7 @@ async def _get_or_build_workflow_engine(
         sparkflow_engine.engine_ctx.variable_pool.system_params.set(
             ParamKey.IsRelease, is_release
         )
-        set_engine(
+        engine_size = await set_engine(
             is_release,
             chat_vo.flow_id,
             chat_vo.version,
@@ -201,6 +372,15 @@ async def _get_or_build_workflow_engine(
             sparkflow_engine,
             span_context,
         )
+        set_local_engine(
+            is_release,
+            chat_vo.flow_id,
+            chat_vo.version,
+            app_alias_id,
+            workflow_dsl_update_time,
+            sparkflow_engine,
+            engine_size,
+        )
 
         span_context.add_info_events(
             {"rebuild_sparkflow_engine_cache_obj": f"{time.time() * 1000 - start_time}"}
@@ -259,7 +439,6 @@ async def _init_callbacks_and_consumers(
         support_stream_node_id_queue=support_stream_node_id_queue,
         structured_data=structured_data,
         stream_queue=response_queue,
-        support_stream_node_id_set=callback_consumer.support_stream_node_id_set,
     )
 
     # Start consumer tasks
@@ -354,9 +533,10 @@ async def _get_chat_history(
 
     if nodes_need_history:
         start_time = time.time() * 1000
-        history = get_history(
+        history = await load_history(
             flow_id=chat_vo.flow_id,
             uid=uid,
+            node_ids=[node.id for node in nodes_need_history],
             node_max_token=sparkflow_engine.node_max_token,
         )
         span_context.add_info_events(
@@ -455,12 +635,17 @@ async def _run(
     app_audit_policy: AppAuditPolicy,
     response_queue: Queue,
     span: Span,
+    snapshot: Optional[RunSnapshot] = None,
+    src_engine: Optional[WorkflowEngine] = None,
 ) -> None:
     """
     Process chat request and execute workflow.
 
     This is the main workflow execution function that orchestrates the entire
     process from engine initialization to result processing and cleanup.
+    A run that waits too long for user input may be checkpointed, in which
+    case its log is reported as hibernated and a ``None`` frame ends the
+    response queue.
 
     :param app_alias_id: Application alias ID for identification
     :param event_id: Unique event identifier for tracking
@@ -471,6 +656,8 @@ async def _run(
     :param response_queue: Response queue for streaming output results
     :param app_audit_policy: Application audit policy for content moderation
     :param span: Distributed tracing span for monitoring
+    :param snapshot: Run state of a checkpointed run to continue instead of starting one
+    :param src_engine: Built workflow engine, None to get it from the cache
     :return: None
     """
     func_name = "sse_chat_open" if is_release else "sse_chat_debug"
@@ -483,7 +670,8 @@ async def _run(
         # span_context.add_info_event(f"start event_stream : {time.time() - start_time}")
         span.add_info_event(f"user input: {chat_vo.json()}")
         span.add_info_event(
-            f"spark dsl: {json.dumps(workflow_dsl, ensure_ascii=False)}"
+            lambda: f"spark dsl: {json.dumps(workflow_dsl, ensure_ascii=False)}",
+            kind="spark dsl",
         )
 
         workflow_trace = _init_workflow_trace(
@@ -491,10 +679,11 @@ async def _run(
         )
         code = 0
         error_message = ""
+        hibernated = False
         try:
 
             # Get or build workflow engine
-            src_sparkflow_engine = await _get_or_build_workflow_engine(
+            src_sparkflow_engine = src_engine or await _get_or_build_workflow_engine(
                 is_release,
                 chat_vo,
                 app_alias_id,
@@ -502,7 +691,7 @@ async def _run(
                 workflow_dsl_update_time,
                 span_context,
             )
-            sparkflow_engine = copy.deepcopy(src_sparkflow_engine)
+            sparkflow_engine = src_sparkflow_engine.fork()
 
             # Initialize streaming processing components
             need_order_stream_result_q: asyncio.Queue[Any] = asyncio.Queue()
@@ -526,33 +715,70 @@ async def _run(
                 chat_vo.flow_id,
             )
 
-            # Validate file inputs (if any)
-            await _validate_file_inputs(workflow_dsl, chat_vo, span_context)
+            sparkflow_engine.engine_ctx.hibernate_handler = _build_hibernate_handler(
+                sparkflow_engine,
+                RunCheckpoint(
+                    event_id=event_id,
+                    app_alias_id=app_alias_id,
+                    workflow_dsl=workflow_dsl,
+                    workflow_dsl_update_time=workflow_dsl_update_time,
+                    chat_vo=chat_vo,
+                    is_release=is_release,
+                    app_audit_policy=app_audit_policy,
+                ),
+                span_context,
+            )
 
-            # Get chat history records
-            history = await _get_chat_history(sparkflow_engine, chat_vo, span_context)
+            if snapshot is None:
+                # Validate file inputs (if any)
+                await _validate_file_inputs(workflow_dsl, chat_vo, span_context)
 
-            # Perform input content audit
-            if app_audit_policy == AppAuditPolicy.AGENT_PLATFORM:
-                await _perform_input_audit(chat_vo, span)
+                # Get chat history records
+                history = await _get_chat_history(
+                    sparkflow_engine, chat_vo, span_context
+                )
 
-            # Execute workflow
-            await callbacks.on_sparkflow_start()
+                # Perform input content audit
+                if app_audit_policy == AppAuditPolicy.AGENT_PLATFORM:
+                    await _perform_input_audit(chat_vo, span)
 
-            result = await sparkflow_engine.async_run(
-                inputs=chat_vo.parameters,
-                callback=callbacks,
-                span=span_context,
-                history=history,
-                history_v2=chat_vo.history,
-                event_log_trace=workflow_trace,
-            )
+                # Execute workflow
+                await callbacks.on_sparkflow_start()
+
+                result = await sparkflow_engine.async_run(
+                    inputs=chat_vo.parameters,
+                    callback=callbacks,
+                    span=span_context,
+                    history=history,
+                    history_v2=chat_vo.history,
+                    event_log_trace=workflow_trace,
+                )
+            else:
+                result = await sparkflow_engine.async_resume(
+                    snapshot=snapshot,
+                    span=span_context,
+                    callback=callbacks,
+                    event_log_trace=workflow_trace,
+                )
+
+            if result.status == WorkflowNodeExecutionStatus.HIBERNATED:
+                # Chat history of the run is kept in the snapshot until it ends
+                hibernated = True
+                # The log of the resumed run reports the rest of the run
+                error_message = WorkflowNodeExecutionStatus.HIBERNATED.value
+                span_context.add_info_event(
+                    f"Workflow hibernated on node {result.node_id}"
+                )
+                await _cleanup_resources(consumer_tasks)
+                await response_queue.put(None)
+                return
 
             # Process results and upload trace information
             await _process_and_report_result(
                 result, workflow_trace, span_context, consumer_tasks
             )
 
+            await _save_run_history(sparkflow_engine, span_context)
             await callbacks.on_sparkflow_end(message=result)
             m.in_success_count()
         except CustomException as err:
@@ -576,6 +802,9 @@ async def _run(
             code = CodeEnum.OPEN_API_ERROR.code
             error_message = CodeEnum.OPEN_API_ERROR.msg
         finally:
+            # Keep the history of the nodes that completed before a failure
+            if "sparkflow_engine" in locals() and not hibernated:
+                await _save_run_history(sparkflow_engine, span_context)
             kafka_report(
                 span=span_context,
                 workflow_log=workflow_trace,
@@ -588,6 +817,120 @@ async def _run(
             )
 
 
+async def _save_run_history(sparkflow_engine: WorkflowEngine, span: Span) -> None:
+    """
+    Write the chat history recorded by the nodes of a run with a single insert.
+
+    The records are taken from the variable pool, so saving twice is a no-op.
+    A failure is recorded on the span and does not fail the run.
+
+    :param sparkflow_engine: Engine of the run
+    :param span: Distributed tracing span for monitoring
+    """
+    variable_pool = sparkflow_engine.engine_ctx.variable_pool
+    records, variable_pool.pending_history = variable_pool.pending_history, []
+    if not records:
+        return
+    try:
+        start_time = time.time() * 1000
+        await save_histories(records)
+        span.add_info_events(
+            {"save_node_history_to_database": f"{time.time() * 1000 - start_time}"}
+        )
+    except Exception as err:
+        span.record_exception(err)
+
+
+def _build_hibernate_handler(
+    sparkflow_engine: WorkflowEngine, checkpoint: RunCheckpoint, span: Span
+) -> HibernateHandler:
+    """
+    Build the handler checkpointing the run while a node waits for user input.
+
+    The checkpoint is claimed by the first resume request. A reply that arrives
+    while the checkpoint is saved is caught by claiming it back, in which case
+    the run keeps waiting in memory.
+
+    :param sparkflow_engine: Engine of the run
+    :param checkpoint: Checkpoint of the run without its run state
+    :param span: Distributed tracing span for monitoring
+    :return: Handler returning True if the run was checkpointed
+    """
+
+    async def hibernate(node_id: str) -> bool:
+        snapshot = sparkflow_engine.snapshot(node_id)
+        if snapshot is None:
+            span.add_info_event(f"Workflow cannot hibernate on node {node_id}")
+            return False
+        event = await EventRegistry().get_event(event_id=checkpoint.event_id)
+        if not await save_run_checkpoint(
+            checkpoint.model_copy(update={"snapshot": snapshot}),
+            event.timeout,
+            span,
+        ):
+            return False
+        if not await EventRegistry().wait_resume_data(
+            queue_name=event.get_node_q_name(), timeout=0
+        ):
+            return True
+        # Keep running in memory unless the resume request claimed the checkpoint
+        return await claim_run_checkpoint(checkpoint.event_id) is None
+
+    return hibernate
+
+
+async def resume_hibernated_run(event: Event, span: Span) -> bool:
+    """
+    Continue a checkpointed run of the event in this process.
+
+    Must be called after the resume data was written to the node queue. The run
+    streams to the workflow queue of the event like an interrupted run does.
+
+    :param event: Interrupted event
+    :param span: Distributed tracing span for monitoring
+    :return: True if the run was checkpointed and continues here
+    """
+    checkpoint = await claim_run_checkpoint(event.event_id)
+    if checkpoint is None or checkpoint.snapshot is None:
+        return False
+    span.add_info_event("Resume workflow from checkpoint")
+
+    response_queue: Queue = Queue()
+    forward_task = asyncio.create_task(
+        _forward_queue_messages(
+            checkpoint.app_audit_policy,
+            None,
+            response_queue,
+            event.event_id,
+            span,
+        )
+    )
+    task = asyncio.create_task(
+        _run(
+            checkpoint.app_alias_id,
+            checkpoint.event_id,
+            checkpoint.workflow_dsl,
+            checkpoint.workflow_dsl_update_time,
+            checkpoint.chat_vo,
+            checkpoint.is_release,
+            checkpoint.app_audit_policy,
+            response_queue,
+            span,
+            snapshot=checkpoint.snapshot,
+        )
+    )
+
+    def _handle_task_result(t: asyncio.Task) -> None:
+        try:
+            t.result()
+        except Exception:
+            logger.exception("resumed workflow background task failed")
+
+    task.add_done_callback(_handle_task_result)
+    forward_task.add_done_callback(_handle_task_result)
+    return True
+
+
 async def _init_stream_q(
     msg_or_end_node_deps: Dict[str, MsgOrEndDepInfo], variable_pool: VariablePool
 ) -> None:
@@ -666,7 +1009,7 @@ async def _get_response(
     app_audit_policy: AppAuditPolicy,
     audit_strategy: Optional[AuditStrategy],
     response_queue: asyncio.Queue,
-) -> LLMGenerate:
+) -> Optional[LLMGenerate]:
     """
     Get response data from appropriate queue based on audit policy and strategy.
 
@@ -676,10 +1019,10 @@ async def _get_response(
     :param app_audit_policy: Application audit policy configuration
     :param audit_strategy: Optional audit strategy for content moderation
     :param response_queue: Default response queue for non-audited responses
-    :return: LLMGenerate object containing response data
+    :return: LLMGenerate object, None once the run is hibernated
     :raises Exception: When timeout occurs or audit processing fails
     """
-    response: LLMGenerate
+    response: Optional[LLMGenerate]
     if app_audit_policy == AppAuditPolicy.AGENT_PLATFORM and audit_strategy:
         frame_audit_result: FrameAuditResult = await asyncio.wait_for(
             audit_strategy.context.output_queue.get(), timeout=120
@@ -692,6 +1035,30 @@ async def _get_response(
     return response
 
 
+async def _get_response_within(
+    app_audit_policy: AppAuditPolicy,
+    audit_strategy: Optional[AuditStrategy],
+    response_queue: asyncio.Queue,
+    timeout: float,
+) -> Optional[LLMGenerate]:
+    """
+    Get response data, giving up after a short wait.
+
+    :param app_audit_policy: Application audit policy configuration
+    :param audit_strategy: Optional audit strategy for content moderation
+    :param response_queue: Default response queue for non-audited responses
+    :param timeout: Seconds to wait
+    :return: LLMGenerate object, None if nothing arrived in time
+    """
+    try:
+        return await asyncio.wait_for(
+            _get_response(app_audit_policy, audit_strategy, response_queue),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        return None
+
+
 async def _get_resume_response(
     event: Event, audit_strategy: AuditStrategy | None
 ) -> LLMGenerate:
@@ -844,10 +1211,50 @@ async def _chat_response_stream(
     is_stream: bool,
     is_release: bool,
     span: Span,
+    coalesce_policy: Optional[StreamCoalescePolicy] = None,
 ) -> AsyncIterator[str]:
     """
     Process chat response streaming queue and generate streaming output.
 
+    :param response_queue: Queue containing workflow execution responses
+    :param flow_id: Workflow identifier for tracking
+    :param app_audit_policy: Application audit policy for content moderation
+    :param event_id: Unique event identifier for tracking
+    :param is_stream: Whether to enable streaming mode
+    :param is_release: Whether running in production release environment
+    :param span: Distributed tracing span for monitoring
+    :param coalesce_policy: Content frame merging policy, None sends every frame
+    :return: AsyncIterator yielding streaming response strings
+    """
+    async with aclosing(
+        _chat_response_frames(
+            response_queue,
+            flow_id,
+            app_audit_policy,
+            event_id,
+            is_stream,
+            is_release,
+            span,
+            coalesce_policy,
+        )
+    ) as frames:
+        async for frame in frames:
+            yield Streaming.generate_data(frame)
+
+
+async def _chat_response_frames(
+    response_queue: Queue,
+    flow_id: str,
+    app_audit_policy: AppAuditPolicy,
+    event_id: str,
+    is_stream: bool,
+    is_release: bool,
+    span: Span,
+    coalesce_policy: Optional[StreamCoalescePolicy] = None,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Process chat response streaming queue and generate response frames.
+
     This function handles the streaming response processing, including audit
     integration, response filtering, and error handling.
 
@@ -858,14 +1265,20 @@ async def _chat_response_stream(
     :param is_stream: Whether to enable streaming mode
     :param is_release: Whether running in production release environment
     :param span: Distributed tracing span for monitoring
-    :return: AsyncIterator yielding streaming response strings
+    :param coalesce_policy: Content frame merging policy, None sends every frame
+    :return: AsyncIterator yielding response frames
     """
 
     message_cache: List[str] = []
     reasoning_content_cache: List[str] = []
-    final_content = ""
-    final_reasoning_content = ""
+    final_content: List[str] = []
+    final_reasoning_content: List[str] = []
     last_workflow_step = WorkflowStep(seq=0, progress=0)
+    coalescer = (
+        StreamCoalescer(coalesce_policy, last_workflow_step, renumber=is_release)
+        if coalesce_policy and is_stream
+        else None
+    )
 
     with span.start(attributes={"flow_id": flow_id}) as span_context:
 
@@ -877,10 +1290,34 @@ async def _chat_response_stream(
         response = None
         try:
             while True:
-                response = await _get_response(
-                    app_audit_policy, audit_strategy, response_queue
+                wait_time = coalescer.timeout() if coalescer else None
+                if wait_time is None:
+                    response = await _get_response(
+                        app_audit_policy, audit_strategy, response_queue
+                    )
+                    if response is None:
+                        # Hibernated before the interrupt frame was sent
+                        raise CustomException(CodeEnum.OPEN_API_ERROR)
+                else:
+                    response = await _get_response_within(
+                        app_audit_policy, audit_strategy, response_queue, wait_time
+                    )
+                    if response is None:
+                        # Coalescing window elapsed, send what has been merged
+                        for frame in coalescer.flush():
+                            response = frame
+                            final_content.append(frame.choices[0].delta.content)
+                            final_reasoning_content.append(
+                                frame.choices[0].delta.reasoning_content
+                            )
+                            yield frame.model_dump(exclude_none=True)
+                        continue
+
+                node_id = (
+                    response.workflow_step.node.id
+                    if response.workflow_step and response.workflow_step.node
+                    else ""
                 )
-
                 response, should_return = _filter_response_frame(
                     response_frame=response,
                     is_stream=is_stream,
@@ -896,39 +1333,43 @@ async def _chat_response_stream(
                 if not response:
                     raise CustomException(CodeEnum.OPEN_API_ERROR)
 
-                # deal with event data
-                if response.event_data:
-                    yield await _del_response_resume_data(
-                        app_audit_policy, response, is_stream, event_id
-                    )
-                    # forward queue messages
-                    _ = asyncio.create_task(
-                        _forward_queue_messages(
-                            app_audit_policy,
-                            audit_strategy,
-                            response_queue,
-                            event_id,
-                            span_context,
+                frames = coalescer.push(response, node_id) if coalescer else [response]
+                for response in frames:
+                    # deal with event data
+                    if response.event_data:
+                        yield await _del_response_resume_data(
+                            app_audit_policy, response, is_stream, event_id
                         )
-                    )
-                    return
+                        # forward queue messages
+                        _ = asyncio.create_task(
+                            _forward_queue_messages(
+                                app_audit_policy,
+                                audit_strategy,
+                                response_queue,
+                                event_id,
+                                span_context,
+                            )
+                        )
+                        return
 
-                final_content += response.choices[0].delta.content
-                final_reasoning_content += response.choices[0].delta.reasoning_content
-                span_context.add_info_events(
-                    {
-                        "llm_resp": json.dumps(
-                            response.model_dump(exclude_none=True),
-                            ensure_ascii=False,
+                    final_content.append(response.choices[0].delta.content)
+                    final_reasoning_content.append(
+                        response.choices[0].delta.reasoning_content
+                    )
+                    data = response.model_dump(exclude_none=True)
+                    if not coalescer:
+                        span_context.add_info_events(
+                            {"llm_resp": lambda: json.dumps(data, ensure_ascii=False)}
                         )
-                    }
-                )
-                yield Streaming.generate_data(response.model_dump(exclude_none=True))
+                    yield data
 
-                if response.choices[0].finish_reason == ChatStatus.FINISH_REASON.value:
-                    # Exit condition met
-                    EventRegistry().on_finished(event_id=event_id)
-                    return
+                    if (
+                        response.choices[0].finish_reason
+                        == ChatStatus.FINISH_REASON.value
+                    ):
+                        # Exit condition met
+                        await EventRegistry().on_finished(event_id=event_id)
+                        return
 
         except asyncio.TimeoutError:
             llm_resp = LLMGenerate.workflow_end_open_error(
@@ -943,7 +1384,7 @@ async def _chat_response_stream(
                     )
                 }
             )
-            yield Streaming.generate_data(llm_resp.model_dump(exclude_none=True))
+            yield llm_resp.model_dump(exclude_none=True)
             return
         except CustomException as e:
             llm_resp = LLMGenerate.workflow_end_open_error(
@@ -958,7 +1399,7 @@ async def _chat_response_stream(
                     )
                 }
             )
-            yield Streaming.generate_data(llm_resp.model_dump(exclude_none=True))
+            yield llm_resp.model_dump(exclude_none=True)
             return
         except Exception:
             llm_resp = LLMGenerate.workflow_end_open_error(
@@ -973,7 +1414,7 @@ async def _chat_response_stream(
                     )
                 }
             )
-            yield Streaming.generate_data(llm_resp.model_dump(exclude_none=True))
+            yield llm_resp.model_dump(exclude_none=True)
             return
         finally:
             if task:
@@ -984,8 +1425,24 @@ async def _chat_response_stream(
             ):
                 span.add_info_event(
                     f"Workflow output data processed through audit:\n"
-                    f"final_content: {final_content}, \n"
-                    f"final_reasoning_content: {final_reasoning_content}"
+                    f"final_content: {''.join(final_content)}, \n"
+                    f"final_reasoning_content: {''.join(final_reasoning_content)}"
+                )
+            if coalescer:
+                span_context.add_info_events(
+                    {
+                        "llm_resp_summary": json.dumps(
+                            {
+                                "received_frames": coalescer.received,
+                                "sent_frames": coalescer.sent,
+                                "final_content": "".join(final_content),
+                                "final_reasoning_content": "".join(
+                                    final_reasoning_content
+                                ),
+                            },
+                            ensure_ascii=False,
+                        )
+                    }
                 )
 
 
@@ -1010,7 +1467,10 @@ async def _forward_queue_messages(
             response = await _get_response(
                 app_audit_policy, audit_strategy, response_queue
             )
-            event = EventRegistry().get_event(event_id=event_id)
+            if response is None:
+                # The run was checkpointed, its resumed run forwards the rest
+                return
+            event = await EventRegistry().get_event(event_id=event_id)
             data = json.dumps(response.dict(), ensure_ascii=False)
             await EventRegistry().write_resume_data(
                 queue_name=event.get_workflow_q_name(),
@@ -1029,7 +1489,7 @@ async def _del_response_resume_data(
     response: LLMGenerate,
     is_stream: bool,
     event_id: str,
-) -> str:
+) -> Dict[str, Any]:
     """
     Handle response resume data delivery for interrupted workflows.
 
@@ -1040,14 +1500,14 @@ async def _del_response_resume_data(
     :param response: LLMGenerate response object
     :param is_stream: Whether streaming mode is enabled
     :param event_id: Unique event identifier
-    :return: Streaming data string
+    :return: Response frame
     :raises CustomException: When audit policy doesn't support QA nodes
     """
     # Question-answer nodes currently don't support audit
     if app_audit_policy == AppAuditPolicy.AGENT_PLATFORM:
         raise CustomException(CodeEnum.AUDIT_QA_ERROR)
-    EventRegistry().on_interrupt(event_id=event_id)
-    return Streaming.generate_data(response.model_dump(exclude_none=True))
+    await EventRegistry().on_interrupt(event_id=event_id)
+    return response.model_dump(exclude_none=True)
 
 
 async def _init_audit_policy(
@@ -1093,14 +1553,14 @@ async def chat_resume_response_stream(
     :param is_release: Whether running in production release environment
     :return: AsyncGenerator yielding streaming response strings
     """
-    event = EventRegistry().get_event(event_id=event_id)
+    event = await EventRegistry().get_event(event_id=event_id)
 
     message_cache: List[str] = []
     reasoning_content_cache: List[str] = []
     is_stream = event.is_stream
 
-    final_content = ""
-    final_reasoning_content = ""
+    final_content: List[str] = []
+    final_reasoning_content: List[str] = []
     last_workflow_step = WorkflowStep(seq=0, progress=0)
 
     while True:
@@ -1134,20 +1594,17 @@ async def chat_resume_response_stream(
                 raise CustomException(CodeEnum.OPEN_API_ERROR)
 
             if response and response.event_data:
-                EventRegistry().on_interrupt(event_id=event_id)
+                await EventRegistry().on_interrupt(event_id=event_id)
                 response.id = span.sid
                 yield Streaming.generate_data(response.model_dump(exclude_none=True))
                 return
 
-            final_content += response.choices[0].delta.content
-            final_reasoning_content += response.choices[0].delta.reasoning_content
+            final_content.append(response.choices[0].delta.content)
+            final_reasoning_content.append(response.choices[0].delta.reasoning_content)
 
+            data = response.model_dump(exclude_none=True)
             span.add_info_events(
-                {
-                    "llm_resp": json.dumps(
-                        response.model_dump(exclude_none=True), ensure_ascii=False
-                    )
-                }
+                {"llm_resp": lambda: json.dumps(data, ensure_ascii=False)}
             )
             response.id = span.sid
             yield Streaming.generate_data(response.model_dump(exclude_none=True))
@@ -1155,11 +1612,11 @@ async def chat_resume_response_stream(
             if response.choices[0].finish_reason == ChatStatus.FINISH_REASON.value:
                 span.add_info_event(
                     f"Workflow output data processed through audit:\n"
-                    f"final_content: {final_content}, \n"
-                    f"final_reasoning_content: {final_reasoning_content}"
+                    f"final_content: {''.join(final_content)}, \n"
+                    f"final_reasoning_content: {''.join(final_reasoning_content)}"
                 )
                 # Exit condition met
-                EventRegistry().on_finished(event_id=event_id)
+                await EventRegistry().on_finished(event_id=event_id)
                 return
 
         except (Exception, asyncio.TimeoutError, CustomException) as e:
@@ -1181,7 +1638,7 @@ async def chat_resume_response_stream(
                     )
                 }
             )
-            EventRegistry().on_finished(event_id=event_id)
+            await EventRegistry().on_finished(event_id=event_id)
             llm_resp.id = span.sid
             yield Streaming.generate_data(llm_resp.model_dump(exclude_none=True))
             return
@@ -12,6 +12,7 @@ from typing import Any, Dict, cast
 from sqlmodel import Session  # type: ignore
 from workflow.cache import flow as flow_cache
 from workflow.cache.engine import ENGINE_CACHE_PREFIX
+from workflow.consts.tenant_publish_matrix import Platform, TenantPublishMatrix
 from workflow.domain.entities.flow import FlowUpdate
 from workflow.domain.entities.node_debug_vo import NodeDebugRespVo
 from workflow.domain.models.ai_app import App
@@ -32,7 +33,11 @@ from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.middleware.cache.base import BaseCacheService
 from workflow.extensions.middleware.database.utils import session_getter
-from workflow.extensions.middleware.getters import get_cache_service, get_db_service
+from workflow.extensions.middleware.getters import (
+    get_async_db_service,
+    get_cache_service,
+    get_db_service,
+)
 from workflow.extensions.otlp.log_trace.workflow_log import WorkflowLog
 from workflow.extensions.otlp.trace.span import Span
 from workflow.repository import flow_dao, license_dao
@@ -127,10 +132,45 @@ def get(flow_id: str, session: Session, span: Span) -> Flow:
     db_flow = flow_cache.get_flow_by_id(flow_id)
     if db_flow:
         return db_flow
+    db_flow = _query_flow(flow_id, session)
+    flow_cache.set_flow_by_id(flow_id, db_flow)
+    return db_flow
+
+
+def _query_flow(flow_id: str, session: Session) -> Flow:
+    """
+    Query a workflow by its ID from the database, bypassing the cache.
+
+    :param flow_id: The unique identifier of the workflow
+    :param session: Database session for querying
+    :return: The flow object
+    :raises CustomException: If flow with the given ID is not found
+    """
     db_flow = session.query(Flow).filter_by(id=int(flow_id)).first()
     if not db_flow:
         raise CustomException(CodeEnum.FLOW_NOT_FOUND_ERROR)
-    flow_cache.set_flow_by_id(flow_id, db_flow)
+    return db_flow
+
+
+async def async_get(flow_id: str, span: Span) -> Flow:
+    """
+    Retrieve a workflow by its ID without blocking the event loop.
+
+    The cache is read and written through the async cache service and a
+    cache miss is queried in a session of the async database service.
+
+    :param flow_id: The unique identifier of the workflow
+    :param span: Tracing span for logging operations
+    :return: The flow object if found
+    :raises CustomException: If flow with the given ID is not found
+    """
+    db_flow = await flow_cache.async_get_flow_by_id(flow_id)
+    if db_flow:
+        return db_flow
+    db_flow = await get_async_db_service().run(
+        lambda session: _query_flow(flow_id, session)
+    )
+    await flow_cache.async_set_flow_by_id(flow_id, db_flow)
     return db_flow
 
 
@@ -160,6 +200,32 @@ def get_latest_published_flow_by(
         return flow
 
     # Query database if not found in cache
+    published_flow = _query_latest_published_flow(
+        flow_id, app_alias_id, session, version
+    )
+
+    # Cache the result for future requests
+    if not version:
+        flow_cache.set_flow_by_flow_id_latest(flow_id, published_flow)
+    else:
+        flow_cache.set_flow_by_flow_id_version(flow_id, version, published_flow)
+
+    return published_flow
+
+
+def _query_latest_published_flow(
+    flow_id: str, app_alias_id: str, session: Session, version: str = ""
+) -> Flow:
+    """
+    Query the latest published workflow from the database, bypassing the cache.
+
+    :param flow_id: The unique identifier of the workflow
+    :param app_alias_id: The alias ID of the application
+    :param session: Database session for querying
+    :param version: Optional version number of the workflow (empty string for latest)
+    :return: The published flow object
+    :raises CustomException: If flow not found, not authorized, or not published
+    """
     db_flow = session.query(Flow).filter_by(id=int(flow_id)).first()
     if not db_flow:
         raise CustomException(CodeEnum.FLOW_NOT_FOUND_ERROR)
@@ -178,16 +244,64 @@ def get_latest_published_flow_by(
     )
     if not published_flow:
         raise CustomException(CodeEnum.FLOW_NOT_PUBLISH_ERROR)
+    return published_flow
 
-    # Cache the result for future requests
+
+async def async_get_latest_published_flow_by(
+    flow_id: str, app_alias_id: str, span: Span, version: str = ""
+) -> Flow:
+    """
+    Retrieve the latest published workflow without blocking the event loop.
+
+    The cache is read and written through the async cache service, the
+    license check and the flow query of a cache miss run in a session of the
+    async database service.
+
+    :param flow_id: The unique identifier of the workflow
+    :param app_alias_id: The alias ID of the application
+    :param span: Tracing span for logging operations
+    :param version: Optional version number of the workflow (empty string for latest)
+    :return: The published flow object
+    :raises CustomException: If flow not found, not authorized, or not published
+    """
     if not version:
-        flow_cache.set_flow_by_flow_id_latest(flow_id, published_flow)
+        flow = await flow_cache.async_get_flow_by_flow_id_latest(flow_id)
     else:
-        flow_cache.set_flow_by_flow_id_version(flow_id, version, published_flow)
+        flow = await flow_cache.async_get_flow_by_flow_id_version(flow_id, version)
+    if flow:
+        return flow
 
+    published_flow = await get_async_db_service().run(
+        lambda session: _query_latest_published_flow(
+            flow_id, app_alias_id, session, version
+        )
+    )
+    if not version:
+        await flow_cache.async_set_flow_by_flow_id_latest(flow_id, published_flow)
+    else:
+        await flow_cache.async_set_flow_by_flow_id_version(
+            flow_id, version, published_flow
+        )
     return published_flow
 
 
+def is_flow_taken_off(release_status: int) -> bool:
+    """
+    Check whether a published workflow is unavailable to open API calls.
+
+    A workflow is unavailable if it was never released or if it has been taken
+    off every platform it can be published to.
+
+    :param release_status: Release status bit flags of the workflow
+    :return: True if the workflow cannot be called
+    """
+    return release_status == 0 or bool(
+        (release_status & TenantPublishMatrix(Platform.XINGCHEN).get_take_off)
+        and (release_status & TenantPublishMatrix(Platform.KAI_FANG).get_take_off)
+        and (release_status & TenantPublishMatrix(Platform.AI_UI).get_take_off)
+    )
+
+
 def gen_mcp_input_schema(flow: Flow) -> dict:
     """
     Generate MCP (Model Context Protocol) input schema from workflow definition.
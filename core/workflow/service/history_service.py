@@ -2,17 +2,29 @@
 
 This module provides functionality to store and retrieve conversation history
 for workflow nodes, with support for token limits and database constraints.
+The histories of all nodes of a chat are loaded with a single windowed query
+and the histories recorded during a run are written with a single bulk insert
+when the run ends. The recent history of active chats is kept in Redis lists,
+one per node, so consecutive requests of a chat skip the database.
 """
 
 import json
-from typing import Any, Dict, List, Optional
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import desc
+from loguru import logger
+from sqlalchemy import desc, func, insert
 from sqlmodel import Session, select  # type: ignore
 from workflow.domain.models.history import History
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
-from workflow.extensions.middleware.getters import get_session
+from workflow.extensions.middleware.database.utils import session_getter
+from workflow.extensions.middleware.getters import (
+    get_async_cache_service,
+    get_async_db_service,
+    get_db_service,
+)
 
 # Maximum number of history records to keep per node
 MAX_HISTORY_SIZE = 10
@@ -20,6 +32,64 @@ MAX_HISTORY_SIZE = 10
 TOKEN_LIMIT = 8192 * 0.95
 # Database row length limit (95% of mediumText max length 16MB for safety margin)
 DB_ROW_LENGTH_LIMIT = 16777215 * 0.95
+# Redis list of the recent (raw question, raw answer) pairs of a node, newest first
+HISTORY_CACHE_PREFIX = "sparkflowV2:history"
+# Fills a history list loaded from the database unless it is already cached,
+# a list cached meanwhile may already hold records pushed by save_histories.
+# ARGV: expire time, then the records newest first
+_FILL_HISTORY_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('RPUSH', KEYS[1], unpack(ARGV, 2))
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+"""
+
+# Raw question and raw answer JSON strings of one history record
+NodeHistory = List[Tuple[str, str]]
+
+
+def new_history_record(
+    flow_id: str,
+    node_id: str,
+    uid: str,
+    raw_question: dict,
+    raw_answer: dict,
+    chat_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build a history record to be written with ``add_histories``.
+
+    :param flow_id: Unique identifier for the workflow flow
+    :param node_id: Unique identifier for the workflow node
+    :param uid: User identifier
+    :param raw_question: Question data as dictionary
+    :param raw_answer: Answer data as dictionary
+    :param chat_id: Optional chat session identifier
+    :return: Column values of the history record
+    """
+    # Truncate content if it exceeds database row length limit
+    rq_content = raw_question.get("content")
+    if (
+        isinstance(rq_content, str)
+        and len(rq_content.encode("utf-8")) > DB_ROW_LENGTH_LIMIT
+    ):
+        raw_question["content"] = rq_content[: int(DB_ROW_LENGTH_LIMIT)]
+    ra_content = raw_answer.get("content")
+    if (
+        isinstance(ra_content, str)
+        and len(ra_content.encode("utf-8")) > DB_ROW_LENGTH_LIMIT
+    ):
+        raw_answer["content"] = ra_content[: int(DB_ROW_LENGTH_LIMIT)]
+
+    # Serialize question and answer data to JSON strings
+    return {
+        "flow_id": flow_id,
+        "node_id": node_id,
+        "uid": uid,
+        "raw_question": json.dumps(raw_question, ensure_ascii=False),
+        "raw_answer": json.dumps(raw_answer, ensure_ascii=False),
+        "chat_id": chat_id,
+        "create_time": datetime.now(),
+    }
 
 
 def add_history(
@@ -42,39 +112,29 @@ def add_history(
     :param kwargs: Additional keyword arguments
     :raises CustomException: If database operation fails
     """
-    try:
-        session: Session = next(get_session())
-        # Truncate content if it exceeds database row length limit
-        rq_content = raw_question.get("content")
-        if (
-            isinstance(rq_content, str)
-            and len(rq_content.encode("utf-8")) > DB_ROW_LENGTH_LIMIT
-        ):
-            raw_question["content"] = rq_content[: int(DB_ROW_LENGTH_LIMIT)]
-        ra_content = raw_answer.get("content")
-        if (
-            isinstance(ra_content, str)
-            and len(ra_content.encode("utf-8")) > DB_ROW_LENGTH_LIMIT
-        ):
-            raw_answer["content"] = ra_content[: int(DB_ROW_LENGTH_LIMIT)]
-
-        # Serialize question and answer data to JSON strings
-        question_str = json.dumps(raw_question, ensure_ascii=False)
-        answer_str = json.dumps(raw_answer, ensure_ascii=False)
-
-        # Create and persist history record
-        db_history = History(
-            flow_id=flow_id,
-            node_id=node_id,
-            uid=uid,
-            raw_question=question_str,
-            raw_answer=answer_str,
-            chat_id=chat_id,
+    with session_getter(get_db_service()) as session:
+        add_histories(
+            [
+                new_history_record(
+                    flow_id, node_id, uid, raw_question, raw_answer, chat_id
+                )
+            ],
+            session,
         )
-        session.add(db_history)
-        session.commit()
 
-        session.refresh(db_history)
+
+def add_histories(records: List[Dict[str, Any]], session: Session) -> None:
+    """Write history records to the database with a single bulk insert.
+
+    :param records: History records built by ``new_history_record``
+    :param session: Database session
+    :raises CustomException: If database operation fails
+    """
+    if not records:
+        return
+    try:
+        session.execute(insert(History), records)
+        session.commit()
     except Exception as e:
         raise CustomException(
             CodeEnum.ENG_RUN_ERROR,
@@ -83,6 +143,146 @@ def add_history(
         ) from e
 
 
+async def save_histories(records: List[Dict[str, Any]]) -> None:
+    """Write the history records of a run and push them to the cached histories.
+
+    :param records: History records built by ``new_history_record``
+    :raises CustomException: If database operation fails
+    """
+    if not records:
+        return
+    await get_async_db_service().run(lambda session: add_histories(records, session))
+    try:
+        cache = get_async_cache_service()
+        expire_time = _history_cache_expire_time()
+        async with cache.pipeline() as pipe:
+            for record in records:
+                key = _history_cache_key(
+                    record["flow_id"], record["uid"], record["node_id"]
+                )
+                # Only histories cached by a previous load are extended,
+                # a missing list is loaded from the database on next use
+                pipe.lpushx(
+                    key, json.dumps([record["raw_question"], record["raw_answer"]])
+                )
+                pipe.ltrim(key, 0, MAX_HISTORY_SIZE - 1)
+                pipe.expire(key, expire_time)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"history cache update failed, {e}")
+
+
+def query_history(
+    flow_id: str,
+    uid: str,
+    session: Session,
+    node_ids: Optional[List[str]] = None,
+    history_size: int = MAX_HISTORY_SIZE,
+) -> Dict[str, NodeHistory]:
+    """Query the recent history records of the nodes of a flow in one query.
+
+    :param flow_id: Unique identifier for the workflow flow
+    :param uid: User identifier
+    :param session: Database session
+    :param node_ids: Nodes to query, all nodes with history if None
+    :param history_size: Maximum number of history records to retrieve per node
+    :return: Raw question and answer of the records of each node, newest first
+    :raises CustomException: If database operation fails
+    """
+    try:
+        conditions = [History.flow_id == flow_id, History.uid == uid]
+        if node_ids is not None:
+            if not node_ids:
+                return {}
+            conditions.append(History.node_id.in_(node_ids))  # type: ignore
+        # Number the records of each node from the newest one
+        ranked = (
+            select(
+                History.node_id,
+                History.raw_question,
+                History.raw_answer,
+                func.row_number()
+                .over(partition_by=History.node_id, order_by=desc(History.create_time))
+                .label("rn"),
+            )
+            .where(*conditions)
+            .subquery()
+        )
+        query = (
+            select(ranked.c.node_id, ranked.c.raw_question, ranked.c.raw_answer)
+            .where(ranked.c.rn <= history_size)
+            .order_by(ranked.c.node_id, ranked.c.rn)
+        )
+        results: Dict[str, NodeHistory] = {}
+        for node_id, raw_question, raw_answer in session.exec(query).all():
+            results.setdefault(node_id, []).append((raw_question, raw_answer))
+        return results
+    except Exception as e:
+        raise CustomException(
+            CodeEnum.ENG_RUN_ERROR,
+            err_msg=f"get_history method failed to retrieve LLM history; {e}",
+            cause_error=f"err code : {CodeEnum.ENG_RUN_ERROR.code}. message: get_history method failed to retrieve LLM history; {e}",
+        ) from e
+
+
+def format_history(
+    results: Dict[str, NodeHistory],
+    node_max_token: Optional[Dict[str, int]] = None,
+) -> List[Dict]:
+    """Format the history records of nodes into chat histories within token limits.
+
+    :param results: Raw question and answer of the records of each node, newest first
+    :param node_max_token: Optional dictionary mapping node IDs to token limits
+    :return: List of dictionaries containing node history with chat records
+    """
+    # Process and format history data with token limits
+    history: List[Dict[str, Any]] = []
+    node_history_dict: Dict[str, List[Dict[str, Any]]] = {}
+    current_utf8_length = 0
+
+    for node_id, results_content in results.items():
+        if node_id not in node_history_dict:
+            node_history_dict[node_id] = []
+
+        # Process each history record for the current node
+        for raw_question, raw_answer in results_content:
+            # Check token limits and break if exceeded
+            current_utf8_length += len(raw_question.encode("utf-8")) + len(
+                raw_answer.encode("utf-8")
+            )
+            max_token: Optional[float] = None
+            if node_max_token is not None:
+                # Use 80% of the specified token limit for safety margin
+                max_token = float(node_max_token.get(node_id, int(TOKEN_LIMIT))) * 0.8
+
+            if max_token is not None and current_utf8_length > max_token:
+                break
+
+            # Parse JSON strings back to dictionaries
+            question_dict = json.loads(raw_question)
+            answer_dict = json.loads(raw_answer)
+
+            # Add answer and question to history in chronological order
+            node_history_dict[node_id].append(
+                {
+                    "role": answer_dict.get("role"),
+                    "content": answer_dict.get("content"),
+                }
+            )
+            node_history_dict[node_id].append(
+                {
+                    "role": question_dict.get("role"),
+                    "content": question_dict.get("content"),
+                }
+            )
+    # Format final history structure
+    for node_id, chat_history in node_history_dict.items():
+        # Reverse to get chronological order (oldest first)
+        chat_history.reverse()
+        history.append({"nodeID": node_id, "chat_history": chat_history})
+    return history
+
+
 def get_history(
     flow_id: str,
     uid: str,
@@ -98,84 +298,92 @@ def get_history(
     :return: List of dictionaries containing node history with chat records
     :raises CustomException: If database operation fails
     """
+    with session_getter(get_db_service()) as session:
+        results = query_history(flow_id, uid, session, history_size=history_size)
+    return format_history(results, node_max_token)
+
+
+async def load_history(
+    flow_id: str,
+    uid: str,
+    node_ids: List[str],
+    node_max_token: Optional[Dict[str, int]] = None,
+    history_size: int = MAX_HISTORY_SIZE,
+) -> List[Dict]:
+    """Load the conversation history of nodes, from the history cache or the database.
+
+    Nodes whose history is not cached are queried together and their
+    history is cached for CHAT_HISTORY_CACHE_TTL seconds (default: 1800).
+
+    :param flow_id: Unique identifier for the workflow flow
+    :param uid: User identifier
+    :param node_ids: Nodes whose history is loaded
+    :param node_max_token: Optional dictionary mapping node IDs to token limits
+    :param history_size: Maximum number of history records to retrieve per node
+    :return: List of dictionaries containing node history with chat records
+    :raises CustomException: If database operation fails
+    """
+    results: Dict[str, NodeHistory] = {}
     try:
-        session: Session = next(get_session())
-        # Get all unique node IDs for the specified flow
-        node_id_query = (
-            select(History.node_id)
-            .where(History.flow_id == flow_id, History.uid == uid)
-            .distinct()
-        )
-        node_ids = session.exec(node_id_query).all()
-        results: Dict[str, List[Any]] = {}
-
-        # Retrieve recent history records for each node
-        for node_id in node_ids:
-            # Get only the most recent MAX_HISTORY_SIZE records for each node_id
-            query = (
-                select(History.raw_question, History.raw_answer, History.create_time)
-                .where(
-                    History.flow_id == flow_id,
-                    History.node_id == node_id,
-                    History.uid == uid,
-                )
-                .order_by(desc("create_time"))
-                .limit(history_size)
-            )
-            query_results = session.exec(query).all()
-            results[node_id] = list(query_results)
-
-        # Process and format history data with token limits
-        history: List[Dict[str, Any]] = []
-        node_history_dict: Dict[str, List[Dict[str, Any]]] = {}
-        current_utf8_length = 0
-
-        for node_id, results_content in results.items():
-            if node_id not in node_history_dict:
-                node_history_dict[node_id] = []
-
-            # Process each history record for the current node
-            for raw_question, raw_answer in results_content:
-                # Check token limits and break if exceeded
-                current_utf8_length += len(raw_question.encode("utf-8")) + len(
-                    raw_answer.encode("utf-8")
-                )
-                max_token: Optional[float] = None
-                if node_max_token is not None:
-                    # Use 80% of the specified token limit for safety margin
-                    max_token = (
-                        float(node_max_token.get(node_id, int(TOKEN_LIMIT))) * 0.8
-                    )
-
-                if max_token is not None and current_utf8_length > max_token:
-                    break
-
-                # Parse JSON strings back to dictionaries
-                question_dict = json.loads(raw_question)
-                answer_dict = json.loads(raw_answer)
-
-                # Add answer and question to history in chronological order
-                node_history_dict[node_id].append(
-                    {
-                        "role": answer_dict.get("role"),
-                        "content": answer_dict.get("content"),
-                    }
+        cache = get_async_cache_service()
+        async with cache.pipeline() as pipe:
+            for node_id in node_ids:
+                pipe.lrange(
+                    _history_cache_key(flow_id, uid, node_id), 0, history_size - 1
                 )
-                node_history_dict[node_id].append(
-                    {
-                        "role": question_dict.get("role"),
-                        "content": question_dict.get("content"),
-                    }
+            cached = await pipe.execute()
+        for node_id, values in zip(node_ids, cached):
+            if values:
+                results[node_id] = [tuple(json.loads(value)) for value in values]
+    except Exception as e:
+        logger.warning(f"history cache get failed, {e}")
+
+    missing = [node_id for node_id in node_ids if node_id not in results]
+    if missing:
+        loaded = await get_async_db_service().run(
+            lambda session: query_history(flow_id, uid, session, missing, history_size)
+        )
+        results.update(loaded)
+        if loaded:
+            await _cache_history(flow_id, uid, loaded)
+    return format_history(
+        {node_id: results[node_id] for node_id in node_ids if node_id in results},
+        node_max_token,
+    )
+
+
+async def _cache_history(
+    flow_id: str, uid: str, results: Dict[str, NodeHistory]
+) -> None:
+    """Cache the history records of nodes loaded from the database.
+
+    Histories cached meanwhile by another request are kept, they may already
+    hold records of a run that ended after the database query.
+
+    :param flow_id: Unique identifier for the workflow flow
+    :param uid: User identifier
+    :param results: Raw question and answer of the records of each node, newest first
+    """
+    try:
+        cache = get_async_cache_service()
+        expire_time = _history_cache_expire_time()
+        async with cache.pipeline() as pipe:
+            for node_id, node_history in results.items():
+                pipe.eval(
+                    _FILL_HISTORY_SCRIPT,
+                    1,
+                    _history_cache_key(flow_id, uid, node_id),
+                    expire_time,
+                    *[json.dumps(record) for record in node_history],
                 )
-        # Format final history structure
-        for node_id, chat_history in node_history_dict.items():
-            # Reverse to get chronological order (oldest first)
-            chat_history.reverse()
-            history.append({"nodeID": node_id, "chat_history": chat_history})
-        return history
+            await pipe.execute()
     except Exception as e:
-        raise CustomException(
-            CodeEnum.ENG_RUN_ERROR,
-            err_msg=f"get_history method failed to retrieve LLM history; {e}",
-            cause_error=f"err code : {CodeEnum.ENG_RUN_ERROR.code}. message: get_history method failed to retrieve LLM history; {e}",
-        ) from e
+        logger.warning(f"history cache set failed, {e}")
+
+
+def _history_cache_key(flow_id: str, uid: str, node_id: str) -> str:
+    return f"{HISTORY_CACHE_PREFIX}:{flow_id}:{uid}:{node_id}"
+
+
+def _history_cache_expire_time() -> int:
+    return int(os.getenv("CHAT_HISTORY_CACHE_TTL") or "1800")